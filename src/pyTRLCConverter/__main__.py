@@ -27,37 +27,37 @@ import inspect
 import os
 import sys
 import argparse
-from typing import Optional
+import cProfile
+from typing import Any, Optional
+from trlc.ast import Symbol_Table
 from pyTRLCConverter.abstract_converter import AbstractConverter
-from pyTRLCConverter.dump_converter import DumpConverter
+from pyTRLCConverter.base_converter import BaseConverter
+from pyTRLCConverter.build_cache import BuildCache
+from pyTRLCConverter.conversion_server import ConversionServer
+from pyTRLCConverter.converter_registry import ConverterEntry, ConverterRegistry
 from pyTRLCConverter.item_walker import ItemWalker
 from pyTRLCConverter.ret import Ret
 from pyTRLCConverter.version import __license__, __repository__, __version__
-from pyTRLCConverter.trlc_helper import get_trlc_symbols
-from pyTRLCConverter.markdown_converter import MarkdownConverter
-from pyTRLCConverter.docx_converter import DocxConverter
-from pyTRLCConverter.logger import enable_verbose, log_verbose, is_verbose_enabled, log_error
-from pyTRLCConverter.rst_converter import RstConverter
-from pyTRLCConverter.reqif_converter import ReqifConverter
+from pyTRLCConverter.symbols_cache import get_trlc_symbols_cached
+from pyTRLCConverter.logger import enable_verbose, log_verbose, is_verbose_enabled, log_error, log_info
+from pyTRLCConverter.profiler import enable_profiling, get_profiler, profile_phase
+from pyTRLCConverter.render_cache import RenderCache
 from pyTRLCConverter.render_config import RenderConfig
+from pyTRLCConverter.source_watcher import SourceWatcher
+from pyTRLCConverter.symbols_store import SymbolsStore
 
 # Variables ********************************************************************
 
 PROG_NAME = "pyTRLCConverter"
 PROG_DESC = "A CLI tool to convert TRLC into different formats."
+PROG_SERVE_DESC = "Run a conversion daemon, which converts the jobs of a local HTTP API with a warm model."
+
+# The command, which runs the conversion daemon instead of a single conversion.
+SERVE_COMMAND = "serve"
 PROG_COPYRIGHT = "Copyright (c) 2024 - 2026 NewTec GmbH - " + __license__
 PROG_GITHUB = "Find the project on GitHub: " + __repository__
 PROG_EPILOG = PROG_COPYRIGHT + " - " + PROG_GITHUB
 
-# List of built-in converters to use or subclass by a project converter.
-BUILD_IN_CONVERTER_LIST = [
-    MarkdownConverter,
-    DocxConverter,
-    DumpConverter,
-    RstConverter,
-    ReqifConverter
-]
-
 # Classes **********************************************************************
 
 # Functions ********************************************************************
@@ -105,9 +105,10 @@ def _create_args_parser() -> argparse.ArgumentParser:
         "-s",
         "--source",
         type=str,
-        required=True,
+        default=None,
+        required=False,
         action="append",
-        help="The path to the TRLC files folder or a single TRLC file."
+        help="The path to the TRLC files folder or a single TRLC file. Required by the converters."
     )
 
     # lobster-trace: SwRequirements.sw_req_cli_exclude
@@ -161,11 +162,214 @@ def _create_args_parser() -> argparse.ArgumentParser:
         help="Requirement attribute translation JSON file."
     )
 
+    # lobster-trace: SwRequirements.sw_req_cli_jobs
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        required=False,
+        help="Number of worker processes to convert the files in parallel in multiple document mode (default = 1)."
+    )
+
+    # lobster-trace: SwRequirements.sw_req_cli_cache_dir
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        required=False,
+        help="Folder for the build cache. If given, only the output documents whose inputs changed are written."
+    )
+
+    # lobster-trace: SwRequirements.sw_req_cli_symbols_cache
+    parser.add_argument(
+        "--symbols-cache",
+        type=str,
+        default=None,
+        required=False,
+        help="File for the snapshot of the processed TRLC symbols. If given and no TRLC file changed, "
+             "the snapshot is loaded instead of processing the TRLC files again."
+    )
+
+    # lobster-trace: SwRequirements.sw_req_cli_profile
+    parser.add_argument(
+        "--profile",
+        type=str,
+        default=None,
+        required=False,
+        metavar="REPORT",
+        help="JSON file for the profiling report with the wall and CPU time of the conversion phases, "
+             "record types, attribute formats and the slowest records. Files are converted sequentially then."
+    )
+
+    # lobster-trace: SwRequirements.sw_req_cli_profile
+    parser.add_argument(
+        "--profile-stats",
+        type=str,
+        default=None,
+        required=False,
+        metavar="STATS",
+        help="File for the cProfile statistics of the conversion, which can be analyzed with pstats."
+    )
+
+    # lobster-trace: SwRequirements.sw_req_cli_render_cache
+    parser.add_argument(
+        "--render-cache-size",
+        type=_non_negative_int,
+        default=RenderCache.SIZE_DEFAULT,
+        required=False,
+        metavar="SIZE",
+        help="Maximum number of rendered Markdown attribute values, which are cached to render repeated "
+             f"attribute values only once (default = {RenderCache.SIZE_DEFAULT}). 0 disables the cache."
+    )
+
+    # lobster-trace: SwRequirements.sw_req_cli_watch
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Watch the TRLC sources, the render configuration and the translation file and convert "
+             "again on every change, until Ctrl+C is pressed. Only the affected output documents are written."
+    )
+
+    # lobster-trace: SwRequirements.sw_req_cli_watch
+    parser.add_argument(
+        "--watch-interval",
+        type=_positive_float,
+        default=SourceWatcher.INTERVAL_DEFAULT,
+        required=False,
+        metavar="SECONDS",
+        help="Interval in seconds to check the watched files for changes "
+             f"(default = {SourceWatcher.INTERVAL_DEFAULT})."
+    )
+
     return parser
 
-def _setup_converters(args_sub_parser: argparse._SubParsersAction) -> Ret:
+def _add_serve_sub_parser(args_sub_parser: Any) -> None:
+    # lobster-trace: SwRequirements.sw_req_serve
+    """Add the sub parser of the serve command, which runs the conversion daemon.
+
+    Args:
+        args_sub_parser (Any): The sub parsers action of the program arguments parser.
+    """
+    parser = args_sub_parser.add_parser(SERVE_COMMAND,
+                                        help=PROG_SERVE_DESC,
+                                        description=PROG_SERVE_DESC,
+                                        epilog=PROG_EPILOG)
+
+    # The serve command runs the conversion daemon instead of a converter.
+    parser.set_defaults(serve=True)
+
+    # The verbose mode may be enabled before or after the serve command.
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        default=argparse.SUPPRESS,
+        help="Print the requests and the details of the conversion jobs."
+    )
+
+    parser.add_argument(
+        "--host",
+        type=str,
+        default=ConversionServer.HOST_DEFAULT,
+        required=False,
+        help=f"Host to listen on (default = {ConversionServer.HOST_DEFAULT}). The daemon has no "
+             "authentication and writes wherever a job requests, therefore listen on the local host only."
+    )
+
+    parser.add_argument(
+        "--port",
+        type=_non_negative_int,
+        default=ConversionServer.PORT_DEFAULT,
+        required=False,
+        help=f"Port to listen on (default = {ConversionServer.PORT_DEFAULT}). 0 selects a free port."
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=ConversionServer.WORKERS_DEFAULT,
+        required=False,
+        help=f"Number of worker threads, which run the conversion jobs (default = {ConversionServer.WORKERS_DEFAULT})."
+    )
+
+def _positive_int(value: str) -> int:
+    """Convert the given command line argument value to a positive integer.
+
+    Args:
+        value (str): The command line argument value.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive integer.
+
+    Returns:
+        int: The positive integer.
+    """
+    try:
+        number = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"{value} is not an integer.") from exc
+
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer.")
+
+    return number
+
+def _non_negative_int(value: str) -> int:
+    """Convert the given command line argument value to a non-negative integer.
+
+    Args:
+        value (str): The command line argument value.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a non-negative integer.
+
+    Returns:
+        int: The non-negative integer.
+    """
+    try:
+        number = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"{value} is not an integer.") from exc
+
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"{value} is a negative integer.")
+
+    return number
+
+def _positive_float(value: str) -> float:
+    """Convert the given command line argument value to a positive float.
+
+    Args:
+        value (str): The command line argument value.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive float.
+
+    Returns:
+        float: The positive float.
+    """
+    try:
+        number = float(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"{value} is not a number.") from exc
+
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive number.")
+
+    return number
+
+def _setup_converters(args_parser: argparse.ArgumentParser, argv: Optional[list[str]] = None) -> Ret:
+    # lobster-trace: SwRequirements.sw_req_converter_registry
     """Setup the converters.
 
+    Only the subcommand and the description of the converters are registered. The
+    converter module is imported, if its subcommand is selected.
+
+    Args:
+        args_parser (argparse.ArgumentParser): The parser of the program arguments.
+        argv (Optional[list[str]]): The program arguments or None for the command line arguments.
+
     Returns:
         Ret: Status of the setup.
     """
@@ -175,24 +379,22 @@ def _setup_converters(args_sub_parser: argparse._SubParsersAction) -> Ret:
     project_converter = None
 
     try:
-        project_converter = _get_project_converter()
+        project_converter = _get_project_converter(argv)
     except ValueError as exc:
         log_error(str(exc))
         ret_status = Ret.ERROR
 
     if ret_status == Ret.OK:
-
-        project_converter_cmd = None
+        # The built-in converters are used unless a third-party or project converter is replacing them.
+        # lobster-trace: SwRequirements.sw_req_no_prj_spec
+        registry = ConverterRegistry()
+        registry.add_entry_points()
 
         if project_converter is not None:
-            project_converter.register(args_sub_parser)
-            project_converter_cmd = project_converter.get_subcommand()
+            registry.add(ConverterEntry.from_class(project_converter))
 
-        # Load the built-in converters unless a project converter is replacing built-in.
-        # lobster-trace: SwRequirements.sw_req_no_prj_spec
-        for converter in BUILD_IN_CONVERTER_LIST:
-            if converter.get_subcommand() != project_converter_cmd:
-                converter.register(args_sub_parser)
+        args_sub_parser = registry.register(args_parser)
+        _add_serve_sub_parser(args_sub_parser)
 
     return ret_status
 
@@ -229,32 +431,52 @@ def _setup_render_configuration(file_name: Optional[str]) -> Optional[RenderConf
 
     return render_cfg
 
-def _get_project_converter() -> Optional[AbstractConverter]:
+def _setup_build_cache(args: argparse.Namespace) -> Optional[BuildCache]:
+    # lobster-trace: SwRequirements.sw_req_cli_cache_dir
+    """Setup the build cache for the incremental conversion.
+
+    Args:
+        args (argparse.Namespace): Program arguments
+
+    Returns:
+        BuildCache|None: Build cache or None if no cache folder is given or the cache could not be loaded.
+    """
+    build_cache = None
+
+    if args.cache_dir is not None:
+        build_cache = BuildCache(args.cache_dir, args)
+
+        if build_cache.load() is False:
+            build_cache = None
+
+    return build_cache
+
+def _get_project_converter(argv: Optional[list[str]] = None) -> Optional[AbstractConverter]:
     # lobster-trace: SwRequirements.sw_req_prj_spec
     # lobster-trace: SwRequirements.sw_req_prj_spec_file
     """Get the project specific converter class from a --project or -p argument.
 
+    The project converter must be known before the program arguments are parsed,
+    because it registers its own subcommand. Therefore only the project argument
+    is parsed in advance.
+
+    Args:
+        argv (Optional[list[str]]): The program arguments or None for the command line arguments.
+
     Returns:
         AbstractConverter: The project specific converter or None if not found.
     """
-    project_module_name = None
-
-    # Check for project option (-p or --project).
-    arglist = sys.argv[1:]
-    for index, argval in enumerate(arglist):
-        if argval.startswith("-p="):
-            project_module_name = argval[3:]
-        elif argval.startswith("--project="):
-            project_module_name = argval[10:]
-        elif argval in ('-p', '--project') and (index + 1) < len(arglist):
-            project_module_name = arglist[index + 1]
-
-        if project_module_name is not None:
-            break
+    project_args_parser = argparse.ArgumentParser(add_help=False)
+    project_args_parser.add_argument("-p", "--project", type=str, default=None)
+    project_module_name = project_args_parser.parse_known_args(argv)[0].project
 
     if project_module_name is not None:
-        # Dynamically load the module and search for an AbstractConverter class definition
-        sys.path.append(os.path.dirname(project_module_name))
+        # Dynamically load the module and search for an AbstractConverter class definition.
+        # An already loaded module is reused, e.g. by the conversion daemon.
+        project_module_path = os.path.dirname(project_module_name)
+
+        if project_module_path not in sys.path:
+            sys.path.append(project_module_path)
         project_module_name_basename = os.path.basename(project_module_name).replace('.py', '')
 
         try:
@@ -290,61 +512,350 @@ def _create_out_folder(path: str) -> None:
                 log_error(f"Failed to create folder {path}: {e}")
                 raise
 
-def main() -> int:
-    # lobster-trace: SwRequirements.sw_req_cli
+def _convert(args: argparse.Namespace,
+             render_cfg: Optional[RenderConfig],
+             symbols: Symbol_Table,
+             build_cache: Optional[BuildCache],
+             previous_converter: Optional[AbstractConverter] = None) -> tuple[Ret, Optional[AbstractConverter]]:
     # lobster-trace: SwRequirements.sw_req_destination_format
-    """Main program entry point.
+    # lobster-trace: SwRequirements.sw_req_cli_cache_dir
+    # lobster-trace: SwRequirements.sw_req_cli_watch
+    """Convert the TRLC symbols with the converter selected by the program arguments.
+
+    Args:
+        args (argparse.Namespace): Program arguments
+        render_cfg (RenderConfig|None): Render configuration
+        symbols (Symbol_Table): The TRLC symbols to convert.
+        build_cache (BuildCache|None): Build cache for the incremental conversion or None.
+        previous_converter (AbstractConverter|None): The converter of the previous conversion
+            in watch mode, whose caches are taken over, or None.
 
     Returns:
-        int: Program status
+        tuple[Ret, AbstractConverter|None]: Status of the conversion and the converter or None if
+            it couldn't be created.
+    """
+    converter = None
+
+    try:
+        _create_out_folder(args.out)
+
+        # Feed the items into the given converter.
+        log_verbose(
+            f"Using converter {args.converter_class.__name__}: {args.converter_class.get_description()}")
+
+        converter = args.converter_class(args)
+        converter.set_render_cfg(render_cfg)
+
+        if isinstance(converter, BaseConverter) and (type(previous_converter) is type(converter)):
+            converter.take_over_caches(previous_converter)
+
+        walker = ItemWalker(args, converter, build_cache)
+        ret_status = walker.walk_symbols(symbols)
+
+        if (ret_status == Ret.OK) and (build_cache is not None):
+            if build_cache.save() is False:
+                ret_status = Ret.ERROR
+
+    except (FileNotFoundError, OSError) as exc:
+        log_error(str(exc))
+        ret_status = Ret.ERROR
+
+    return ret_status, converter
+
+def _process(args: argparse.Namespace, symbols_store: Optional[SymbolsStore] = None) -> Ret:
+    # lobster-trace: SwRequirements.sw_req_destination_format
+    """Process the TRLC sources and convert them as given by the program arguments.
+
+    Args:
+        args (argparse.Namespace): Program arguments
+        symbols_store (SymbolsStore|None): The symbols store of the conversion daemon, which
+            keeps the TRLC symbols in memory, or None.
+
+    Returns:
+        Ret: Status of the processing.
     """
     ret_status = Ret.OK
 
-    # Create program arguments parser.
-    args_parser = _create_args_parser()
-    args_sub_parser = args_parser.add_subparsers(required=True)
+    render_cfg = _setup_render_configuration(args.renderCfg)
+    build_cache = _setup_build_cache(args)
+    is_up_to_date = (build_cache is not None) and (build_cache.is_up_to_date() is True)
+    symbols = None
 
-    ret_status = _setup_converters(args_sub_parser)
+    # lobster-trace: SwRequirements.sw_req_process_trlc_symbols
+    if is_up_to_date is False:
+        with profile_phase("parse"):
+            if symbols_store is None:
+                symbols = get_trlc_symbols_cached(args.source, args.include, args.symbols_cache)
+            else:
+                symbols = symbols_store.get(args.source, args.include, args.symbols_cache)
 
-    if ret_status == Ret.OK:
+    if render_cfg is None:
+        log_error(f"Failed to load render configuration file {args.renderCfg}.")
+        ret_status = Ret.ERROR
+    if is_up_to_date is True:
+        log_verbose("All output documents are up to date.")
+    elif symbols is None:
+        log_error(f"No items found at {args.source}.")
+        ret_status = Ret.ERROR
+    else:
+        ret_status, _ = _convert(args, render_cfg, symbols, build_cache)
 
-        args = args_parser.parse_args()
+    return ret_status
 
-        if args is None:
-            ret_status = Ret.ERROR
+def _get_watched_files(args: argparse.Namespace) -> list[str]:
+    # lobster-trace: SwRequirements.sw_req_cli_watch
+    """Get the input files given by the program arguments, which are watched in addition to the TRLC sources.
 
-        else:
-            enable_verbose(args.verbose)
-            _show_program_arguments(args)
+    Args:
+        args (argparse.Namespace): Program arguments
+
+    Returns:
+        list[str]: The normalized file names, e.g. of the render configuration and the translation file.
+    """
+    file_names = []
+
+    # The input files, which influence all output documents, are watched in addition to the TRLC sources.
+    for arg_name in BuildCache.INPUT_FILE_ARGS:
+        file_name = getattr(args, arg_name, None)
 
-            render_cfg = _setup_render_configuration(args.renderCfg)
+        if isinstance(file_name, str):
+            file_names.append(os.path.normpath(file_name))
+
+    return file_names
+
+def _process_watched(args: argparse.Namespace) -> Ret:
+    # lobster-trace: SwRequirements.sw_req_cli_watch
+    """Process the TRLC sources and process them again on every change of a watched file.
+
+    The model is kept warm between the conversions: the TRLC sources are processed
+    again only if a TRLC file changed and the render configuration is loaded again
+    only if its file changed. The build cache, kept in memory if no cache folder is
+    given, limits the conversion to the output documents whose inputs changed and the
+    new converter takes over the caches of the previous one. Watching stops with Ctrl+C.
+
+    Args:
+        args (argparse.Namespace): Program arguments
+
+    Returns:
+        Ret: Status of the last processing.
+    """
+    ret_status = Ret.OK
+    render_cfg_file_name = os.path.normpath(args.renderCfg) if args.renderCfg is not None else None
+    watcher = SourceWatcher(args.source, args.include, _get_watched_files(args), args.watch_interval)
+    build_cache = BuildCache(args.cache_dir, args)
+    render_cfg = None
+    symbols = None
+    converter = None
+    changes = watcher.start()
+
+    try:
+        while True:
+            if (render_cfg is None) or (render_cfg_file_name in changes):
+                render_cfg = _setup_render_configuration(args.renderCfg)
 
             # lobster-trace: SwRequirements.sw_req_process_trlc_symbols
-            symbols = get_trlc_symbols(args.source, args.include)
+            if (symbols is None) or any(SourceWatcher.is_trlc_file(file_name) for file_name in changes):
+                symbols = get_trlc_symbols_cached(args.source, args.include, args.symbols_cache)
 
             if render_cfg is None:
                 log_error(f"Failed to load render configuration file {args.renderCfg}.")
                 ret_status = Ret.ERROR
-            if symbols is None:
+            elif build_cache.load() is False:
+                ret_status = Ret.ERROR
+            elif build_cache.is_up_to_date() is True:
+                log_verbose("All output documents are up to date.")
+                ret_status = Ret.OK
+            elif symbols is None:
                 log_error(f"No items found at {args.source}.")
                 ret_status = Ret.ERROR
             else:
-                try:
-                    _create_out_folder(args.out)
+                ret_status, converter = _convert(args, render_cfg, symbols, build_cache, converter)
 
-                    # Feed the items into the given converter.
-                    log_verbose(
-                        f"Using converter {args.converter_class.__name__}: {args.converter_class.get_description()}")
+            result = "Conversion done" if ret_status == Ret.OK else "Conversion failed"
+            log_info(f"{result}, watching for changes. Press Ctrl+C to stop.")
 
-                    converter = args.converter_class(args)
-                    converter.set_render_cfg(render_cfg)
+            changes = watcher.wait_for_changes()
+
+            for file_name in changes:
+                log_info(f"Changed: {file_name}")
+
+    except KeyboardInterrupt:
+        log_info("Stopped watching.")
+
+    return ret_status
 
-                    walker = ItemWalker(args, converter)
-                    ret_status = walker.walk_symbols(symbols)
+def _process_profiled(args: argparse.Namespace) -> Ret:
+    # lobster-trace: SwRequirements.sw_req_cli_profile
+    """Process the TRLC sources and write the profiling report and statistics, if requested.
 
-                except (FileNotFoundError, OSError) as exc:
-                    log_error(str(exc))
-                    ret_status = Ret.ERROR
+    Args:
+        args (argparse.Namespace): Program arguments
+
+    Returns:
+        Ret: Status of the processing.
+    """
+    stats_profile = None
+
+    enable_profiling(args.profile is not None)
+
+    if args.profile_stats is not None:
+        stats_profile = cProfile.Profile()
+        stats_profile.enable()
+
+    try:
+        ret_status = _process(args)
+    finally:
+        if stats_profile is not None:
+            stats_profile.disable()
+
+    if stats_profile is not None:
+        log_verbose(f"Writing profiling statistics {args.profile_stats}.")
+
+        try:
+            stats_profile.dump_stats(args.profile_stats)
+        except OSError as exc:
+            log_error(f"Failed to write profiling statistics {args.profile_stats}: {exc}")
+            ret_status = Ret.ERROR
+
+    profiler = get_profiler()
+
+    if profiler is not None:
+        if profiler.save(args.profile) is False:
+            ret_status = Ret.ERROR
+
+        enable_profiling(False)
+
+    return ret_status
+
+def _parse_args(argv: Optional[list[str]] = None) -> Optional[argparse.Namespace]:
+    # lobster-trace: SwRequirements.sw_req_cli
+    """Parse the program arguments, including the arguments of the selected converter.
+
+    Args:
+        argv (Optional[list[str]]): The program arguments or None for the command line arguments.
+
+    Returns:
+        Optional[argparse.Namespace]: The parsed program arguments or None if the converters couldn't be set up.
+    """
+    args = None
+
+    # Create program arguments parser.
+    args_parser = _create_args_parser()
+
+    if _setup_converters(args_parser, argv) == Ret.OK:
+        args = args_parser.parse_args(argv)
+
+        # lobster-trace: SwRequirements.sw_req_cli_source
+        if (getattr(args, "serve", False) is False) and (args.source is None):
+            args_parser.error("the following arguments are required: -s/--source")
+
+    return args
+
+def _run_job(argv: list[str], symbols_store: SymbolsStore) -> Ret:
+    # lobster-trace: SwRequirements.sw_req_serve
+    """Run a conversion job of the conversion daemon.
+
+    The job is converted like on the command line, but with the TRLC symbols of the
+    symbols store. The verbose mode is given by the daemon. Watch mode and profiling
+    are not supported, because they affect the whole daemon process.
+
+    Args:
+        argv (list[str]): The program arguments of the conversion job.
+        symbols_store (SymbolsStore): The symbols store of the conversion daemon.
+
+    Returns:
+        Ret: Status of the conversion job.
+    """
+    ret_status = Ret.ERROR
+
+    # argparse exits after reporting invalid program arguments or showing the help and a
+    # converter may exit as well. This shall end the conversion job only, not the daemon.
+    try:
+        args = _parse_args(argv)
+
+        if args is None:
+            log_error(f"Invalid program arguments of the conversion job {argv}.")
+        elif getattr(args, "serve", False) is True:
+            log_error("A conversion job can't run the conversion daemon.")
+        elif (args.watch is True) or (args.profile is not None) or (args.profile_stats is not None):
+            log_error("Watch mode and profiling are not supported by conversion jobs.")
+        else:
+            _show_program_arguments(args)
+            ret_status = _process(args, symbols_store)
+
+    except SystemExit as exc:
+        log_error(f"Conversion job {argv} exited with {exc.code}.")
+        ret_status = Ret.ERROR
+
+    return ret_status
+
+def _serve(args: argparse.Namespace) -> Ret:
+    # lobster-trace: SwRequirements.sw_req_serve
+    """Run the conversion daemon until Ctrl+C is pressed.
+
+    Args:
+        args (argparse.Namespace): The program arguments of the conversion daemon.
+
+    Returns:
+        Ret: Status of the conversion daemon.
+    """
+    ret_status = Ret.OK
+    symbols_store = SymbolsStore()
+
+    try:
+        server = ConversionServer((args.host, args.port),
+                                  args.workers,
+                                  lambda job_argv: _run_job(job_argv, symbols_store),
+                                  symbols_store)
+
+    except OSError as exc:
+        log_error(f"Failed to listen on {args.host}:{args.port}: {exc}")
+        ret_status = Ret.ERROR
+
+    else:
+        host, port = server.get_address()
+        log_info(f"Conversion daemon listening on http://{host}:{port}. Press Ctrl+C to stop.")
+
+        try:
+            server.serve()
+        except KeyboardInterrupt:
+            log_info("Stopped the conversion daemon.")
+        finally:
+            server.close()
+
+    return ret_status
+
+def main() -> int:
+    # lobster-trace: SwRequirements.sw_req_cli
+    # lobster-trace: SwRequirements.sw_req_destination_format
+    """Main program entry point.
+
+    Returns:
+        int: Program status
+    """
+    ret_status = Ret.OK
+    args = _parse_args()
+
+    if args is None:
+        ret_status = Ret.ERROR
+
+    # lobster-trace: SwRequirements.sw_req_serve
+    elif getattr(args, "serve", False) is True:
+        enable_verbose(args.verbose)
+        ret_status = _serve(args)
+
+    else:
+        enable_verbose(args.verbose)
+        _show_program_arguments(args)
+
+        # lobster-trace: SwRequirements.sw_req_cli_watch
+        if args.watch is False:
+            ret_status = _process_profiled(args)
+        elif (args.profile is not None) or (args.profile_stats is not None):
+            log_error("Watch mode can't be combined with profiling.")
+            ret_status = Ret.ERROR
+        else:
+            ret_status = _process_watched(args)
 
     return ret_status
 
@@ -20,14 +20,20 @@
 # If not, see <https://www.gnu.org/licenses/>.
 
 # Imports **********************************************************************
+import contextlib
+import re
 from enum import Enum
 from typing import Optional, Any, Callable
 from pyTRLCConverter.abstract_converter import AbstractConverter
 from pyTRLCConverter.ret import Ret
-from pyTRLCConverter.trlc_helper import Record_Object
+from pyTRLCConverter.trlc_helper import Record_Object, TrlcAstWalker, is_item_record
 from pyTRLCConverter.translator import Translator
-from pyTRLCConverter.logger import log_error
+from pyTRLCConverter.logger import log_error, log_verbose
+from pyTRLCConverter.profiler import get_profiler, is_profiling_enabled, profile_attribute_format
+from pyTRLCConverter.record_type_schema import RecordTypeSchema
+from pyTRLCConverter.render_cache import RenderCache
 from pyTRLCConverter.render_config import RenderConfig
+from pyTRLCConverter.plantuml import PlantUML
 
 # Variables ********************************************************************
 
@@ -44,6 +50,7 @@ class RecordsPolicy(Enum):
     """Skip record types that are not linked to a handler."""
 
 
+# pylint: disable-next=too-many-instance-attributes
 class BaseConverter(AbstractConverter):
     # lobster-trace: SwRequirements.sw_req_destination_format
     # lobster-trace: SwRequirements.sw_req_translation
@@ -57,6 +64,10 @@ class BaseConverter(AbstractConverter):
     # Default value used to replace empty attribute values.
     EMPTY_ATTRIBUTE_DEFAULT = "N/A"
 
+    # Fenced code blocks with PlantUML diagrams in Markdown text.
+    PLANTUML_FENCED_CODE_PATTERN = re.compile(r"^(?P<fence>```|~~~)plantuml[ \t]*\n(?P<source>.*?)^(?P=fence)[ \t]*$",
+                                              re.MULTILINE | re.DOTALL)
+
     def __init__(self, args: Any) -> None:
         """
         Initializes the converter with the given arguments.
@@ -83,6 +94,27 @@ class BaseConverter(AbstractConverter):
         # Render configuration used to know how to interprete the attribute value.
         self._render_cfg = RenderConfig()
 
+        # TRLC AST walker to convert the record field values, created on first use.
+        self._trlc_ast_walker: Optional[TrlcAstWalker] = None
+
+        # lobster-trace: SwRequirements.sw_req_record_type_schema
+        # Record type schemas, built on first use per package and record type.
+        self._record_type_schemas: dict[tuple[str, Any], RecordTypeSchema] = {}
+
+        # lobster-trace: SwRequirements.sw_req_record_field_values
+        # The record, which field values are converted to Python objects, and its converted field values.
+        # They are converted on first use and dropped when the next record is converted.
+        self._field_values_record: Optional[Record_Object] = None
+        self._field_values: dict[str, Any] = {}
+
+        # lobster-trace: SwRequirements.sw_req_cli_render_cache
+        # Cache of the rendered Markdown attribute values.
+        self._render_cache = RenderCache(getattr(args, "render_cache_size", RenderCache.SIZE_DEFAULT))
+
+        # lobster-trace: SwRequirements.sw_req_plantuml_batch
+        # PlantUML image generator, which keeps the diagrams rendered in advance. Created on first use.
+        self._plantuml: Optional[PlantUML] = None
+
     @classmethod
     def register(cls, args_parser: Any) -> None:
         """Register converter specific argument parser.
@@ -104,6 +136,130 @@ class BaseConverter(AbstractConverter):
         """
         self._render_cfg = render_cfg
 
+        # The record type schemas contain the resolved render configuration.
+        self._record_type_schemas = {}
+
+    def get_render_cfg(self) -> RenderConfig:
+        """Get the render configuration.
+
+        Returns:
+            RenderConfig: Render configuration
+        """
+        return self._render_cfg
+
+    def is_parallel_file_processing_supported(self) -> bool:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """Check whether the files can be converted by independent converter instances in parallel.
+
+        This is only the case if every file is written on its own without any state
+        shared across files. A converter which supports it shall override this method.
+
+        Returns:
+            bool: True if parallel file processing is supported, otherwise False.
+        """
+        return False
+
+    def get_output_files(self, file_name: str) -> Optional[list[str]]:  # pylint: disable=unused-argument
+        # lobster-trace: SwRequirements.sw_req_cli_cache_dir
+        """Get the output files which are written for the given TRLC file.
+
+        The incremental conversion requires this information to detect missing
+        output files. A converter which supports it shall override this method.
+
+        Args:
+            file_name (str): The TRLC file name.
+
+        Returns:
+            Optional[list[str]]: The output files or None if not known.
+        """
+        return None
+
+    def take_over_caches(self, converter: "BaseConverter") -> None:
+        # lobster-trace: SwRequirements.sw_req_cli_watch
+        """Take over the caches of the converter of the previous conversion, e.g. in watch mode.
+
+        The base converter takes over the render cache. A converter whose cached values
+        depend on the output document shall override this method.
+
+        Args:
+            converter (BaseConverter): The converter of the previous conversion of the same class.
+        """
+        self._render_cache = converter._render_cache  # pylint: disable=protected-access
+
+    def prefetch_plantuml_diagrams(self, item_list: list) -> None:
+        # lobster-trace: SwRequirements.sw_req_plantuml_batch
+        """Render all PlantUML diagrams of the records in a TRLC file in advance as batch.
+
+        Starting Java for every single diagram is expensive. Therefore all diagrams in
+        Markdown attributes are collected before the file is converted and handed over
+        to PlantUML at once. The converter later takes the images from there.
+
+        Args:
+            item_list (list): The list of TRLC items in the file.
+        """
+        diagram_type = self._get_plantuml_diagram_type()  # pylint: disable=assignment-from-none
+
+        if diagram_type is not None:
+            diagram_sources = []
+
+            for item in item_list:
+                if is_item_record(item):
+                    diagram_sources.extend(self._get_plantuml_diagram_sources(item[0]))
+
+            if 0 < len(diagram_sources):
+                self._get_plantuml().prefetch(diagram_type, diagram_sources)
+
+    def _get_plantuml(self) -> PlantUML:
+        # lobster-trace: SwRequirements.sw_req_plantuml_batch
+        """Get the PlantUML image generator of the converter, it is created on first use.
+
+        Returns:
+            PlantUML: The PlantUML image generator.
+        """
+        if self._plantuml is None:
+            self._plantuml = PlantUML()
+
+        return self._plantuml
+
+    def _get_plantuml_diagram_type(self) -> Optional[str]:
+        # lobster-trace: SwRequirements.sw_req_plantuml_batch
+        """Get the type of the images the converter renders PlantUML diagrams to.
+
+        A converter which renders PlantUML diagrams shall override this method.
+
+        Returns:
+            Optional[str]: Diagram type, e.g. svg or None if no diagrams are rendered.
+        """
+        return None
+
+    def _get_plantuml_diagram_sources(self, record: Record_Object) -> list[str]:
+        # lobster-trace: SwRequirements.sw_req_plantuml_batch
+        """Get the sources of the PlantUML diagrams in the Markdown attributes of a record.
+
+        Args:
+            record (Record_Object): The record object.
+
+        Returns:
+            list[str]: The PlantUML diagram sources.
+        """
+        diagram_sources = []
+        markdown_fields = self._get_record_type_schema(record).get_fields_by_format(
+            RenderConfig.FORMAT_SPECIFIER_MD,
+            RenderConfig.FORMAT_SPECIFIER_GFM
+        )
+
+        for field in markdown_fields:
+            attribute_value = record.field[field.name].to_python_object()
+            values = attribute_value if isinstance(attribute_value, list) else [attribute_value]
+
+            for value in values:
+                if isinstance(value, str):
+                    diagram_sources.extend(
+                        match.group("source") for match in self.PLANTUML_FENCED_CODE_PATTERN.finditer(value)
+                    )
+
+        return diagram_sources
+
     def begin(self) -> Ret:
         """ Begin the conversion process.
 
@@ -116,6 +272,9 @@ class BaseConverter(AbstractConverter):
             if self._translator.load(self._args.translation) is False:
                 result = Ret.ERROR
 
+        # The record type schemas contain the translated attribute names.
+        self._record_type_schemas = {}
+
         return result
 
     def enter_file(self, file_name: str) -> Ret:
@@ -163,7 +322,10 @@ class BaseConverter(AbstractConverter):
             Ret: Status
         """
         # Get the record attribute translation dictionary.
-        translation = self._translator.get_translation(record.n_typ.name)
+        translation = self._get_record_type_schema(record).translation
+
+        # The field values of the previous record are not used anymore.
+        self._reset_field_values()
 
         # Check for a specific record handler.
         record_handler = self._record_handler_dict.get(record.n_typ.name)
@@ -188,6 +350,31 @@ class BaseConverter(AbstractConverter):
         """
         return Ret.OK
 
+    def begin_worker(self) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """Begin the conversion in a worker process of the parallel file processing.
+
+        The main process calls begin() and finish() once for the whole conversion. The
+        converter of a worker process only converts single files, it is set up by this
+        method instead. A converter which supports parallel file processing shall override
+        it, if the conversion of a file requires more than the base converter sets up.
+
+        Returns:
+            Ret: Status
+        """
+        return BaseConverter.begin(self)
+
+    def finish_worker(self) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """Finish the conversion in a worker process of the parallel file processing.
+
+        It releases what begin_worker() set up, e.g. temporary folders.
+
+        Returns:
+            Ret: Status
+        """
+        return Ret.OK
+
     # helpers **************************************************************
 
     def convert_record_object_generic(self, record: Record_Object, level: int, translation: Optional[dict]) -> Ret:
@@ -223,7 +410,114 @@ class BaseConverter(AbstractConverter):
         for record_type, handler in handlers.items():
             self._set_project_record_handler(record_type, handler)
 
+    def _report_render_cache_statistics(self) -> None:
+        # lobster-trace: SwRequirements.sw_req_cli_render_cache
+        """Report the statistics of the render cache in verbose mode and in the profiling report."""
+        if self._render_cache.is_enabled() is True:
+            statistics = self._render_cache.get_statistics()
+
+            log_verbose(f"Render cache: {statistics['hits']} hits, {statistics['misses']} misses, "
+                        f"hit rate {statistics['hit_rate']:.1%}, {statistics['evictions']} evictions, "
+                        f"{statistics['size']} of {statistics['max_size']} values cached.")
+
+            profiler = get_profiler()
+            if profiler is not None:
+                profiler.add_statistics("render_cache", self.get_subcommand(), statistics)
+
+    def _render_attribute(self, package_name: str, type_name: str, attribute_name: str, attribute_value: str) -> Any:
+        # lobster-trace: SwRequirements.sw_req_cli_profile
+        """Render the attribute value by the converter and measure it per format, if the profiling is enabled.
+
+        Args:
+            package_name (str): The package name of the record.
+            type_name (str): The record type name.
+            attribute_name (str): The attribute name.
+            attribute_value (str): The attribute value.
+
+        Returns:
+            Any: The rendered attribute value, see _render().
+        """
+        context: contextlib.AbstractContextManager = contextlib.nullcontext()
+
+        if is_profiling_enabled() is True:
+            context = profile_attribute_format(
+                self._render_cfg.get_format_specifier(package_name, type_name, attribute_name))
+
+        with context:
+            rendered_value = self._render(package_name, type_name, attribute_name, attribute_value)
+
+        return rendered_value
+
+    # pylint: disable-next=unused-argument
+    def _render(self, package_name: str, type_name: str, attribute_name: str, attribute_value: str) -> Any:
+        """Render the attribute value according to the render configuration.
+
+        A converter which renders attribute values shall override this method and call
+        _render_attribute() to render them.
+
+        Args:
+            package_name (str): The package name of the record.
+            type_name (str): The record type name.
+            attribute_name (str): The attribute name.
+            attribute_value (str): The attribute value.
+
+        Returns:
+            Any: The rendered attribute value, by default the unchanged attribute value.
+        """
+        return attribute_value
+
+    def _get_trlc_ast_walker(self) -> TrlcAstWalker:
+        """Get the TRLC AST walker to convert the record field values.
+
+        The walker is created only once per converter, because its dispatchers don't
+        depend on the record.
+
+        Returns:
+            TrlcAstWalker: The TRLC AST walker.
+        """
+        if self._trlc_ast_walker is None:
+            self._trlc_ast_walker = self._create_trlc_ast_walker()
+
+        return self._trlc_ast_walker
+
+    def _create_trlc_ast_walker(self) -> TrlcAstWalker:
+        """Create the TRLC AST walker to convert the record field values.
+
+        A converter which needs specific dispatchers shall override this method.
+
+        Returns:
+            TrlcAstWalker: The TRLC AST walker.
+        """
+        return TrlcAstWalker()
+
+    def _get_field_value(self, record: Record_Object, attribute_name: str) -> Any:
+        # lobster-trace: SwRequirements.sw_req_record_field_values
+        """Get the field value of the record object as Python object, like record.to_python_dict() provides it.
+
+        Only the requested field is converted. The converted values are kept until
+        another record is requested or converted.
+
+        Args:
+            record (Record_Object): The record object
+            attribute_name (str): The attribute name to get the value from.
+
+        Returns:
+            Any: The field value, None if the field is null.
+        """
+        if record is not self._field_values_record:
+            self._reset_field_values()
+            self._field_values_record = record
+
+        if attribute_name in self._field_values:
+            attribute_value = self._field_values[attribute_name]
+        else:
+            attribute_value = record.field[attribute_name].to_python_object()
+            self._field_values[attribute_name] = attribute_value
+
+        return attribute_value
+
     def _get_attribute(self, record: Record_Object, attribute_name: str) -> str:
+        # lobster-trace: SwRequirements.sw_req_record_field_values
         """Get the attribute value from the record object.
             If the attribute is not found or empty, return the default value.
 
@@ -234,8 +528,7 @@ class BaseConverter(AbstractConverter):
         Returns:
             str: The attribute value.
         """
-        record_dict = record.to_python_dict()
-        attribute_value = record_dict[attribute_name]
+        attribute_value = self._get_field_value(record, attribute_name)
 
         if attribute_value is None:
             attribute_value = self._empty_attribute_value
@@ -244,6 +537,53 @@ class BaseConverter(AbstractConverter):
 
         return attribute_value
 
+    def _get_attributes(self, record: Record_Object, attribute_names: list[str]) -> dict[str, Any]:
+        # lobster-trace: SwRequirements.sw_req_record_field_values
+        """Get several attribute values from the record object at once.
+            Attributes which are empty get the default value, see _get_attribute().
+
+        Args:
+            record (Record_Object): The record object
+            attribute_names (list[str]): The attribute names to get the values from.
+
+        Returns:
+            dict[str, Any]: The attribute values by attribute name, in the order of the given names.
+        """
+        return {attribute_name: self._get_attribute(record, attribute_name) for attribute_name in attribute_names}
+
+    def _reset_field_values(self) -> None:
+        """Drop the converted field values of the record."""
+        self._field_values_record = None
+        self._field_values = {}
+
+    def _get_record_type_schema(self, record: Record_Object) -> RecordTypeSchema:
+        # lobster-trace: SwRequirements.sw_req_record_type_schema
+        """Get the schema of the record type of the given record.
+
+        The schema is built once per package and record type with the translation and
+        the render configuration of the converter. It is available to all converters,
+        including the project specific ones.
+
+        Args:
+            record (Record_Object): The record object.
+
+        Returns:
+            RecordTypeSchema: The record type schema.
+        """
+        key = (record.n_package.name, record.n_typ)
+        schema = self._record_type_schemas.get(key)
+
+        if schema is None:
+            schema = RecordTypeSchema(
+                record.n_typ,
+                record.n_package.name,
+                self._translator.get_translation(record.n_typ.name),
+                self._render_cfg
+            )
+            self._record_type_schemas[key] = schema
+
+        return schema
+
     def _translate_attribute_name(self, translation: Optional[dict], attribute_name: str) -> str:
         """Translate attribute name on demand.
             If no translation is provided, the attribute name will be returned as is.
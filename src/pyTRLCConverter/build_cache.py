@@ -0,0 +1,392 @@
+"""Persistent build cache for the incremental conversion.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import hashlib
+import inspect
+import json
+import os
+from typing import Any, Optional
+from trlc.ast import Array_Aggregate, Expression, Record_Reference, Tuple_Aggregate
+from pyTRLCConverter.logger import log_error, log_verbose
+from pyTRLCConverter.trlc_helper import get_trlc_source_files, is_item_record
+from pyTRLCConverter.version import __version__
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+
+# pylint: disable-next=too-many-instance-attributes
+class BuildCache():
+    """Persistent cache of the fingerprints of the inputs of every output document.
+
+    The global fingerprint covers everything which influences all output documents:
+    the program version, the converter implementation, the program arguments, the
+    content of the input files given as arguments (render configuration, translation
+    and template) and the TRLC model files (.rsl).
+
+    Every converted TRLC file gets its own fingerprint, which is built from the global
+    fingerprint, its own content and the content of all files which contain records
+    it links to. An output document is only written again if its fingerprint changed
+    or one of its output files doesn't exist anymore.
+
+    Without a cache folder, the fingerprints are kept in memory only, e.g. between the
+    conversions in watch mode.
+    """
+
+    SCHEMA_VERSION = 1
+
+    # Program arguments which have no influence on the generated output.
+    IGNORED_ARGS = ["verbose", "jobs", "cache_dir", "symbols_cache", "converter_class", "target_args",
+                    "watch", "watch_interval", "profile", "profile_stats", "render_cache_size"]
+
+    # Program arguments with input files, whose content influences all output documents.
+    INPUT_FILE_ARGS = ["renderCfg", "translation", "template"]
+
+    def __init__(self, cache_dir: Optional[str], args: Any) -> None:
+        # lobster-trace: SwRequirements.sw_req_cli_cache_dir
+        # lobster-trace: SwRequirements.sw_req_cli_watch
+        """Construct the build cache for the given program arguments.
+
+        Args:
+            cache_dir (Optional[str]): Folder where the build cache is stored or None to keep it in memory.
+            args (Any): The parsed program arguments.
+        """
+        self._args = args
+        self._file_name = None
+
+        # The cache file is specific to the converter and the output folder. This way
+        # several conversions can share the same cache folder.
+        if cache_dir is not None:
+            cache_key = f"{args.converter_class.get_subcommand()}:{os.path.abspath(args.out)}"
+            cache_key_digest = hashlib.sha256(cache_key.encode("utf-8")).hexdigest()[:16]
+            self._file_name = os.path.join(cache_dir, f"build_{cache_key_digest}.json")
+
+        self._input_hashes = {}
+        self._global_fingerprint = ""
+        self._cached_inputs = {}
+        self._cached_global_fingerprint = None
+        self._cached_files = {}
+        self._files = {}
+
+    def load(self) -> bool:
+        # lobster-trace: SwRequirements.sw_req_cli_cache_dir
+        """Fingerprint the current inputs and load the build cache of the previous conversion.
+
+        A missing or outdated cache file is treated as the initial conversion without
+        reporting an error. A build cache in memory keeps the state of the previous
+        conversion with save().
+
+        Returns:
+            bool: True if loading succeeded or the cache doesn't exist yet, False on error.
+        """
+        status = True
+
+        self._input_hashes = {}
+        self._files = {}
+
+        try:
+            for file_name in get_trlc_source_files(self._args.source, self._args.include):
+                self._input_hashes[file_name] = BuildCache._get_file_hash(file_name)
+
+            self._global_fingerprint = self._get_global_fingerprint()
+
+            if self._file_name is not None:
+                log_verbose(f"Loading build cache {self._file_name}.")
+
+                with open(self._file_name, "r", encoding="utf-8") as file:
+                    data = json.load(file)
+
+                if data.get("version") == BuildCache.SCHEMA_VERSION:
+                    self._cached_global_fingerprint = data.get("global")
+                    self._cached_inputs = dict(data.get("inputs", {}))
+                    self._cached_files = dict(data.get("files", {}))
+                else:
+                    log_verbose(f"Build cache {self._file_name} has an unknown version; starting empty.")
+
+        except FileNotFoundError:
+            log_verbose(f"Build cache {self._file_name} does not exist yet; starting empty.")
+
+        except (OSError, IOError) as exc:
+            log_error(f"Failed to load build cache {self._file_name}: {exc}")
+            status = False
+
+        except ValueError as exc:
+            log_verbose(f"Build cache {self._file_name} is corrupt, starting empty: {exc}")
+
+        return status
+
+    def is_up_to_date(self) -> bool:
+        # lobster-trace: SwRequirements.sw_req_cli_cache_dir
+        """Check whether all output documents of the previous conversion are still up to date.
+
+        This check doesn't require to parse the TRLC sources, because it considers
+        every input file.
+
+        Returns:
+            bool: True if nothing changed since the previous conversion, otherwise False.
+        """
+        is_up_to_date = (0 < len(self._cached_files)) and \
+                        (self._cached_global_fingerprint == self._global_fingerprint) and \
+                        (self._cached_inputs == self._input_hashes)
+
+        if is_up_to_date is True:
+            for entry in self._cached_files.values():
+                if BuildCache._are_outputs_available(entry) is False:
+                    is_up_to_date = False
+                    break
+
+        return is_up_to_date
+
+    def is_file_up_to_date(self, file_name: str, item_list: list) -> bool:
+        # lobster-trace: SwRequirements.sw_req_cli_cache_dir
+        """Check whether the output of the given TRLC file is up to date.
+
+        If it is up to date, its cache entry is taken over for the next conversion.
+
+        Args:
+            file_name (str): The normalized TRLC file name.
+            item_list (list): The list of TRLC items in the file.
+
+        Returns:
+            bool: True if the output doesn't need to be written again, otherwise False.
+        """
+        is_up_to_date = False
+        entry = self._cached_files.get(file_name)
+
+        if entry is not None:
+            if entry.get("fingerprint") == self._get_file_fingerprint(file_name, item_list):
+                is_up_to_date = BuildCache._are_outputs_available(entry)
+
+        if is_up_to_date is True:
+            self._files[file_name] = entry
+
+        return is_up_to_date
+
+    def update_file(self, file_name: str, item_list: list, output_files: list[str]) -> None:
+        # lobster-trace: SwRequirements.sw_req_cli_cache_dir
+        """Update the cache entry of the given TRLC file after it was converted.
+
+        Args:
+            file_name (str): The normalized TRLC file name.
+            item_list (list): The list of TRLC items in the file.
+            output_files (list[str]): The output files written for the TRLC file.
+        """
+        self._files[file_name] = {
+            "fingerprint": self._get_file_fingerprint(file_name, item_list),
+            "outputs": output_files
+        }
+
+    def save(self) -> bool:
+        # lobster-trace: SwRequirements.sw_req_cli_cache_dir
+        """Persist the build cache of the current conversion.
+
+        Returns:
+            bool: True if the file was written successfully, False otherwise.
+        """
+        status = True
+
+        if self._file_name is None:
+            self._cached_global_fingerprint = self._global_fingerprint
+            self._cached_inputs = dict(self._input_hashes)
+            self._cached_files = dict(self._files)
+
+        else:
+            status = self._write()
+
+        return status
+
+    def _write(self) -> bool:
+        """Write the build cache of the current conversion to the cache file.
+
+        Returns:
+            bool: True if the file was written successfully, False otherwise.
+        """
+        status = True
+
+        log_verbose(f"Saving build cache {self._file_name}.")
+
+        data = {
+            "version": BuildCache.SCHEMA_VERSION,
+            "global": self._global_fingerprint,
+            "inputs": self._input_hashes,
+            "files": self._files
+        }
+
+        try:
+            cache_dir = os.path.dirname(self._file_name)
+            if 0 < len(cache_dir):
+                os.makedirs(cache_dir, exist_ok=True)
+
+            with open(self._file_name, "w", encoding="utf-8") as file:
+                json.dump(data, file, indent=4, sort_keys=True)
+
+        except (OSError, IOError) as exc:
+            log_error(f"Failed to save build cache {self._file_name}: {exc}")
+            status = False
+
+        return status
+
+    def _get_global_fingerprint(self) -> str:
+        """Get the fingerprint of all inputs which influence every output document.
+
+        Returns:
+            str: Fingerprint
+        """
+        hasher = hashlib.sha256()
+        hasher.update(__version__.encode("utf-8"))
+
+        # The converter implementation, which might be a project specific one.
+        converter_class = self._args.converter_class
+        hasher.update(f"{converter_class.__module__}.{converter_class.__qualname__}".encode("utf-8"))
+        converter_file_name = inspect.getsourcefile(converter_class)
+        if converter_file_name is not None:
+            hasher.update(BuildCache._get_file_hash(converter_file_name).encode("utf-8"))
+
+        # The program arguments and the content of the files given by them.
+        for arg_name, arg_value in sorted(vars(self._args).items()):
+            if arg_name not in BuildCache.IGNORED_ARGS:
+                hasher.update(f"{arg_name}={arg_value!r}".encode("utf-8"))
+
+                if (arg_name in BuildCache.INPUT_FILE_ARGS) and isinstance(arg_value, str):
+                    hasher.update(BuildCache._get_file_hash(arg_value).encode("utf-8"))
+
+        # The model influences all records, adding or removing a file may change the links.
+        for file_name, file_hash in self._input_hashes.items():
+            hasher.update(file_name.encode("utf-8"))
+
+            if file_name.endswith(".rsl"):
+                hasher.update(file_hash.encode("utf-8"))
+
+        return hasher.hexdigest()
+
+    def _get_file_fingerprint(self, file_name: str, item_list: list) -> str:
+        """Get the fingerprint of a TRLC file, considering the files of its link targets.
+
+        Args:
+            file_name (str): The normalized TRLC file name.
+            item_list (list): The list of TRLC items in the file.
+
+        Returns:
+            str: Fingerprint
+        """
+        hasher = hashlib.sha256()
+        hasher.update(self._global_fingerprint.encode("utf-8"))
+        hasher.update(self._get_input_hash(file_name).encode("utf-8"))
+
+        for dependency in BuildCache._get_link_target_files(item_list):
+            if dependency != file_name:
+                hasher.update(dependency.encode("utf-8"))
+                hasher.update(self._get_input_hash(dependency).encode("utf-8"))
+
+        return hasher.hexdigest()
+
+    def _get_input_hash(self, file_name: str) -> str:
+        """Get the content hash of an input file.
+
+        Args:
+            file_name (str): The normalized file name.
+
+        Returns:
+            str: Content hash
+        """
+        file_hash = self._input_hashes.get(file_name)
+
+        # Files which are included on demand might not be part of the source list.
+        if file_hash is None:
+            file_hash = BuildCache._get_file_hash(file_name)
+            self._input_hashes[file_name] = file_hash
+
+        return file_hash
+
+    @staticmethod
+    def _get_file_hash(file_name: str) -> str:
+        """Get the content hash of a file.
+
+        Args:
+            file_name (str): The file name.
+
+        Returns:
+            str: Content hash or empty string if the file doesn't exist.
+        """
+        file_hash = ""
+
+        if os.path.isfile(file_name):
+            with open(file_name, "rb") as file:
+                file_hash = hashlib.sha256(file.read()).hexdigest()
+
+        return file_hash
+
+    @staticmethod
+    def _are_outputs_available(entry: dict) -> bool:
+        """Check whether all output files of a cache entry exist.
+
+        Args:
+            entry (dict): The cache entry.
+
+        Returns:
+            bool: True if all output files exist, otherwise False.
+        """
+        return all(os.path.isfile(output_file) for output_file in entry.get("outputs", []))
+
+    @staticmethod
+    def _get_link_target_files(item_list: list) -> list[str]:
+        """Get the files which contain the records the given items link to.
+
+        Args:
+            item_list (list): The list of TRLC items.
+
+        Returns:
+            list[str]: Sorted list of normalized file names.
+        """
+        file_names = set()
+
+        for item in item_list:
+            if is_item_record(item):
+                for expression in item[0].field.values():
+                    BuildCache._collect_link_target_files(expression, file_names)
+
+        return sorted(file_names)
+
+    @staticmethod
+    def _collect_link_target_files(expression: Optional[Expression], file_names: set) -> None:
+        """Collect the files of the link targets in the given expression.
+
+        Args:
+            expression (Optional[Expression]): The field value.
+            file_names (set): The collected normalized file names.
+        """
+        if isinstance(expression, Record_Reference):
+            if expression.target is not None:
+                file_names.add(os.path.normpath(expression.target.location.file_name))
+
+        elif isinstance(expression, Array_Aggregate):
+            for value in expression.value:
+                BuildCache._collect_link_target_files(value, file_names)
+
+        elif isinstance(expression, Tuple_Aggregate):
+            for value in expression.value.values():
+                BuildCache._collect_link_target_files(value, file_names)
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
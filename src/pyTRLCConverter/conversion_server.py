@@ -0,0 +1,305 @@
+"""Conversion daemon, which runs conversion jobs against the warm model.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+
+# Imports **********************************************************************
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional
+from urllib.parse import urlparse
+from pyTRLCConverter.logger import log_error, log_verbose
+from pyTRLCConverter.ret import Ret
+from pyTRLCConverter.symbols_store import SymbolsStore
+from pyTRLCConverter.version import __version__
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+
+# pylint: disable-next=too-many-instance-attributes
+class ConversionServer():
+    # lobster-trace: SwRequirements.sw_req_serve
+    """Conversion daemon with a HTTP API on the local host.
+
+    A conversion job consists of the same program arguments as a conversion on the
+    command line. The jobs run in a pool of worker threads in the daemon process,
+    so the imported converters, the loaded project converters and the processed TRLC
+    symbol tables of the symbols store are kept warm between the jobs.
+
+    API:
+
+    * POST /convert with the JSON body {"args": [...]} runs a conversion job.
+    * GET /health reports whether the daemon is running.
+    * GET /metrics reports the job and symbols store statistics.
+    """
+
+    # Default host and port of the daemon. The daemon has no authentication, therefore
+    # it listens on the local host only by default.
+    HOST_DEFAULT = "127.0.0.1"
+    PORT_DEFAULT = 8765
+
+    # Default number of worker threads.
+    WORKERS_DEFAULT = 2
+
+    def __init__(self,
+                 address: tuple[str, int],
+                 workers: int,
+                 run_job: Callable[[list[str]], Ret],
+                 symbols_store: SymbolsStore) -> None:
+        """Construct the conversion daemon and bind it to the given address.
+
+        Args:
+            address (tuple[str, int]): The host and port. Port 0 selects a free port.
+            workers (int): The number of worker threads, which run the conversion jobs.
+            run_job (Callable[[list[str]], Ret]): Runs a conversion job with the given program arguments.
+            symbols_store (SymbolsStore): The symbols store used by the conversion jobs.
+
+        Raises:
+            OSError: If the address can't be bound.
+        """
+        self._run_job = run_job
+        self._symbols_store = symbols_store
+        self._workers = workers
+        self._start_time = time.monotonic()
+        self._lock = threading.Lock()
+        self._jobs = {
+            "total": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "pending": 0,
+            "duration_total": 0.0,
+            "duration_max": 0.0
+        }
+
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pyTRLCConverter_job")
+        self._http_server = _HttpServer(address, self)
+
+    def get_address(self) -> tuple[str, int]:
+        """Get the address the daemon listens on.
+
+        Returns:
+            tuple[str, int]: The host and port.
+        """
+        host, port = self._http_server.server_address[:2]
+
+        return str(host), int(port)
+
+    def serve(self) -> None:
+        # lobster-trace: SwRequirements.sw_req_serve
+        """Handle the requests until shutdown() is called."""
+        self._http_server.serve_forever()
+
+    def shutdown(self) -> None:
+        """Stop serving. Must be called from another thread than serve()."""
+        self._http_server.shutdown()
+
+    def close(self) -> None:
+        """Close the listening socket and wait for the running conversion jobs."""
+        self._http_server.server_close()
+        self._executor.shutdown(wait=True)
+
+    def convert(self, args: list[str]) -> tuple[Ret, float]:
+        # lobster-trace: SwRequirements.sw_req_serve
+        """Run a conversion job by the worker pool and wait for its completion.
+
+        Args:
+            args (list[str]): The program arguments of the conversion job.
+
+        Returns:
+            tuple[Ret, float]: Status of the conversion and its duration in seconds, including the waiting time.
+        """
+        start_time = time.perf_counter()
+
+        with self._lock:
+            self._jobs["total"] += 1
+            self._jobs["pending"] += 1
+
+        # A failing job shall neither end the request handling nor keep the job pending.
+        try:
+            ret_status = self._executor.submit(self._run_job, args).result()
+        except (Exception, SystemExit) as exc:  # pylint: disable=broad-except
+            log_error(f"Conversion job {args} failed: {exc!r}")
+            ret_status = Ret.ERROR
+
+        duration = time.perf_counter() - start_time
+
+        with self._lock:
+            self._jobs["pending"] -= 1
+            self._jobs["succeeded" if ret_status == Ret.OK else "failed"] += 1
+            self._jobs["duration_total"] += duration
+            self._jobs["duration_max"] = max(self._jobs["duration_max"], duration)
+
+        return ret_status, duration
+
+    def get_health(self) -> dict:
+        # lobster-trace: SwRequirements.sw_req_serve
+        """Get the health of the daemon.
+
+        Returns:
+            dict: The status and the program version.
+        """
+        return {
+            "status": "ok",
+            "version": __version__
+        }
+
+    def get_metrics(self) -> dict:
+        # lobster-trace: SwRequirements.sw_req_serve
+        """Get the metrics of the daemon.
+
+        Returns:
+            dict: The uptime in seconds, the number of workers, the job statistics and the symbols store statistics.
+        """
+        with self._lock:
+            jobs = dict(self._jobs)
+
+        return {
+            "uptime": time.monotonic() - self._start_time,
+            "workers": self._workers,
+            "jobs": jobs,
+            "symbols_store": self._symbols_store.get_statistics()
+        }
+
+
+class _HttpServer(ThreadingHTTPServer):
+    """HTTP server, which handles every request in its own thread."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], conversion_server: ConversionServer) -> None:
+        """Construct the HTTP server and bind it to the given address.
+
+        Args:
+            address (tuple[str, int]): The host and port.
+            conversion_server (ConversionServer): The conversion daemon, which handles the requests.
+        """
+        super().__init__(address, _RequestHandler)
+        self.conversion_server = conversion_server
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Handler of the requests to the conversion daemon."""
+
+    server_version = f"pyTRLCConverter/{__version__}"
+
+    # pylint: disable-next=invalid-name
+    def do_GET(self) -> None:
+        # lobster-trace: SwRequirements.sw_req_serve
+        """Handle the health and metrics requests."""
+        conversion_server = self._get_conversion_server()
+        path = urlparse(self.path).path
+
+        if path == "/health":
+            self._send_json(200, conversion_server.get_health())
+        elif path == "/metrics":
+            self._send_json(200, conversion_server.get_metrics())
+        else:
+            self._send_json(404, {"status": "error", "message": f"Unknown path {path}."})
+
+    # pylint: disable-next=invalid-name
+    def do_POST(self) -> None:
+        # lobster-trace: SwRequirements.sw_req_serve
+        """Handle the conversion job requests."""
+        conversion_server = self._get_conversion_server()
+        path = urlparse(self.path).path
+
+        if path != "/convert":
+            self._send_json(404, {"status": "error", "message": f"Unknown path {path}."})
+
+        else:
+            args = self._read_job_args()
+
+            if args is None:
+                self._send_json(400, {"status": "error", "message": "Expected a JSON object with a list of "
+                                                                    "program arguments as strings in 'args'."})
+            else:
+                ret_status, duration = conversion_server.convert(args)
+
+                if ret_status == Ret.OK:
+                    self._send_json(200, {"status": "ok", "duration": duration})
+                else:
+                    self._send_json(500, {"status": "error", "duration": duration})
+
+    # pylint: disable-next=redefined-builtin
+    def log_message(self, format: str, *args: Any) -> None:
+        """Log a request in verbose mode only.
+
+        Args:
+            format (str): The message format.
+            *args (Any): The message arguments.
+        """
+        log_verbose(f"{self.address_string()} - {format % args}")
+
+    def _get_conversion_server(self) -> ConversionServer:
+        """Get the conversion daemon, which handles the requests.
+
+        Returns:
+            ConversionServer: The conversion daemon.
+        """
+        assert isinstance(self.server, _HttpServer)
+
+        return self.server.conversion_server
+
+    def _read_job_args(self) -> Optional[list[str]]:
+        """Read the program arguments of a conversion job from the request body.
+
+        Returns:
+            Optional[list[str]]: The program arguments or None if the request body is invalid.
+        """
+        args = None
+
+        try:
+            content_length = int(self.headers.get("Content-Length", "0"))
+            job = json.loads(self.rfile.read(content_length).decode("utf-8"))
+
+            if isinstance(job, dict):
+                args = job.get("args")
+
+        except (ValueError, UnicodeDecodeError):
+            args = None
+
+        if (not isinstance(args, list)) or (not all(isinstance(arg, str) for arg in args)):
+            args = None
+
+        return args
+
+    def _send_json(self, status_code: int, data: dict) -> None:
+        """Send a response with a JSON body.
+
+        Args:
+            status_code (int): The HTTP status code.
+            data (dict): The response data.
+        """
+        body = json.dumps(data).encode("utf-8")
+
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
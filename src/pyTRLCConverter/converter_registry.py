@@ -0,0 +1,323 @@
+"""Registry of the converters, which are imported only if they are selected.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import argparse
+import importlib
+from importlib.metadata import EntryPoint, entry_points
+from typing import Any, Callable, Optional
+from pyTRLCConverter.abstract_converter import AbstractConverter
+from pyTRLCConverter.logger import log_error
+
+# Variables ********************************************************************
+
+# Entry point group of the third-party converters. The entry point name is the subcommand.
+ENTRY_POINT_GROUP = "pyTRLCConverter.converters"
+
+# Subcommand and description of the built-in converters. The converter classes return them
+# and the registry lists them in the help, without importing the converter modules.
+MARKDOWN_SUBCOMMAND = "markdown"
+MARKDOWN_DESCRIPTION = "Convert into markdown format."
+DOCX_SUBCOMMAND = "docx"
+DOCX_DESCRIPTION = "Convert into docx format."
+DUMP_SUBCOMMAND = "dump"
+DUMP_DESCRIPTION = "Dump TRCL item list to console."
+RST_SUBCOMMAND = "rst"
+RST_DESCRIPTION = "Convert into reStructuredText format."
+REQIF_SUBCOMMAND = "reqif"
+REQIF_DESCRIPTION = "Convert into ReqIF format."
+MULTI_SUBCOMMAND = "multi"
+MULTI_DESCRIPTION = "Convert to several formats with a single processing of the TRLC sources."
+
+# Classes **********************************************************************
+
+
+class ConverterEntry():
+    # lobster-trace: SwRequirements.sw_req_converter_registry
+    """Lightweight metadata of a converter, which is enough to list it in the help.
+
+    The converter class is loaded on first use, only then its module and the
+    libraries it depends on are imported.
+    """
+
+    def __init__(self, subcommand: str, description: str, loader: Callable[[], Any]) -> None:
+        """Construct the converter entry.
+
+        Args:
+            subcommand (str): The subcommand of the converter.
+            description (str): The converter description, shown in the help.
+            loader (Callable[[], Any]): Loads the converter class.
+        """
+        self.subcommand = subcommand
+        self.description = description
+        self._loader = loader
+        self._converter_class: Optional[type[AbstractConverter]] = None
+
+    @staticmethod
+    def from_module(subcommand: str, description: str, module_name: str, class_name: str) -> "ConverterEntry":
+        """Create the entry of a converter class, which is defined in the given module.
+
+        Args:
+            subcommand (str): The subcommand of the converter.
+            description (str): The converter description, shown in the help.
+            module_name (str): The full name of the module, which defines the converter class.
+            class_name (str): The name of the converter class.
+
+        Returns:
+            ConverterEntry: The converter entry.
+        """
+        return ConverterEntry(subcommand,
+                              description,
+                              lambda: getattr(importlib.import_module(module_name), class_name))
+
+    @staticmethod
+    def from_class(converter_class: type[AbstractConverter]) -> "ConverterEntry":
+        """Create the entry of an already loaded converter class, e.g. a project converter.
+
+        Args:
+            converter_class (type[AbstractConverter]): The converter class.
+
+        Returns:
+            ConverterEntry: The converter entry.
+        """
+        return ConverterEntry(converter_class.get_subcommand(),
+                              converter_class.get_description(),
+                              lambda: converter_class)
+
+    @staticmethod
+    def from_entry_point(entry_point: EntryPoint) -> "ConverterEntry":
+        # lobster-trace: SwRequirements.sw_req_converter_entry_point
+        """Create the entry of a third-party converter, which is provided by an entry point.
+
+        Args:
+            entry_point (EntryPoint): The entry point, its name must be the subcommand of the converter.
+
+        Returns:
+            ConverterEntry: The converter entry.
+        """
+        provider = entry_point.value
+
+        if entry_point.dist is not None:
+            provider = entry_point.dist.name
+
+        return ConverterEntry(entry_point.name, f"Third-party converter of {provider}.", entry_point.load)
+
+    def load(self) -> type[AbstractConverter]:
+        # lobster-trace: SwRequirements.sw_req_converter_registry
+        """Load the converter class.
+
+        Raises:
+            ImportError: If the converter module can't be imported.
+            AttributeError: If the converter class is not defined in its module.
+            TypeError: If the loaded object is no converter class.
+
+        Returns:
+            type[AbstractConverter]: The converter class.
+        """
+        if self._converter_class is None:
+            converter_class = self._loader()
+
+            if (not isinstance(converter_class, type)) or (not issubclass(converter_class, AbstractConverter)):
+                raise TypeError(f"{converter_class} is no AbstractConverter derived class.")
+
+            self._converter_class = converter_class
+
+        return self._converter_class
+
+
+class ConverterRegistry():
+    # lobster-trace: SwRequirements.sw_req_converter_registry
+    """Registry of the available converters, keyed by their subcommand.
+
+    A later added converter replaces an earlier one with the same subcommand and is
+    listed before the earlier added ones. The registry starts with the built-in
+    converters, followed by the third-party converters of the entry points and the
+    project converter.
+    """
+
+    # The built-in converters.
+    BUILD_IN_CONVERTERS = [
+        ConverterEntry.from_module(MARKDOWN_SUBCOMMAND, MARKDOWN_DESCRIPTION,
+                                   "pyTRLCConverter.markdown_converter", "MarkdownConverter"),
+        ConverterEntry.from_module(DOCX_SUBCOMMAND, DOCX_DESCRIPTION,
+                                   "pyTRLCConverter.docx_converter", "DocxConverter"),
+        ConverterEntry.from_module(DUMP_SUBCOMMAND, DUMP_DESCRIPTION,
+                                   "pyTRLCConverter.dump_converter", "DumpConverter"),
+        ConverterEntry.from_module(RST_SUBCOMMAND, RST_DESCRIPTION,
+                                   "pyTRLCConverter.rst_converter", "RstConverter"),
+        ConverterEntry.from_module(REQIF_SUBCOMMAND, REQIF_DESCRIPTION,
+                                   "pyTRLCConverter.reqif_converter", "ReqifConverter"),
+        ConverterEntry.from_module(MULTI_SUBCOMMAND, MULTI_DESCRIPTION,
+                                   "pyTRLCConverter.multi_converter", "MultiConverter")
+    ]
+
+    def __init__(self) -> None:
+        """Construct the registry with the built-in converters."""
+        self._entries = {entry.subcommand: entry for entry in ConverterRegistry.BUILD_IN_CONVERTERS}
+
+    def add(self, entry: ConverterEntry) -> None:
+        # lobster-trace: SwRequirements.sw_req_converter_registry
+        """Add the given converter in front, it replaces a converter with the same subcommand.
+
+        Args:
+            entry (ConverterEntry): The converter entry.
+        """
+        if entry.subcommand in self._entries:
+            del self._entries[entry.subcommand]
+
+        self._entries = {entry.subcommand: entry, **self._entries}
+
+    def add_entry_points(self) -> None:
+        # lobster-trace: SwRequirements.sw_req_converter_entry_point
+        """Add the third-party converters of the installed packages, without importing them."""
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            self.add(ConverterEntry.from_entry_point(entry_point))
+
+    def get_entries(self) -> list[ConverterEntry]:
+        """Get the converter entries in the order they are listed in the help.
+
+        Returns:
+            list[ConverterEntry]: The converter entries.
+        """
+        return list(self._entries.values())
+
+    def register(self, args_parser: argparse.ArgumentParser) -> Any:
+        # lobster-trace: SwRequirements.sw_req_converter_registry
+        """Add the sub parsers of all converters to the given parser, without loading the converters.
+
+        Args:
+            args_parser (argparse.ArgumentParser): The parser of the program arguments.
+
+        Returns:
+            Any: The sub parsers action, which further subcommands can be added to.
+        """
+        args_sub_parser = args_parser.add_subparsers(required=True, parser_class=ConverterArgumentParser)
+
+        for entry in self._entries.values():
+            args_sub_parser.add_parser(entry.subcommand,
+                                       help=entry.description,
+                                       converter_entry=entry,
+                                       sub_parsers=args_sub_parser.choices)
+
+        return args_sub_parser
+
+
+class ConverterArgumentParser(argparse.ArgumentParser):
+    # lobster-trace: SwRequirements.sw_req_converter_registry
+    """Sub parser of a converter, which registers the converter specific arguments on demand.
+
+    Every converter gets a sub parser with its description, which is enough for the help.
+    The converter class is loaded and registers its specific arguments only if the sub
+    parser is used, i.e. the subcommand is selected on the command line or by the multi
+    converter.
+    """
+
+    def __init__(self,
+                 *args: Any,
+                 converter_entry: Optional[ConverterEntry] = None,
+                 sub_parsers: Optional[dict[str, argparse.ArgumentParser]] = None,
+                 **kwargs: Any) -> None:
+        """Construct the sub parser.
+
+        Args:
+            *args (Any): Positional arguments of the argparse parser.
+            converter_entry (Optional[ConverterEntry]): The converter entry or None if there is no converter to load.
+            sub_parsers (Optional[dict[str, argparse.ArgumentParser]]): The sub parsers of all converters.
+            **kwargs (Any): Keyword arguments of the argparse parser.
+        """
+        super().__init__(*args, **kwargs)
+
+        self._converter_entry = converter_entry
+        self._sub_parsers = {} if sub_parsers is None else sub_parsers
+
+    def parse_known_args(self, args: Any = None, namespace: Any = None) -> Any:
+        """Load the converter, which registers its specific arguments, and parse the arguments.
+
+        Args:
+            args (Any): The arguments to parse or None for the command line arguments.
+            namespace (Any): The namespace to populate or None for a new one.
+
+        Returns:
+            Any: The populated namespace and the remaining arguments.
+        """
+        entry = self._converter_entry
+
+        if entry is not None:
+            self._converter_entry = None
+
+            try:
+                converter_class = entry.load()
+
+            except (ImportError, AttributeError, TypeError) as exc:
+                log_error(f"Failed to load converter {entry.subcommand}: {exc}")
+                self.exit(2)
+
+            converter_class.register(_ConverterSubParsers(self, entry.subcommand, self._sub_parsers))
+
+            if self.get_default("converter_class") is None:
+                log_error(f"Converter {converter_class.__name__} doesn't register the subcommand {entry.subcommand}.")
+                self.exit(2)
+
+        return super().parse_known_args(args, namespace)
+
+
+# pylint: disable-next=too-few-public-methods
+class _ConverterSubParsers():
+    """Sub parsers, which are given to a converter to register its specific arguments.
+
+    The converter gets its already existing sub parser instead of a new one. The sub
+    parsers of all converters are available by their subcommand.
+    """
+
+    def __init__(self,
+                 parser: ConverterArgumentParser,
+                 subcommand: str,
+                 choices: dict[str, argparse.ArgumentParser]) -> None:
+        """Construct the sub parsers.
+
+        Args:
+            parser (ConverterArgumentParser): The sub parser of the converter.
+            subcommand (str): The subcommand of the converter.
+            choices (dict[str, argparse.ArgumentParser]): The sub parsers of all converters.
+        """
+        self._parser = parser
+        self._subcommand = subcommand
+        self.choices = choices
+
+    def add_parser(self, name: str, **_kwargs: Any) -> argparse.ArgumentParser:
+        """Get the sub parser of the converter, its description is already set.
+
+        Args:
+            name (str): The subcommand of the converter.
+            **_kwargs (Any): Keyword arguments of the argparse sub parser, not used.
+
+        Returns:
+            argparse.ArgumentParser: The sub parser.
+        """
+        if name != self._subcommand:
+            log_error(f"Converter {self._subcommand} can't register the subcommand {name}.")
+            self._parser.exit(2)
+
+        return self._parser
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
@@ -20,6 +20,7 @@
 # If not, see <https://www.gnu.org/licenses/>.
 
 # Imports **********************************************************************
+import copy
 import os
 from typing import Optional, Any
 import docx
@@ -28,11 +29,16 @@ from docx.text.paragraph import Paragraph
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 from docx.enum.style import WD_STYLE_TYPE
-from marko import Markdown
 from trlc.ast import Implicit_Null, Record_Object, Record_Reference, String_Literal, Array_Aggregate, Expression
 from pyTRLCConverter.base_converter import BaseConverter
+from pyTRLCConverter.converter_registry import DOCX_DESCRIPTION, DOCX_SUBCOMMAND
+from pyTRLCConverter.docx_stream_writer import DocxStreamWriter
+from pyTRLCConverter.marko.marko_renderer import MarkoRenderer
 from pyTRLCConverter.marko.md2docx_renderer import Md2DocxRenderer
 from pyTRLCConverter.marko.gfm2docx_renderer import Gfm2DocxRenderer
+from pyTRLCConverter.profiler import profile_phase
+from pyTRLCConverter.render_cache import RenderCache
+from pyTRLCConverter.render_config import RenderConfig
 from pyTRLCConverter.ret import Ret
 from pyTRLCConverter.trlc_helper import TrlcAstWalker
 from pyTRLCConverter.logger import log_verbose
@@ -54,6 +60,14 @@ class DocxConverter(BaseConverter):
 
     OUTPUT_FILE_NAME_DEFAULT = "output.docx"
 
+    # The document body is streamed to a spool file and written into the docx package.
+    BACKEND_STREAM = "stream"
+
+    # The whole document is kept by python-docx and saved at the end.
+    BACKEND_PYTHON_DOCX = "python-docx"
+
+    BACKEND_DEFAULT = BACKEND_STREAM
+
     def __init__(self, args: Any) -> None:
         # lobster-trace: SwRequirements.sw_req_no_prj_spec
         # lobster-trace: SwRequirements.sw_req_docx
@@ -85,6 +99,18 @@ class DocxConverter(BaseConverter):
         # Docx block item container to add content to during conversion and markdown rendering.
         self._block_item_container: Optional[BlockItemContainer] = None
 
+        # lobster-trace: SwRequirements.sw_req_render_markdown_reuse
+        # The Markdown parsers and renderers, which are set up once and reused for every attribute.
+        self._marko_renderer_md = MarkoRenderer(Md2DocxRenderer)
+        self._marko_renderer_gfm = MarkoRenderer(Gfm2DocxRenderer, ["gfm"])
+
+        # lobster-trace: SwRequirements.sw_req_docx_stream
+        # The stream writer, which writes the document body incrementally, or None for the python-docx backend.
+        self._stream_writer: Optional[DocxStreamWriter] = None
+
+        if getattr(args, "backend", DocxConverter.BACKEND_DEFAULT) == DocxConverter.BACKEND_STREAM:
+            self._stream_writer = DocxStreamWriter(self._docx)
+
     @staticmethod
     def get_subcommand() -> str:
         # lobster-trace: SwRequirements.sw_req_docx
@@ -93,7 +119,7 @@ class DocxConverter(BaseConverter):
         Returns:
             Ret: Status
         """
-        return "docx"
+        return DOCX_SUBCOMMAND
 
     @staticmethod
     def get_description() -> str:
@@ -103,7 +129,7 @@ class DocxConverter(BaseConverter):
         Returns:
             Ret: Status
         """
-        return "Convert into docx format."
+        return DOCX_DESCRIPTION
 
     @classmethod
     def register(cls, args_parser: Any) -> None:
@@ -134,6 +160,29 @@ class DocxConverter(BaseConverter):
             help="Name of the generated output file inside the output folder " \
                 f"(default = {DocxConverter.OUTPUT_FILE_NAME_DEFAULT})."
         )
+        BaseConverter._parser.add_argument(
+            "--backend",
+            type=str,
+            choices=[DocxConverter.BACKEND_STREAM, DocxConverter.BACKEND_PYTHON_DOCX],
+            default=DocxConverter.BACKEND_DEFAULT,
+            required=False,
+            help="Write the document body incrementally (stream) or keep the whole document " \
+                f"in memory (python-docx) (default = {DocxConverter.BACKEND_DEFAULT})."
+        )
+
+    def begin(self) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_docx_stream
+        """Begin the conversion process.
+
+        Returns:
+            Ret: Status
+        """
+        result = super().begin()
+
+        if (result == Ret.OK) and (self._stream_writer is not None):
+            self._stream_writer.start()
+
+        return result
 
     def convert_section(self, section: str, level: int) -> Ret:
         # lobster-trace: SwRequirements.sw_req_docx_section
@@ -149,9 +198,29 @@ class DocxConverter(BaseConverter):
         assert self._docx is not None
 
         self._docx.add_heading(section, level)
+        self._flush()
 
         return Ret.OK
 
+    def convert_record_object(self, record: Record_Object, level: int) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_docx_stream
+        """Process the given record object, by its specific handler or in a generic way.
+
+        The completed blocks are written with the stream writer afterwards, also the
+        ones of project specific handlers.
+
+        Args:
+            record (Record_Object): The record object
+            level (int): The record level
+
+        Returns:
+            Ret: Status
+        """
+        result = super().convert_record_object(record, level)
+        self._flush()
+
+        return result
+
     def convert_record_object_generic(self, record: Record_Object, level: int, translation: Optional[dict]) -> Ret:
         # lobster-trace: SwRequirements.sw_req_docx_record
         """
@@ -172,6 +241,43 @@ class DocxConverter(BaseConverter):
         """
         return self._convert_record_object(record, level, translation)
 
+    def take_over_caches(self, converter: BaseConverter) -> None:
+        # lobster-trace: SwRequirements.sw_req_cli_watch
+        """Take over the Markdown parsers and renderers of the converter of the previous conversion.
+
+        The render cache is not taken over, because the cached document elements may
+        refer to parts of the previous document, e.g. images.
+
+        Args:
+            converter (BaseConverter): The converter of the previous conversion of the same class.
+        """
+        if isinstance(converter, DocxConverter):
+            # pylint: disable=protected-access
+            self._marko_renderer_md = converter._marko_renderer_md
+            self._marko_renderer_gfm = converter._marko_renderer_gfm
+            # pylint: enable=protected-access
+
+    def get_output_files(self, file_name: str) -> Optional[list[str]]:
+        # lobster-trace: SwRequirements.sw_req_cli_cache_dir
+        """Get the output files which are written for the given TRLC file.
+
+        Args:
+            file_name (str): The TRLC file name.
+
+        Returns:
+            Optional[list[str]]: The output files.
+        """
+        return [os.path.join(self._args.out, self._args.name)]
+
+    def _get_plantuml_diagram_type(self) -> Optional[str]:
+        # lobster-trace: SwRequirements.sw_req_plantuml_batch
+        """Get the type of the images the converter renders PlantUML diagrams to.
+
+        Returns:
+            Optional[str]: Diagram type png.
+        """
+        return "png"
+
     def finish(self) -> Ret:
         # lobster-trace: SwRequirements.sw_req_docx_file
         """Finish the conversion.
@@ -187,10 +293,18 @@ class DocxConverter(BaseConverter):
                 output_file_name = os.path.join(self._args.out, self._args.name)
 
             log_verbose(f"Writing docx {output_file_name}.")
-            self._docx.save(output_file_name)
+            with profile_phase("write"):
+                if self._stream_writer is not None:
+                    self._stream_writer.write(output_file_name)
+                    self._stream_writer.close()
+                    self._stream_writer = None
+                else:
+                    self._docx.save(output_file_name)
             self._docx = None
             result = Ret.OK
 
+        self._report_render_cache_statistics()
+
         return result
 
     def _on_implict_null(self, _: Implicit_Null) -> None:
@@ -237,7 +351,7 @@ class DocxConverter(BaseConverter):
             type_name = self._ast_meta_data.get("type_name", "")
             attribute_name = self._ast_meta_data.get("attribute_name", "")
 
-            self._render(package_name, type_name, attribute_name, string_literal.to_string())
+            self._render_attribute(package_name, type_name, attribute_name, string_literal.to_string())
             is_handled = True
 
         if is_handled is False:
@@ -303,7 +417,7 @@ class DocxConverter(BaseConverter):
         assert self._block_item_container is not None
         self._block_item_container.add_paragraph(expression.to_string())
 
-    def _get_trlc_ast_walker(self) -> TrlcAstWalker:
+    def _create_trlc_ast_walker(self) -> TrlcAstWalker:
         # lobster-trace: SwRequirements.sw_req_docx_record
         """
         If a record object contains a record reference, the record reference will be converted to
@@ -360,21 +474,65 @@ class DocxConverter(BaseConverter):
 
         # If the attribute is marked as CommonMark Markdown format, convert it.
         if self._render_cfg.is_format_md(package_name, type_name, attribute_name) is True:
-            Md2DocxRenderer.block_item_container = self._block_item_container
-            Md2DocxRenderer().reset()
-            markdown = Markdown(renderer=Md2DocxRenderer)
-            markdown.convert(attribute_value)
+            self._render_markdown(attribute_value, gfm_mode=False)
 
         # If the attribute is marked as GitHub Flavored Markdown format, convert it.
         elif self._render_cfg.is_format_gfm(package_name, type_name, attribute_name) is True:
-            Gfm2DocxRenderer.block_item_container = self._block_item_container
-            Gfm2DocxRenderer().reset()
-            markdown = Markdown(renderer=Gfm2DocxRenderer, extensions=['gfm'])
-            markdown.convert(attribute_value)
+            self._render_markdown(attribute_value, gfm_mode=True)
 
         else:
             self._block_item_container.add_paragraph(attribute_value)
 
+    def _render_markdown(self, markdown_text: str, gfm_mode: bool) -> None:
+        # lobster-trace: SwRequirements.sw_req_docx_render_md
+        # lobster-trace: SwRequirements.sw_req_docx_render_gfm
+        # lobster-trace: SwRequirements.sw_req_cli_render_cache
+        """Render the Markdown text into the current block item container.
+
+        The document elements, which are appended by rendering, are cached and copies
+        of them are appended again, if the same Markdown text is rendered later on.
+        If rendering changes elements which were already in the container, e.g. a
+        thematic break removes the previous paragraph, the result is not cached.
+        Only the elements of a block item container, e.g. a table cell, are cached.
+
+        Args:
+            markdown_text (str): Markdown source text.
+            gfm_mode (bool): If True, use the GFM extension; otherwise use CommonMark.
+        """
+        assert self._block_item_container is not None
+        container_element = self._block_item_container._element # pylint: disable=protected-access
+        cache_key = None
+        cached = None
+
+        if (self._render_cache.is_enabled() is True) and isinstance(self._block_item_container, BlockItemContainer):
+            format_specifier = RenderConfig.FORMAT_SPECIFIER_GFM if gfm_mode else RenderConfig.FORMAT_SPECIFIER_MD
+            cache_key = RenderCache.get_key(markdown_text, format_specifier, None, self.get_subcommand())
+            cached = self._render_cache.get(cache_key)
+
+        if cached is not None:
+            for element in cached:
+                container_element.append(copy.deepcopy(element))
+
+        else:
+            elements_before = list(container_element) if cache_key is not None else []
+
+            marko_renderer = self._marko_renderer_gfm if gfm_mode else self._marko_renderer_md
+            marko_renderer.convert(markdown_text,
+                                   block_item_container=self._block_item_container,
+                                   plantuml=self._get_plantuml())
+
+            if cache_key is not None:
+                elements_after = list(container_element)
+                is_appended_only = (len(elements_before) <= len(elements_after)) and \
+                    all(before is after for before, after in zip(elements_before, elements_after))
+
+                if is_appended_only is True:
+                    self._render_cache.put(
+                        cache_key,
+                        tuple(copy.deepcopy(element) for element in elements_after[len(elements_before):])
+                    )
+
+    # pylint: disable-next=too-many-locals
     def _convert_record_object(self, record: Record_Object, level: int, translation: Optional[dict]) -> Ret:
         # lobster-trace: SwRequirements.sw_req_docx_record
         """
@@ -405,9 +563,10 @@ class DocxConverter(BaseConverter):
 
         # Walk through the record object fields and write the table rows.
         trlc_ast_walker = self._get_trlc_ast_walker()
+        schema = self._get_record_type_schema(record)
 
         for name, value in record.field.items():
-            attribute_name = self._translate_attribute_name(translation, name)
+            attribute_name = schema.fields[name].get_attribute_name(translation)
 
             cells = table.add_row().cells
             cells[0].text = attribute_name
@@ -435,6 +594,12 @@ class DocxConverter(BaseConverter):
 
         return Ret.OK
 
+    def _flush(self) -> None:
+        # lobster-trace: SwRequirements.sw_req_docx_stream
+        """Write the completed blocks of the document body with the stream writer, if it is used."""
+        if self._stream_writer is not None:
+            self._stream_writer.flush()
+
     @staticmethod
     def docx_add_bookmark(paragraph: Paragraph, bookmark_name: str) -> None:
         # lobster-trace: SwRequirements.sw_req_docx_record
@@ -0,0 +1,243 @@
+"""Streaming writer of docx documents.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import tempfile
+from typing import IO, Any, Callable, Optional
+from zipfile import ZipFile, ZIP_DEFLATED
+from docx.document import Document
+from docx.opc.packuri import PackURI
+from docx.opc.pkgwriter import PackageWriter
+from docx.oxml.ns import qn
+from lxml import etree
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+
+class DocxStreamWriter():
+    # lobster-trace: SwRequirements.sw_req_docx_stream
+    """Writes the body of a python-docx document incrementally, instead of keeping it in memory.
+
+    python-docx keeps the whole document in one XML tree and inserts every new block
+    before the section properties at the end of the body, which gets slower with every
+    block. The stream writer serializes the blocks, which are complete, into a temporary
+    spool file and removes them from the tree. So the body only holds the blocks of the
+    record currently converted. When the document is written, the spool file is copied
+    in chunks into the main document part of the package. All other parts, e.g. the
+    styles and settings of the template, the images and the relationships, are written
+    like python-docx does.
+
+    The package is identical to the one python-docx writes with Document.save().
+    """
+
+    # Size of the chunks in bytes, the spool file is copied with.
+    CHUNK_SIZE = 64 * 1024
+
+    # Marker in the body, where the spooled blocks are written.
+    _BODY_MARKER = "pyTRLCConverter-body"
+
+    def __init__(self, document: Document) -> None:
+        """Construct the stream writer. The spool file is created with start().
+
+        Args:
+            document (Document): The python-docx document, e.g. loaded from a template.
+        """
+        self._document = document
+        self._spool_file: Optional[IO[bytes]] = None
+        self._document_head = b""
+        self._document_tail = b""
+        self._section_properties_tag = qn("w:sectPr")
+
+        # The namespace declarations of the document element, which lxml repeats at
+        # every block which is serialized on its own.
+        self._namespace_declarations = [
+            (f' xmlns:{prefix}="{uri}"' if prefix is not None else f' xmlns="{uri}"').encode("utf-8")
+            for prefix, uri in document.element.nsmap.items()
+        ]
+
+    def start(self) -> None:
+        # lobster-trace: SwRequirements.sw_req_docx_stream
+        """Start spooling the blocks of the body.
+
+        The document element and the template blocks are kept as serialized head of the
+        main document part, the section properties stay at the end of the body.
+        """
+        body = self._document.element.body
+        # pylint: disable-next=c-extension-no-member
+        marker = etree.Comment(DocxStreamWriter._BODY_MARKER)
+
+        if (0 < len(body)) and (body[-1].tag == self._section_properties_tag):
+            body[-1].addprevious(marker)
+        else:
+            body.append(marker)
+
+        # pylint: disable-next=c-extension-no-member
+        document_xml = etree.tostring(self._document.element, encoding="UTF-8", standalone=True)
+        body.remove(marker)
+
+        marker_xml = f"<!--{DocxStreamWriter._BODY_MARKER}-->".encode("utf-8")
+        self._document_head, self._document_tail = document_xml.split(marker_xml)
+
+        for element in self._get_blocks():
+            body.remove(element)
+
+        # pylint: disable-next=consider-using-with
+        self._spool_file = tempfile.TemporaryFile("w+b", prefix="pyTRLCConverter_docx_")
+
+    def flush(self) -> None:
+        # lobster-trace: SwRequirements.sw_req_docx_stream
+        """Spool all blocks of the body and remove them from the body.
+
+        The section properties at the end of the body are kept.
+        """
+        if self._spool_file is not None:
+            body = self._document.element.body
+
+            for element in self._get_blocks():
+                self._spool_file.write(self._serialize(element))
+                body.remove(element)
+
+    def write(self, file_name: str) -> None:
+        # lobster-trace: SwRequirements.sw_req_docx_stream
+        """Write the docx package with the spooled blocks.
+
+        If spooling is not started yet, the whole body is written like python-docx does.
+
+        Args:
+            file_name (str): The docx file name.
+        """
+        if self._spool_file is None:
+            self.start()
+
+        self.flush()
+
+        package = self._document.part.package
+        parts = list(package.iter_parts())
+
+        for part in parts:
+            part.before_marshal()
+
+        with ZipFile(file_name, "w", compression=ZIP_DEFLATED) as zip_file:
+            package_writer = _PackageZipWriter(zip_file, self._document.part.partname, self._write_document_part)
+
+            # pylint: disable=protected-access
+            PackageWriter._write_content_types_stream(package_writer, parts)
+            PackageWriter._write_pkg_rels(package_writer, package.rels)
+            PackageWriter._write_parts(package_writer, parts)
+            # pylint: enable=protected-access
+
+    def close(self) -> None:
+        # lobster-trace: SwRequirements.sw_req_docx_stream
+        """Close and remove the spool file. The spooled blocks are discarded."""
+        if self._spool_file is not None:
+            self._spool_file.close()
+            self._spool_file = None
+
+    def _get_blocks(self) -> list:
+        """Get the blocks of the body, without the section properties at its end.
+
+        Returns:
+            list: The blocks, e.g. paragraphs and tables.
+        """
+        blocks = list(self._document.element.body)
+
+        if (0 < len(blocks)) and (blocks[-1].tag == self._section_properties_tag):
+            blocks.pop()
+
+        return blocks
+
+    def _serialize(self, element: Any) -> bytes:
+        """Serialize a block of the body without the namespace declarations of the document element.
+
+        Args:
+            element (Any): The block, e.g. a paragraph or a table.
+
+        Returns:
+            bytes: The XML of the block.
+        """
+        # pylint: disable-next=c-extension-no-member
+        xml = etree.tostring(element, encoding="UTF-8")
+        start_tag_end = xml.index(b">")
+        start_tag = xml[:start_tag_end]
+
+        for namespace_declaration in self._namespace_declarations:
+            start_tag = start_tag.replace(namespace_declaration, b"", 1)
+
+        return start_tag + xml[start_tag_end:]
+
+    def _write_document_part(self, zip_file: ZipFile, member_name: str) -> None:
+        """Write the main document part with the spooled blocks.
+
+        Args:
+            zip_file (ZipFile): The docx package.
+            member_name (str): The name of the main document part in the package.
+        """
+        with zip_file.open(member_name, "w", force_zip64=True) as document_part:
+            document_part.write(self._document_head)
+
+            if self._spool_file is not None:
+                self._spool_file.seek(0)
+
+                chunk = self._spool_file.read(DocxStreamWriter.CHUNK_SIZE)
+                while 0 < len(chunk):
+                    document_part.write(chunk)
+                    chunk = self._spool_file.read(DocxStreamWriter.CHUNK_SIZE)
+
+                # Continue spooling at the end, if further blocks are added.
+                self._spool_file.seek(0, 2)
+
+            document_part.write(self._document_tail)
+
+
+# pylint: disable-next=too-few-public-methods
+class _PackageZipWriter():
+    """Writes the parts of a docx package to a ZIP file, the main document part by the stream writer."""
+
+    def __init__(self, zip_file: ZipFile, document_part_name: PackURI,
+                 write_document_part: Callable[[ZipFile, str], None]) -> None:
+        """Construct the package writer.
+
+        Args:
+            zip_file (ZipFile): The ZIP file.
+            document_part_name (PackURI): The name of the main document part.
+            write_document_part (Callable[[ZipFile, str], None]): Writes the main document part.
+        """
+        self._zip_file = zip_file
+        self._document_part_name = document_part_name
+        self._write_document_part = write_document_part
+
+    def write(self, pack_uri: PackURI, blob: bytes) -> None:
+        """Write a part to the ZIP file.
+
+        Args:
+            pack_uri (PackURI): The part name.
+            blob (bytes): The part content, which is ignored for the main document part.
+        """
+        if pack_uri == self._document_part_name:
+            self._write_document_part(self._zip_file, pack_uri.membername)
+        else:
+            self._zip_file.writestr(pack_uri.membername, blob)
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
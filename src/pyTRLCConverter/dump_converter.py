@@ -22,6 +22,7 @@
 # Imports **********************************************************************
 from typing import Optional
 from pyTRLCConverter.base_converter import BaseConverter
+from pyTRLCConverter.converter_registry import DUMP_DESCRIPTION, DUMP_SUBCOMMAND
 from pyTRLCConverter.ret import Ret
 from pyTRLCConverter.trlc_helper import Record_Object
 
@@ -42,7 +43,7 @@ class DumpConverter(BaseConverter):
         Returns:
             str: Parser subcommand token
         """
-        return "dump"
+        return DUMP_SUBCOMMAND
 
     @staticmethod
     def get_description() -> str:
@@ -51,7 +52,7 @@ class DumpConverter(BaseConverter):
         Returns:
             str: Converter description
         """
-        return "Dump TRCL item list to console."
+        return DUMP_DESCRIPTION
 
     def enter_file(self, file_name: str) -> Ret:
         """Enter a file.
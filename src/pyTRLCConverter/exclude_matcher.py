@@ -0,0 +1,100 @@
+"""Matcher of the TRLC files which are excluded from the conversion.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import os
+from typing import Optional
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+
+class ExcludeMatcher():
+    # lobster-trace: SwRequirements.sw_req_cli_exclude
+    """Decides whether a TRLC file is excluded by one of the given paths.
+
+    A file is excluded if it is one of the paths or is located in one of them.
+    The excluded paths are normalized once and the decision is kept per file name,
+    because the same file names are checked over and over again, e.g. for every
+    link to a record.
+    """
+
+    def __init__(self, excluded_paths: Optional[list[str]]) -> None:
+        """Construct the exclude matcher.
+
+        Args:
+            excluded_paths (Optional[list[str]]): The excluded files and folders or None.
+        """
+        self._paths: list[str] = []
+        self._folders: list[str] = []
+        self._is_excluded_by_file_name: dict[str, bool] = {}
+
+        if excluded_paths is not None:
+            for excluded_path in excluded_paths:
+                path = ExcludeMatcher._normalize(excluded_path)
+
+                self._paths.append(path)
+                self._folders.append(path if path.endswith(os.sep) else path + os.sep)
+
+    def is_empty(self) -> bool:
+        """Check whether no path is excluded.
+
+        Returns:
+            bool: True if no path is excluded, otherwise False.
+        """
+        return 0 == len(self._paths)
+
+    def is_excluded(self, file_name: str) -> bool:
+        # lobster-trace: SwRequirements.sw_req_cli_exclude
+        """Check whether the given file is excluded.
+
+        Args:
+            file_name (str): The file name.
+
+        Returns:
+            bool: True if the file is excluded, otherwise False.
+        """
+        is_excluded = self._is_excluded_by_file_name.get(file_name)
+
+        if is_excluded is None:
+            path = ExcludeMatcher._normalize(file_name)
+            is_excluded = (path in self._paths) or path.startswith(tuple(self._folders))
+
+            self._is_excluded_by_file_name[file_name] = is_excluded
+
+        return is_excluded
+
+    @staticmethod
+    def _normalize(path: str) -> str:
+        """Normalize the given path to make it comparable.
+
+        Args:
+            path (str): The path.
+
+        Returns:
+            str: The normalized path.
+        """
+        return os.path.normcase(os.path.normpath(path))
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
@@ -21,18 +21,33 @@ Author: Norbert Schulz (norbert.schulz@newtec.de)
 # If not, see <https://www.gnu.org/licenses/>.
 
 # Imports **********************************************************************
+import contextlib
+import io
+import multiprocessing
 import os
 import traceback
-from typing import Any
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.util import Finalize
+from typing import Any, Optional
 from trlc.ast import Symbol_Table
 
 from pyTRLCConverter.abstract_converter import AbstractConverter
-from pyTRLCConverter.logger import log_verbose, log_error
+from pyTRLCConverter.base_converter import BaseConverter
+from pyTRLCConverter.build_cache import BuildCache
+from pyTRLCConverter.exclude_matcher import ExcludeMatcher
+from pyTRLCConverter.logger import enable_verbose, log_verbose, log_error
+from pyTRLCConverter.profiler import is_profiling_enabled, profile_file, profile_phase, profile_record
+from pyTRLCConverter.render_config import RenderConfig
 from pyTRLCConverter.trlc_helper import get_file_dict_from_symbols, is_item_record, is_item_section
 from pyTRLCConverter.ret import Ret
+from pyTRLCConverter.symbols_cache import get_trlc_symbols_cached
 
 # Variables ********************************************************************
 
+# Per worker process context, set up once by the pool initializer.
+_worker_context = {}
+
 # Classes **********************************************************************
 
 
@@ -41,16 +56,20 @@ class ItemWalker:
     # lobster-trace: SwRequirements.sw_req_process_trlc_symbols
     """A walker that traverses through the TRLC items in the given symbol table."""
 
-    def __init__(self, args: Any, converter: AbstractConverter) -> None:
+    def __init__(self, args: Any, converter: AbstractConverter, build_cache: Optional[BuildCache] = None) -> None:
         """
         Initializes the TrlcWalker with the given arguments and converter.
 
         Args:
-            args (Any): Arguments containing the exclude file paths.
+            args (Any): Arguments containing the exclude file paths and the number of jobs.
             converter (AbstractConverter): The converter used for processing items.
+            build_cache (Optional[BuildCache]): Build cache for the incremental conversion or None.
         """
+        self._args = args
         self._converter = converter
-        self._exclude_files = args.exclude
+        self._exclude_matcher = ExcludeMatcher(args.exclude)
+        self._jobs = getattr(args, "jobs", 1)
+        self._build_cache = build_cache
 
     def walk_symbols(self, symbol_table: Symbol_Table) -> Ret:
         """
@@ -62,42 +81,183 @@ class ItemWalker:
         Returns:
             Ret: Status of the walk operation.
         """
-        result = self._converter.begin()
+        with profile_phase("begin"):
+            result = self._converter.begin()
 
         if result == Ret.OK:
-            files_dict = get_file_dict_from_symbols(symbol_table)
-            for file_name, item_list in files_dict.items():
-                skip_it = False
+            files_dict = self._get_files_to_walk(symbol_table)
+
+            if self._build_cache is not None:
+                files_dict = self._get_outdated_files(files_dict)
+
+            if self._is_parallel_walk_possible(files_dict) is True:
+                result = self._walk_files_parallel(files_dict)
+
+            else:
+                for file_name, item_list in files_dict.items():
+                    log_verbose(f"Processing file {file_name}.")
+                    result = self._walk_file(file_name, item_list)
 
-                # Normalize the file name to make it comparable.
-                file_name = os.path.normpath(file_name)
+                    if result != Ret.OK:
+                        break
 
-                if self._exclude_files is not None:
-                    for excluded_path in self._exclude_files:
+                    self._update_build_cache(file_name, item_list)
 
-                        # Normalize the excluded path to make it comparable.
-                        excluded_path = os.path.normpath(excluded_path)
+        if result == Ret.OK:
+            with profile_phase("finish"):
+                result = self._converter.finish()
 
-                        if os.path.commonpath([excluded_path, file_name]) == excluded_path:
-                            skip_it = True
-                            break
+        return result
 
-                if skip_it is True:
-                    log_verbose(f"Skipping file {file_name}.")
+    def _get_files_to_walk(self, symbol_table: Symbol_Table) -> dict:
+        # lobster-trace: SwRequirements.sw_req_cli_exclude
+        """
+        Get the files and their items which shall be walked through, without the excluded ones.
 
+        Args:
+            symbol_table (Symbol_Table): The symbol table containing items to be walked through.
+
+        Returns:
+            dict: The normalized file names and their list of items.
+        """
+        files_to_walk = {}
+
+        for file_name, item_list in get_file_dict_from_symbols(symbol_table).items():
+            # Normalize the file name to make it comparable.
+            file_name = os.path.normpath(file_name)
+
+            if self._exclude_matcher.is_excluded(file_name) is True:
+                log_verbose(f"Skipping file {file_name}.")
+            else:
+                files_to_walk[file_name] = item_list
+
+        return files_to_walk
+
+    def _get_outdated_files(self, files_dict: dict) -> dict:
+        # lobster-trace: SwRequirements.sw_req_cli_cache_dir
+        """
+        Get the files whose output is not up to date anymore.
+
+        Only a converter which writes every file independently of the others can skip
+        single files. Otherwise all files are walked through.
+
+        Args:
+            files_dict (dict): The files which shall be walked through.
+
+        Returns:
+            dict: The files which need to be walked through.
+        """
+        outdated_files = files_dict
+
+        if isinstance(self._converter, BaseConverter) and \
+           (self._converter.is_parallel_file_processing_supported() is True):
+            outdated_files = {}
+
+            for file_name, item_list in files_dict.items():
+                if self._build_cache.is_file_up_to_date(file_name, item_list) is True:
+                    log_verbose(f"File {file_name} is up to date.")
                 else:
-                    log_verbose(f"Processing file {file_name}.")
-                    result = self._walk_file(file_name, item_list)
+                    outdated_files[file_name] = item_list
 
-                if result != Ret.OK:
-                    break
+        return outdated_files
 
-        if result == Ret.OK:
-            result = self._converter.finish()
+    def _update_build_cache(self, file_name: str, item_list: list) -> None:
+        # lobster-trace: SwRequirements.sw_req_cli_cache_dir
+        """
+        Update the build cache after the given file was walked through successfully.
+
+        Args:
+            file_name (str): The normalized name of the file.
+            item_list (list): The list of trlc items in the file.
+        """
+        if (self._build_cache is not None) and isinstance(self._converter, BaseConverter):
+            output_files = self._converter.get_output_files(file_name)
+
+            if output_files is not None:
+                self._build_cache.update_file(file_name, item_list, output_files)
+
+    def _is_parallel_walk_possible(self, files_dict: dict) -> bool:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        Check whether the files can be walked through by several worker processes.
+
+        This requires more than one job, more than one file and a converter
+        which writes every file independently of the others.
+
+        Args:
+            files_dict (dict): The files which shall be walked through.
+
+        Returns:
+            bool: True if the files can be processed in parallel, otherwise False.
+        """
+        is_possible = False
+
+        if (self._jobs is not None) and (1 < self._jobs) and (1 < len(files_dict)):
+            if isinstance(self._converter, BaseConverter):
+                is_possible = self._converter.is_parallel_file_processing_supported()
+
+            if is_possible is False:
+                log_verbose("Converter doesn't support parallel file processing, continue sequentially.")
+
+            # lobster-trace: SwRequirements.sw_req_cli_profile
+            elif is_profiling_enabled() is True:
+                log_verbose("Profiling measures the main process only, continue sequentially.")
+                is_possible = False
+
+        return is_possible
+
+    def _walk_files_parallel(self, files_dict: dict) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        Walks through the given files by a pool of worker processes.
+
+        Every worker process parses the TRLC sources once and uses its own
+        converter instance. The results are collected in the file order.
+        A worker process which fails to finish its converter, reports it by
+        the finish failed event, which is checked after all workers terminated.
+
+        Args:
+            files_dict (dict): The normalized names of the files to walk through and their items.
+
+        Returns:
+            Ret: The result of the walk operation.
+        """
+        result = Ret.OK
+        file_names = list(files_dict.keys())
+        jobs = min(self._jobs, len(file_names))
+        render_cfg = None
+        mp_context = multiprocessing.get_context()
+        finish_failed = mp_context.Event()
+
+        if isinstance(self._converter, BaseConverter):
+            render_cfg = self._converter.get_render_cfg()
+
+        log_verbose(f"Processing {len(file_names)} files with {jobs} worker processes.")
+
+        try:
+            with ProcessPoolExecutor(max_workers=jobs,
+                                     mp_context=mp_context,
+                                     initializer=_init_worker,
+                                     initargs=(self._args, render_cfg, finish_failed)) as executor:
+                for file_name, file_result in zip(file_names, executor.map(_walk_file_in_worker, file_names)):
+                    if file_result != Ret.OK:
+                        log_error(f"Failed to process file {file_name}.")
+                        result = Ret.ERROR
+                    else:
+                        self._update_build_cache(file_name, files_dict[file_name])
+
+        except (BrokenProcessPool, OSError) as e:
+            log_error(f"Parallel processing failed: {e}")
+            result = Ret.ERROR
+
+        if finish_failed.is_set() is True:
+            log_error("Failed to finish the conversion in a worker process.")
+            result = Ret.ERROR
 
         return result
 
     def _walk_file(self, file_name: str, item_list: Any) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_cli_profile
         """
         Walks through the items in the given file.
 
@@ -111,16 +271,44 @@ class ItemWalker:
         result = Ret.ERROR
 
         try:
-            if Ret.OK == self._converter.enter_file(file_name):
-                if Ret.OK == self._walk_items(item_list):
-                    if Ret.OK == self._converter.leave_file(file_name):
-                        result = Ret.OK
+            with profile_file(file_name):
+                result = self._walk_file_items(file_name, item_list)
 
         except Exception as e:  # pylint: disable=broad-except
             log_error(f"Error processing file {file_name}: {e}")
 
         return result
 
+    def _walk_file_items(self, file_name: str, item_list: Any) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_cli_profile
+        """
+        Enters the given file, walks through its items and leaves it again.
+
+        Args:
+            file_name (str): The name of the file.
+            item_list (Any): The list of trlc items in the file.
+
+        Returns:
+            Ret: The result of the walk operation.
+        """
+        result = Ret.ERROR
+
+        # lobster-trace: SwRequirements.sw_req_plantuml_batch
+        if isinstance(self._converter, BaseConverter):
+            with profile_phase("prefetch"):
+                self._converter.prefetch_plantuml_diagrams(item_list)
+
+        with profile_phase("enter_file"):
+            enter_result = self._converter.enter_file(file_name)
+
+        if Ret.OK == enter_result:
+            if Ret.OK == self._walk_items(item_list):
+                with profile_phase("leave_file"):
+                    if Ret.OK == self._converter.leave_file(file_name):
+                        result = Ret.OK
+
+        return result
+
     def _walk_items(self, item_list: list) -> Ret:
         """
         Walks through the given list of items.
@@ -148,6 +336,7 @@ class ItemWalker:
         return result
 
     def _visit_item(self, item: Any) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_cli_profile
         """
         Visits the given item and processes it based on its type.
 
@@ -160,9 +349,11 @@ class ItemWalker:
         result = Ret.OK
 
         if is_item_section(item):
-            result = self._converter.convert_section(item[0], item[1])
+            with profile_phase("convert_section"):
+                result = self._converter.convert_section(item[0], item[1])
         elif is_item_record(item):
-            result = self._converter.convert_record_object(item[0], item[1])
+            with profile_record(item[0].name, item[0].n_typ.name, item[0].location.file_name):
+                result = self._converter.convert_record_object(item[0], item[1])
         else:
             log_error(f"Unrecognized item type {item}")
             result = Ret.ERROR
@@ -171,5 +362,74 @@ class ItemWalker:
 
 # Functions ********************************************************************
 
+def _init_worker(args: Any, render_cfg: Optional[RenderConfig], finish_failed: Any) -> None:
+    # lobster-trace: SwRequirements.sw_req_cli_jobs
+    """
+    Initialize a worker process of the parallel file processing.
+
+    The TRLC sources are parsed again or taken from the symbols cache, because the
+    symbol table can't be shared between processes. The converter instance lives as long as the worker process
+    and is finished when the worker process terminates. The main process begins and finishes the conversion
+    itself, therefore the worker converter is set up by begin_worker() and released by finish_worker().
+
+    Args:
+        args (Any): The parsed program arguments.
+        render_cfg (Optional[RenderConfig]): The render configuration or None for the default one.
+        finish_failed (Any): Event, which is set if the converter can't be finished.
+    """
+    enable_verbose(args.verbose)
+
+    # The sources were already parsed successfully by the main process, therefore
+    # the TRLC messages shall not be reported once again by every worker.
+    with contextlib.redirect_stdout(io.StringIO()):
+        symbols = get_trlc_symbols_cached(args.source, args.include, args.symbols_cache)
+
+    converter = args.converter_class(args)
+
+    if render_cfg is not None:
+        converter.set_render_cfg(render_cfg)
+
+    walker = ItemWalker(args, converter)
+
+    _worker_context["walker"] = walker
+    _worker_context["files"] = walker._get_files_to_walk(symbols)  # pylint: disable=protected-access
+    _worker_context["begin_result"] = converter.begin_worker()
+
+    # Release the resources of the converter e.g. temporary folders when the worker process terminates.
+    Finalize(converter, _finish_worker, args=(converter, finish_failed), exitpriority=10)
+
+def _finish_worker(converter: BaseConverter, finish_failed: Any) -> None:
+    # lobster-trace: SwRequirements.sw_req_cli_jobs
+    """
+    Finish the converter of a worker process, when the worker process terminates.
+
+    Args:
+        converter (BaseConverter): The converter of the worker process.
+        finish_failed (Any): Event, which is set if the converter can't be finished.
+    """
+    if converter.finish_worker() != Ret.OK:
+        finish_failed.set()
+
+def _walk_file_in_worker(file_name: str) -> Ret:
+    # lobster-trace: SwRequirements.sw_req_cli_jobs
+    """
+    Walk through the given file in a worker process.
+
+    Args:
+        file_name (str): The normalized name of the file to walk through.
+
+    Returns:
+        Ret: The result of the walk operation.
+    """
+    result = Ret.ERROR
+    walker = _worker_context.get("walker")
+    item_list = _worker_context.get("files", {}).get(file_name)
+
+    if (walker is not None) and (item_list is not None) and (_worker_context["begin_result"] == Ret.OK):
+        log_verbose(f"Processing file {file_name}.")
+        result = walker._walk_file(file_name, item_list)  # pylint: disable=protected-access
+
+    return result
+
 
 # Main *************************************************************************
@@ -0,0 +1,114 @@
+"""Index of the link targets of the records in the output documents.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+from typing import Any, Callable
+from pyTRLCConverter.exclude_matcher import ExcludeMatcher
+from pyTRLCConverter.trlc_helper import Record_Object
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+
+class RecordLinkIndex():
+    # lobster-trace: SwRequirements.sw_req_markdown_record
+    # lobster-trace: SwRequirements.sw_req_rst_link
+    """Index from the records to their link targets in the output documents.
+
+    In single document mode a record is located in the single document, except its
+    TRLC file is excluded from the conversion. Then it is expected in the document of
+    its TRLC file. In multiple document mode every record is located in the document
+    of its TRLC file.
+
+    The output document is determined once per TRLC file and the link target once
+    per record, so linking a record again is a single lookup.
+    """
+
+    def __init__(self,
+                 args: Any,
+                 get_output_file_name: Callable[[str], str],
+                 get_link_target: Callable[[str, str], str]) -> None:
+        """Construct the record link index.
+
+        Args:
+            args (Any): The parsed program arguments with the single document mode, the
+                single document name and the excluded paths.
+            get_output_file_name (Callable[[str], str]): Gets the output document name of a TRLC file name.
+            get_link_target (Callable[[str, str], str]): Gets the link target of a record by its
+                output document name and record name.
+        """
+        self._single_document_name = None
+
+        if getattr(args, "single_document", False) is True:
+            self._single_document_name = args.name
+
+        self._exclude_matcher = ExcludeMatcher(args.exclude)
+        self._get_output_file_name = get_output_file_name
+        self._get_link_target = get_link_target
+
+        self._output_file_names: dict[str, str] = {}
+        self._link_targets: dict[Record_Object, str] = {}
+
+    def get_link_target(self, record: Record_Object) -> str:
+        # lobster-trace: SwRequirements.sw_req_markdown_record
+        # lobster-trace: SwRequirements.sw_req_rst_link
+        """Get the link target of the given record.
+
+        Args:
+            record (Record_Object): The record.
+
+        Returns:
+            str: The link target.
+        """
+        link_target = self._link_targets.get(record)
+
+        if link_target is None:
+            link_target = self._get_link_target(self.get_output_file_name(record.location.file_name), record.name)
+            self._link_targets[record] = link_target
+
+        return link_target
+
+    def get_output_file_name(self, file_name: str) -> str:
+        # lobster-trace: SwRequirements.sw_req_cli_exclude
+        """Get the name of the output document, where the records of the given TRLC file are located.
+
+        Args:
+            file_name (str): The TRLC file name.
+
+        Returns:
+            str: The output document name.
+        """
+        output_file_name = self._output_file_names.get(file_name)
+
+        if output_file_name is None:
+            if (self._single_document_name is not None) and (self._exclude_matcher.is_excluded(file_name) is False):
+                output_file_name = self._single_document_name
+            else:
+                output_file_name = self._get_output_file_name(file_name)
+
+            self._output_file_names[file_name] = output_file_name
+
+        return output_file_name
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
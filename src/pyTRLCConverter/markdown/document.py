@@ -1,7 +1,8 @@
 """Markdown document container.
-    Collects Markdown block elements and renders them into a single string.
-    Consecutive blocks are separated by a single blank line, the first block
-    has no leading blank line and the document ends with a single newline.
+    Collects Markdown block elements and renders them into a single string or
+    streams them into a text stream as soon as they are added. Consecutive
+    blocks are separated by a single blank line, the first block has no
+    leading blank line and the document ends with a single newline.
 
     Author: Andreas Merkle (andreas.merkle@newtec.de)
 """
@@ -23,7 +24,8 @@
 # If not, see <https://www.gnu.org/licenses/>.
 
 # Imports **********************************************************************
-from typing import List
+import io
+from typing import List, Optional, TextIO
 from pyTRLCConverter.markdown.element import MarkdownElement
 
 # Variables ********************************************************************
@@ -32,13 +34,24 @@ from pyTRLCConverter.markdown.element import MarkdownElement
 
 
 class MarkdownDocument:
-    """In-memory Markdown document built from block elements.
+    """Markdown document built from block elements.
+
+    Without a writer the elements are kept in memory until the document is rendered.
+    With a writer every element is written as soon as it is added and not kept,
+    which keeps the memory usage independent of the document size.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, writer: Optional[TextIO] = None) -> None:
+        # lobster-trace: SwRequirements.sw_req_markdown_streaming
         """Initialize an empty Markdown document.
+
+        Args:
+            writer (Optional[TextIO]): Text stream the elements are streamed to.
+                                       If None, the elements are kept in memory.
         """
         self._elements: List[MarkdownElement] = []
+        self._writer = writer
+        self._element_count = 0
 
     def add(self, element: MarkdownElement) -> None:
         # lobster-trace: SwRequirements.sw_req_markdown
@@ -47,7 +60,12 @@ class MarkdownDocument:
         Args:
             element (MarkdownElement): Block element to append.
         """
-        self._elements.append(element)
+        if self._writer is None:
+            self._elements.append(element)
+        else:
+            self._write_element(self._writer, element, self._element_count)
+
+        self._element_count += 1
 
     def is_empty(self) -> bool:
         # lobster-trace: SwRequirements.sw_req_markdown
@@ -56,7 +74,7 @@ class MarkdownDocument:
         Returns:
             bool: True if no element has been added, otherwise False.
         """
-        return len(self._elements) == 0
+        return self._element_count == 0
 
     def render(self) -> str:
         # lobster-trace: SwRequirements.sw_req_markdown
@@ -64,10 +82,44 @@ class MarkdownDocument:
         Blocks are separated by a single blank line, the first block has no
         leading blank line and the document ends with a single newline.
 
+        Only available if the document is not streamed.
+
         Returns:
             str: Rendered Markdown document
         """
-        return "\n".join(element.render() for element in self._elements)
+        assert self._writer is None
+
+        writer = io.StringIO()
+        self.write(writer)
+
+        return writer.getvalue()
+
+    def write(self, writer: TextIO) -> None:
+        # lobster-trace: SwRequirements.sw_req_markdown_streaming
+        """Write the whole document element by element into the given text stream.
+        Only available if the document is not streamed.
+
+        Args:
+            writer (TextIO): The text stream to write to.
+        """
+        assert self._writer is None
+
+        for index, element in enumerate(self._elements):
+            self._write_element(writer, element, index)
+
+    @staticmethod
+    def _write_element(writer: TextIO, element: MarkdownElement, index: int) -> None:
+        """Write a single block element, separated by a blank line from the previous one.
+
+        Args:
+            writer (TextIO): The text stream to write to.
+            element (MarkdownElement): Block element to write.
+            index (int): Index of the element in the document.
+        """
+        if 0 < index:
+            writer.write("\n")
+
+        element.write(writer)
 
 # Functions ********************************************************************
 
@@ -1,6 +1,7 @@
 """Markdown block elements.
-    Each element renders itself into a Markdown string. Elements are collected
-    by the MarkdownDocument and rendered once when the output file is written.
+    Each element renders itself into a Markdown string or writes itself directly
+    into a text stream. The MarkdownDocument either collects the elements or
+    streams them to the output file as soon as they are added.
 
     Author: Andreas Merkle (andreas.merkle@newtec.de)
 """
@@ -22,9 +23,10 @@
 # If not, see <https://www.gnu.org/licenses/>.
 
 # Imports **********************************************************************
+import io
 import os
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, TextIO
 from pyTRLCConverter.logger import log_error
 from pyTRLCConverter.markdown.text import MarkdownText
 
@@ -45,6 +47,16 @@ class MarkdownElement(ABC):
             str: Rendered Markdown
         """
 
+    def write(self, writer: TextIO) -> None:
+        # lobster-trace: SwRequirements.sw_req_markdown_streaming
+        """Write the rendered element into the given text stream.
+        Elements with a large output override it to write their parts directly.
+
+        Args:
+            writer (TextIO): The text stream to write to.
+        """
+        writer.write(self.render())
+
 # pylint: disable-next=too-few-public-methods
 class Heading(MarkdownElement):
     """Markdown heading block element.
@@ -108,36 +120,32 @@ class Table(MarkdownElement):
         Returns:
             str: Markdown table
         """
-        table = "<table>\n"
-        table += "<thead>\n"
-        table += "<tr>\n"
+        writer = io.StringIO()
+        self.write(writer)
 
-        for column_title in self._column_titles:
-            table += f"<th>{column_title}</th>\n"
-
-        table += "</tr>\n"
-        table += "</thead>\n"
-        table += "<tbody>\n"
-
-        for row_values in self._rows:
-            table += "<tr>\n"
+        return writer.getvalue()
 
-            for cell_value in row_values:
-                # To allow Markdown content inside table cells, a blank line is required
-                # before and after the cell content.
-                # See https://spec.commonmark.org/0.31.2/#html-blocks
-                table += "<td>\n"
-                table += "\n"
-                table += f"{cell_value}\n"
-                table += "\n"
-                table += "</td>\n"
+    def write(self, writer: TextIO) -> None:
+        # lobster-trace: SwRequirements.sw_req_markdown_table
+        # lobster-trace: SwRequirements.sw_req_markdown_streaming
+        """Write the table in HTML format row by row into the given text stream.
 
-            table += "</tr>\n"
+        Args:
+            writer (TextIO): The text stream to write to.
+        """
+        writer.write("<table>\n<thead>\n<tr>\n")
+        writer.write("".join(f"<th>{column_title}</th>\n" for column_title in self._column_titles))
+        writer.write("</tr>\n</thead>\n<tbody>\n")
 
-        table += "</tbody>\n"
-        table += "</table>\n"
+        for row_values in self._rows:
+            # To allow Markdown content inside table cells, a blank line is required
+            # before and after the cell content.
+            # See https://spec.commonmark.org/0.31.2/#html-blocks
+            writer.write("<tr>\n")
+            writer.write("".join(f"<td>\n\n{cell_value}\n\n</td>\n" for cell_value in row_values))
+            writer.write("</tr>\n")
 
-        return table
+        writer.write("</tbody>\n</table>\n")
 
 # pylint: disable-next=too-few-public-methods
 class BulletList(MarkdownElement):
@@ -162,17 +170,12 @@ class BulletList(MarkdownElement):
         Returns:
             str: Markdown list
         """
-        list_str = ""
-
-        for value_raw in self._values:
-            value = value_raw
-
-            if self._escape is True:  # Escape the value if necessary.
-                value = MarkdownText.escape(value)
+        values = self._values
 
-            list_str += f"- {value}\n"
+        if self._escape is True:  # Escape the values if necessary.
+            values = [MarkdownText.escape(value) for value in values]
 
-        return list_str
+        return "".join(f"- {value}\n" for value in values)
 
 # pylint: disable-next=too-few-public-methods
 class Image(MarkdownElement):
@@ -21,9 +21,16 @@
 # If not, see <https://www.gnu.org/licenses/>.
 
 # Imports **********************************************************************
+from pyTRLCConverter.text_escaper import TextEscaper
 
 # Variables ********************************************************************
 
+# Characters which have a special meaning in Markdown and need to be escaped by a backslash.
+MARKDOWN_ESCAPE_CHARACTERS = ["\\", "`", "*", "_", "{", "}", "[", "]", "<", ">", "(", ")", "#", "+", "-", ".", "!", "|"]
+
+# Escapes the special characters and keeps the escaped short texts in a cache.
+MARKDOWN_ESCAPER = TextEscaper(MARKDOWN_ESCAPE_CHARACTERS)
+
 # Classes **********************************************************************
 
 
@@ -43,12 +50,7 @@ class MarkdownText:
         Returns:
             str: Escaped text
         """
-        characters = ["\\", "`", "*", "_", "{", "}", "[", "]", "<", ">", "(", ")", "#", "+", "-", ".", "!", "|"]
-
-        for character in characters:
-            text = text.replace(character, "\\" + character)
-
-        return text
+        return MARKDOWN_ESCAPER.escape(text)
 
     @staticmethod
     def lf2soft_return(text: str) -> str:
@@ -25,13 +25,15 @@ import os
 import re
 import shutil
 import tempfile
-from typing import Optional, Any
+from typing import Optional, Any, TextIO
 from trlc.ast import Implicit_Null, Record_Object, Record_Reference, String_Literal, Expression
 from pyTRLCConverter.base_converter import BaseConverter
+from pyTRLCConverter.converter_registry import MARKDOWN_DESCRIPTION, MARKDOWN_SUBCOMMAND
+from pyTRLCConverter.link_index import RecordLinkIndex
 from pyTRLCConverter.markdown.document import MarkdownDocument
 from pyTRLCConverter.markdown.element import Heading, Table, BulletList
 from pyTRLCConverter.markdown.text import MarkdownText
-from pyTRLCConverter.plantuml import PlantUML
+from pyTRLCConverter.profiler import profile_phase
 from pyTRLCConverter.ret import Ret
 from pyTRLCConverter.trlc_helper import TrlcAstWalker
 from pyTRLCConverter.logger import log_verbose, log_error
@@ -46,14 +48,19 @@ class MarkdownConverter(BaseConverter):
     MarkdownConverter provides functionality for converting to a markdown format.
 
     The converter builds a Markdown AST (MarkdownDocument made of block elements)
-    while walking the TRLC symbols and writes the output file(s) only once the
-    document is complete (in leave_file() for multiple-document mode and in
-    finish() for single-document mode).
+    while walking the TRLC symbols. Every block element is streamed to the output
+    file as soon as it is added, which keeps the memory usage independent of the
+    document size. The output file is opened in enter_file() and closed in
+    leave_file() for multiple-document mode and opened in begin() and closed in
+    finish() for single-document mode.
     """
 
     OUTPUT_FILE_NAME_DEFAULT = "output.md"
     TOP_LEVEL_DEFAULT = "Specification"
 
+    # Fenced code blocks with PlantUML diagrams, which are replaced by image references.
+    PLANTUML_FENCED_CODE_PATTERN = re.compile(r"```plantuml\n(?P<source>.*?)```", re.DOTALL)
+
     def __init__(self, args: Any) -> None:
         # lobster-trace: SwRequirements.sw_req_no_prj_spec
         # lobster-trace: SwRequirements.sw_req_markdown
@@ -68,16 +75,18 @@ class MarkdownConverter(BaseConverter):
         # The path to the given output folder.
         self._out_path = args.out
 
-        # The excluded paths in normalized form.
-        self._excluded_paths = []
-
-        if args.exclude is not None:
-            self._excluded_paths = [os.path.normpath(path) for path in args.exclude]
+        # The link targets of the records in the output documents.
+        self._record_link_index = RecordLinkIndex(args,
+                                                  self._file_name_trlc_to_md,
+                                                  MarkdownConverter._get_record_link_target)
 
         # The Markdown document currently being built. In multiple-document mode a new
         # document is created per file, in single-document mode one document is shared.
         self._document: Optional[MarkdownDocument] = None
 
+        # The output file the current Markdown document is streamed to.
+        self._out_file: Optional[TextIO] = None
+
         # The base level for the headings. Its the minimum level for the headings which depends
         # on the single/multiple document mode.
         self._base_level = 1
@@ -103,7 +112,7 @@ class MarkdownConverter(BaseConverter):
         Returns:
             str: Parser subcommand token
         """
-        return "markdown"
+        return MARKDOWN_SUBCOMMAND
 
     @staticmethod
     def get_description() -> str:
@@ -114,7 +123,7 @@ class MarkdownConverter(BaseConverter):
         Returns:
             str: Converter description
         """
-        return "Convert into markdown format."
+        return MARKDOWN_DESCRIPTION
 
     @classmethod
     def register(cls, args_parser: Any) -> None:
@@ -207,30 +216,61 @@ class MarkdownConverter(BaseConverter):
             else:
                 log_verbose("Multiple document mode.")
 
-            # Set the value for empty attributes.
-            self._empty_attribute_value = self._args.empty
-
-            log_verbose(f"Empty attribute value: {self._empty_attribute_value}")
-
-            if self._args.render_plantuml is True:
-                # pylint: disable-next=consider-using-with
-                self._plantuml_tmp_dir = tempfile.TemporaryDirectory(
-                    prefix="pyTRLCConverter_markdown_"
-                )
+            self._prepare_conversion()
 
             # Single document mode?
             if self._args.single_document is True:
-                self._document = MarkdownDocument()
+                result = self._open_document(self._args.name)
+
+                if result == Ret.OK:
+                    assert self._document is not None
 
-                # The top level heading is always required in single document mode.
-                self._document.add(Heading(self._args.top_level, 1))
-                self._is_top_level_heading_req = False
+                    # The top level heading is always required in single document mode.
+                    self._document.add(Heading(self._args.top_level, 1))
+                    self._is_top_level_heading_req = False
 
-                # All headings will be shifted by one level.
-                self._base_level = self._base_level + 1
+                    # All headings will be shifted by one level.
+                    self._base_level = self._base_level + 1
 
         return result
 
+    def is_parallel_file_processing_supported(self) -> bool:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """Check whether the files can be converted by independent converter instances in parallel.
+
+        This is the case in multiple document mode.
+
+        Returns:
+            bool: True if parallel file processing is supported, otherwise False.
+        """
+        return self._args.single_document is False
+
+    def get_output_files(self, file_name: str) -> Optional[list[str]]:
+        # lobster-trace: SwRequirements.sw_req_cli_cache_dir
+        """Get the output files which are written for the given TRLC file.
+
+        Args:
+            file_name (str): The TRLC file name.
+
+        Returns:
+            Optional[list[str]]: The output files.
+        """
+        output_file_name = self._args.name
+
+        if self._args.single_document is False:
+            output_file_name = self._file_name_trlc_to_md(file_name)
+
+        return [os.path.join(self._out_path, output_file_name)]
+
+    def _get_plantuml_diagram_type(self) -> Optional[str]:
+        # lobster-trace: SwRequirements.sw_req_plantuml_batch
+        """Get the type of the images the converter renders PlantUML diagrams to.
+
+        Returns:
+            Optional[str]: Diagram type svg if --render-plantuml is given, otherwise None.
+        """
+        return "svg" if self._args.render_plantuml is True else None
+
     def enter_file(self, file_name: str) -> Ret:
         # lobster-trace: SwRequirements.sw_req_markdown_multiple_doc_mode
         """
@@ -242,16 +282,18 @@ class MarkdownConverter(BaseConverter):
         Returns:
             Ret: Status
         """
+        result = Ret.OK
+
         # Multiple document mode?
         if self._args.single_document is False:
             assert self._document is None
 
             # A new document is built for each file. The very first written Markdown part
             # shall not have an empty line before, which the document handles implicitly.
-            self._document = MarkdownDocument()
+            result = self._open_document(self._file_name_trlc_to_md(file_name))
             self._is_top_level_heading_req = True
 
-        return Ret.OK
+        return result
 
     def leave_file(self, file_name: str) -> Ret:
         # lobster-trace: SwRequirements.sw_req_markdown_multiple_doc_mode
@@ -270,8 +312,7 @@ class MarkdownConverter(BaseConverter):
         if self._args.single_document is False:
             assert self._document is not None
 
-            file_name_md = self._file_name_trlc_to_md(file_name)
-            result = self._write_document(file_name_md)
+            result = self._close_document()
 
             self._copy_external_files(self._out_path)
             self._external_files = []
@@ -342,18 +383,63 @@ class MarkdownConverter(BaseConverter):
         if self._args.single_document is True:
             assert self._document is not None
 
-            result = self._write_document(self._args.name)
+            result = self._close_document()
 
             self._copy_external_files(self._out_path)
             self._external_files = []
             self._document = None
 
+        self._release_plantuml_tmp_dir()
+
+        return result
+
+    def begin_worker(self) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        Begin the conversion in a worker process of the parallel file processing.
+
+        Returns:
+            Ret: Status
+        """
+        result = BaseConverter.begin_worker(self)
+
+        if result == Ret.OK:
+            self._prepare_conversion()
+
+        return result
+
+    def finish_worker(self) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        Finish the conversion in a worker process of the parallel file processing.
+
+        Returns:
+            Ret: Status
+        """
+        self._release_plantuml_tmp_dir()
+
+        return Ret.OK
+
+    def _prepare_conversion(self) -> None:
+        """Set the value for empty attributes and create the folder for the rendered PlantUML diagrams.
+        """
+        self._empty_attribute_value = self._args.empty
+
+        log_verbose(f"Empty attribute value: {self._empty_attribute_value}")
+
+        if self._args.render_plantuml is True:
+            # pylint: disable-next=consider-using-with
+            self._plantuml_tmp_dir = tempfile.TemporaryDirectory(
+                prefix="pyTRLCConverter_markdown_"
+            )
+
+    def _release_plantuml_tmp_dir(self) -> None:
+        """Remove the folder for the rendered PlantUML diagrams.
+        """
         if self._plantuml_tmp_dir is not None:
             self._plantuml_tmp_dir.cleanup()
             self._plantuml_tmp_dir = None
 
-        return result
-
     def _add_top_level_heading_on_demand(self) -> None:
         # lobster-trace: SwRequirements.sw_req_markdown_md_top_level
         # lobster-trace: SwRequirements.sw_req_markdown_sd_top_level
@@ -395,10 +481,11 @@ class MarkdownConverter(BaseConverter):
 
         return file_name
 
-    def _write_document(self, file_name: str) -> Ret:
+    def _open_document(self, file_name: str) -> Ret:
         # lobster-trace: SwRequirements.sw_req_markdown_out_folder
+        # lobster-trace: SwRequirements.sw_req_markdown_streaming
         """
-        Write the current Markdown document to the output file.
+        Open the output file and create the Markdown document, which is streamed to it.
 
         Args:
             file_name (str): The output file name without path.
@@ -406,7 +493,7 @@ class MarkdownConverter(BaseConverter):
         Returns:
             Ret: Status
         """
-        assert self._document is not None
+        assert self._out_file is None
 
         result = Ret.OK
         file_name_with_path = file_name
@@ -416,14 +503,39 @@ class MarkdownConverter(BaseConverter):
             file_name_with_path = os.path.join(self._out_path, file_name)
 
         try:
-            with open(file_name_with_path, "w", encoding="utf-8") as out_file:
-                out_file.write(self._document.render())
+            # pylint: disable-next=consider-using-with
+            self._out_file = open(file_name_with_path, "w", encoding="utf-8")
+            self._document = MarkdownDocument(self._out_file)
         except IOError as e:
             log_error(f"Failed to open file {file_name_with_path}: {e}")
             result = Ret.ERROR
 
         return result
 
+    def _close_document(self) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_markdown_out_folder
+        # lobster-trace: SwRequirements.sw_req_markdown_streaming
+        """
+        Close the output file of the current Markdown document.
+
+        Returns:
+            Ret: Status
+        """
+        assert self._out_file is not None
+
+        result = Ret.OK
+
+        try:
+            with profile_phase("write"):
+                self._out_file.close()
+        except IOError as e:
+            log_error(f"Failed to write file {self._out_file.name}: {e}")
+            result = Ret.ERROR
+
+        self._out_file = None
+
+        return result
+
     def _on_implict_null(self, _: Implicit_Null) -> str:
         # lobster-trace: SwRequirements.sw_req_markdown_record
         """
@@ -467,7 +579,7 @@ class MarkdownConverter(BaseConverter):
             type_name = self._ast_meta_data.get("type_name", "")
             attribute_name = self._ast_meta_data.get("attribute_name", "")
 
-            result = self._render(package_name, type_name, attribute_name, result)
+            result = self._render_attribute(package_name, type_name, attribute_name, result)
 
         return result
 
@@ -486,28 +598,24 @@ class MarkdownConverter(BaseConverter):
         """
         assert record_reference.target is not None
 
-        file_name = ""
-
-        # Single document mode?
-        if self._args.single_document is True:
-            file_name = self._args.name
+        anchor_tag = self._record_link_index.get_link_target(record_reference.target)
 
-            # Is the link to a excluded file?
-            for excluded_path in self._excluded_paths:
-
-                if os.path.commonpath([excluded_path, record_reference.target.location.file_name]) == excluded_path:
-                    file_name = self._file_name_trlc_to_md(record_reference.target.location.file_name)
-                    break
-
-        # Multiple document mode
-        else:
-            file_name = self._file_name_trlc_to_md(record_reference.target.location.file_name)
+        return MarkdownText.link(str(record_reference.to_python_object()), anchor_tag)
 
-        record_name = record_reference.target.name
+    @staticmethod
+    def _get_record_link_target(file_name: str, record_name: str) -> str:
+        # lobster-trace: SwRequirements.sw_req_markdown_record
+        """
+        Get the link target of a record in a Markdown document.
 
-        anchor_tag = file_name + "#" + record_name.lower().replace(" ", "-")
+        Args:
+            file_name (str): The Markdown file name.
+            record_name (str): The record name.
 
-        return MarkdownText.link(str(record_reference.to_python_object()), anchor_tag)
+        Returns:
+            str: The link target with the file name and the anchor of the record.
+        """
+        return file_name + "#" + record_name.lower().replace(" ", "-")
 
     def _other_dispatcher(self, expression: Expression) -> str:
         # lobster-trace: SwRequirements.sw_req_markdown_record
@@ -523,7 +631,7 @@ class MarkdownConverter(BaseConverter):
         """
         return MarkdownText.escape(expression.to_string())
 
-    def _get_trlc_ast_walker(self) -> TrlcAstWalker:
+    def _create_trlc_ast_walker(self) -> TrlcAstWalker:
         # lobster-trace: SwRequirements.sw_req_markdown_record
         # lobster-trace: SwRequirements.sw_req_markdown_escape
         # lobster-trace: SwRequirements.sw_req_markdown_string_format
@@ -609,10 +717,9 @@ class MarkdownConverter(BaseConverter):
         assert self._plantuml_tmp_dir is not None
 
         def _replace(match: re.Match) -> str:
-            diagram_source = match.group(1)
+            diagram_source = match.group("source")
             try:
-                plantuml = PlantUML()
-                svg_bytes = plantuml.generate_to_bytes("svg", diagram_source)
+                svg_bytes = self._get_plantuml().generate_to_bytes("svg", diagram_source)
                 digest = hashlib.sha1(diagram_source.encode("utf-8")).hexdigest()[:12]
                 local_name = f"plantuml_{digest}.svg"
                 svg_path = os.path.join(self._plantuml_tmp_dir.name, local_name)
@@ -623,7 +730,7 @@ class MarkdownConverter(BaseConverter):
             except (FileNotFoundError, OSError) as exc:
                 return f"[PlantUML error: {exc}]"
 
-        return re.sub(r"```plantuml\n(.*?)```", _replace, text, flags=re.DOTALL)
+        return self.PLANTUML_FENCED_CODE_PATTERN.sub(_replace, text)
 
     def _copy_external_files(self, dest_dir: str) -> None:
         # lobster-trace: SwRequirements.sw_req_markdown_render_plantuml
@@ -672,9 +779,10 @@ class MarkdownConverter(BaseConverter):
 
         # Walk through the record object fields and build the table rows.
         trlc_ast_walker = self._get_trlc_ast_walker()
+        schema = self._get_record_type_schema(record)
 
         for name, value in record.field.items():
-            attribute_name = self._translate_attribute_name(translation, name)
+            attribute_name = schema.fields[name].get_attribute_name(translation)
             attribute_name = MarkdownText.escape(attribute_name)
 
             # Retrieve the attribute value by processing the field value.
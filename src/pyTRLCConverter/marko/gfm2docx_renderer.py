@@ -24,22 +24,18 @@
 
 from __future__ import annotations
 from typing import Any, Optional
-from docx.blkcntnr import BlockItemContainer
-from pyTRLCConverter.marko.md2docx_renderer import Md2DocxRenderer, Singleton
+from pyTRLCConverter.marko.md2docx_renderer import Md2DocxRenderer
 
 # Variables ********************************************************************
 
 # Classes **********************************************************************
 
-class Gfm2DocxRenderer(Md2DocxRenderer, metaclass=Singleton):
+class Gfm2DocxRenderer(Md2DocxRenderer):
     # lobster-trace: SwRequirements.sw_req_docx_render_gfm
     """Renderer for DOCX output.
     It is used to convert GitHub Flavored Markdown to DOCX format.
     """
 
-    # DOCX block item container to add content to.
-    block_item_container: Optional[BlockItemContainer] = None
-
     def __init__(self) -> None:
         """Initialize the renderer."""
         self._checkbox_prefix: Optional[str] = None
@@ -0,0 +1,102 @@
+"""Reusable marko parser and renderer setup.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import threading
+from typing import Any, Optional
+from marko import Markdown, Renderer
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+
+# pylint: disable-next=too-few-public-methods
+class MarkoRenderer():
+    # lobster-trace: SwRequirements.sw_req_render_markdown_reuse
+    """Renders Markdown text with a marko parser and renderer, which are set up only once.
+
+    marko builds the parser and the renderer with the mixins of all extensions on the
+    first conversion of a Markdown instance. The instance is kept and reused for every
+    further Markdown text. A Markdown instance is not thread-safe, therefore every
+    thread gets its own one.
+
+    The per conversion state, e.g. the docx block item container, is passed as
+    keyword arguments and set as attributes of the renderer instance for the
+    duration of the rendering.
+    """
+
+    def __init__(self, renderer: type[Renderer], extensions: Optional[list[str]] = None) -> None:
+        """Construct the marko renderer. The marko objects are created on first use per thread.
+
+        Args:
+            renderer (type[Renderer]): The marko renderer class.
+            extensions (Optional[list[str]]): The marko extensions, e.g. gfm, or None.
+        """
+        self._renderer = renderer
+        self._extensions = extensions if extensions is not None else []
+        self._thread_local = threading.local()
+
+    def convert(self, text: str, **render_context: Any) -> Any:
+        # lobster-trace: SwRequirements.sw_req_render_markdown_reuse
+        """Parse and render the given Markdown text.
+
+        Args:
+            text (str): The Markdown text.
+            **render_context (Any): The per conversion attributes of the renderer, e.g. the
+                block item container. They are reset to None after rendering.
+
+        Returns:
+            Any: The rendered result, e.g. a string or None if the renderer adds the
+                content to a document.
+        """
+        markdown = self._get_markdown()
+        document = markdown.parse(text)
+
+        for name, value in render_context.items():
+            assert hasattr(markdown.renderer, name), f"Unknown renderer attribute {name}."
+            setattr(markdown.renderer, name, value)
+
+        try:
+            result = markdown.render(document)
+        finally:
+            for name in render_context:
+                setattr(markdown.renderer, name, None)
+
+        return result
+
+    def _get_markdown(self) -> Markdown:
+        """Get the Markdown instance of the current thread, it is created on first use.
+
+        Returns:
+            Markdown: The Markdown instance.
+        """
+        markdown = getattr(self._thread_local, "markdown", None)
+
+        if markdown is None:
+            markdown = Markdown(renderer=self._renderer, extensions=self._extensions)
+            self._thread_local.markdown = markdown
+
+        return markdown
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
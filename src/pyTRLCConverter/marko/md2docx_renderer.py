@@ -24,7 +24,6 @@
 
 from __future__ import annotations
 import io
-import tempfile
 from typing import TYPE_CHECKING, Any, cast, Optional
 from marko import Renderer
 from docx.oxml import OxmlElement
@@ -39,36 +38,26 @@ if TYPE_CHECKING:
 
 # Classes **********************************************************************
 
-class Singleton(type):
-    # lobster-trace: SwRequirements.sw_req_docx_render_md
-    """Singleton metaclass to ensure only one instance of a class exists."""
-
-    _instances = {}
-
-    def __call__(cls, *args, **kwargs):
-        """
-        Returns the singleton instance of the class.
-
-        Returns:
-            instance (cls): The singleton instance of the class.
-        """
-
-        if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
-
-        return cls._instances[cls]
-
 # pylint: disable-next=too-many-public-methods, too-many-instance-attributes
-class Md2DocxRenderer(Renderer, metaclass=Singleton):
+class Md2DocxRenderer(Renderer):
     # lobster-trace: SwRequirements.sw_req_docx_render_md
-    """Renderer for docx output."""
+    # lobster-trace: SwRequirements.sw_req_render_markdown_reuse
+    """Renderer for docx output.
 
-    # Docx block item container to add content to.
-    block_item_container: Optional[BlockItemContainer] = None
+    The renderer is reused for every conversion, the docx block item container
+    to add the content to is set per conversion.
+    """
 
     def __init__(self) -> None:
         """Initialize the renderer."""
         super().__init__()
+
+        # Docx block item container to add content to.
+        self.block_item_container: Optional[BlockItemContainer] = None
+
+        # PlantUML image generator of the converter, which holds the images rendered in advance.
+        self.plantuml: Optional[PlantUML] = None
+
         self._list_indent_level = 0
         self._is_italic = False
         self._is_bold = False
@@ -84,7 +73,7 @@ class Md2DocxRenderer(Renderer, metaclass=Singleton):
     def reset(self) -> None:
         """Resets the renderer state before a new convert() call.
 
-        The Singleton pattern means __init__ runs only once. Without an explicit reset,
+        The renderer is reused, so __init__ runs only once. Without an explicit reset,
         stale state from a previous convert() call (e.g. _current_paragraph) would persist
         into the next call and cause spurious empty paragraphs in the output.
         """
@@ -100,6 +89,15 @@ class Md2DocxRenderer(Renderer, metaclass=Singleton):
         self._is_quote = False
         self._current_paragraph = None
 
+    def __enter__(self) -> Md2DocxRenderer:
+        """Reset the renderer state, marko enters the renderer for every rendering.
+
+        Returns:
+            Md2DocxRenderer: The renderer.
+        """
+        self.reset()
+        return super().__enter__()
+
     def render_children(self, element: Any) -> None:
         """
         Recursively renders child elements of a given element to
@@ -120,7 +118,7 @@ class Md2DocxRenderer(Renderer, metaclass=Singleton):
         """
         assert self.block_item_container is not None
 
-        # The Singleton pattern means __init__ runs only once, so _current_paragraph persists
+        # The renderer is reused, so __init__ runs only once and _current_paragraph persists
         # across convert() calls. Each paragraph element must own exactly one docx paragraph for
         # the duration of rendering its inline children — set it here and clear it after.
         self._current_paragraph = self.block_item_container.add_paragraph()
@@ -218,21 +216,10 @@ class Md2DocxRenderer(Renderer, metaclass=Singleton):
         assert self.block_item_container is not None
 
         try:
-            plantuml = PlantUML()
-            with tempfile.TemporaryDirectory() as tmp_dir:
-                # Write the diagram source to a temp file so PlantUML can read it.
-                with tempfile.NamedTemporaryFile(
-                    dir=tmp_dir, suffix=".puml", mode='w',
-                    encoding='utf-8', delete=False
-                ) as src_file:
-                    src_file.write(diagram_source)
-                    src_name = src_file.name
-                # PNG is required: python-docx's add_picture() only accepts raster formats;
-                # SVG is not supported.
-                plantuml.generate("png", src_name, tmp_dir)
-                png_path = src_name.replace(".puml", ".png")
-                with open(png_path, 'rb') as png_file:
-                    png_bytes = png_file.read()
+            plantuml = self.plantuml if self.plantuml is not None else PlantUML()
+            # PNG is required: python-docx's add_picture() only accepts raster formats;
+            # SVG is not supported.
+            png_bytes = plantuml.generate_to_bytes("png", diagram_source)
 
             paragraph = self.block_item_container.add_paragraph()
             run = paragraph.add_run()
@@ -50,16 +50,24 @@ class Md2ReqifRenderer(HTMLRenderer):
     class as ``<pre><code>`` blocks.
     """
 
-    # Destination directory where generated SVG images are written. The
-    # converter is responsible for setting this before each ``convert()`` call
-    # and for ensuring the directory exists and survives until the external
-    # files have been copied to the final output location.
-    image_dir: Optional[str] = None
+    def __init__(self) -> None:
+        # lobster-trace: SwRequirements.sw_req_render_markdown_reuse
+        """Initialize the renderer."""
+        super().__init__()
 
-    # List of ``(source_path, local_name)`` tuples collected during rendering.
-    # The converter merges these into its own ``_external_files`` list so the
-    # images are copied alongside the ReqIF document.
-    external_files: Optional[list] = None
+        # Destination directory where generated SVG images are written. The
+        # converter is responsible for setting this for each conversion and for
+        # ensuring the directory exists and survives until the external files
+        # have been copied to the final output location.
+        self.image_dir: Optional[str] = None
+
+        # List of ``(source_path, local_name)`` tuples collected during rendering.
+        # The converter passes its own ``_external_files`` list so the images are
+        # copied alongside the ReqIF document.
+        self.external_files: Optional[list] = None
+
+        # PlantUML image generator of the converter, which holds the images rendered in advance.
+        self.plantuml: Optional[PlantUML] = None
 
     def render_fenced_code(self, element: "block.FencedCode") -> str:
         # lobster-trace: SwRequirements.sw_req_reqif_render_md
@@ -103,11 +111,11 @@ class Md2ReqifRenderer(HTMLRenderer):
             str: XHTML fragment referencing the generated image, or an error
                 paragraph if image generation failed.
         """
-        assert Md2ReqifRenderer.image_dir is not None
-        assert Md2ReqifRenderer.external_files is not None
+        assert self.image_dir is not None
+        assert self.external_files is not None
 
         try:
-            plantuml = PlantUML()
+            plantuml = self.plantuml if self.plantuml is not None else PlantUML()
             svg_bytes = plantuml.generate_to_bytes("svg", diagram_source)
 
             # Derive a stable, content-addressed file name from the diagram
@@ -116,11 +124,11 @@ class Md2ReqifRenderer(HTMLRenderer):
             # same output directory (multi-document mode).
             digest = hashlib.sha1(diagram_source.encode("utf-8")).hexdigest()[:12]
             local_name = f"plantuml_{digest}.svg"
-            svg_path = os.path.join(Md2ReqifRenderer.image_dir, local_name)
+            svg_path = os.path.join(self.image_dir, local_name)
             with open(svg_path, "wb") as svg_file:
                 svg_file.write(svg_bytes)
 
-            Md2ReqifRenderer.external_files.append((svg_path, local_name))
+            self.external_files.append((svg_path, local_name))
 
             result = f'<p><object type="image/svg+xml" data="{html.escape(local_name)}"></object></p>\n'
         except (FileNotFoundError, OSError) as exc:
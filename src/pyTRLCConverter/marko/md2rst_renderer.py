@@ -48,19 +48,32 @@ class Md2RstRenderer(Renderer):
     ``.. image::`` directives.
     """
 
-    # Destination directory where generated PNG images are written.
-    image_dir: Optional[str] = None
-
-    # List of ``(source_path, local_name)`` tuples collected during rendering.
-    external_files: Optional[list] = None
-
     def __init__(self) -> None:
+        # lobster-trace: SwRequirements.sw_req_render_markdown_reuse
         """
         Initializes the renderer.
         """
         super().__init__()
         self._list_indent_level = 0
 
+        # Destination directory where generated SVG images are written, set per conversion.
+        self.image_dir: Optional[str] = None
+
+        # List of ``(source_path, local_name)`` tuples collected during rendering, set per conversion.
+        self.external_files: Optional[list] = None
+
+        # PlantUML image generator of the converter, which holds the images rendered in advance.
+        self.plantuml: Optional[PlantUML] = None
+
+    def __enter__(self) -> Md2RstRenderer:
+        """Reset the renderer state, marko enters the renderer for every rendering.
+
+        Returns:
+            Md2RstRenderer: The renderer.
+        """
+        self._list_indent_level = 0
+        return super().__enter__()
+
     def render_paragraph(self, element: block.Paragraph) -> str:
         """
         Renders a paragraph element.
@@ -171,20 +184,20 @@ class Md2RstRenderer(Renderer):
             str: RST fragment referencing the generated image, or an error
                 paragraph if image generation failed.
         """
-        assert Md2RstRenderer.image_dir is not None
-        assert Md2RstRenderer.external_files is not None
+        assert self.image_dir is not None
+        assert self.external_files is not None
 
         try:
-            plantuml = PlantUML()
+            plantuml = self.plantuml if self.plantuml is not None else PlantUML()
             svg_bytes = plantuml.generate_to_bytes("svg", diagram_source)
 
             digest = hashlib.sha1(diagram_source.encode("utf-8")).hexdigest()[:12]
             local_name = f"plantuml_{digest}.svg"
-            svg_path = os.path.join(Md2RstRenderer.image_dir, local_name)
+            svg_path = os.path.join(self.image_dir, local_name)
             with open(svg_path, "wb") as svg_file:
                 svg_file.write(svg_bytes)
 
-            Md2RstRenderer.external_files.append((svg_path, local_name))
+            self.external_files.append((svg_path, local_name))
 
             result = f".. image:: {local_name}\n\n"
         except (FileNotFoundError, OSError) as exc:
@@ -0,0 +1,471 @@
+"""Converter which drives several converters with a single walk over the TRLC symbols.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import argparse
+import os
+import shlex
+from typing import Any, Callable, Optional
+from pyTRLCConverter.abstract_converter import AbstractConverter
+from pyTRLCConverter.base_converter import BaseConverter
+from pyTRLCConverter.converter_registry import MULTI_DESCRIPTION, MULTI_SUBCOMMAND
+from pyTRLCConverter.logger import log_error, log_verbose
+from pyTRLCConverter.ret import Ret
+from pyTRLCConverter.trlc_helper import Record_Object
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+
+# The records are forwarded by convert_record_object(), there is no generic record conversion.
+# pylint: disable-next=abstract-method
+class MultiConverter(BaseConverter):
+    # lobster-trace: SwRequirements.sw_req_multi
+    """Converter which forwards every TRLC item to several converters.
+
+    The TRLC sources are processed once and the TRLC symbols are walked once for
+    all target formats. Every target converter writes to its own sub folder of the
+    output folder, which is named like its subcommand.
+    """
+
+    # The argument sub parsers of all registered converters, to parse the target converter arguments.
+    _args_sub_parser = None
+
+    def __init__(self, args: Any) -> None:
+        # lobster-trace: SwRequirements.sw_req_multi
+        """
+        Initializes the converter.
+
+        Args:
+            args (Any): The parsed program arguments.
+        """
+        super().__init__(args)
+
+        # The target converters, created in begin().
+        self._converters: list[AbstractConverter] = []
+
+        # lobster-trace: SwRequirements.sw_req_cli_watch
+        # The target converters of the previous conversion, whose caches are taken over.
+        self._previous_converters: list[AbstractConverter] = []
+
+    @staticmethod
+    def get_subcommand() -> str:
+        """ Return subcommand token for this converter.
+
+        Returns:
+            str: Parser subcommand token
+        """
+        return MULTI_SUBCOMMAND
+
+    @staticmethod
+    def get_description() -> str:
+        """ Return converter description.
+
+        Returns:
+            str: Converter description
+        """
+        return MULTI_DESCRIPTION
+
+    @classmethod
+    def register(cls, args_parser: Any) -> None:
+        # lobster-trace: SwRequirements.sw_req_multi
+        """Register converter specific argument parser.
+
+        Args:
+            args_parser (Any): Argument parser
+        """
+        super().register(args_parser)
+
+        assert BaseConverter._parser is not None
+
+        MultiConverter._args_sub_parser = args_parser
+
+        BaseConverter._parser.add_argument(
+            "--to",
+            type=MultiConverter._comma_separated_list,
+            required=True,
+            help="Comma separated list of the converter subcommands, e.g. markdown,rst,docx,reqif."
+        )
+
+        BaseConverter._parser.add_argument(
+            "--converter-args",
+            type=str,
+            action="append",
+            default=[],
+            required=False,
+            metavar="SUBCOMMAND=ARGS",
+            help="Arguments of a target converter, e.g. \"markdown=--single-document --name all.md\". "
+                 "Can be given once per target converter."
+        )
+
+        BaseConverter._parser.set_defaults(target_args=None)
+
+    def begin(self) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_multi
+        """Create the target converters and begin their conversion.
+
+        Returns:
+            Ret: Status
+        """
+        return self._begin_targets(lambda converter: converter.begin())
+
+    def begin_worker(self) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_multi
+        """Create the target converters and begin their conversion in a worker process.
+
+        Returns:
+            Ret: Status
+        """
+        return self._begin_targets(
+            lambda converter: converter.begin_worker() if isinstance(converter, BaseConverter) else Ret.ERROR
+        )
+
+    def take_over_caches(self, converter: BaseConverter) -> None:
+        # lobster-trace: SwRequirements.sw_req_cli_watch
+        """Take over the caches of the target converters of the previous conversion.
+
+        The target converters are created in begin(), they take over the caches then.
+
+        Args:
+            converter (BaseConverter): The converter of the previous conversion of the same class.
+        """
+        super().take_over_caches(converter)
+
+        if isinstance(converter, MultiConverter):
+            self._previous_converters = converter._converters  # pylint: disable=protected-access
+
+    def is_parallel_file_processing_supported(self) -> bool:
+        # lobster-trace: SwRequirements.sw_req_multi
+        """Check whether the files can be converted by independent converter instances in parallel.
+
+        This is the case if all target converters support it.
+
+        Returns:
+            bool: True if parallel file processing is supported, otherwise False.
+        """
+        return all(isinstance(converter, BaseConverter) and converter.is_parallel_file_processing_supported()
+                   for converter in self._converters)
+
+    def get_output_files(self, file_name: str) -> Optional[list[str]]:
+        # lobster-trace: SwRequirements.sw_req_multi
+        """Get the output files which are written by all target converters for the given TRLC file.
+
+        Args:
+            file_name (str): The TRLC file name.
+
+        Returns:
+            Optional[list[str]]: The output files or None if unknown for at least one target converter.
+        """
+        output_files = []
+
+        for converter in self._converters:
+            converter_output_files = None
+
+            if isinstance(converter, BaseConverter):
+                converter_output_files = converter.get_output_files(file_name)
+
+            if converter_output_files is None:
+                output_files = None
+                break
+
+            output_files.extend(converter_output_files)
+
+        return output_files
+
+    def prefetch_plantuml_diagrams(self, item_list: list) -> None:
+        # lobster-trace: SwRequirements.sw_req_multi
+        """Let every target converter render the PlantUML diagrams of the given items in advance.
+
+        Args:
+            item_list (list): The list of TRLC items of a file.
+        """
+        for converter in self._converters:
+            if isinstance(converter, BaseConverter):
+                converter.prefetch_plantuml_diagrams(item_list)
+
+    def enter_file(self, file_name: str) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_multi
+        """Enter a file in all target converters.
+
+        Args:
+            file_name (str): File name
+
+        Returns:
+            Ret: Status
+        """
+        return self._forward(lambda converter: converter.enter_file(file_name))
+
+    def leave_file(self, file_name: str) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_multi
+        """Leave a file in all target converters.
+
+        Args:
+            file_name (str): File name
+
+        Returns:
+            Ret: Status
+        """
+        return self._forward(lambda converter: converter.leave_file(file_name))
+
+    def convert_section(self, section: str, level: int) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_multi
+        """Convert the given section with all target converters.
+
+        Args:
+            section (str): The section name
+            level (int): The section indentation level
+
+        Returns:
+            Ret: Status
+        """
+        return self._forward(lambda converter: converter.convert_section(section, level))
+
+    def convert_record_object(self, record: Record_Object, level: int) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_multi
+        """Convert the given record object with all target converters.
+
+        Args:
+            record (Record_Object): The record object.
+            level (int): The record level.
+
+        Returns:
+            Ret: Status
+        """
+        return self._forward(lambda converter: converter.convert_record_object(record, level))
+
+    def finish(self) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_multi
+        """Finish the conversion of all target converters.
+
+        Every target converter is finished, even if another one fails, to release its resources.
+
+        Returns:
+            Ret: Status
+        """
+        result = Ret.OK
+
+        for converter in self._converters:
+            if converter.finish() != Ret.OK:
+                result = Ret.ERROR
+
+        self._converters = []
+
+        return result
+
+    def finish_worker(self) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_multi
+        """Finish the conversion of all target converters in a worker process.
+
+        Returns:
+            Ret: Status
+        """
+        result = Ret.OK
+
+        for converter in self._converters:
+            if isinstance(converter, BaseConverter) and (converter.finish_worker() != Ret.OK):
+                result = Ret.ERROR
+
+        self._converters = []
+
+        return result
+
+    def _begin_targets(self, begin: Callable[[AbstractConverter], Ret]) -> Ret:
+        """Create the target converters and begin their conversion with the given function.
+
+        Args:
+            begin (Callable[[AbstractConverter], Ret]): Called with the target converter, returns the status.
+
+        Returns:
+            Ret: Status
+        """
+        result = Ret.OK
+        target_args_list = self._get_target_args_list()
+
+        if target_args_list is None:
+            result = Ret.ERROR
+
+        else:
+            for target_args in target_args_list:
+                log_verbose(f"Using converter {target_args.converter_class.__name__}: "
+                            f"{target_args.converter_class.get_description()}")
+
+                if 0 < len(target_args.out):
+                    os.makedirs(target_args.out, exist_ok=True)
+
+                converter = target_args.converter_class(target_args)
+
+                if isinstance(converter, BaseConverter):
+                    converter.set_render_cfg(self.get_render_cfg())
+                    self._take_over_target_caches(converter)
+
+                self._converters.append(converter)
+
+                if begin(converter) != Ret.OK:
+                    result = Ret.ERROR
+                    break
+
+        return result
+
+    def _forward(self, function: Callable[[AbstractConverter], Ret]) -> Ret:
+        """Call the given function with every target converter until one fails.
+
+        Args:
+            function (Callable[[AbstractConverter], Ret]): Called with the target converter, returns the status.
+
+        Returns:
+            Ret: Status
+        """
+        result = Ret.OK
+
+        for converter in self._converters:
+            if function(converter) != Ret.OK:
+                result = Ret.ERROR
+                break
+
+        return result
+
+    def _take_over_target_caches(self, converter: BaseConverter) -> None:
+        """Let the given target converter take over the caches of its previous one.
+
+        Args:
+            converter (BaseConverter): The target converter.
+        """
+        for previous_converter in self._previous_converters:
+            if type(previous_converter) is type(converter):
+                converter.take_over_caches(previous_converter)
+                break
+
+    def _get_target_args_list(self) -> Optional[list[argparse.Namespace]]:
+        """Get the program arguments of every target converter.
+
+        The program arguments are derived from the global program arguments, with the
+        output folder of the target converter and its arguments given by --converter-args.
+        They are kept in the program arguments, because the worker processes of the
+        parallel file processing can't parse them again.
+
+        Returns:
+            Optional[list[argparse.Namespace]]: The program arguments or None on error.
+        """
+        if self._args.target_args is None:
+            self._args.target_args = self._parse_target_args_list()
+
+        return self._args.target_args
+
+    def _parse_target_args_list(self) -> Optional[list[argparse.Namespace]]:
+        """Parse the program arguments of every target converter.
+
+        Returns:
+            Optional[list[argparse.Namespace]]: The program arguments or None on error.
+        """
+        target_args_list = []
+        converter_args = {}
+
+        for converter_arg in self._args.converter_args:
+            subcommand, separator, arguments = converter_arg.partition("=")
+
+            if (0 == len(separator)) or (subcommand not in self._args.to):
+                log_error(f"Invalid converter arguments {converter_arg}, expected SUBCOMMAND=ARGS "
+                          "with a subcommand given by --to.")
+                target_args_list = None
+                break
+
+            converter_args[subcommand] = arguments
+
+        if target_args_list is not None:
+            for subcommand in self._args.to:
+                target_args = self._parse_target_args(subcommand, converter_args.get(subcommand, ""))
+
+                if target_args is None:
+                    target_args_list = None
+                    break
+
+                target_args_list.append(target_args)
+
+        return target_args_list
+
+    def _parse_target_args(self, subcommand: str, arguments: str) -> Optional[argparse.Namespace]:
+        """Parse the program arguments of a single target converter.
+
+        Args:
+            subcommand (str): The subcommand of the target converter.
+            arguments (str): The target converter specific arguments.
+
+        Returns:
+            Optional[argparse.Namespace]: The program arguments or None if the subcommand is unknown
+                or the arguments are invalid.
+        """
+        target_args = None
+        sub_parsers = {}
+
+        if MultiConverter._args_sub_parser is not None:
+            sub_parsers = MultiConverter._args_sub_parser.choices
+
+        if (subcommand == MultiConverter.get_subcommand()) or (subcommand not in sub_parsers):
+            log_error(f"Unknown converter subcommand {subcommand}.")
+
+        else:
+            # The global program arguments are taken over, but not the multi converter specific ones.
+            target_args = argparse.Namespace(**vars(self._args))
+            for name in ["converter_class", "to", "converter_args", "target_args"]:
+                delattr(target_args, name)
+
+            target_args.out = os.path.join(self._args.out, subcommand)
+
+            # The sub parser sets the converter class and the defaults of the converter specific arguments.
+            # It reports invalid arguments and exits, which shall not end the program here.
+            try:
+                target_args = sub_parsers[subcommand].parse_args(shlex.split(arguments), namespace=target_args)
+            except (SystemExit, ValueError):
+                log_error(f"Invalid converter arguments {arguments} for {subcommand}.")
+                target_args = None
+
+        return target_args
+
+    @staticmethod
+    def _comma_separated_list(value: str) -> list[str]:
+        """Convert the given command line argument value to a list of unique subcommands.
+
+        Args:
+            value (str): The command line argument value.
+
+        Raises:
+            argparse.ArgumentTypeError: If the list is empty.
+
+        Returns:
+            list[str]: The subcommands in the given order.
+        """
+        subcommands = []
+
+        for subcommand in value.split(","):
+            subcommand = subcommand.strip()
+
+            if (0 < len(subcommand)) and (subcommand not in subcommands):
+                subcommands.append(subcommand)
+
+        if 0 == len(subcommands):
+            raise argparse.ArgumentTypeError(f"{value} contains no converter subcommand.")
+
+        return subcommands
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
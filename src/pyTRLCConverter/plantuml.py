@@ -20,17 +20,26 @@
 # If not, see <https://www.gnu.org/licenses/>.
 
 # Imports **********************************************************************
+import atexit
 import os
+import re
 import subprocess
 import sys
+import threading
 import zlib
 import base64
 import urllib
 import urllib.parse
-import urllib3
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from pyTRLCConverter.logger import log_verbose, log_error
+from pyTRLCConverter.plantuml_cache import PlantUMLCache
+from pyTRLCConverter.profiler import profile_phase
+
+# The HTTP libraries are imported on first use of the PlantUML server.
+if TYPE_CHECKING:
+    import requests
 
 # Variables ********************************************************************
 
@@ -40,6 +49,27 @@ BASE64_ENCODE_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz01234
 PLANTUML_ENCODE_CHARS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz-_"
 PLANTUML_ENV_VAR = "PLANTUML"
 PLANTUML_VERIFY_SSL_ENV_VAR = "PLANTUML_VERIFY_SSL"
+PLANTUML_CACHE_DIR_ENV_VAR = "PLANTUML_CACHE_DIR"
+PLANTUML_CACHE_SIZE_ENV_VAR = "PLANTUML_CACHE_SIZE"
+PLANTUML_PIPE_WORKER_ENV_VAR = "PLANTUML_PIPE_WORKER"
+PLANTUML_SERVER_CONCURRENCY_ENV_VAR = "PLANTUML_SERVER_CONCURRENCY"
+PLANTUML_SERVER_RETRIES_ENV_VAR = "PLANTUML_SERVER_RETRIES"
+PLANTUML_SERVER_TIMEOUT_ENV_VAR = "PLANTUML_SERVER_TIMEOUT"
+
+# Defaults of the PlantUML server connection.
+PLANTUML_SERVER_CONCURRENCY_DEFAULT = 4
+PLANTUML_SERVER_RETRIES_DEFAULT = 3
+PLANTUML_SERVER_TIMEOUT_DEFAULT = 10.0
+
+# HTTP status codes of the PlantUML server, which are worth a retry.
+PLANTUML_SERVER_RETRY_STATUS = (429, 500, 502, 503, 504)
+
+# Delimiter written by plantuml.jar after every image in the multi-diagram pipe mode.
+PLANTUML_PIPE_DELIMITER = "@@@pyTRLCConverter-end-of-image@@@"
+
+# Regular expressions to find the begin and end of a diagram in the PlantUML source.
+PLANTUML_DIAGRAM_START_PATTERN = re.compile(r"^\s*@start", re.MULTILINE)
+PLANTUML_DIAGRAM_END_PATTERN = re.compile(r"^\s*@end", re.MULTILINE)
 
 # Classes **********************************************************************
 
@@ -48,6 +78,11 @@ class PlantUML():
     # lobster-trace: SwRequirements.sw_req_plantuml
     """PlantUML image generator.
     """
+
+    # Pooled HTTP sessions to the PlantUML server, keyed by process, pool size and retries.
+    _sessions = {}
+    _sessions_lock = threading.Lock()
+
     def __init__(self) -> None:
         self._server_url = None
         self._plantuml_jar = None
@@ -56,6 +91,7 @@ class PlantUML():
         # with self-signed or corporate CA certificates.
         self._verify_ssl = os.environ.get(PLANTUML_VERIFY_SSL_ENV_VAR, "true").lower() != "false"
         if not self._verify_ssl:
+            import urllib3  # pylint: disable=import-outside-toplevel
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
         if PLANTUML_ENV_VAR in os.environ:
@@ -70,6 +106,47 @@ class PlantUML():
             except ValueError:
                 self._plantuml_jar = plantuml_access
 
+        # lobster-trace: SwRequirements.sw_req_plantuml_cache
+        self._cache: Optional[PlantUMLCache] = None
+        if PLANTUML_CACHE_DIR_ENV_VAR in os.environ:
+            cache_size = PlantUML._get_number_from_env(PLANTUML_CACHE_SIZE_ENV_VAR, PlantUMLCache.SIZE_LIMIT_DEFAULT)
+            self._cache = PlantUMLCache(os.environ[PLANTUML_CACHE_DIR_ENV_VAR], cache_size)
+
+        # lobster-trace: SwRequirements.sw_req_plantuml_batch
+        # Images rendered in advance by prefetch(), keyed by diagram type and diagram source.
+        self._prefetched_images: dict[tuple[str, str], bytes] = {}
+
+        # lobster-trace: SwRequirements.sw_req_plantuml_server_concurrency
+        self._server_settings = PlantUMLServerSettings()
+
+    @staticmethod
+    def _get_number_from_env(env_var: str, default: Any) -> Any:
+        """Get a number from an environment variable.
+
+        Args:
+            env_var (str): Name of the environment variable.
+            default (Any): Default value, which determines the number type (int or float).
+
+        Returns:
+            Any: The number or the default value if the variable isn't set or invalid.
+        """
+        value = default
+
+        try:
+            value = type(default)(os.environ.get(env_var, default))
+        except ValueError:
+            log_error(f"Invalid {env_var} value, using {default}.", True)
+
+        return value
+
+    def is_available(self) -> bool:
+        """Is PlantUML configured, either as server or as local plantuml.jar?
+
+        Returns:
+            bool: True if PlantUML is configured, otherwise False.
+        """
+        return (self._server_url is not None) or (self._plantuml_jar is not None)
+
     def _get_absolute_path(self, path):
         """Convert a relative path to an absolute path based on the working directory.
 
@@ -165,12 +242,195 @@ class PlantUML():
         """
         assert diagram_type in ("png", "svg")
 
+        result = self._prefetched_images.get((diagram_type, diagram_source))
+        cache_key = None
+
+        # lobster-trace: SwRequirements.sw_req_plantuml_cache
+        if (result is None) and (self._cache is not None):
+            cache_key = PlantUMLCache.get_key(diagram_type, diagram_source, self._get_version())
+            result = self._cache.get(cache_key, diagram_type)
+
+        if result is None:
+            with profile_phase("plantuml"):
+                if self._server_url is not None:
+                    result = self._generate_to_bytes_server(diagram_type, diagram_source)
+                elif (PlantUML._is_pipe_worker_enabled() is True) and \
+                     (PlantUML._is_single_diagram(diagram_source) is True):
+                    result = self._generate_to_bytes_pipe_worker(diagram_type, diagram_source)
+                else:
+                    result = self._generate_to_bytes_local(diagram_type, diagram_source)
+
+            if cache_key is not None:
+                self._cache.put(cache_key, diagram_type, result)
+
+        return result
+
+    def generate_batch_to_bytes(self, diagram_type: str, diagram_sources: list[str]) -> list[bytes]:
+        # lobster-trace: SwRequirements.sw_req_plantuml_batch
+        """Generate the PlantUML images of several diagrams at once and return their raw bytes.
+
+        With a local plantuml.jar all diagrams which are not cached yet are rendered
+        by a single PlantUML process in the multi-diagram pipe mode. This way the
+        Java startup time is spent only once.
+
+        Args:
+            diagram_type (str): Diagram type, e.g. png. See PlantUML -t options.
+            diagram_sources (list[str]): PlantUML diagram source texts.
+
+        Raises:
+            FileNotFoundError: PlantUML jar file not found or Java not installed (local mode).
+            subprocess.CalledProcessError: PlantUML failed to render the diagrams (local mode).
+            ValueError: PlantUML didn't provide an image for every diagram (local mode).
+            requests.exceptions.RequestException: HTTP error from PlantUML server (server mode).
+
+        Returns:
+            list[bytes]: The raw image bytes in the order of the diagram sources.
+        """
+        assert diagram_type in ("png", "svg")
+
+        images = {}
+        pending_sources = []
+
+        # Every diagram shall only be rendered once, even if it is used several times.
+        for diagram_source in dict.fromkeys(diagram_sources):
+            image = None
+
+            if self._cache is not None:
+                image = self._cache.get(PlantUMLCache.get_key(diagram_type, diagram_source, self._get_version()),
+                                        diagram_type)
+
+            if image is None:
+                pending_sources.append(diagram_source)
+            else:
+                images[diagram_source] = image
+
+        if 0 < len(pending_sources):
+            with profile_phase("plantuml"):
+                if self._server_url is not None:
+                    pending_images = self._run_server_requests(
+                        self._generate_to_bytes_server,
+                        [(diagram_type, diagram_source) for diagram_source in pending_sources]
+                    )
+                else:
+                    pending_images = self._generate_batch_to_bytes_local(diagram_type, pending_sources)
+
+            for diagram_source, image in zip(pending_sources, pending_images):
+                images[diagram_source] = image
+
+                if self._cache is not None:
+                    self._cache.put(PlantUMLCache.get_key(diagram_type, diagram_source, self._get_version()),
+                                    diagram_type,
+                                    image)
+
+        return [images[diagram_source] for diagram_source in diagram_sources]
+
+    def prefetch(self, diagram_type: str, diagram_sources: list[str]) -> None:
+        # lobster-trace: SwRequirements.sw_req_plantuml_batch
+        """Render the given diagrams in advance as batch, see generate_batch_to_bytes().
+
+        The images are kept until the next prefetch and are used by generate_to_bytes().
+        Failing to render the diagrams in advance is not an error, because they will be
+        rendered one by one with the usual error handling later on.
+
+        Args:
+            diagram_type (str): Diagram type, e.g. png. See PlantUML -t options.
+            diagram_sources (list[str]): PlantUML diagram source texts.
+        """
+        import requests  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+        self._prefetched_images.clear()
+
+        if (self.is_available() is True) and (0 < len(diagram_sources)):
+            log_verbose(f"Rendering {len(diagram_sources)} PlantUML diagram(s) in advance.")
+
+            try:
+                images = self.generate_batch_to_bytes(diagram_type, diagram_sources)
+
+                for diagram_source, image in zip(diagram_sources, images):
+                    self._prefetched_images[(diagram_type, diagram_source)] = image
+
+            except (OSError, ValueError, subprocess.SubprocessError, requests.exceptions.RequestException) as exc:
+                log_verbose(f"Failed to render PlantUML diagrams in advance: {exc}")
+
+    def _get_version(self) -> str:
+        # lobster-trace: SwRequirements.sw_req_plantuml_cache
+        """Get the identifier of the used PlantUML version, which is part of the cache key.
+
+        Returns:
+            str: Version identifier
+        """
+        version = ""
+
         if self._server_url is not None:
-            result = self._generate_to_bytes_server(diagram_type, diagram_source)
+            version = f"server-{self._server_url}"
+        elif self._plantuml_jar is not None:
+            version = PlantUMLCache.get_version_of_jar(self._plantuml_jar)
+
+        return version
+
+    def _get_session(self) -> "requests.Session":
+        # lobster-trace: SwRequirements.sw_req_plantuml_server_concurrency
+        """Get the pooled HTTP session to the PlantUML server.
+
+        The session keeps the connections alive and retries failed requests with
+        an exponential backoff. Every process has its own session, because the
+        connections can't be shared with forked worker processes.
+
+        Returns:
+            requests.Session: The session.
+        """
+        import requests  # pylint: disable=import-outside-toplevel,redefined-outer-name
+        import urllib3  # pylint: disable=import-outside-toplevel
+        from requests.adapters import HTTPAdapter  # pylint: disable=import-outside-toplevel
+
+        session_key = (os.getpid(), self._server_settings.concurrency, self._server_settings.retries)
+
+        with PlantUML._sessions_lock:
+            session = PlantUML._sessions.get(session_key)
+
+            if session is None:
+                retry = urllib3.util.Retry(
+                    total=self._server_settings.retries,
+                    backoff_factor=0.5,
+                    status_forcelist=PLANTUML_SERVER_RETRY_STATUS,
+                    allowed_methods=["GET"],
+                    raise_on_status=False
+                )
+                adapter = HTTPAdapter(pool_connections=1,
+                                      pool_maxsize=self._server_settings.concurrency,
+                                      max_retries=retry)
+
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                PlantUML._sessions[session_key] = session
+
+        return session
+
+    def _run_server_requests(self, function: Callable, arguments_list: list[tuple]) -> list:
+        # lobster-trace: SwRequirements.sw_req_plantuml_server_concurrency
+        """Run PlantUML server requests concurrently by a bounded thread pool.
+
+        Args:
+            function (Callable): The function which sends a single request.
+            arguments_list (list[tuple]): The arguments of every call.
+
+        Raises:
+            requests.exceptions.RequestException: The first error of the requests.
+
+        Returns:
+            list: The results in the order of the arguments.
+        """
+        max_workers = min(self._server_settings.concurrency, len(arguments_list))
+
+        if max_workers <= 1:
+            results = [function(*arguments) for arguments in arguments_list]
         else:
-            result = self._generate_to_bytes_local(diagram_type, diagram_source)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(function, *arguments) for arguments in arguments_list]
+                results = [future.result() for future in futures]
 
-        return result
+        return results
 
     def _generate_to_bytes_server(self, diagram_type: str, diagram_source: str) -> bytes:
         """Generate image via PlantUML server and return raw bytes.
@@ -186,9 +446,11 @@ class PlantUML():
             bytes: The raw image bytes.
         """
 
+        import requests  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
         url = self._make_server_url(diagram_type, diagram_source, source_is_file=False)
         log_verbose(f"Sending GET request {url}")
-        response = requests.get(url, timeout=10, verify=self._verify_ssl)
+        response = self._get_session().get(url, timeout=self._server_settings.timeout, verify=self._verify_ssl)
 
         if response.status_code != 200:
             raise requests.exceptions.RequestException(
@@ -210,22 +472,8 @@ class PlantUML():
         Returns:
             bytes: The raw image bytes.
         """
-        if self._plantuml_jar is None:
-            raise FileNotFoundError(
-                f"PlantUML not found. Set the {PLANTUML_ENV_VAR} environment variable"
-                " to the path of plantuml.jar or a server URL."
-            )
-
-        if not os.path.isfile(self._plantuml_jar):
-            raise FileNotFoundError(f"plantuml.jar at {self._plantuml_jar} not found.")
-
-        plantuml_cmd = ["java"]
-
-        if sys.platform.startswith("linux"):
-            plantuml_cmd.append("-Djava.awt.headless=true")
-
+        plantuml_cmd = self._get_plantuml_jar_cmd()
         plantuml_cmd.extend([
-            "-jar", self._plantuml_jar,
             f"-t{diagram_type}",
             "-pipe"
         ])
@@ -247,6 +495,179 @@ class PlantUML():
 
         return output.stdout
 
+    def _generate_batch_to_bytes_local(self, diagram_type: str, diagram_sources: list[str]) -> list[bytes]:
+        # lobster-trace: SwRequirements.sw_req_plantuml_batch
+        """Generate images of several diagrams via a single local plantuml.jar process.
+
+        The diagrams are streamed to PlantUML in the multi-diagram pipe mode and the
+        images are separated by the pipe delimiter.
+
+        Args:
+            diagram_type (str): Diagram type, e.g. png.
+            diagram_sources (list[str]): PlantUML diagram source texts.
+
+        Raises:
+            FileNotFoundError: Java not installed or plantuml.jar not found.
+            subprocess.CalledProcessError: PlantUML failed to render the diagrams.
+            ValueError: PlantUML didn't provide an image for every diagram.
+
+        Returns:
+            list[bytes]: The raw image bytes in the order of the diagram sources.
+        """
+        # The multi-diagram pipe mode requires every source to contain exactly one diagram.
+        if (len(diagram_sources) == 1) or \
+           (all(PlantUML._is_single_diagram(diagram_source) for diagram_source in diagram_sources) is False):
+            images = [self._generate_to_bytes_local(diagram_type, diagram_source)
+                      for diagram_source in diagram_sources]
+
+        else:
+            plantuml_cmd = self._get_plantuml_jar_cmd()
+            plantuml_cmd.extend([
+                f"-t{diagram_type}",
+                "-pipe",
+                "-pipedelimitor", PLANTUML_PIPE_DELIMITER
+            ])
+
+            diagrams = "".join(diagram_source.rstrip("\n") + "\n" for diagram_source in diagram_sources)
+
+            try:
+                output = subprocess.run(
+                    plantuml_cmd,
+                    input=diagrams.encode("utf-8"),
+                    capture_output=True,
+                    check=False
+                )
+            except FileNotFoundError as exc:
+                raise FileNotFoundError(
+                    "Java not found. Ensure Java is installed and available on PATH."
+                ) from exc
+
+            if output.returncode != 0:
+                output.check_returncode()
+
+            images = PlantUML._split_pipe_output(output.stdout, len(diagram_sources))
+
+        return images
+
+    def _generate_to_bytes_pipe_worker(self, diagram_type: str, diagram_source: str) -> bytes:
+        # lobster-trace: SwRequirements.sw_req_plantuml_batch
+        """Generate image via a persistent local plantuml.jar process and return raw bytes.
+
+        Args:
+            diagram_type (str): Diagram type, e.g. png.
+            diagram_source (str): PlantUML diagram source text, which contains exactly one diagram.
+
+        Raises:
+            FileNotFoundError: Java not installed or plantuml.jar not found.
+
+        Returns:
+            bytes: The raw image bytes.
+        """
+        plantuml_cmd = self._get_plantuml_jar_cmd()
+        plantuml_cmd.extend([
+            f"-t{diagram_type}",
+            "-pipe",
+            "-pipedelimitor", PLANTUML_PIPE_DELIMITER
+        ])
+
+        return PlantUMLPipeWorker.get(plantuml_cmd).render(diagram_source)
+
+    def _get_plantuml_jar_cmd(self) -> list[str]:
+        """Get the command line to run the local plantuml.jar without PlantUML options.
+
+        Raises:
+            FileNotFoundError: plantuml.jar not configured or not found.
+
+        Returns:
+            list[str]: The command line.
+        """
+        if self._plantuml_jar is None:
+            raise FileNotFoundError(
+                f"PlantUML not found. Set the {PLANTUML_ENV_VAR} environment variable"
+                " to the path of plantuml.jar or a server URL."
+            )
+
+        if not os.path.isfile(self._plantuml_jar):
+            raise FileNotFoundError(f"plantuml.jar at {self._plantuml_jar} not found.")
+
+        plantuml_cmd = ["java"]
+
+        if sys.platform.startswith("linux"):
+            plantuml_cmd.append("-Djava.awt.headless=true")
+
+        plantuml_cmd.extend(["-jar", self._plantuml_jar])
+
+        return plantuml_cmd
+
+    @staticmethod
+    def _is_pipe_worker_enabled() -> bool:
+        # lobster-trace: SwRequirements.sw_req_plantuml_batch
+        """Shall single diagrams be rendered by a persistent plantuml.jar process?
+
+        Returns:
+            bool: True if enabled by the PLANTUML_PIPE_WORKER environment variable, otherwise False.
+        """
+        return os.environ.get(PLANTUML_PIPE_WORKER_ENV_VAR, "false").lower() == "true"
+
+    @staticmethod
+    def _is_single_diagram(diagram_source: str) -> bool:
+        """Does the PlantUML source contain exactly one complete diagram?
+
+        Only such sources can be streamed to PlantUML in the multi-diagram pipe mode.
+
+        Args:
+            diagram_source (str): PlantUML diagram source text.
+
+        Returns:
+            bool: True if the source contains exactly one diagram, otherwise False.
+        """
+        starts = [match.start() for match in PLANTUML_DIAGRAM_START_PATTERN.finditer(diagram_source)]
+        ends = [match.start() for match in PLANTUML_DIAGRAM_END_PATTERN.finditer(diagram_source)]
+
+        return (len(starts) == 1) and (len(ends) == 1) and (starts[0] < ends[0])
+
+    @staticmethod
+    def _split_pipe_output(output: bytes, count: int) -> list[bytes]:
+        """Split the output of the multi-diagram pipe mode into the single images.
+
+        Args:
+            output (bytes): The output of plantuml.jar.
+            count (int): Number of expected images.
+
+        Raises:
+            ValueError: The number of images doesn't match.
+
+        Returns:
+            list[bytes]: The raw image bytes.
+        """
+        parts = output.split(PLANTUML_PIPE_DELIMITER.encode("utf-8"))
+
+        # The delimiter is followed by a line break, which doesn't belong to the next image.
+        images = [parts[0]] + [PlantUML._strip_line_break(part) for part in parts[1:]]
+
+        # The output ends with the last delimiter, which is followed by nothing.
+        if (len(images) != (count + 1)) or (0 < len(images[-1])):
+            raise ValueError(f"PlantUML provided {len(images) - 1} images instead of {count}.")
+
+        return images[:-1]
+
+    @staticmethod
+    def _strip_line_break(data: bytes) -> bytes:
+        """Strip a single leading line break.
+
+        Args:
+            data (bytes): Data to strip.
+
+        Returns:
+            bytes: The data without leading line break.
+        """
+        if data.startswith(b"\r\n"):
+            data = data[2:]
+        elif data.startswith(b"\n"):
+            data = data[1:]
+
+        return data
+
     def generate(self, diagram_type: str, diagram_path: str, dst_path: str) -> None:
         """Generate plantuml image.
 
@@ -263,10 +684,39 @@ class PlantUML():
         """
         assert diagram_type in ("png", "svg")
 
-        if self._server_url is not None:
-            self._generate_server(diagram_type, diagram_path, dst_path)
-        else:
-            self._generate_local(diagram_type, diagram_path, dst_path)
+        with profile_phase("plantuml"):
+            if self._server_url is not None:
+                self._generate_server(diagram_type, diagram_path, dst_path)
+            else:
+                self._generate_local(diagram_type, diagram_path, dst_path)
+
+    def generate_batch(self, diagram_type: str, diagram_paths: list[str], dst_path: str) -> None:
+        # lobster-trace: SwRequirements.sw_req_plantuml_batch
+        """Generate plantuml images of several diagram files at once.
+
+        With a local plantuml.jar all diagrams are rendered by a single Java process.
+
+        Args:
+            diagram_type (str): Diagram type, e.g. svg. See PlantUML -t options.
+            diagram_paths (list[str]): Paths to the PlantUML diagrams.
+            dst_path (str): Path to the destination of the generated images.
+
+        Raises:
+            FileNotFoundError: PlantUML java jar file not found in local mode.
+            FileNotFoundError: PlantUML diagram file not found.
+            requests.exceptions.RequestException: Error during GET request to PlantUML server.
+            OSError: Destination path does not exist.
+        """
+        assert diagram_type in ("png", "svg")
+
+        with profile_phase("plantuml"):
+            if self._server_url is not None:
+                self._run_server_requests(
+                    self._generate_server,
+                    [(diagram_type, diagram_path, dst_path) for diagram_path in diagram_paths]
+                )
+            elif 0 < len(diagram_paths):
+                self._generate_local_files(diagram_type, diagram_paths, dst_path)
 
     def _generate_server(self, diagram_type: str, diagram_path: str, dst_path: str) -> None:
         """Generate image using a plantuml server.
@@ -284,13 +734,15 @@ class PlantUML():
             OSError: Destination path does not exist.
             requests.exceptions.RequestException: Error during GET request to PlantUML server.
         """
+        import requests  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
         if not os.path.exists(dst_path):
             os.makedirs(dst_path)
 
         # Send GET request to the PlantUML server.
         url = self._make_server_url(diagram_type, diagram_path)
         log_verbose(f"Sending GET request {url}")
-        response = requests.get(url, timeout=10, verify=self._verify_ssl)
+        response = self._get_session().get(url, timeout=self._server_settings.timeout, verify=self._verify_ssl)
 
         if response.status_code == 200:
             # Save the response content in image file.
@@ -312,6 +764,20 @@ class PlantUML():
             diagram_path (str): Path to the PlantUML diagram.
             dst_path (str): Path to the destination of the generated image.
 
+        Raises:
+            FileNotFoundError: PlantUML java jar file not found.
+            OSError: Destination path does not exist.
+        """
+        self._generate_local_files(diagram_type, [diagram_path], dst_path)
+
+    def _generate_local_files(self, diagram_type: str, diagram_paths: list[str], dst_path: str) -> None:
+        """Generate images of several diagram files by a single local call to plantuml.jar.
+
+        Args:
+            diagram_type (str): Diagram type, e.g. svg. See PlantUML -t options.
+            diagram_paths (list[str]): Paths to the PlantUML diagrams.
+            dst_path (str): Path to the destination of the generated images.
+
         Raises:
             FileNotFoundError: PlantUML java jar file not found.
             OSError: Destination path does not exist.
@@ -326,10 +792,10 @@ class PlantUML():
             if sys.platform.startswith("linux"):
                 plantuml_cmd.append("-Djava.awt.headless=true")
 
+            plantuml_cmd.extend(["-jar", f"{self._plantuml_jar}"])
+            plantuml_cmd.extend(diagram_paths)
             plantuml_cmd.extend(
                 [
-                    "-jar", f"{self._plantuml_jar}",
-                    f"{diagram_path}",
                     f"-t{diagram_type}",
                     "-o", self._get_absolute_path(dst_path)
                 ]
@@ -347,8 +813,9 @@ class PlantUML():
             if output.returncode != 0:
                 if not os.path.isfile(self._plantuml_jar):
                     raise FileNotFoundError(f"plantuml.jar at {self._plantuml_jar} not found.")
-                if not os.path.isfile(diagram_path):
-                    raise FileNotFoundError(f"Diagram at {diagram_path} not found.")
+                for diagram_path in diagram_paths:
+                    if not os.path.isfile(diagram_path):
+                        raise FileNotFoundError(f"Diagram at {diagram_path} not found.")
                 output.check_returncode()
             log_verbose(output.stdout)
         else:
@@ -357,6 +824,152 @@ class PlantUML():
                 " to the path of plantuml.jar or a server URL."
             )
 
+
+# pylint: disable-next=too-few-public-methods
+class PlantUMLServerSettings():
+    # lobster-trace: SwRequirements.sw_req_plantuml_server_concurrency
+    """Settings of the requests to the PlantUML server, read from the environment.
+    """
+
+    def __init__(self) -> None:
+        # pylint: disable=protected-access
+        # Maximum number of concurrent requests and size of the connection pool.
+        self.concurrency = max(1, PlantUML._get_number_from_env(PLANTUML_SERVER_CONCURRENCY_ENV_VAR,
+                                                                PLANTUML_SERVER_CONCURRENCY_DEFAULT))
+        # Number of retries of a failed request.
+        self.retries = max(0, PlantUML._get_number_from_env(PLANTUML_SERVER_RETRIES_ENV_VAR,
+                                                            PLANTUML_SERVER_RETRIES_DEFAULT))
+        # Timeout of a request in seconds.
+        self.timeout = PlantUML._get_number_from_env(PLANTUML_SERVER_TIMEOUT_ENV_VAR,
+                                                     PLANTUML_SERVER_TIMEOUT_DEFAULT)
+        # pylint: enable=protected-access
+
+
+class PlantUMLPipeWorker():
+    # lobster-trace: SwRequirements.sw_req_plantuml_batch
+    """Persistent plantuml.jar process in the multi-diagram pipe mode.
+
+    The process is started on first use and kept alive until the program exits,
+    which avoids the Java startup time for every single diagram.
+    """
+
+    # Running workers, keyed by their command line.
+    _workers = {}
+    _workers_lock = threading.Lock()
+
+    def __init__(self, plantuml_cmd: list[str]) -> None:
+        """Start the plantuml.jar process.
+
+        Args:
+            plantuml_cmd (list[str]): Command line including the pipe and pipe delimiter options.
+
+        Raises:
+            FileNotFoundError: Java not installed.
+        """
+        try:
+            # pylint: disable-next=consider-using-with
+            self._process = subprocess.Popen(
+                plantuml_cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        except FileNotFoundError as exc:
+            raise FileNotFoundError(
+                "Java not found. Ensure Java is installed and available on PATH."
+            ) from exc
+
+        self._buffer = b""
+
+        # The pipe is used by one rendering at a time.
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get(plantuml_cmd: list[str]) -> "PlantUMLPipeWorker":
+        """Get the running worker for the given command line or start a new one.
+
+        Args:
+            plantuml_cmd (list[str]): Command line including the pipe and pipe delimiter options.
+
+        Returns:
+            PlantUMLPipeWorker: The worker.
+        """
+        worker_key = tuple(plantuml_cmd)
+
+        with PlantUMLPipeWorker._workers_lock:
+            worker = PlantUMLPipeWorker._workers.get(worker_key)
+
+            if (worker is None) or (worker.is_alive() is False):
+                if len(PlantUMLPipeWorker._workers) == 0:
+                    atexit.register(PlantUMLPipeWorker.close_all)
+
+                log_verbose(f"Starting PlantUML worker {' '.join(plantuml_cmd)}")
+                worker = PlantUMLPipeWorker(plantuml_cmd)
+                PlantUMLPipeWorker._workers[worker_key] = worker
+
+        return worker
+
+    @staticmethod
+    def close_all() -> None:
+        """Close all running workers.
+        """
+        with PlantUMLPipeWorker._workers_lock:
+            for worker in PlantUMLPipeWorker._workers.values():
+                worker.close()
+
+            PlantUMLPipeWorker._workers.clear()
+
+    def is_alive(self) -> bool:
+        """Is the plantuml.jar process still running?
+
+        Returns:
+            bool: True if running, otherwise False.
+        """
+        return self._process.poll() is None
+
+    def render(self, diagram_source: str) -> bytes:
+        """Render a single diagram.
+
+        Args:
+            diagram_source (str): PlantUML diagram source text, which contains exactly one diagram.
+
+        Raises:
+            OSError: The plantuml.jar process terminated unexpectedly.
+
+        Returns:
+            bytes: The raw image bytes.
+        """
+        delimiter = PLANTUML_PIPE_DELIMITER.encode("utf-8")
+
+        with self._lock:
+            self._process.stdin.write(diagram_source.rstrip("\n").encode("utf-8") + b"\n")
+            self._process.stdin.flush()
+
+            while delimiter not in self._buffer:
+                data = self._process.stdout.read1(64 * 1024)
+
+                if len(data) == 0:
+                    self.close()
+                    raise OSError("PlantUML worker terminated unexpectedly.")
+
+                self._buffer += data
+
+            image, self._buffer = self._buffer.split(delimiter, 1)
+
+        # The line break after the delimiter may arrive with a later read, then it precedes the next image.
+        return PlantUML._strip_line_break(image) # pylint: disable=protected-access
+
+    def close(self) -> None:
+        """Terminate the plantuml.jar process.
+        """
+        if self.is_alive() is True:
+            try:
+                self._process.stdin.close()
+                self._process.wait(timeout=10)
+            except (OSError, subprocess.TimeoutExpired):
+                self._process.kill()
+                self._process.wait()
+
 # Functions ********************************************************************
 
 # Main *************************************************************************
@@ -0,0 +1,255 @@
+"""Persistent content-addressed cache for generated PlantUML images.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import hashlib
+import os
+import tempfile
+from typing import Optional
+from pyTRLCConverter.logger import log_verbose
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+
+class PlantUMLCache():
+    # lobster-trace: SwRequirements.sw_req_plantuml_cache
+    """Persistent cache for generated PlantUML images.
+
+    Every image is stored in its own file, named by the hash of the diagram source,
+    the diagram type and the PlantUML version. This way the cache can be shared by
+    all converters, by several worker processes and across consecutive conversions.
+
+    The cache is limited in size. If the limit is exceeded, the least recently used
+    images are removed. Every cache hit updates the modification time of the image
+    file, which is used to determine the least recently used ones.
+
+    The cache folder is scanned for its size once, afterwards the size is updated by
+    every stored image. Only if the limit is exceeded, the cache folder is scanned
+    again, because other processes may have stored or removed images meanwhile.
+    """
+
+    # Default size limit in MiB.
+    SIZE_LIMIT_DEFAULT = 100
+
+    # Share of the size limit, down to which the least recently used images are removed.
+    # It avoids scanning the cache folder again for every further image.
+    EVICTION_TARGET = 0.9
+
+    # Suffix of the temporary files, which are written before they are renamed to the images.
+    # They are never removed by the eviction, because other processes may still write them.
+    TMP_FILE_SUFFIX = ".tmp"
+
+    # Content hashes of the PlantUML jar files, to hash them only once per process.
+    _jar_hashes = {}
+
+    def __init__(self, cache_dir: str, size_limit: int = SIZE_LIMIT_DEFAULT) -> None:
+        """Construct the PlantUML image cache.
+
+        Args:
+            cache_dir (str): Folder where the images are stored.
+            size_limit (int): Size limit of the cache in MiB.
+        """
+        self._cache_dir = cache_dir
+        self._size_limit = size_limit * 1024 * 1024
+
+        # Size of all images in the cache folder, determined by the first stored image.
+        self._size: Optional[int] = None
+
+    @staticmethod
+    def get_version_of_jar(plantuml_jar: str) -> str:
+        """Get a version identifier of the given PlantUML jar file.
+
+        Starting the jar to request its version would take as long as generating the
+        image. Therefore the content hash of the jar file identifies the version.
+
+        Args:
+            plantuml_jar (str): Path to the plantuml.jar file.
+
+        Returns:
+            str: Version identifier or empty string if the jar file doesn't exist.
+        """
+        version = ""
+
+        if os.path.isfile(plantuml_jar):
+            stat = os.stat(plantuml_jar)
+            jar_key = (os.path.abspath(plantuml_jar), stat.st_size, stat.st_mtime_ns)
+            version = PlantUMLCache._jar_hashes.get(jar_key)
+
+            if version is None:
+                hasher = hashlib.sha256()
+
+                with open(plantuml_jar, "rb") as jar_file:
+                    for chunk in iter(lambda: jar_file.read(1024 * 1024), b""):
+                        hasher.update(chunk)
+
+                version = f"jar-{hasher.hexdigest()}"
+                PlantUMLCache._jar_hashes[jar_key] = version
+
+        return version
+
+    @staticmethod
+    def get_key(diagram_type: str, diagram_source: str, version: str) -> str:
+        """Get the cache key of a diagram.
+
+        Args:
+            diagram_type (str): Diagram type, e.g. svg.
+            diagram_source (str): PlantUML diagram source text.
+            version (str): PlantUML version identifier.
+
+        Returns:
+            str: Cache key
+        """
+        hasher = hashlib.sha256()
+        hasher.update(diagram_type.encode("utf-8"))
+        hasher.update(b"\0")
+        hasher.update(version.encode("utf-8"))
+        hasher.update(b"\0")
+        hasher.update(diagram_source.encode("utf-8"))
+
+        return hasher.hexdigest()
+
+    def get(self, key: str, diagram_type: str) -> Optional[bytes]:
+        """Get the image of the given key from the cache.
+
+        Args:
+            key (str): Cache key
+            diagram_type (str): Diagram type, e.g. svg.
+
+        Returns:
+            Optional[bytes]: The raw image bytes or None if not cached.
+        """
+        image = None
+        file_name = self._get_file_name(key, diagram_type)
+
+        try:
+            with open(file_name, "rb") as image_file:
+                image = image_file.read()
+
+            # Mark the image as recently used.
+            os.utime(file_name)
+
+            log_verbose(f"PlantUML image {key} taken from cache.")
+
+        except OSError:
+            image = None
+
+        return image
+
+    def put(self, key: str, diagram_type: str, image: bytes) -> None:
+        """Store the image of the given key in the cache and evict old images on demand.
+
+        Failing to store the image is not an error, the image just isn't cached.
+
+        Args:
+            key (str): Cache key
+            diagram_type (str): Diagram type, e.g. svg.
+            image (bytes): The raw image bytes.
+        """
+        file_name = self._get_file_name(key, diagram_type)
+
+        try:
+            os.makedirs(os.path.dirname(file_name), exist_ok=True)
+
+            # Write to a temporary file first, to never expose partially written images to
+            # other processes which use the same cache.
+            file_descriptor, tmp_file_name = tempfile.mkstemp(suffix=PlantUMLCache.TMP_FILE_SUFFIX,
+                                                              dir=os.path.dirname(file_name))
+            with os.fdopen(file_descriptor, "wb") as image_file:
+                image_file.write(image)
+
+            replaced_size = os.path.getsize(file_name) if os.path.isfile(file_name) else 0
+            os.replace(tmp_file_name, file_name)
+
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._get_images())
+            else:
+                self._size += len(image) - replaced_size
+
+            if self._size_limit < self._size:
+                self._evict()
+
+        except OSError as exc:
+            log_verbose(f"Failed to store PlantUML image {key} in cache: {exc}")
+
+    def _get_file_name(self, key: str, diagram_type: str) -> str:
+        """Get the file name of the cached image.
+
+        Args:
+            key (str): Cache key
+            diagram_type (str): Diagram type, e.g. svg.
+
+        Returns:
+            str: File name with path.
+        """
+        return os.path.join(self._cache_dir, key[:2], f"{key}.{diagram_type}")
+
+    def _get_images(self) -> list[tuple[int, int, str]]:
+        """Get all images in the cache folder, without the temporary files.
+
+        Returns:
+            list[tuple[int, int, str]]: Modification time in ns, size and file name of every image.
+        """
+        images = []
+
+        for path, _, files in os.walk(self._cache_dir):
+            for file_name in files:
+                if file_name.endswith(PlantUMLCache.TMP_FILE_SUFFIX) is False:
+                    file_name = os.path.join(path, file_name)
+
+                    try:
+                        stat = os.stat(file_name)
+                    except OSError:
+                        continue
+
+                    images.append((stat.st_mtime_ns, stat.st_size, file_name))
+
+        return images
+
+    def _evict(self) -> None:
+        """Remove the least recently used images, if the cache size exceeds its limit.
+
+        The images are removed until the cache size is down to the eviction target.
+        """
+        images = self._get_images()
+        total_size = sum(size for _, size, _ in images)
+
+        if self._size_limit < total_size:
+            target_size = int(self._size_limit * PlantUMLCache.EVICTION_TARGET)
+            images.sort()
+
+            for _, size, file_name in images:
+                try:
+                    os.remove(file_name)
+                    total_size -= size
+                    log_verbose(f"Evicted {file_name} from PlantUML cache.")
+                except OSError:
+                    pass
+
+                if total_size <= target_size:
+                    break
+
+        self._size = total_size
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
@@ -0,0 +1,366 @@
+"""Phase timing of the conversion for the profiling report.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import contextlib
+import heapq
+import json
+import time
+from typing import Iterator, Optional
+from pyTRLCConverter.logger import log_error, log_verbose
+from pyTRLCConverter.version import __version__
+
+# Variables ********************************************************************
+
+_PROFILER = None
+
+# Classes **********************************************************************
+
+
+class Profiler():
+    # lobster-trace: SwRequirements.sw_req_cli_profile
+    """Collects the wall and CPU time of the conversion phases.
+
+    The time of a phase includes the time of all phases which are nested in it, e.g.
+    the time of a record conversion includes the rendering of its attribute values.
+    A phase which is entered again while it is active, e.g. by a recursive call, is
+    only measured once.
+    """
+
+    SCHEMA_VERSION = 1
+
+    # Number of the slowest records in the report.
+    SLOWEST_RECORDS_DEFAULT = 10
+
+    def __init__(self, slowest_records_count: int = SLOWEST_RECORDS_DEFAULT) -> None:
+        """Construct the profiler.
+
+        Args:
+            slowest_records_count (int): Number of the slowest records in the report.
+        """
+        self._slowest_records_count = slowest_records_count
+        self._start = (time.perf_counter(), time.process_time())
+
+        # Accumulated measurements as [count, wall time, CPU time], per group and key.
+        self._totals: dict[str, dict[str, list]] = {
+            "phases": {},
+            "files": {},
+            "record_types": {},
+            "attribute_formats": {}
+        }
+
+        # Phases which are currently measured.
+        self._active_phases: set[str] = set()
+
+        # Min-heap of the slowest records as (wall time, sequence number, record entry).
+        self._slowest_records: list[tuple] = []
+        self._record_count = 0
+
+        # Further statistics, e.g. of caches, per group and key.
+        self._statistics: dict[str, dict[str, dict]] = {}
+
+    @contextlib.contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        # lobster-trace: SwRequirements.sw_req_cli_profile
+        """Measure the wall and CPU time of the given phase.
+
+        Args:
+            phase (str): The phase name, e.g. parse or begin.
+
+        Yields:
+            None: The phase is measured while the context is active.
+        """
+        if phase in self._active_phases:
+            yield
+
+        else:
+            self._active_phases.add(phase)
+            start = (time.perf_counter(), time.process_time())
+
+            try:
+                yield
+            finally:
+                self._active_phases.discard(phase)
+                self._add("phases", phase, start)
+
+    @contextlib.contextmanager
+    def measure_file(self, file_name: str) -> Iterator[None]:
+        # lobster-trace: SwRequirements.sw_req_cli_profile
+        """Measure the conversion of a TRLC file.
+
+        Args:
+            file_name (str): The TRLC file name.
+
+        Yields:
+            None: The file is measured while the context is active.
+        """
+        start = (time.perf_counter(), time.process_time())
+
+        try:
+            yield
+        finally:
+            self._add("files", file_name, start)
+
+    @contextlib.contextmanager
+    def measure_record(self, record_name: str, record_type: str, file_name: str) -> Iterator[None]:
+        # lobster-trace: SwRequirements.sw_req_cli_profile
+        """Measure the conversion of a record and keep it, if it belongs to the slowest ones.
+
+        Args:
+            record_name (str): The record name.
+            record_type (str): The record type name.
+            file_name (str): The TRLC file name of the record.
+
+        Yields:
+            None: The record is measured while the context is active.
+        """
+        start = (time.perf_counter(), time.process_time())
+
+        try:
+            with self.measure("convert_record"):
+                yield
+        finally:
+            wall_time, cpu_time = self._add("record_types", record_type, start)
+
+            entry = {
+                "name": record_name,
+                "type": record_type,
+                "file": file_name,
+                "wall_s": wall_time,
+                "cpu_s": cpu_time
+            }
+
+            self._record_count += 1
+            if len(self._slowest_records) < self._slowest_records_count:
+                heapq.heappush(self._slowest_records, (wall_time, self._record_count, entry))
+            elif 0 < self._slowest_records_count:
+                heapq.heappushpop(self._slowest_records, (wall_time, self._record_count, entry))
+
+    @contextlib.contextmanager
+    def measure_attribute_format(self, format_specifier: str) -> Iterator[None]:
+        # lobster-trace: SwRequirements.sw_req_cli_profile
+        """Measure the rendering of an attribute value in the given format.
+
+        Args:
+            format_specifier (str): The format of the attribute value, e.g. plain or md.
+
+        Yields:
+            None: The rendering is measured while the context is active.
+        """
+        start = (time.perf_counter(), time.process_time())
+
+        try:
+            with self.measure("render"):
+                yield
+        finally:
+            self._add("attribute_formats", format_specifier, start)
+
+    def add_statistics(self, group: str, key: str, statistics: dict) -> None:
+        # lobster-trace: SwRequirements.sw_req_cli_render_cache
+        """Add further statistics to the report, e.g. the statistics of a cache.
+
+        Args:
+            group (str): The group, e.g. render_cache.
+            key (str): The key in the group, e.g. the converter subcommand.
+            statistics (dict): The statistics, which can be serialized to JSON.
+        """
+        self._statistics.setdefault(group, {})[key] = statistics
+
+    def get_report(self) -> dict:
+        # lobster-trace: SwRequirements.sw_req_cli_profile
+        """Get the profiling report.
+
+        Returns:
+            dict: The profiling report, which can be serialized to JSON.
+        """
+        report = {
+            "version": Profiler.SCHEMA_VERSION,
+            "program_version": __version__,
+            "total": {
+                "wall_s": time.perf_counter() - self._start[0],
+                "cpu_s": time.process_time() - self._start[1]
+            }
+        }
+
+        for group, totals in self._totals.items():
+            report[group] = {
+                key: {"count": count, "wall_s": wall_time, "cpu_s": cpu_time}
+                for key, (count, wall_time, cpu_time) in totals.items()
+            }
+
+        report["slowest_records"] = [entry for _, _, entry in sorted(self._slowest_records, reverse=True)]
+        report["statistics"] = self._statistics
+
+        return report
+
+    def save(self, file_name: str) -> bool:
+        # lobster-trace: SwRequirements.sw_req_cli_profile
+        """Write the profiling report to the given JSON file.
+
+        Args:
+            file_name (str): The report file name.
+
+        Returns:
+            bool: True if the report was written, otherwise False.
+        """
+        status = True
+
+        log_verbose(f"Writing profiling report {file_name}.")
+
+        try:
+            with open(file_name, "w", encoding="utf-8") as file:
+                json.dump(self.get_report(), file, indent=4)
+
+        except (OSError, IOError) as exc:
+            log_error(f"Failed to write profiling report {file_name}: {exc}")
+            status = False
+
+        return status
+
+    def _add(self, group: str, key: str, start: tuple[float, float]) -> tuple[float, float]:
+        """Add a measurement to the totals of the given group and key.
+
+        Args:
+            group (str): The group, e.g. phases or record_types.
+            key (str): The key in the group, e.g. the phase name.
+            start (tuple[float, float]): Wall and CPU time at the start of the measurement.
+
+        Returns:
+            tuple[float, float]: The measured wall and CPU time.
+        """
+        wall_time = time.perf_counter() - start[0]
+        cpu_time = time.process_time() - start[1]
+
+        totals = self._totals[group].setdefault(key, [0, 0.0, 0.0])
+        totals[0] += 1
+        totals[1] += wall_time
+        totals[2] += cpu_time
+
+        return wall_time, cpu_time
+
+# Functions ********************************************************************
+
+
+def enable_profiling(enable: bool) -> None:
+    # lobster-trace: SwRequirements.sw_req_cli_profile
+    """Enable or disable the profiling. Enabling it starts a new measurement.
+
+    Args:
+        enable (bool): True to enable the profiling, False to disable it.
+    """
+    global _PROFILER  # pylint: disable=global-statement
+    _PROFILER = Profiler() if enable is True else None
+
+
+def get_profiler() -> Optional[Profiler]:
+    # lobster-trace: SwRequirements.sw_req_cli_profile
+    """Get the profiler.
+
+    Returns:
+        Optional[Profiler]: The profiler or None if the profiling is disabled.
+    """
+    return _PROFILER
+
+
+def is_profiling_enabled() -> bool:
+    # lobster-trace: SwRequirements.sw_req_cli_profile
+    """Check whether the profiling is enabled.
+
+    Returns:
+        bool: True if the profiling is enabled, otherwise False.
+    """
+    return _PROFILER is not None
+
+
+def profile_phase(phase: str) -> contextlib.AbstractContextManager:
+    # lobster-trace: SwRequirements.sw_req_cli_profile
+    """Measure the given phase, if the profiling is enabled.
+
+    Args:
+        phase (str): The phase name.
+
+    Returns:
+        contextlib.AbstractContextManager: Context manager which measures the phase.
+    """
+    context = contextlib.nullcontext()
+
+    if _PROFILER is not None:
+        context = _PROFILER.measure(phase)
+
+    return context
+
+
+def profile_file(file_name: str) -> contextlib.AbstractContextManager:
+    # lobster-trace: SwRequirements.sw_req_cli_profile
+    """Measure the conversion of the given TRLC file, if the profiling is enabled.
+
+    Args:
+        file_name (str): The TRLC file name.
+
+    Returns:
+        contextlib.AbstractContextManager: Context manager which measures the file.
+    """
+    context = contextlib.nullcontext()
+
+    if _PROFILER is not None:
+        context = _PROFILER.measure_file(file_name)
+
+    return context
+
+
+def profile_record(record_name: str, record_type: str, file_name: str) -> contextlib.AbstractContextManager:
+    # lobster-trace: SwRequirements.sw_req_cli_profile
+    """Measure the conversion of the given record, if the profiling is enabled.
+
+    Args:
+        record_name (str): The record name.
+        record_type (str): The record type name.
+        file_name (str): The TRLC file name of the record.
+
+    Returns:
+        contextlib.AbstractContextManager: Context manager which measures the record.
+    """
+    context = contextlib.nullcontext()
+
+    if _PROFILER is not None:
+        context = _PROFILER.measure_record(record_name, record_type, file_name)
+
+    return context
+
+
+def profile_attribute_format(format_specifier: str) -> contextlib.AbstractContextManager:
+    # lobster-trace: SwRequirements.sw_req_cli_profile
+    """Measure the rendering of an attribute value in the given format, if the profiling is enabled.
+
+    Args:
+        format_specifier (str): The format of the attribute value, e.g. plain or md.
+
+    Returns:
+        contextlib.AbstractContextManager: Context manager which measures the rendering.
+    """
+    context = contextlib.nullcontext()
+
+    if _PROFILER is not None:
+        context = _PROFILER.measure_attribute_format(format_specifier)
+
+    return context
+
+# Main *************************************************************************
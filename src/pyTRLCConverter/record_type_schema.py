@@ -0,0 +1,180 @@
+"""Per record type information, which is precomputed once for all records of the type.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import re
+from typing import Optional
+from trlc.ast import Composite_Component, Enumeration_Type, Record_Type
+from pyTRLCConverter.render_config import RenderConfig
+
+# Variables ********************************************************************
+
+# Characters which are replaced in identifier tokens.
+_IDENTIFIER_TOKEN_PATTERN = re.compile(r"[^a-zA-Z0-9]+")
+
+# Classes **********************************************************************
+
+
+# pylint: disable-next=too-many-instance-attributes, too-few-public-methods
+class FieldSchema():
+    # lobster-trace: SwRequirements.sw_req_record_type_schema
+    """Information about a field of a record type, which is the same for all its records."""
+
+    def __init__(self, component: Composite_Component, translation: Optional[dict],
+                 format_specifier: str, table_options: dict) -> None:
+        """Construct the field schema.
+
+        Args:
+            component (Composite_Component): The TRLC record type component of the field.
+            translation (Optional[dict]): The attribute name translation of the record type or None.
+            format_specifier (str): The format of the field values from the render configuration.
+            table_options (dict): The table options of the field values from the render configuration.
+        """
+        # The field name.
+        self.name = component.name
+
+        # The TRLC type of the field values, e.g. String or an enumeration.
+        self.component_type = component.n_typ
+
+        # Whether the field may be null.
+        self.optional = component.optional
+
+        # The enumeration type and the names of its literals in declaration order, if it is an enumeration field.
+        self.enum_type: Optional[Enumeration_Type] = None
+        self.enum_literal_names: list[str] = []
+
+        if isinstance(component.n_typ, Enumeration_Type):
+            self.enum_type = component.n_typ
+            self.enum_literal_names = [literal.name for literal in component.n_typ.literals.table.values()]
+
+        # The translated attribute name.
+        self.translated_name = self.name
+
+        if (translation is not None) and (self.name in translation):
+            self.translated_name = translation[self.name]
+
+        # The render configuration of the field values.
+        self.format_specifier = format_specifier
+        self.table_options = table_options
+
+        # The key of the field attribute in the generated document, e.g. the ReqIF attribute definition key.
+        self.definition_key = f"field_{self.name}"
+
+        self._translation = translation
+
+    def get_attribute_name(self, translation: Optional[dict]) -> str:
+        # lobster-trace: SwRequirements.sw_req_record_type_schema
+        """Get the attribute name of the field, translated by the given translation.
+
+        The precomputed name is used, if it is the translation of the record type.
+
+        Args:
+            translation (Optional[dict]): The translation dictionary or None.
+
+        Returns:
+            str: The translated attribute name.
+        """
+        attribute_name = self.translated_name
+
+        if translation is not self._translation:
+            attribute_name = self.name
+
+            if (translation is not None) and (self.name in translation):
+                attribute_name = translation[self.name]
+
+        return attribute_name
+
+
+class RecordTypeSchema():
+    # lobster-trace: SwRequirements.sw_req_record_type_schema
+    """Information about a record type, which is built once and used for all its records.
+
+    Everything a converter needs per field and depends only on the record type is
+    precomputed: the field order, the component and enumeration types, the
+    translated attribute names, the render configuration and the keys of the
+    attributes in the generated document. The render configuration is selected by
+    the package of the records, therefore a schema is built per package and type.
+    """
+
+    def __init__(self, record_type: Record_Type, package_name: str, translation: Optional[dict],
+                 render_cfg: RenderConfig) -> None:
+        """Construct the record type schema.
+
+        Args:
+            record_type (Record_Type): The TRLC record type.
+            package_name (str): The TRLC package of the records.
+            translation (Optional[dict]): The attribute name translation of the record type or None.
+            render_cfg (RenderConfig): The render configuration.
+        """
+        self.record_type = record_type
+        self.name = record_type.name
+        self.package_name = package_name
+        self.translation = translation
+
+        # The schemas of the fields in the order of the record fields, inherited ones first.
+        self.fields: dict[str, FieldSchema] = {}
+
+        for component in record_type.all_components():
+            format_specifier, table_options = render_cfg.resolve(package_name, record_type.name, component.name)
+            self.fields[component.name] = FieldSchema(component, translation, format_specifier, table_options)
+
+    def get_field(self, name: str) -> Optional[FieldSchema]:
+        # lobster-trace: SwRequirements.sw_req_record_type_schema
+        """Get the schema of the given field.
+
+        Args:
+            name (str): The field name.
+
+        Returns:
+            Optional[FieldSchema]: The field schema or None if the record type has no such field.
+        """
+        return self.fields.get(name)
+
+    def get_fields_by_format(self, *format_specifiers: str) -> list[FieldSchema]:
+        # lobster-trace: SwRequirements.sw_req_record_type_schema
+        """Get the schemas of the fields, which values have one of the given formats.
+
+        Args:
+            *format_specifiers (str): The format specifiers, e.g. md and gfm.
+
+        Returns:
+            list[FieldSchema]: The field schemas in field order.
+        """
+        return [field for field in self.fields.values() if field.format_specifier in format_specifiers]
+
+# Functions ********************************************************************
+
+
+def get_identifier_token(value: str) -> str:
+    # lobster-trace: SwRequirements.sw_req_record_type_schema
+    """Get a lowercase identifier token with only letters, digits and dashes, e.g. for ReqIF identifiers.
+
+    Args:
+        value (str): The raw token, e.g. a type or attribute name.
+
+    Returns:
+        str: The identifier token, "item" if no letter or digit remains.
+    """
+    token = _IDENTIFIER_TOKEN_PATTERN.sub("-", value.lower()).strip("-")
+
+    return token if 0 < len(token) else "item"
+
+# Main *************************************************************************
@@ -0,0 +1,146 @@
+"""Bounded cache of the rendered attribute values.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import hashlib
+from collections import OrderedDict
+from typing import Any, Optional
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+
+class RenderCache():
+    # lobster-trace: SwRequirements.sw_req_cli_render_cache
+    """Least recently used cache of the rendered attribute values.
+
+    Requirement sets contain a lot of repeated attribute text, e.g. boilerplate
+    rationales. A Markdown attribute value is parsed and rendered only once per
+    format, table options and target, the next occurrences take the cached result.
+    What is cached depends on the target: the rendered text for text based formats
+    or the generated document elements, which are replayed, for docx.
+
+    The cache key holds a hash of the attribute value instead of the value itself.
+    """
+
+    # Default maximum number of cached values.
+    SIZE_DEFAULT = 1024
+
+    def __init__(self, max_size: int = SIZE_DEFAULT) -> None:
+        """Construct the render cache.
+
+        Args:
+            max_size (int): Maximum number of cached values. 0 disables the cache.
+        """
+        self._max_size = max(0, max_size)
+        self._values: OrderedDict[tuple, Any] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def get_key(text: str, format_specifier: str, table_options: Optional[dict], target: str) -> tuple:
+        # lobster-trace: SwRequirements.sw_req_cli_render_cache
+        """Get the cache key of the given attribute value.
+
+        Args:
+            text (str): The attribute value.
+            format_specifier (str): The format of the attribute value, e.g. md or gfm.
+            table_options (Optional[dict]): The table rendering options or None.
+            target (str): The target, e.g. the subcommand of the converter.
+
+        Returns:
+            tuple: The cache key.
+        """
+        text_hash = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        options = None
+
+        if table_options:
+            options = tuple(sorted(table_options.items()))
+
+        return (text_hash, len(text), format_specifier, options, target)
+
+    def is_enabled(self) -> bool:
+        """Check whether the cache is enabled.
+
+        Returns:
+            bool: True if values are cached, otherwise False.
+        """
+        return 0 < self._max_size
+
+    def get(self, key: tuple) -> Optional[Any]:
+        # lobster-trace: SwRequirements.sw_req_cli_render_cache
+        """Get the cached value of the given key and mark it as recently used.
+
+        Args:
+            key (tuple): The cache key.
+
+        Returns:
+            Optional[Any]: The cached value or None if it is not cached.
+        """
+        value = self._values.get(key)
+
+        if value is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+            self._values.move_to_end(key)
+
+        return value
+
+    def put(self, key: tuple, value: Any) -> None:
+        # lobster-trace: SwRequirements.sw_req_cli_render_cache
+        """Cache the given value. The least recently used value is evicted if the cache is full.
+
+        Args:
+            key (tuple): The cache key.
+            value (Any): The value, must not be None.
+        """
+        if self.is_enabled() is True:
+            self._values[key] = value
+            self._values.move_to_end(key)
+
+            if self._max_size < len(self._values):
+                self._values.popitem(last=False)
+                self._evictions += 1
+
+    def get_statistics(self) -> dict:
+        # lobster-trace: SwRequirements.sw_req_cli_render_cache
+        """Get the cache statistics to size the cache.
+
+        Returns:
+            dict: Number of hits, misses and evictions, the hit rate, the size and the maximum size.
+        """
+        lookups = self._hits + self._misses
+
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "hit_rate": (self._hits / lookups) if 0 < lookups else 0.0,
+            "size": len(self._values),
+            "max_size": self._max_size
+        }
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
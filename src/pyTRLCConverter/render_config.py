@@ -22,8 +22,9 @@
 # Imports **********************************************************************
 import json
 import re
+from typing import Optional
 
-from pyTRLCConverter.logger import log_verbose
+from pyTRLCConverter.logger import log_error, log_verbose
 
 # Variables ********************************************************************
 
@@ -52,6 +53,12 @@ class RenderConfig():
         #   "tableOptions": { "border": "<css-style>", "headingStyle": "<css-style>" } }] }
         self._cfg = {}
 
+        # The render configuration items with their precompiled package, type and attribute patterns.
+        self._rules = []  # type: list[tuple[Optional[re.Pattern], Optional[re.Pattern], Optional[re.Pattern], dict]]
+
+        # Resolved format specifier and table options per TRLC package, type and attribute.
+        self._resolved = {}  # type: dict[tuple[str, str, str], tuple[str, dict]]
+
     def load(self, file_name: str) -> bool:
         """Loads the render configuration from the given file.
         
@@ -68,69 +75,76 @@ class RenderConfig():
         try:
             with open(file_name, 'r', encoding='utf-8') as f:
                 self._cfg = json.load(f)
+            self._compile()
             status = True
 
         except FileNotFoundError:
             pass
 
+        except re.error as exc:
+            log_error(f"Invalid pattern in render configuration {file_name}: {exc}")
+
         return status
 
-    def _is_package_match(self, item: dict, trlc_package: str) -> bool:
-        """Checks if the given TRLC package matches the package pattern in the given item.
+    def _compile(self) -> None:
+        # lobster-trace: SwRequirements.sw_req_render_configuration
+        """Precompiles the patterns of all render configuration items.
 
-        Args:
-            item (dict): Single render configuration item.
-            trlc_package (str): The TRLC package.
-
-        Returns:
-            bool: If the given TRLC package matches the package pattern in the given item.
+        Raises:
+            re.error: A pattern is not a valid regular expression.
         """
-        it_matches = False
-
-        if "package" in item:
-            if re.match(item["package"], trlc_package):
-                it_matches = True
+        self._rules = []
+        self._resolved = {}
 
-        return it_matches
+        for item in self._cfg.get("renderCfg", []):
+            self._rules.append((
+                RenderConfig._compile_pattern(item, "package"),
+                RenderConfig._compile_pattern(item, "type"),
+                RenderConfig._compile_pattern(item, "attribute"),
+                item
+            ))
 
-    def _is_type_match(self, item: dict, trlc_type: str) -> bool:
-        """Checks if the given TRLC type matches the type pattern in the given item.
+    @staticmethod
+    def _compile_pattern(item: dict, key: str) -> Optional[re.Pattern]:
+        """Compiles the pattern of the given key in the given item.
 
         Args:
             item (dict): Single render configuration item.
-            trlc_type (str): The TRLC type.
+            key (str): The key of the pattern, e.g. package.
 
         Returns:
-            bool: If the given TRLC type matches the type pattern in the given item.
+            Optional[re.Pattern]: The compiled pattern or None if the item has no such pattern.
         """
-        it_matches = False
+        pattern = None
+
+        if key in item:
+            pattern = re.compile(item[key])
 
-        if "type" in item:
-            if re.match(item["type"], trlc_type):
-                it_matches = True
+        return pattern
 
-        return it_matches
+    @staticmethod
+    def _is_match(pattern: Optional[re.Pattern], value: str) -> bool:
+        """Checks if the given value matches the given pattern.
 
-    def _is_type_attribute_match(self, item: dict, trlc_type_attribute: str) -> bool:
-        """Checks if the given TRLC type attribute matches the type attribute pattern in the given item.
+        A missing pattern matches nothing.
 
         Args:
-            item (dict): Single render configuration item.
-            trlc_type (str): The TRLC type attribute.
+            pattern (Optional[re.Pattern]): The compiled pattern.
+            value (str): The TRLC package, type or attribute.
 
         Returns:
-            bool: If the given TRLC type attribute matches the type attribute pattern in the given item.
+            bool: If the given value matches the pattern.
         """
-        it_matches = False
-
-        if "attribute" in item:
-            if re.match(item["attribute"], trlc_type_attribute):
-                it_matches = True
+        return (pattern is not None) and (pattern.match(value) is not None)
 
-        return it_matches
+    def resolve(self, trlc_package: str, trlc_type: str, trlc_type_attribute: str) -> tuple[str, dict]:
+        # lobster-trace: SwRequirements.sw_req_render_configuration
+        # lobster-trace: SwRequirements.sw_req_reqif_render_table_options
+        """Returns the format specifier and the table options for the given TRLC package, type and attribute.
 
-    def get_format_specifier(self, trlc_package: str, trlc_type: str, trlc_type_attribute: str) -> str:
-        """Returns the format specifier for the given TRLC package, type and attribute.
+        The format specifier is taken from the first matching item, which has a format.
+        The table options are taken from the first matching item. The result is
+        memoized, because the same attributes are rendered for every record.
 
         Args:
             trlc_package (str): The TRLC package.
@@ -138,27 +152,56 @@ class RenderConfig():
             trlc_type_attribute (str): The TRLC type attribute.
 
         Returns:
-            str: The format specifier for the given TRLC package, type and attribute.
+            tuple[str, dict]: The format specifier and the table options, see get_format_specifier()
+                and get_table_options().
         """
-        format_specifier = RenderConfig.FORMAT_SPECIFIER_PLAIN
+        key = (trlc_package, trlc_type, trlc_type_attribute)
+        resolved = self._resolved.get(key)
 
-        if "renderCfg" in self._cfg:
-            for item in self._cfg["renderCfg"]:
-                match_list = []
+        if resolved is None:
+            format_specifier = None
+            table_options = None
 
-                match_list.append(self._is_package_match(item, trlc_package))
-                match_list.append(self._is_type_match(item, trlc_type))
-                match_list.append(self._is_type_attribute_match(item, trlc_type_attribute))
+            for package_pattern, type_pattern, attribute_pattern, item in self._rules:
 
                 # All of the available ones must match!
-                if all(match_list):
-                    if "format" in item:
+                if RenderConfig._is_match(package_pattern, trlc_package) and \
+                   RenderConfig._is_match(type_pattern, trlc_type) and \
+                   RenderConfig._is_match(attribute_pattern, trlc_type_attribute):
+
+                    # First match wins.
+                    if table_options is None:
+                        table_options = item.get("tableOptions", {})
+
+                    if (format_specifier is None) and ("format" in item):
                         format_specifier = item["format"]
 
-                        # First match wins.
+                    if format_specifier is not None:
                         break
 
-        return format_specifier
+            if format_specifier is None:
+                format_specifier = RenderConfig.FORMAT_SPECIFIER_PLAIN
+
+            if table_options is None:
+                table_options = {}
+
+            resolved = (format_specifier, table_options)
+            self._resolved[key] = resolved
+
+        return resolved
+
+    def get_format_specifier(self, trlc_package: str, trlc_type: str, trlc_type_attribute: str) -> str:
+        """Returns the format specifier for the given TRLC package, type and attribute.
+
+        Args:
+            trlc_package (str): The TRLC package.
+            trlc_type (str): The TRLC type.
+            trlc_type_attribute (str): The TRLC type attribute.
+
+        Returns:
+            str: The format specifier for the given TRLC package, type and attribute.
+        """
+        return self.resolve(trlc_package, trlc_type, trlc_type_attribute)[0]
 
     def get_table_options(self, trlc_package: str, trlc_type: str, trlc_type_attribute: str) -> dict:
         # lobster-trace: SwRequirements.sw_req_reqif_render_table_options
@@ -179,24 +222,7 @@ class RenderConfig():
         Returns:
             dict: Table options dict, or empty dict if no table options are configured.
         """
-        table_options = {}
-
-        if "renderCfg" in self._cfg:
-            for item in self._cfg["renderCfg"]:
-                match_list = []
-
-                match_list.append(self._is_package_match(item, trlc_package))
-                match_list.append(self._is_type_match(item, trlc_type))
-                match_list.append(self._is_type_attribute_match(item, trlc_type_attribute))
-
-                # All of the available ones must match!
-                if all(match_list):
-                    table_options = item.get("tableOptions", {})
-
-                    # First match wins.
-                    break
-
-        return table_options
+        return self.resolve(trlc_package, trlc_type, trlc_type_attribute)[1]
 
     def is_format_plain(self, trlc_package: str, trlc_type: str, trlc_type_attribute: str) -> bool:
         """Checks if the given TRLC package, type and attribute should be rendered in plain text format.
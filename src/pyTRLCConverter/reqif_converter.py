@@ -21,6 +21,7 @@
 
 # Imports **********************************************************************
 import html
+import io
 import mimetypes
 import os
 import re
@@ -29,10 +30,8 @@ import tempfile
 import zipfile
 from datetime import datetime, timezone
 from typing import Any, Optional
-from marko import Markdown
 from reqif.object_lookup import ReqIFObjectLookup
 from reqif.reqif_bundle import ReqIFBundle
-from reqif.unparser import ReqIFUnparser
 from reqif.models.reqif_core_content import ReqIFCoreContent
 from reqif.models.reqif_data_type import (
     ReqIFDataTypeDefinitionEnumeration,
@@ -53,12 +52,20 @@ from reqif.models.reqif_specification_type import ReqIFSpecificationType
 from reqif.models.reqif_types import SpecObjectAttributeType
 from trlc.ast import (
     Array_Aggregate, Enumeration_Literal, Enumeration_Type, Implicit_Null,
-    Record_Object, Record_Reference, String_Literal, Expression, Symbol_Table
+    Record_Object, Record_Reference, String_Literal, Expression
 )
 from pyTRLCConverter.base_converter import BaseConverter
+from pyTRLCConverter.converter_registry import REQIF_DESCRIPTION, REQIF_SUBCOMMAND
+from pyTRLCConverter.render_cache import RenderCache
+from pyTRLCConverter.record_type_schema import get_identifier_token
+from pyTRLCConverter.render_config import RenderConfig
 from pyTRLCConverter.reqif_identifier_store import ReqifIdentifierStore
+from pyTRLCConverter.reqif_identifier_store_sqlite import ReqifIdentifierStoreSqlite
+from pyTRLCConverter.reqif_stream_writer import ReqifStreamWriter
+from pyTRLCConverter.marko.marko_renderer import MarkoRenderer
 from pyTRLCConverter.marko.md2reqif_renderer import Md2ReqifRenderer
 from pyTRLCConverter.marko.gfm2reqif_renderer import Gfm2ReqifRenderer
+from pyTRLCConverter.profiler import profile_phase
 from pyTRLCConverter.ret import Ret
 from pyTRLCConverter.trlc_helper import TrlcAstWalker
 from pyTRLCConverter.logger import log_error, log_verbose
@@ -87,6 +94,14 @@ class ReqifConverter(BaseConverter):
     XSI_NAMESPACE = "http://www.w3.org/2001/XMLSchema-instance"
 
     SYSTEM_ATTRIBUTE_PREFIX = "ReqIF."
+
+    # Extensions of the already compressed media, which are stored uncompressed in the .reqifz archive.
+    REQIFZ_STORED_EXTENSIONS = (
+        ".png", ".jpg", ".jpeg", ".gif", ".webp",
+        ".zip", ".gz", ".bz2", ".xz", ".7z",
+        ".docx", ".xlsx", ".pptx", ".reqifz",
+        ".mp3", ".mp4"
+    )
     ATTRIBUTE_KEY_RECORD_FOREIGN_ID = "foreignID"
 
     def __init__(self, args: Any) -> None:
@@ -100,14 +115,14 @@ class ReqifConverter(BaseConverter):
         super().__init__(args)
 
         self._out_path = args.out
-        self._markdown_renderer_md = Markdown(renderer=Md2ReqifRenderer)
-        self._markdown_renderer_gfm = Markdown(renderer=Gfm2ReqifRenderer, extensions=["gfm"])
+        self._marko_renderer_md = MarkoRenderer(Md2ReqifRenderer)
+        self._marko_renderer_gfm = MarkoRenderer(Gfm2ReqifRenderer, ["gfm"])
         self._plantuml_tmp_dir: Optional[tempfile.TemporaryDirectory] = None
 
         self._id_store_path = getattr(args, "id_store", None)
         self._id_store: Optional[ReqifIdentifierStore] = None
 
-        self._spec_objects = []
+        self._stream_writer = ReqifStreamWriter()
         self._spec_relations = []
         self._root_hierarchies = []
         self._hierarchy_stack = []
@@ -133,7 +148,7 @@ class ReqifConverter(BaseConverter):
         Returns:
             str: Parser subcommand token
         """
-        return "reqif"
+        return REQIF_SUBCOMMAND
 
     @staticmethod
     def get_description() -> str:
@@ -144,7 +159,7 @@ class ReqifConverter(BaseConverter):
         Returns:
             str: Converter description
         """
-        return "Convert into ReqIF format."
+        return REQIF_DESCRIPTION
 
     @classmethod
     def register(cls, args_parser: Any) -> None:
@@ -215,6 +230,25 @@ class ReqifConverter(BaseConverter):
                  "The default is to write plain .reqif files."
         )
 
+        BaseConverter._parser.add_argument(
+            "--reqifz-compression-level",
+            type=int,
+            choices=range(0, 10),
+            default=None,
+            required=False,
+            metavar="LEVEL",
+            help="Deflate compression level of the .reqifz archive from 0 (none) to 9 (best). "
+                 "The default is the zlib default level."
+        )
+
+        BaseConverter._parser.add_argument(
+            "--reqifz-no-folder",
+            action="store_true",
+            required=False,
+            default=False,
+            help="Write only the .reqifz archive, without the unpacked document subfolder."
+        )
+
         BaseConverter._parser.add_argument(
             "--id-store",
             type=str,
@@ -223,7 +257,28 @@ class ReqifConverter(BaseConverter):
             help="Path to a JSON file used to keep the identifiers of ReqIF Identifiable "
                  "elements immutable across consecutive exports. On the initial conversion "
                  "the file is created with the generated identifiers; on subsequent "
-                 "conversions the stored identifiers are reused and new elements are added."
+                 "conversions the stored identifiers are reused and new elements are added. "
+                 f"A file with one of the extensions {', '.join(ReqifIdentifierStoreSqlite.FILE_EXTENSIONS)} "
+                 "is a SQLite database instead, which is read on demand and written incrementally."
+        )
+
+        BaseConverter._parser.add_argument(
+            "--id-store-prune",
+            type=int,
+            default=None,
+            required=False,
+            metavar="EXPORTS",
+            help="Drop the identifiers from the SQLite identifier store, which were not used "
+                 "in the last EXPORTS exports, including this one."
+        )
+
+        BaseConverter._parser.add_argument(
+            "--id-store-migrate",
+            type=str,
+            default=None,
+            required=False,
+            metavar="JSON_ID_STORE",
+            help="Import the identifiers of the given JSON identifier store into the SQLite identifier store."
         )
 
     def begin(self) -> Ret:
@@ -239,19 +294,10 @@ class ReqifConverter(BaseConverter):
         result = BaseConverter.begin(self)
 
         if result == Ret.OK:
-            self._empty_attribute_value = self._args.empty
-            log_verbose(f"Empty attribute value: {self._empty_attribute_value}")
+            self._prepare_conversion()
 
             if self._id_store_path is not None:
-                self._id_store = ReqifIdentifierStore()
-                if self._id_store.load(self._id_store_path) is False:
-                    result = Ret.ERROR
-
-            # Temporary directory for inline PlantUML images generated while
-            # rendering Markdown attributes. The directory is cleaned up in
-            # finish() once all documents have been written.
-            # pylint: disable-next=consider-using-with
-            self._plantuml_tmp_dir = tempfile.TemporaryDirectory(prefix="pyTRLCConverter_reqif_")
+                result = self._open_id_store()
 
             if self._args.single_document is True:
                 log_verbose("Single document mode.")
@@ -261,6 +307,64 @@ class ReqifConverter(BaseConverter):
 
         return result
 
+    def take_over_caches(self, converter: BaseConverter) -> None:
+        # lobster-trace: SwRequirements.sw_req_cli_watch
+        """Take over the Markdown parsers and renderers of the converter of the previous conversion.
+
+        The render cache is not taken over, because the cached values may refer to
+        external files, e.g. PlantUML images, in the temporary folder of the previous
+        conversion, which is removed at its end.
+
+        Args:
+            converter (BaseConverter): The converter of the previous conversion of the same class.
+        """
+        if isinstance(converter, ReqifConverter):
+            # pylint: disable=protected-access
+            self._marko_renderer_md = converter._marko_renderer_md
+            self._marko_renderer_gfm = converter._marko_renderer_gfm
+            # pylint: enable=protected-access
+
+    def is_parallel_file_processing_supported(self) -> bool:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """Check whether the files can be converted by independent converter instances in parallel.
+
+        This is the case in multiple document mode without an identifier store,
+        because the identifier store is shared by all documents.
+
+        Returns:
+            bool: True if parallel file processing is supported, otherwise False.
+        """
+        return (self._args.single_document is False) and (self._id_store_path is None)
+
+    def get_output_files(self, file_name: str) -> Optional[list[str]]:
+        # lobster-trace: SwRequirements.sw_req_cli_cache_dir
+        """Get the output files which are written for the given TRLC file.
+
+        Args:
+            file_name (str): The TRLC file name.
+
+        Returns:
+            Optional[list[str]]: The output files.
+        """
+        output_file_name = self._args.name
+
+        if self._args.single_document is False:
+            output_file_name = self._file_name_trlc_to_reqif(file_name)
+
+        if self._args.reqifz:
+            output_file_name = os.path.splitext(os.path.basename(output_file_name))[0] + ".reqifz"
+
+        return [os.path.join(self._out_path, output_file_name)]
+
+    def _get_plantuml_diagram_type(self) -> Optional[str]:
+        # lobster-trace: SwRequirements.sw_req_plantuml_batch
+        """Get the type of the images the converter renders PlantUML diagrams to.
+
+        Returns:
+            Optional[str]: Diagram type svg.
+        """
+        return "svg"
+
     def enter_file(self, file_name: str) -> Ret:
         # lobster-trace: SwRequirements.sw_req_reqif_multiple_doc_mode
         """Enter a file and reset document state in multiple document mode.
@@ -362,22 +466,23 @@ class ReqifConverter(BaseConverter):
             }
         }
         type_key = self._get_record_type_key(record)
+        schema = self._get_record_type_schema(record)
 
         for name, value in record.field.items():
             if self._queue_spec_relations_from_expression(record, value, name) is True:
                 continue
 
-            attribute_name = self._translate_attribute_name(translation, name)
-            enum_type = self._get_field_enum_type(record, name)
+            field = schema.fields[name]
+            attribute_name = field.get_attribute_name(translation)
 
-            if enum_type is not None:
+            if field.enum_type is not None:
                 enum_values = self._collect_enum_values_from_expression(value)
                 if enum_values is not None:
-                    attribute_value_map[f"field_{name}"] = {
+                    attribute_value_map[field.definition_key] = {
                         "long_name": attribute_name,
                         "value": enum_values,
                         "attribute_type": SpecObjectAttributeType.ENUMERATION,
-                        "enum_type": enum_type,
+                        "enum_type": field.enum_type,
                     }
                 continue
 
@@ -392,14 +497,14 @@ class ReqifConverter(BaseConverter):
             if len(attribute_value) == 0:
                 attribute_value = self._empty_attribute_value
 
-            rendered_value = self._render(
+            rendered_value = self._render_attribute(
                 package_name=record.n_package.name,
                 type_name=record.n_typ.name,
                 attribute_name=name,
                 attribute_value=attribute_value
             )
 
-            attribute_value_map[f"field_{name}"] = {
+            attribute_value_map[field.definition_key] = {
                 "long_name": attribute_name,
                 "value": rendered_value,
                 "attribute_type": SpecObjectAttributeType.XHTML
@@ -441,10 +546,93 @@ class ReqifConverter(BaseConverter):
             if self._id_store.save(self._id_store_path) is False:
                 result = Ret.ERROR
 
+        self._release_resources()
+        self._report_render_cache_statistics()
+
+        return result
+
+    def begin_worker(self) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """Begin the conversion in a worker process of the parallel file processing.
+
+        Returns:
+            Ret: Status
+        """
+        result = BaseConverter.begin_worker(self)
+
+        if result == Ret.OK:
+            self._prepare_conversion()
+
+        return result
+
+    def finish_worker(self) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """Finish the conversion in a worker process of the parallel file processing.
+
+        Returns:
+            Ret: Status
+        """
+        self._release_resources()
+
+        return Ret.OK
+
+    def _prepare_conversion(self) -> None:
+        """Set the value for empty attributes and create the folder for the rendered PlantUML diagrams.
+        """
+        self._empty_attribute_value = self._args.empty
+        log_verbose(f"Empty attribute value: {self._empty_attribute_value}")
+
+        # Temporary directory for inline PlantUML images generated while
+        # rendering Markdown attributes. The directory is cleaned up in
+        # finish() once all documents have been written.
+        # pylint: disable-next=consider-using-with
+        self._plantuml_tmp_dir = tempfile.TemporaryDirectory(prefix="pyTRLCConverter_reqif_")
+
+    def _release_resources(self) -> None:
+        """Remove the folder for the rendered PlantUML diagrams and the spool file of the stream writer.
+        """
         if self._plantuml_tmp_dir is not None:
             self._plantuml_tmp_dir.cleanup()
             self._plantuml_tmp_dir = None
 
+        self._stream_writer.close()
+
+    def _open_id_store(self) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_reqif_identifier_store_init
+        # lobster-trace: SwRequirements.sw_req_reqif_identifier_store_sqlite
+        # lobster-trace: SwRequirements.sw_req_reqif_identifier_store_prune
+        # lobster-trace: SwRequirements.sw_req_reqif_identifier_store_migrate
+        """Open the identifier store, selected by the file extension, and apply the migration and pruning.
+
+        Returns:
+            Ret: Status
+        """
+        result = Ret.OK
+        prune_export_count = getattr(self._args, "id_store_prune", None)
+        migrate_file_name = getattr(self._args, "id_store_migrate", None)
+
+        if ReqifIdentifierStoreSqlite.is_sqlite_file(self._id_store_path) is True:
+            self._id_store = ReqifIdentifierStoreSqlite()
+
+            if self._id_store.load(self._id_store_path) is False:
+                result = Ret.ERROR
+
+            elif (migrate_file_name is not None) and (self._id_store.migrate(migrate_file_name) is False):
+                result = Ret.ERROR
+
+            elif prune_export_count is not None:
+                self._id_store.prune(prune_export_count)
+
+        elif (prune_export_count is not None) or (migrate_file_name is not None):
+            log_error("The --id-store-prune and --id-store-migrate options require a SQLite identifier store.")
+            result = Ret.ERROR
+
+        else:
+            self._id_store = ReqifIdentifierStore()
+
+            if self._id_store.load(self._id_store_path) is False:
+                result = Ret.ERROR
+
         return result
 
     def _write_document(self, file_name: str) -> Ret:
@@ -454,12 +642,16 @@ class ReqifConverter(BaseConverter):
         # lobster-trace: SwRequirements.sw_req_reqif_out_file_name_custom
         # lobster-trace: SwRequirements.sw_req_reqif_reqifz
         # lobster-trace: SwRequirements.sw_req_reqif_render_path
-        """Build the ReqIF bundle and write it to the output file.
+        # lobster-trace: SwRequirements.sw_req_reqif_stream
+        """Build the ReqIF bundle and stream it to the output file.
 
         Without --reqifz the .reqif file is written directly into the output folder.
-        With --reqifz a subfolder named after the document is created inside the
-        output folder, the .reqif file is placed there, and all files inside that
-        subfolder are bundled into a .reqifz archive in the output folder.
+        With --reqifz the .reqif file and the external files are bundled into a .reqifz
+        archive in the output folder and, unless --reqifz-no-folder is given, placed
+        in a subfolder named after the document inside the output folder.
+
+        The spec objects are not part of the bundle, they are streamed from the
+        spool of the stream writer, which is discarded afterwards.
 
         Args:
             file_name (str): Output file name (without path prefix).
@@ -468,58 +660,117 @@ class ReqifConverter(BaseConverter):
             Ret: Status
         """
         doc_name = os.path.splitext(os.path.basename(file_name))[0]
+        ret_status = Ret.OK
 
         try:
-            reqif_xml = ReqIFUnparser.unparse(self._build_reqif_bundle())
+            with profile_phase("write"):
+                bundle = self._build_reqif_bundle()
 
-            if self._args.reqifz:
-                self._bundle_as_reqifz(doc_name, reqif_xml)
-            else:
-                out_file_name = os.path.join(self._out_path, file_name) if 0 < len(self._out_path) else file_name
-                with open(out_file_name, "w", encoding="utf-8") as fd:
-                    fd.write(reqif_xml)
-                out_dir = self._out_path if 0 < len(self._out_path) else "."
-                self._copy_external_files(out_dir)
+                if self._args.reqifz:
+                    ret_status = self._bundle_as_reqifz(doc_name, bundle)
+                else:
+                    out_file_name = os.path.join(self._out_path, file_name) if 0 < len(self._out_path) else file_name
+                    with open(out_file_name, "w", encoding="utf-8") as fd:
+                        self._stream_writer.write(bundle, [fd])
+                    out_dir = self._out_path if 0 < len(self._out_path) else "."
+                    self._copy_external_files(out_dir)
 
-            return Ret.OK
+            return ret_status
 
         except (OSError, IOError, ValueError) as exc:
             log_error(f"Failed to write ReqIF output: {exc}")
             return Ret.ERROR
 
-    def _bundle_as_reqifz(self, doc_name: str, reqif_xml: str) -> None:
+        finally:
+            self._stream_writer.close()
+
+    def _bundle_as_reqifz(self, doc_name: str, bundle: ReqIFBundle) -> Ret:
         # lobster-trace: SwRequirements.sw_req_reqif_reqifz
         # lobster-trace: SwRequirements.sw_req_reqif_render_path
-        """Create the document subfolder, write the .reqif, and bundle into a .reqifz archive.
+        # lobster-trace: SwRequirements.sw_req_reqif_stream
+        # lobster-trace: SwRequirements.sw_req_reqif_reqifz_packaging
+        """Write the .reqifz archive and, unless skipped, the unpacked document subfolder.
 
-        The subfolder is named after the document and placed inside the output folder.
-        All files inside the subfolder are included in the archive with paths relative
-        to the subfolder root.
+        The .reqif entry is streamed into the archive and at once into the subfolder,
+        so it is not read back. The external files are added to the archive from their
+        source files. Already compressed media are stored uncompressed, all other
+        entries are deflated with the configured compression level.
 
         Args:
             doc_name (str): Document base name (no extension).
-            reqif_xml (str): Serialised ReqIF XML content.
+            bundle (ReqIFBundle): The ReqIF bundle without the spooled spec objects.
+
+        Returns:
+            Ret: Status, which is Ret.ERROR if an external file can't be archived.
         """
-        subfolder = os.path.join(self._out_path, doc_name) if 0 < len(self._out_path) else doc_name
         reqifz_path = (os.path.join(self._out_path, doc_name + ".reqifz")
                        if 0 < len(self._out_path) else doc_name + ".reqifz")
-        os.makedirs(subfolder, exist_ok=True)
-        with open(os.path.join(subfolder, doc_name + ".reqif"), "w", encoding="utf-8") as fd:
-            fd.write(reqif_xml)
-        self._copy_external_files(subfolder)
-        with zipfile.ZipFile(reqifz_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-            for dirpath, _, filenames in os.walk(subfolder):
-                for fname in filenames:
-                    abs_path = os.path.join(dirpath, fname)
-                    arc_name = os.path.relpath(abs_path, subfolder).replace(os.sep, "/")
-                    zf.write(abs_path, arc_name)
+        reqif_file_name = doc_name + ".reqif"
+        subfolder = None
+
+        if self._args.reqifz_no_folder is False:
+            subfolder = os.path.join(self._out_path, doc_name) if 0 < len(self._out_path) else doc_name
+            os.makedirs(subfolder, exist_ok=True)
+
+        with zipfile.ZipFile(reqifz_path, "w", compression=zipfile.ZIP_DEFLATED,
+                             compresslevel=self._args.reqifz_compression_level) as zf:
+            with io.TextIOWrapper(zf.open(reqif_file_name, "w", force_zip64=True), encoding="utf-8") as entry:
+                if subfolder is None:
+                    self._stream_writer.write(bundle, [entry])
+                else:
+                    with open(os.path.join(subfolder, reqif_file_name), "w", encoding="utf-8") as fd:
+                        self._stream_writer.write(bundle, [fd, entry])
+
+            if subfolder is not None:
+                self._copy_external_files(subfolder)
+
+            ret_status = self._archive_external_files(zf)
+
+        return ret_status
+
+    def _archive_external_files(self, zf: zipfile.ZipFile) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_reqif_render_path
+        # lobster-trace: SwRequirements.sw_req_reqif_reqifz_packaging
+        """Add all collected external files from their source files to the given archive.
+
+        Each file is added using its basename as the entry name. Duplicate source paths
+        are added only once. If a source file cannot be read, an error is logged and the
+        file is skipped, the archive is incomplete then.
+
+        Args:
+            zf (zipfile.ZipFile): The .reqifz archive opened for writing.
+
+        Returns:
+            Ret: Status, which is Ret.ERROR if an external file can't be archived.
+        """
+        ret_status = Ret.OK
+        archived_sources = set()
+
+        for source_path, local_name in self._external_files:
+            if source_path in archived_sources:
+                continue
+
+            compress_type = None
+            if os.path.splitext(local_name)[1].lower() in ReqifConverter.REQIFZ_STORED_EXTENSIONS:
+                compress_type = zipfile.ZIP_STORED
+
+            try:
+                zf.write(source_path, local_name, compress_type=compress_type)
+                archived_sources.add(source_path)
+            except (OSError, IOError) as exc:
+                log_error(f"Failed to archive external file '{source_path}': {exc}", False)
+                ret_status = Ret.ERROR
+
+        return ret_status
 
     def _build_reqif_bundle(self) -> ReqIFBundle:
         # lobster-trace: SwRequirements.sw_req_reqif
-        """Assemble a complete ReqIFBundle from the accumulated spec objects, hierarchies and attribute definitions.
+        """Assemble the ReqIFBundle from the accumulated hierarchies, relations and attribute definitions.
+
+        The spec objects are spooled by the stream writer and are not part of the bundle.
 
         Returns:
-            ReqIFBundle: The assembled ReqIF bundle ready for unparsing.
+            ReqIFBundle: The assembled ReqIF bundle ready for streaming.
         """
         last_change = self._get_reqif_timestamp()
 
@@ -603,7 +854,7 @@ class ReqifConverter(BaseConverter):
         content = ReqIFReqIFContent(
             data_types=[data_type, string_data_type, *enum_data_types],
             spec_types=[*spec_object_type_list, *spec_relation_type_list, specification_type],
-            spec_objects=self._spec_objects,
+            spec_objects=[],
             spec_relations=self._build_spec_relations(),
             specifications=[specification]
         )
@@ -625,7 +876,7 @@ class ReqifConverter(BaseConverter):
         Args:
             title (str): The document title used as the specification long-name.
         """
-        self._spec_objects = []
+        self._stream_writer.close()
         self._spec_relations = []
         self._root_hierarchies = []
         self._hierarchy_stack = []
@@ -720,7 +971,7 @@ class ReqifConverter(BaseConverter):
             identifier_key (str): Stable logical key for the spec-object identifier.
 
         Returns:
-            ReqIFSpecObject: The created and registered spec-object.
+            ReqIFSpecObject: The created spec-object, which is already spooled for the output.
         """
         self._ensure_spec_object_type(type_key, type_long_name)
 
@@ -767,7 +1018,7 @@ class ReqifConverter(BaseConverter):
             last_change=self._get_reqif_timestamp()
         )
 
-        self._spec_objects.append(spec_object)
+        self._stream_writer.add_spec_object(spec_object)
 
         return spec_object
 
@@ -933,34 +1184,6 @@ class ReqifConverter(BaseConverter):
 
         return definition_identifier
 
-    @staticmethod
-    def _get_field_enum_type(record: Record_Object, field_name: str) -> Optional[Enumeration_Type]:
-        # lobster-trace: SwRequirements.sw_req_reqif_enum
-        # lobster-trace: SwRequirements.sw_req_reqif_enum_null
-        """Return the TRLC Enumeration_Type for the named field, or None if it is not an enum field.
-
-        Traverses the component hierarchy including inherited components.
-
-        Args:
-            record (Record_Object): The TRLC record object.
-            field_name (str): The field name to look up.
-
-        Returns:
-            Optional[Enumeration_Type]: The enumeration type, or None.
-        """
-        simplified = Symbol_Table.simplified_name(field_name)
-        stab = getattr(record.n_typ, "components", None)
-        component = None
-
-        while stab is not None and component is None:
-            component = stab.table.get(simplified)
-            stab = stab.parent
-
-        if component is not None and isinstance(component.n_typ, Enumeration_Type):
-            return component.n_typ
-
-        return None
-
     @staticmethod
     def _collect_enum_values_from_expression(value: Expression) -> Optional[list]:
         # lobster-trace: SwRequirements.sw_req_reqif_enum
@@ -1217,8 +1440,7 @@ class ReqifConverter(BaseConverter):
         Returns:
             str: Sanitized lowercase token.
         """
-        sanitized_value = re.sub(r"[^a-zA-Z0-9]+", "-", value.lower()).strip("-")
-        return sanitized_value if len(sanitized_value) > 0 else "item"
+        return get_identifier_token(value)
 
     def _file_name_trlc_to_reqif(self, file_name_trlc: str) -> str:
         # lobster-trace: SwRequirements.sw_req_reqif_multiple_doc_mode
@@ -1284,7 +1506,7 @@ class ReqifConverter(BaseConverter):
         """
         return expression.to_string()
 
-    def _get_trlc_ast_walker(self) -> TrlcAstWalker:
+    def _create_trlc_ast_walker(self) -> TrlcAstWalker:
         # lobster-trace: SwRequirements.sw_req_reqif_record
         """
         Create and configure a TrlcAstWalker for traversing TRLC record field values.
@@ -1342,20 +1564,20 @@ class ReqifConverter(BaseConverter):
         Returns:
             str: XHTML-wrapped content string.
         """
-        if self._render_cfg.is_format_md(package_name, type_name, attribute_name) is True:
-            table_options = self._render_cfg.get_table_options(package_name, type_name, attribute_name)
+        format_specifier, table_options = self._render_cfg.resolve(package_name, type_name, attribute_name)
+
+        if format_specifier == RenderConfig.FORMAT_SPECIFIER_MD:
             return self._markdown_to_xhtml(attribute_value, gfm_mode=False, table_options=table_options)
 
-        if self._render_cfg.is_format_gfm(package_name, type_name, attribute_name) is True:
-            table_options = self._render_cfg.get_table_options(package_name, type_name, attribute_name)
+        if format_specifier == RenderConfig.FORMAT_SPECIFIER_GFM:
             return self._markdown_to_xhtml(attribute_value, gfm_mode=True, table_options=table_options)
 
-        if self._render_cfg.is_format_xhtml(package_name, type_name, attribute_name) is True:
+        if format_specifier == RenderConfig.FORMAT_SPECIFIER_XHTML:
             if "<" in attribute_value:
                 return self._wrap_xhtml(attribute_value)
             return self._plain_text_to_xhtml(attribute_value)
 
-        if self._render_cfg.is_format_path(package_name, type_name, attribute_name) is True:
+        if format_specifier == RenderConfig.FORMAT_SPECIFIER_PATH:
             return self._path_to_xhtml(attribute_value)
 
         return self._plain_text_to_xhtml(attribute_value)
@@ -1389,6 +1611,51 @@ class ReqifConverter(BaseConverter):
         # lobster-trace: SwRequirements.sw_req_reqif_render_gfm
         # lobster-trace: SwRequirements.sw_req_reqif_render_table_options
         # lobster-trace: SwRequirements.sw_req_reqif_render_plantuml
+        # lobster-trace: SwRequirements.sw_req_cli_render_cache
+        """Convert Markdown text to an XHTML-wrapped string, taking it from the render cache if possible.
+
+        The external files, which were registered while rendering, are cached with the
+        XHTML and registered again if the cached XHTML is used.
+
+        Args:
+            markdown_text (str): Markdown source text.
+            gfm_mode (bool): If True, use the GFM extension; otherwise use CommonMark.
+            table_options (Optional[dict]): Optional table rendering options with keys
+                ``"border"`` and/or ``"headingStyle"``.
+
+        Returns:
+            str: XHTML-wrapped HTML string.
+        """
+        cache_key = None
+        cached = None
+
+        if self._render_cache.is_enabled() is True:
+            format_specifier = RenderConfig.FORMAT_SPECIFIER_GFM if gfm_mode else RenderConfig.FORMAT_SPECIFIER_MD
+            cache_key = RenderCache.get_key(markdown_text, format_specifier, table_options, self.get_subcommand())
+            cached = self._render_cache.get(cache_key)
+
+        if cached is not None:
+            xhtml, external_files = cached
+
+            for external_file in external_files:
+                if external_file not in self._external_files:
+                    self._external_files.append(external_file)
+
+        else:
+            external_file_count = len(self._external_files)
+            xhtml = self._render_markdown_to_xhtml(markdown_text, gfm_mode, table_options)
+
+            if cache_key is not None:
+                self._render_cache.put(cache_key, (xhtml, tuple(self._external_files[external_file_count:])))
+
+        return xhtml
+
+    def _render_markdown_to_xhtml(self, markdown_text: str, gfm_mode: bool,
+                                  table_options: Optional[dict] = None) -> str:
+        # lobster-trace: SwRequirements.sw_req_reqif_render_md
+        # lobster-trace: SwRequirements.sw_req_reqif_render_gfm
+        # lobster-trace: SwRequirements.sw_req_reqif_render_table_options
+        # lobster-trace: SwRequirements.sw_req_reqif_render_plantuml
         """Convert Markdown text to an XHTML-wrapped string using marko.
 
         If ``table_options`` is provided and non-empty, table styling is applied to the
@@ -1408,16 +1675,16 @@ class ReqifConverter(BaseConverter):
         Returns:
             str: XHTML-wrapped HTML string.
         """
-        renderer = self._markdown_renderer_gfm if gfm_mode else self._markdown_renderer_md
+        marko_renderer = self._marko_renderer_gfm if gfm_mode else self._marko_renderer_md
 
         # Wire the inline-PlantUML renderer state to this converter so generated
         # SVGs are written to the converter's temp directory and tracked in
         # _external_files for copying.
         assert self._plantuml_tmp_dir is not None
-        Md2ReqifRenderer.image_dir = self._plantuml_tmp_dir.name
-        Md2ReqifRenderer.external_files = self._external_files
-
-        html_text = renderer.convert(markdown_text).strip()
+        html_text = marko_renderer.convert(markdown_text,
+                                           image_dir=self._plantuml_tmp_dir.name,
+                                           external_files=self._external_files,
+                                           plantuml=self._get_plantuml()).strip()
 
         if len(html_text) == 0:
             html_text = "<p></p>"
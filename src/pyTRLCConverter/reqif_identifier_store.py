@@ -49,6 +49,7 @@ class ReqifIdentifierStore():
         """Construct an empty identifier store."""
         self._identifiers = {}
         self._next_id = 1
+        self._is_modified = False
 
     def load(self, file_name: str) -> bool:
         # lobster-trace: SwRequirements.sw_req_reqif_identifier_store_init
@@ -77,6 +78,7 @@ class ReqifIdentifierStore():
 
         except FileNotFoundError:
             log_verbose(f"ReqIF identifier store {file_name} does not exist yet; starting empty.")
+            self._is_modified = True
 
         except (OSError, IOError, ValueError) as exc:
             log_error(f"Failed to load ReqIF identifier store {file_name}: {exc}")
@@ -105,14 +107,35 @@ class ReqifIdentifierStore():
             identifier = f"{prefix}-{self._next_id}"
             self._next_id += 1
             self._identifiers[key] = identifier
+            self._is_modified = True
 
         return identifier
 
+    def get_identifiers(self) -> dict[str, str]:
+        # lobster-trace: SwRequirements.sw_req_reqif_identifier_store_migrate
+        """Get the identifiers of the store.
+
+        Returns:
+            dict[str, str]: The identifiers keyed by their stable logical key.
+        """
+        return self._identifiers
+
+    def get_next_id(self) -> int:
+        # lobster-trace: SwRequirements.sw_req_reqif_identifier_store_migrate
+        """Get the number of the next generated identifier.
+
+        Returns:
+            int: The number of the next generated identifier.
+        """
+        return self._next_id
+
     def save(self, file_name: str) -> bool:
         # lobster-trace: SwRequirements.sw_req_reqif_identifier_store_init
         # lobster-trace: SwRequirements.sw_req_reqif_identifier_store_reuse
         """Persist the identifier store to a JSON file.
 
+        The file is not written again, if it was loaded and no identifier was added.
+
         Args:
             file_name (str): The name of the JSON file to write.
 
@@ -121,21 +144,27 @@ class ReqifIdentifierStore():
         """
         status = True
 
-        log_verbose(f"Saving ReqIF identifier store {file_name}.")
+        if self._is_modified is False:
+            log_verbose(f"ReqIF identifier store {file_name} is unchanged.")
 
-        data = {
-            "version": ReqifIdentifierStore.SCHEMA_VERSION,
-            "next_id": self._next_id,
-            "identifiers": self._identifiers
-        }
+        else:
+            log_verbose(f"Saving ReqIF identifier store {file_name}.")
 
-        try:
-            with open(file_name, "w", encoding="utf-8") as file:
-                json.dump(data, file, indent=4, sort_keys=True)
+            data = {
+                "version": ReqifIdentifierStore.SCHEMA_VERSION,
+                "next_id": self._next_id,
+                "identifiers": self._identifiers
+            }
 
-        except (OSError, IOError) as exc:
-            log_error(f"Failed to save ReqIF identifier store {file_name}: {exc}")
-            status = False
+            try:
+                with open(file_name, "w", encoding="utf-8") as file:
+                    json.dump(data, file, indent=4, sort_keys=True)
+
+                self._is_modified = False
+
+            except (OSError, IOError) as exc:
+                log_error(f"Failed to save ReqIF identifier store {file_name}: {exc}")
+                status = False
 
         return status
 
@@ -0,0 +1,307 @@
+"""
+This module implements the persistent ReqIF identifier store in a SQLite database.
+
+In contrast to the JSON identifier store, the identifiers are not loaded and saved
+as a whole. They are looked up by their indexed key on demand and only the added
+and used identifiers are written back. Every identifier records the last export it
+was used in, so the identifiers which are not used anymore can be pruned.
+
+Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import os
+import sqlite3
+from typing import Optional
+from pyTRLCConverter.logger import log_error, log_verbose
+from pyTRLCConverter.reqif_identifier_store import ReqifIdentifierStore
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+
+class ReqifIdentifierStoreSqlite(ReqifIdentifierStore):
+    """Persistent store mapping stable logical keys to immutable ReqIF identifiers in a SQLite database.
+
+    The database is opened by load() and closed by save(). The identifiers which
+    were looked up already are kept in memory, the others stay in the database.
+    """
+
+    SCHEMA_VERSION = 1
+
+    # File extensions which select the SQLite identifier store.
+    FILE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+
+    def __init__(self) -> None:
+        # lobster-trace: SwRequirements.sw_req_reqif_identifier_store_sqlite
+        """Construct an empty identifier store."""
+        super().__init__()
+        self._connection: Optional[sqlite3.Connection] = None
+
+        # Number of the current export, counting all exports with this store.
+        self._export = 1
+
+        # Identifiers which are added in the current export, keyed by their key.
+        self._added_identifiers: dict[str, str] = {}
+
+        # Keys of the stored identifiers which are used in the current export.
+        self._used_keys: list[str] = []
+
+        self._prune_export_count: Optional[int] = None
+
+    @staticmethod
+    def is_sqlite_file(file_name: str) -> bool:
+        # lobster-trace: SwRequirements.sw_req_reqif_identifier_store_sqlite
+        """Check whether the given identifier store file is a SQLite database by its extension.
+
+        Args:
+            file_name (str): The identifier store file name.
+
+        Returns:
+            bool: True if it is a SQLite database, otherwise False.
+        """
+        return os.path.splitext(file_name)[1].lower() in ReqifIdentifierStoreSqlite.FILE_EXTENSIONS
+
+    def load(self, file_name: str) -> bool:
+        # lobster-trace: SwRequirements.sw_req_reqif_identifier_store_sqlite
+        # lobster-trace: SwRequirements.sw_req_reqif_identifier_store_init
+        # lobster-trace: SwRequirements.sw_req_reqif_identifier_store_reuse
+        """Open the identifier store database, which is created if it does not exist yet.
+
+        Only the store metadata is read, the identifiers are looked up on demand.
+
+        Args:
+            file_name (str): The name of the SQLite database file.
+
+        Returns:
+            bool: True if the database could be opened, False on error.
+        """
+        status = True
+
+        log_verbose(f"Opening ReqIF identifier store {file_name}.")
+
+        try:
+            self._connection = sqlite3.connect(file_name)
+            self._connection.executescript(
+                "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL);"
+                "CREATE TABLE IF NOT EXISTS identifiers ("
+                "key TEXT PRIMARY KEY, identifier TEXT NOT NULL, last_export INTEGER NOT NULL);"
+            )
+
+            meta = dict(self._connection.execute("SELECT name, value FROM meta").fetchall())
+            version = meta.get("version", ReqifIdentifierStoreSqlite.SCHEMA_VERSION)
+
+            if version != ReqifIdentifierStoreSqlite.SCHEMA_VERSION:
+                log_error(f"ReqIF identifier store {file_name} has the unsupported schema version {version}.")
+                status = False
+            else:
+                self._next_id = meta.get("next_id", 1)
+                self._export = meta.get("export_count", 0) + 1
+
+        except sqlite3.Error as exc:
+            log_error(f"Failed to open ReqIF identifier store {file_name}: {exc}")
+            status = False
+
+        if status is False:
+            self._close()
+
+        return status
+
+    def migrate(self, file_name: str) -> bool:
+        # lobster-trace: SwRequirements.sw_req_reqif_identifier_store_migrate
+        """Import the identifiers of the given JSON identifier store.
+
+        Identifiers which are already in the database are kept. The imported ones count
+        as used in the current export, so they are not pruned before the next exports.
+
+        Args:
+            file_name (str): The name of the JSON identifier store file.
+
+        Returns:
+            bool: True if the identifiers were imported, False on error.
+        """
+        json_store = ReqifIdentifierStore()
+        status = (self._connection is not None) and os.path.isfile(file_name) and json_store.load(file_name)
+
+        if status is False:
+            log_error(f"Failed to migrate ReqIF identifier store {file_name}.")
+
+        else:
+            identifiers = json_store.get_identifiers()
+
+            log_verbose(f"Migrating {len(identifiers)} identifiers of ReqIF identifier store {file_name}.")
+
+            try:
+                with self._connection:
+                    self._connection.executemany(
+                        "INSERT OR IGNORE INTO identifiers (key, identifier, last_export) VALUES (?, ?, ?)",
+                        [(key, identifier, self._export) for key, identifier in identifiers.items()]
+                    )
+
+                self._next_id = max(self._next_id, json_store.get_next_id())
+
+            except sqlite3.Error as exc:
+                log_error(f"Failed to migrate ReqIF identifier store {file_name}: {exc}")
+                status = False
+
+        return status
+
+    def get_or_create(self, key: str, prefix: str) -> str:
+        # lobster-trace: SwRequirements.sw_req_reqif_identifier_immutable
+        # lobster-trace: SwRequirements.sw_req_reqif_identifier_store_reuse
+        # lobster-trace: SwRequirements.sw_req_reqif_identifier_store_sqlite
+        """Return the stored identifier for the given key or create a new immutable one.
+
+        Args:
+            key (str): Stable logical key identifying the ReqIF element.
+            prefix (str): Identifier prefix (e.g. ``"spec-object"`` or ``"hierarchy"``).
+
+        Returns:
+            str: The immutable identifier associated with the key.
+        """
+        identifier = self._lookup(key)
+
+        if identifier is None:
+            identifier = f"{prefix}-{self._next_id}"
+            self._next_id += 1
+            self._identifiers[key] = identifier
+            self._added_identifiers[key] = identifier
+
+        return identifier
+
+    def prune(self, export_count: int) -> None:
+        # lobster-trace: SwRequirements.sw_req_reqif_identifier_store_prune
+        """Drop the identifiers which are not used in the last given number of exports on save.
+
+        The current export counts as one of them. The numbers of dropped identifiers
+        are never reused, so a dropped element gets a new identifier if it returns.
+
+        Args:
+            export_count (int): Number of the last exports, at least 1.
+        """
+        self._prune_export_count = max(1, export_count)
+
+    def save(self, file_name: str) -> bool:
+        # lobster-trace: SwRequirements.sw_req_reqif_identifier_store_sqlite
+        # lobster-trace: SwRequirements.sw_req_reqif_identifier_store_init
+        # lobster-trace: SwRequirements.sw_req_reqif_identifier_store_reuse
+        # lobster-trace: SwRequirements.sw_req_reqif_identifier_store_prune
+        """Write the added and used identifiers to the database and close it.
+
+        Args:
+            file_name (str): The name of the SQLite database file.
+
+        Returns:
+            bool: True if the database was written successfully, False otherwise.
+        """
+        status = True
+
+        log_verbose(f"Saving ReqIF identifier store {file_name}.")
+
+        if self._connection is None:
+            log_error(f"Failed to save ReqIF identifier store {file_name}: it is not open.")
+            status = False
+
+        else:
+            status = self._write(file_name)
+
+        self._close()
+
+        return status
+
+    def _write(self, file_name: str) -> bool:
+        """Write the added and used identifiers to the open database and prune it.
+
+        Args:
+            file_name (str): The name of the SQLite database file.
+
+        Returns:
+            bool: True if the database was written successfully, False otherwise.
+        """
+        status = True
+        pruned_count = 0
+
+        try:
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO identifiers (key, identifier, last_export) VALUES (?, ?, ?)",
+                    [(key, identifier, self._export) for key, identifier in self._added_identifiers.items()]
+                )
+                self._connection.executemany(
+                    "UPDATE identifiers SET last_export = ? WHERE key = ?",
+                    [(self._export, key) for key in self._used_keys]
+                )
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)",
+                    [
+                        ("version", ReqifIdentifierStoreSqlite.SCHEMA_VERSION),
+                        ("next_id", self._next_id),
+                        ("export_count", self._export)
+                    ]
+                )
+
+                if self._prune_export_count is not None:
+                    pruned_count = self._connection.execute(
+                        "DELETE FROM identifiers WHERE last_export <= ?",
+                        (self._export - self._prune_export_count,)
+                    ).rowcount
+
+            if 0 < pruned_count:
+                log_verbose(f"Pruned {pruned_count} identifiers of ReqIF identifier store {file_name}.")
+                self._connection.execute("VACUUM")
+
+        except sqlite3.Error as exc:
+            log_error(f"Failed to save ReqIF identifier store {file_name}: {exc}")
+            status = False
+
+        return status
+
+    def _lookup(self, key: str) -> Optional[str]:
+        """Look up the identifier of the given key, first in memory, then in the database.
+
+        An identifier which is found in the database is kept in memory and recorded as used.
+
+        Args:
+            key (str): Stable logical key identifying the ReqIF element.
+
+        Returns:
+            Optional[str]: The identifier or None if the key is unknown.
+        """
+        identifier = self._identifiers.get(key)
+
+        if (identifier is None) and (self._connection is not None):
+            row = self._connection.execute("SELECT identifier FROM identifiers WHERE key = ?", (key,)).fetchone()
+
+            if row is not None:
+                identifier = row[0]
+                self._identifiers[key] = identifier
+                self._used_keys.append(key)
+
+        return identifier
+
+    def _close(self) -> None:
+        """Close the database, if it is open."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
@@ -0,0 +1,223 @@
+"""Streaming writer of ReqIF documents.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import tempfile
+from typing import Any, Callable, Optional, TextIO
+from reqif.models.reqif_relation_group_type import ReqIFRelationGroupType
+from reqif.models.reqif_req_if_content import ReqIFReqIFContent
+from reqif.models.reqif_spec_object import ReqIFSpecObject
+from reqif.models.reqif_spec_object_type import ReqIFSpecObjectType
+from reqif.models.reqif_spec_relation_type import ReqIFSpecRelationType
+from reqif.models.reqif_specification_type import ReqIFSpecificationType
+from reqif.parsers.data_type_parser import DataTypeParser
+from reqif.parsers.header_parser import ReqIFHeaderParser
+from reqif.parsers.relation_group_parser import ReqIFRelationGroupParser
+from reqif.parsers.spec_object_parser import SpecObjectParser
+from reqif.parsers.spec_relation_parser import SpecRelationParser
+from reqif.parsers.spec_types.relation_group_type_parser import RelationGroupTypeParser
+from reqif.parsers.spec_types.spec_object_type_parser import SpecObjectTypeParser
+from reqif.parsers.spec_types.spec_relation_type_parser import SpecRelationTypeParser
+from reqif.parsers.spec_types.specification_type_parser import SpecificationTypeParser
+from reqif.parsers.specification_parser import ReqIFSpecificationParser
+from reqif.reqif_bundle import ReqIFBundle
+from reqif.unparser import ReqIFUnparser
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+
+class ReqifStreamWriter():
+    # lobster-trace: SwRequirements.sw_req_reqif_stream
+    """Writes a ReqIF document element by element to one or more text streams.
+
+    The datatypes and spec types of a ReqIF document are only complete after all
+    records are converted, but they precede the spec objects in the document.
+    Therefore every spec object is serialized as soon as it is created into a
+    temporary spool file and only its XML is kept, not the object model. When the
+    document is written, the spool file is copied in chunks between the spec types
+    and the spec relations. The output is identical to ReqIFUnparser.unparse(),
+    but the whole document is never kept in memory.
+    """
+
+    # Size of the chunks in characters, the spool file is copied with.
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self) -> None:
+        """Construct the stream writer. The spool file is created with the first spec object."""
+        self._spool_file: Optional[TextIO] = None
+        self._spec_object_count = 0
+
+    def add_spec_object(self, spec_object: ReqIFSpecObject) -> None:
+        # lobster-trace: SwRequirements.sw_req_reqif_stream
+        """Serialize the given spec object into the spool file.
+
+        Args:
+            spec_object (ReqIFSpecObject): The spec object.
+        """
+        if self._spool_file is None:
+            # pylint: disable-next=consider-using-with
+            self._spool_file = tempfile.TemporaryFile("w+", encoding="utf-8", prefix="pyTRLCConverter_reqif_")
+
+        self._spool_file.write(SpecObjectParser.unparse(spec_object))
+        self._spec_object_count += 1
+
+    def get_spec_object_count(self) -> int:
+        """Get the number of spooled spec objects.
+
+        Returns:
+            int: Number of spooled spec objects.
+        """
+        return self._spec_object_count
+
+    def write(self, bundle: ReqIFBundle, targets: list[TextIO]) -> None:
+        # lobster-trace: SwRequirements.sw_req_reqif_stream
+        """Write the ReqIF document to the given text streams.
+
+        The spec objects of the bundle are written first, followed by the spooled ones.
+
+        Args:
+            bundle (ReqIFBundle): The bundle with everything except the spooled spec objects.
+            targets (list[TextIO]): The text streams, e.g. a file and a ZIP archive entry.
+        """
+        def emit(text: str) -> None:
+            for target in targets:
+                target.write(text)
+
+        emit('<?xml version="1.0" encoding="UTF-8"?>\n')
+        emit(ReqIFUnparser.unparse_namespace_info(bundle.namespace_info))
+
+        if bundle.req_if_header is not None:
+            emit(ReqIFHeaderParser.unparse(bundle.req_if_header))
+
+        if bundle.core_content is not None:
+            emit("  <CORE-CONTENT>\n")
+            content = bundle.core_content.req_if_content
+
+            if content:
+                emit("    <REQ-IF-CONTENT>\n")
+                self._write_content(content, emit)
+                emit("    </REQ-IF-CONTENT>\n")
+            emit("  </CORE-CONTENT>\n")
+
+        if bundle.tool_extensions_tag_exists:
+            emit("  <TOOL-EXTENSIONS>\n")
+            emit("  </TOOL-EXTENSIONS>\n")
+
+        emit("</REQ-IF>\n")
+
+    def close(self) -> None:
+        # lobster-trace: SwRequirements.sw_req_reqif_stream
+        """Close and remove the spool file. The spooled spec objects are discarded."""
+        if self._spool_file is not None:
+            self._spool_file.close()
+            self._spool_file = None
+
+        self._spec_object_count = 0
+
+    def _write_content(self, content: ReqIFReqIFContent, emit: Callable[[str], None]) -> None:
+        """Write the sections of the ReqIF content, with the spooled spec objects.
+
+        Args:
+            content (ReqIFReqIFContent): The ReqIF content.
+            emit (Callable[[str], None]): Writes a text to all targets.
+        """
+        if content.data_types is not None:
+            emit("      <DATATYPES>\n")
+            for data_type in content.data_types:
+                emit(DataTypeParser.unparse(data_type))
+            emit("      </DATATYPES>\n")
+
+        if content.spec_types is not None:
+            emit("      <SPEC-TYPES>\n")
+            for spec_type in content.spec_types:
+                emit(ReqifStreamWriter._unparse_spec_type(spec_type))
+            emit("      </SPEC-TYPES>\n")
+
+        if (content.spec_objects is not None) or (self._spool_file is not None):
+            emit("      <SPEC-OBJECTS>\n")
+            for spec_object in content.spec_objects or []:
+                emit(SpecObjectParser.unparse(spec_object))
+            self._copy_spool_file(emit)
+            emit("      </SPEC-OBJECTS>\n")
+
+        if content.spec_relations is not None:
+            emit("      <SPEC-RELATIONS>\n")
+            for spec_relation in content.spec_relations:
+                emit(SpecRelationParser.unparse(spec_relation))
+            emit("      </SPEC-RELATIONS>\n")
+
+        if content.specifications is not None:
+            emit("      <SPECIFICATIONS>\n")
+            for specification in content.specifications:
+                emit(ReqIFSpecificationParser.unparse(specification))
+            emit("      </SPECIFICATIONS>\n")
+
+        if content.spec_relation_groups is not None:
+            emit("      <SPEC-RELATION-GROUPS>\n")
+            for spec_relation_group in content.spec_relation_groups:
+                emit(ReqIFRelationGroupParser.unparse(spec_relation_group))
+            emit("      </SPEC-RELATION-GROUPS>\n")
+
+    def _copy_spool_file(self, emit: Callable[[str], None]) -> None:
+        """Copy the spooled spec objects in chunks.
+
+        Args:
+            emit (Callable[[str], None]): Writes a chunk to all targets.
+        """
+        if self._spool_file is not None:
+            self._spool_file.seek(0)
+
+            chunk = self._spool_file.read(ReqifStreamWriter.CHUNK_SIZE)
+            while 0 < len(chunk):
+                emit(chunk)
+                chunk = self._spool_file.read(ReqifStreamWriter.CHUNK_SIZE)
+
+            # Continue spooling at the end, if further spec objects are added.
+            self._spool_file.seek(0, 2)
+
+    @staticmethod
+    def _unparse_spec_type(spec_type: Any) -> str:
+        """Serialize a spec type with the parser of its kind.
+
+        Args:
+            spec_type (Any): The spec object, spec relation, specification or relation group type.
+
+        Returns:
+            str: The XML of the spec type or an empty string for an unknown kind.
+        """
+        xml = ""
+
+        if isinstance(spec_type, ReqIFSpecObjectType):
+            xml = SpecObjectTypeParser.unparse(spec_type)
+        elif isinstance(spec_type, ReqIFSpecRelationType):
+            xml = SpecRelationTypeParser.unparse(spec_type)
+        elif isinstance(spec_type, ReqIFSpecificationType):
+            xml = SpecificationTypeParser.unparse(spec_type)
+        elif isinstance(spec_type, ReqIFRelationGroupType):
+            xml = RelationGroupTypeParser.unparse(spec_type)
+
+        return xml
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
@@ -21,9 +21,16 @@
 # If not, see <https://www.gnu.org/licenses/>.
 
 # Imports **********************************************************************
+from pyTRLCConverter.text_escaper import TextEscaper
 
 # Variables ********************************************************************
 
+# Characters which have a special meaning in reStructuredText and need to be escaped by a backslash.
+RST_ESCAPE_CHARACTERS = ["\\", "`", "*", "_", "{", "}", "[", "]", "<", ">", "(", ")", "#", "+", "-", ".", "!", "|"]
+
+# Escapes the special characters and keeps the escaped short texts in a cache.
+RST_ESCAPER = TextEscaper(RST_ESCAPE_CHARACTERS)
+
 # Classes **********************************************************************
 
 
@@ -43,12 +50,7 @@ class RstText:
         Returns:
             str: Escaped text
         """
-        characters = ["\\", "`", "*", "_", "{", "}", "[", "]", "<", ">", "(", ")", "#", "+", "-", ".", "!", "|"]
-
-        for character in characters:
-            text = text.replace(character, "\\" + character)
-
-        return text
+        return RST_ESCAPER.escape(text)
 
     @staticmethod
     def link(text: str, target: str, escape: bool = True) -> str:
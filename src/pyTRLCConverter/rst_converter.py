@@ -24,15 +24,20 @@ import os
 import shutil
 import tempfile
 from typing import Optional, Any
-from marko import Markdown
 from trlc.ast import Implicit_Null, Record_Object, Record_Reference, String_Literal, Expression
 from pyTRLCConverter.base_converter import BaseConverter
+from pyTRLCConverter.converter_registry import RST_DESCRIPTION, RST_SUBCOMMAND
+from pyTRLCConverter.link_index import RecordLinkIndex
 from pyTRLCConverter.rst.document import RstDocument
 from pyTRLCConverter.rst.element import RstHeading, RstAdmonition, RstTable, RstBulletList
 from pyTRLCConverter.rst.text import RstText
 from pyTRLCConverter.ret import Ret
 from pyTRLCConverter.trlc_helper import TrlcAstWalker
 from pyTRLCConverter.logger import log_verbose, log_error
+from pyTRLCConverter.profiler import profile_phase
+from pyTRLCConverter.render_cache import RenderCache
+from pyTRLCConverter.render_config import RenderConfig
+from pyTRLCConverter.marko.marko_renderer import MarkoRenderer
 from pyTRLCConverter.marko.md2rst_renderer import Md2RstRenderer
 from pyTRLCConverter.marko.gfm2rst_renderer import Gfm2RstRenderer
 
@@ -66,11 +71,10 @@ class RstConverter(BaseConverter):
         # The path to the given output folder.
         self._out_path = args.out
 
-        # The excluded paths in normalized form.
-        self._excluded_paths = []
-
-        if args.exclude is not None:
-            self._excluded_paths = [os.path.normpath(path) for path in args.exclude]
+        # The link targets of the records in the output documents.
+        self._record_link_index = RecordLinkIndex(args,
+                                                  self._file_name_trlc_to_rst,
+                                                  RstConverter._get_record_link_target)
 
         # The reStructuredText document currently being built. In multiple-document mode a new
         # document is created per file, in single-document mode one document is shared.
@@ -91,6 +95,11 @@ class RstConverter(BaseConverter):
         self._plantuml_tmp_dir: Optional[tempfile.TemporaryDirectory] = None
         self._external_files: list = []
 
+        # lobster-trace: SwRequirements.sw_req_render_markdown_reuse
+        # The Markdown parsers and renderers, which are set up once and reused for every attribute.
+        self._marko_renderer_md = MarkoRenderer(Md2RstRenderer)
+        self._marko_renderer_gfm = MarkoRenderer(Gfm2RstRenderer, ["gfm"])
+
     @staticmethod
     def get_subcommand() -> str:
         # lobster-trace: SwRequirements.sw_req_rst
@@ -100,7 +109,7 @@ class RstConverter(BaseConverter):
         Returns:
             str: Parser subcommand token
         """
-        return "rst"
+        return RST_SUBCOMMAND
 
     @staticmethod
     def get_description() -> str:
@@ -111,7 +120,7 @@ class RstConverter(BaseConverter):
         Returns:
             str: Converter description
         """
-        return "Convert into reStructuredText format."
+        return RST_DESCRIPTION
 
     @classmethod
     def register(cls, args_parser: Any) -> None:
@@ -193,13 +202,7 @@ class RstConverter(BaseConverter):
             else:
                 log_verbose("Multiple document mode.")
 
-            # Set the value for empty attributes.
-            self._empty_attribute_value = self._args.empty
-
-            log_verbose(f"Empty attribute value: {self._empty_attribute_value}")
-
-            # pylint: disable-next=consider-using-with
-            self._plantuml_tmp_dir = tempfile.TemporaryDirectory(prefix="pyTRLCConverter_rst_")
+            self._prepare_conversion()
 
             # Single document mode?
             if self._args.single_document is True:
@@ -214,6 +217,60 @@ class RstConverter(BaseConverter):
 
         return result
 
+    def take_over_caches(self, converter: BaseConverter) -> None:
+        # lobster-trace: SwRequirements.sw_req_cli_watch
+        """Take over the Markdown parsers and renderers of the converter of the previous conversion.
+
+        The render cache is not taken over, because the cached values may refer to
+        external files, e.g. PlantUML images, in the temporary folder of the previous
+        conversion, which is removed at its end.
+
+        Args:
+            converter (BaseConverter): The converter of the previous conversion of the same class.
+        """
+        if isinstance(converter, RstConverter):
+            # pylint: disable=protected-access
+            self._marko_renderer_md = converter._marko_renderer_md
+            self._marko_renderer_gfm = converter._marko_renderer_gfm
+            # pylint: enable=protected-access
+
+    def is_parallel_file_processing_supported(self) -> bool:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """Check whether the files can be converted by independent converter instances in parallel.
+
+        This is the case in multiple document mode.
+
+        Returns:
+            bool: True if parallel file processing is supported, otherwise False.
+        """
+        return self._args.single_document is False
+
+    def get_output_files(self, file_name: str) -> Optional[list[str]]:
+        # lobster-trace: SwRequirements.sw_req_cli_cache_dir
+        """Get the output files which are written for the given TRLC file.
+
+        Args:
+            file_name (str): The TRLC file name.
+
+        Returns:
+            Optional[list[str]]: The output files.
+        """
+        output_file_name = self._args.name
+
+        if self._args.single_document is False:
+            output_file_name = self._file_name_trlc_to_rst(file_name)
+
+        return [os.path.join(self._out_path, output_file_name)]
+
+    def _get_plantuml_diagram_type(self) -> Optional[str]:
+        # lobster-trace: SwRequirements.sw_req_plantuml_batch
+        """Get the type of the images the converter renders PlantUML diagrams to.
+
+        Returns:
+            Optional[str]: Diagram type svg.
+        """
+        return "svg"
+
     def enter_file(self, file_name: str) -> Ret:
         # lobster-trace: SwRequirements.sw_req_rst_multiple_doc_mode
         """
@@ -322,12 +379,55 @@ class RstConverter(BaseConverter):
             self._external_files = []
             self._document = None
 
+        self._release_plantuml_tmp_dir()
+        self._report_render_cache_statistics()
+
+        return result
+
+    def begin_worker(self) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        Begin the conversion in a worker process of the parallel file processing.
+
+        Returns:
+            Ret: Status
+        """
+        result = BaseConverter.begin_worker(self)
+
+        if result == Ret.OK:
+            self._prepare_conversion()
+
+        return result
+
+    def finish_worker(self) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        Finish the conversion in a worker process of the parallel file processing.
+
+        Returns:
+            Ret: Status
+        """
+        self._release_plantuml_tmp_dir()
+
+        return Ret.OK
+
+    def _prepare_conversion(self) -> None:
+        """Set the value for empty attributes and create the folder for the rendered PlantUML diagrams.
+        """
+        self._empty_attribute_value = self._args.empty
+
+        log_verbose(f"Empty attribute value: {self._empty_attribute_value}")
+
+        # pylint: disable-next=consider-using-with
+        self._plantuml_tmp_dir = tempfile.TemporaryDirectory(prefix="pyTRLCConverter_rst_")
+
+    def _release_plantuml_tmp_dir(self) -> None:
+        """Remove the folder for the rendered PlantUML diagrams.
+        """
         if self._plantuml_tmp_dir is not None:
             self._plantuml_tmp_dir.cleanup()
             self._plantuml_tmp_dir = None
 
-        return result
-
     def _get_rst_heading_level(self, level: int) -> int:
         # lobster-trace: SwRequirements.sw_req_rst_section
         """
@@ -380,7 +480,7 @@ class RstConverter(BaseConverter):
             file_name_with_path = os.path.join(self._out_path, file_name)
 
         try:
-            with open(file_name_with_path, "w", encoding="utf-8") as out_file:
+            with profile_phase("write"), open(file_name_with_path, "w", encoding="utf-8") as out_file:
                 out_file.write(self._document.render())
         except IOError as e:
             log_error(f"Failed to open file {file_name_with_path}: {e}")
@@ -431,7 +531,7 @@ class RstConverter(BaseConverter):
             type_name = self._ast_meta_data.get("type_name", "")
             attribute_name = self._ast_meta_data.get("attribute_name", "")
 
-            result = self._render(package_name, type_name, attribute_name, result)
+            result = self._render_attribute(package_name, type_name, attribute_name, result)
 
         return result
 
@@ -449,29 +549,24 @@ class RstConverter(BaseConverter):
         """
         assert record_reference.target is not None
 
-        file_name = ""
+        target_id = self._record_link_index.get_link_target(record_reference.target)
 
-        # Single document mode?
-        if self._args.single_document is True:
-            file_name = self._args.name
-
-            # Is the link to a excluded file?
-            for excluded_path in self._excluded_paths:
-
-                if os.path.commonpath([excluded_path, record_reference.target.location.file_name]) == excluded_path:
-                    file_name = self._file_name_trlc_to_rst(record_reference.target.location.file_name)
-                    break
-
-        # Multiple document mode
-        else:
-            file_name = self._file_name_trlc_to_rst(record_reference.target.location.file_name)
+        return RstText.link(str(record_reference.to_python_object()), target_id)
 
-        record_name = record_reference.target.name
+    @staticmethod
+    def _get_record_link_target(file_name: str, record_name: str) -> str:
+        # lobster-trace: SwRequirements.sw_req_rst_link
+        """
+        Get the target ID of a record in a reStructuredText document.
 
-        # Create a target ID for the record
-        target_id = f"{file_name}-{record_name.lower().replace(' ', '-')}"
+        Args:
+            file_name (str): The reStructuredText file name.
+            record_name (str): The record name.
 
-        return RstText.link(str(record_reference.to_python_object()), target_id)
+        Returns:
+            str: The target ID with the file name and the record name.
+        """
+        return f"{file_name}-{record_name.lower().replace(' ', '-')}"
 
     def _other_dispatcher(self, expression: Expression) -> str:
         # lobster-trace: SwRequirements.sw_req_rst_record
@@ -487,7 +582,7 @@ class RstConverter(BaseConverter):
         """
         return RstText.escape(expression.to_string())
 
-    def _get_trlc_ast_walker(self) -> TrlcAstWalker:
+    def _create_trlc_ast_walker(self) -> TrlcAstWalker:
         # lobster-trace: SwRequirements.sw_req_rst_record
         # lobster-trace: SwRequirements.sw_req_rst_escape
         # lobster-trace: SwRequirements.sw_req_rst_string_format
@@ -547,19 +642,11 @@ class RstConverter(BaseConverter):
 
             # Is it CommonMark Markdown format?
             if self._render_cfg.is_format_md(package_name, type_name, attribute_name) is True:
-                assert self._plantuml_tmp_dir is not None
-                Md2RstRenderer.image_dir = self._plantuml_tmp_dir.name
-                Md2RstRenderer.external_files = self._external_files
-                markdown = Markdown(renderer=Md2RstRenderer)
-                result = markdown.convert(attribute_value)
+                result = self._markdown_to_rst(attribute_value, gfm_mode=False)
 
             # Is it GitHub Flavored Markdown format?
             elif self._render_cfg.is_format_gfm(package_name, type_name, attribute_name) is True:
-                assert self._plantuml_tmp_dir is not None
-                Md2RstRenderer.image_dir = self._plantuml_tmp_dir.name
-                Md2RstRenderer.external_files = self._external_files
-                markdown = Markdown(renderer=Gfm2RstRenderer, extensions=['gfm'])
-                result = markdown.convert(attribute_value)
+                result = self._markdown_to_rst(attribute_value, gfm_mode=True)
 
             # Otherwise escape the text for reStructuredText.
             else:
@@ -567,6 +654,53 @@ class RstConverter(BaseConverter):
 
         return result
 
+    def _markdown_to_rst(self, markdown_text: str, gfm_mode: bool) -> str:
+        # lobster-trace: SwRequirements.sw_req_rst_render_md
+        # lobster-trace: SwRequirements.sw_req_rst_render_gfm
+        # lobster-trace: SwRequirements.sw_req_rst_render_plantuml
+        # lobster-trace: SwRequirements.sw_req_cli_render_cache
+        """Convert Markdown text to reStructuredText, taking it from the render cache if possible.
+
+        The external files, which were registered while rendering, are cached with the
+        reStructuredText and registered again if the cached reStructuredText is used.
+
+        Args:
+            markdown_text (str): Markdown source text.
+            gfm_mode (bool): If True, use the GFM extension; otherwise use CommonMark.
+
+        Returns:
+            str: The reStructuredText.
+        """
+        cache_key = None
+        cached = None
+
+        if self._render_cache.is_enabled() is True:
+            format_specifier = RenderConfig.FORMAT_SPECIFIER_GFM if gfm_mode else RenderConfig.FORMAT_SPECIFIER_MD
+            cache_key = RenderCache.get_key(markdown_text, format_specifier, None, self.get_subcommand())
+            cached = self._render_cache.get(cache_key)
+
+        if cached is not None:
+            result, external_files = cached
+
+            for external_file in external_files:
+                if external_file not in self._external_files:
+                    self._external_files.append(external_file)
+
+        else:
+            external_file_count = len(self._external_files)
+
+            assert self._plantuml_tmp_dir is not None
+            marko_renderer = self._marko_renderer_gfm if gfm_mode else self._marko_renderer_md
+            result = marko_renderer.convert(markdown_text,
+                                            image_dir=self._plantuml_tmp_dir.name,
+                                            external_files=self._external_files,
+                                            plantuml=self._get_plantuml())
+
+            if cache_key is not None:
+                self._render_cache.put(cache_key, (result, tuple(self._external_files[external_file_count:])))
+
+        return result
+
     def _copy_external_files(self, dest_dir: str) -> None:
         # lobster-trace: SwRequirements.sw_req_rst_render_plantuml
         """Copy all collected external files to the given destination directory.
@@ -614,8 +748,9 @@ class RstConverter(BaseConverter):
         # Build rows for the table.
         rows = []
         trlc_ast_walker = self._get_trlc_ast_walker()
+        schema = self._get_record_type_schema(record)
         for name, value in record.field.items():
-            attribute_name = self._translate_attribute_name(translation, name)
+            attribute_name = schema.fields[name].get_attribute_name(translation)
             attribute_name = RstText.escape(attribute_name)
 
             # Retrieve the attribute value by processing the field value.
@@ -0,0 +1,150 @@
+"""Watches the TRLC sources and further input files for changes.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import os
+import time
+from typing import Optional
+from pyTRLCConverter.trlc_helper import get_trlc_source_files
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+
+class SourceWatcher():
+    # lobster-trace: SwRequirements.sw_req_cli_watch
+    """Watches the TRLC sources and further input files for changes by polling.
+
+    Every poll compares the modification time and the size of the files with the
+    previous poll. The source and include folders are scanned again every time, so
+    added and removed TRLC files are detected as well. Polling works on every
+    platform and file system, e.g. network drives, and a poll of a requirements
+    tree takes only a few milliseconds.
+    """
+
+    # Default interval in seconds between two polls.
+    INTERVAL_DEFAULT = 0.5
+
+    def __init__(self,
+                 source_items: list[str],
+                 includes: Optional[list[str]],
+                 file_names: list[str],
+                 interval: float = INTERVAL_DEFAULT) -> None:
+        """Construct the source watcher. The files are watched after start().
+
+        Args:
+            source_items (list[str]): Paths to folders with TRLC files or to TRLC files.
+            includes (Optional[list[str]]): Paths for automatically file inclusion.
+            file_names (list[str]): Further input files, e.g. the render configuration.
+            interval (float): Interval in seconds between two polls.
+        """
+        self._source_items = source_items
+        self._includes = includes
+        self._file_names = [os.path.normpath(file_name) for file_name in file_names]
+        self._interval = interval
+        self._snapshot: dict[str, tuple[int, int]] = {}
+
+    @staticmethod
+    def is_trlc_file(file_name: str) -> bool:
+        """Check whether the given file is a TRLC model or requirements file.
+
+        Args:
+            file_name (str): The file name.
+
+        Returns:
+            bool: True if it is a .rsl or .trlc file, otherwise False.
+        """
+        return os.path.splitext(file_name)[1] in (".rsl", ".trlc")
+
+    def start(self) -> list[str]:
+        # lobster-trace: SwRequirements.sw_req_cli_watch
+        """Start watching by taking the state of all watched files.
+
+        Returns:
+            list[str]: The normalized names of all watched files, which exist.
+        """
+        self._snapshot = self._take_snapshot()
+
+        return sorted(self._snapshot.keys())
+
+    def get_changes(self) -> list[str]:
+        # lobster-trace: SwRequirements.sw_req_cli_watch
+        """Poll the watched files once.
+
+        Returns:
+            list[str]: The normalized names of the changed, added and removed files since the previous poll.
+        """
+        snapshot = self._take_snapshot()
+        file_names = set(snapshot.keys()) | set(self._snapshot.keys())
+        changes = [file_name for file_name in file_names if snapshot.get(file_name) != self._snapshot.get(file_name)]
+
+        self._snapshot = snapshot
+
+        return sorted(changes)
+
+    def wait_for_changes(self) -> list[str]:
+        # lobster-trace: SwRequirements.sw_req_cli_watch
+        """Wait until at least one watched file changed.
+
+        Editors and version control tools often write several files or a file in several
+        steps. Therefore polling continues until one interval passed without further
+        changes and all changes are returned together.
+
+        Returns:
+            list[str]: The normalized names of the changed, added and removed files.
+        """
+        changes: set[str] = set()
+        is_settled = False
+
+        while is_settled is False:
+            time.sleep(self._interval)
+            poll_changes = self.get_changes()
+
+            if 0 < len(poll_changes):
+                changes.update(poll_changes)
+            elif 0 < len(changes):
+                is_settled = True
+
+        return sorted(changes)
+
+    def _take_snapshot(self) -> dict[str, tuple[int, int]]:
+        """Get the modification time and the size of every watched file, which exists.
+
+        Returns:
+            dict[str, tuple[int, int]]: The modification time in nanoseconds and the size, keyed by file name.
+        """
+        snapshot = {}
+
+        for file_name in get_trlc_source_files(self._source_items, self._includes) + self._file_names:
+            try:
+                stat_result = os.stat(file_name)
+                snapshot[file_name] = (stat_result.st_mtime_ns, stat_result.st_size)
+
+            except OSError:
+                # The file was removed.
+                pass
+
+        return snapshot
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
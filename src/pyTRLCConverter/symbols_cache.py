@@ -0,0 +1,277 @@
+"""Persistent snapshot of the processed TRLC symbol table.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import gc
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from typing import Any, Optional
+from trlc.ast import Symbol_Table
+from trlc.errors import Message_Handler
+from trlc.lexer import TRLC_Lexer
+from trlc.version import TRLC_VERSION
+from pyTRLCConverter.logger import log_verbose
+from pyTRLCConverter.trlc_helper import get_trlc_source_files, get_trlc_symbols
+from pyTRLCConverter.version import __version__
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+
+# pylint: disable-next=too-few-public-methods
+class LexerSnapshot():
+    """Replacement of the TRLC lexer in the symbols cache.
+
+    The source references of the TRLC AST nodes only need the file name and the
+    content of their source file after processing. The token stream and the message
+    handler of the lexer are not stored, which reduces the cache size and load time.
+    """
+
+    def __init__(self, file_name: str, content: str) -> None:
+        """Construct the lexer snapshot.
+
+        Args:
+            file_name (str): The TRLC source file name.
+            content (str): The content of the TRLC source file.
+        """
+        self.file_name = file_name
+        self.content = content
+        self.length = len(content)
+
+
+class SymbolsPickler(pickle.Pickler):
+    """Pickler for the TRLC symbol table, which replaces objects that can't or
+    shall not be stored by a lightweight equivalent.
+    """
+
+    def reducer_override(self, obj: Any) -> Any:
+        """Reduce the lexers and the message handlers of the TRLC symbol table.
+
+        Args:
+            obj (Any): The object to pickle.
+
+        Returns:
+            Any: The reduce value or NotImplemented for the default pickling.
+        """
+        result = NotImplemented
+
+        if isinstance(obj, TRLC_Lexer):
+            result = (LexerSnapshot, (obj.file_name, obj.content))
+
+        # The message handler refers to the standard output stream.
+        elif isinstance(obj, Message_Handler):
+            result = (Message_Handler, ())
+
+        return result
+
+
+class SymbolsCache():
+    """Persistent snapshot of the processed TRLC symbol table.
+
+    The snapshot is only used if its fingerprint matches. The fingerprint covers the
+    program version, the TRLC version, the Python version, the source and include
+    paths and the content of all TRLC model and TRLC files.
+
+    The snapshot is stored with pickle. Only use symbols cache files which were
+    written by yourself, because loading a pickle file can execute arbitrary code.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, file_name: str, source_items: list[str], includes: Optional[list[str]]) -> None:
+        # lobster-trace: SwRequirements.sw_req_cli_symbols_cache
+        """Construct the symbols cache.
+
+        Args:
+            file_name (str): The symbols cache file name.
+            source_items (list[str]): Paths to folders with TRLC files or to TRLC files.
+            includes (Optional[list[str]]): Paths for automatically file inclusion.
+        """
+        self._file_name = file_name
+        self._source_items = source_items
+        self._includes = includes
+        self._fingerprint: Optional[str] = None
+
+    def load(self) -> Optional[Symbol_Table]:
+        # lobster-trace: SwRequirements.sw_req_cli_symbols_cache
+        """Load the TRLC symbol table, if the snapshot is up to date.
+
+        A missing, outdated or corrupt snapshot is not an error, the TRLC sources
+        just need to be processed again.
+
+        Returns:
+            Optional[Symbol_Table]: The TRLC symbol table or None if not available.
+        """
+        symbol_table = None
+
+        log_verbose(f"Loading symbols cache {self._file_name}.")
+
+        try:
+            with open(self._file_name, "rb") as file:
+                header = pickle.load(file)
+
+                if header == {"version": SymbolsCache.SCHEMA_VERSION, "fingerprint": self._get_fingerprint()}:
+                    symbol_table = SymbolsCache._load_symbol_table(file)
+                else:
+                    log_verbose(f"Symbols cache {self._file_name} is outdated.")
+
+        except FileNotFoundError:
+            log_verbose(f"Symbols cache {self._file_name} does not exist yet.")
+
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError) as exc:
+            log_verbose(f"Symbols cache {self._file_name} is corrupt: {exc}")
+
+        if (symbol_table is not None) and (not isinstance(symbol_table, Symbol_Table)):
+            log_verbose(f"Symbols cache {self._file_name} doesn't contain a symbol table.")
+            symbol_table = None
+
+        return symbol_table
+
+    def save(self, symbol_table: Symbol_Table) -> bool:
+        # lobster-trace: SwRequirements.sw_req_cli_symbols_cache
+        """Store the snapshot of the TRLC symbol table.
+
+        Failing to store the snapshot is not an error, the TRLC sources just need
+        to be processed again next time.
+
+        Args:
+            symbol_table (Symbol_Table): The processed TRLC symbol table.
+
+        Returns:
+            bool: True if the snapshot was stored, otherwise False.
+        """
+        status = True
+        header = {"version": SymbolsCache.SCHEMA_VERSION, "fingerprint": self._get_fingerprint()}
+
+        log_verbose(f"Saving symbols cache {self._file_name}.")
+
+        try:
+            cache_dir = os.path.dirname(os.path.abspath(self._file_name))
+            os.makedirs(cache_dir, exist_ok=True)
+
+            # Write to a temporary file first, to never expose a partially written snapshot
+            # to other conversions which use the same cache.
+            file_descriptor, tmp_file_name = tempfile.mkstemp(dir=cache_dir)
+
+            try:
+                with os.fdopen(file_descriptor, "wb") as file:
+                    pickle.dump(header, file, protocol=pickle.HIGHEST_PROTOCOL)
+                    SymbolsPickler(file, protocol=pickle.HIGHEST_PROTOCOL).dump(symbol_table)
+
+                os.replace(tmp_file_name, self._file_name)
+
+            finally:
+                if os.path.exists(tmp_file_name):
+                    os.remove(tmp_file_name)
+
+        except (OSError, pickle.PicklingError, RecursionError, TypeError) as exc:
+            log_verbose(f"Failed to save symbols cache {self._file_name}: {exc}")
+            status = False
+
+        return status
+
+    def _get_fingerprint(self) -> str:
+        """Get the fingerprint of all inputs of the TRLC symbol table.
+
+        Returns:
+            str: Fingerprint
+        """
+        if self._fingerprint is None:
+            hasher = hashlib.sha256()
+            hasher.update(f"{__version__}\0{TRLC_VERSION}\0{sys.version}\0".encode("utf-8"))
+            hasher.update(f"{self._source_items!r}\0{self._includes!r}\0".encode("utf-8"))
+
+            for file_name in get_trlc_source_files(self._source_items, self._includes):
+                hasher.update(file_name.encode("utf-8"))
+                hasher.update(b"\0")
+
+                if os.path.isfile(file_name):
+                    with open(file_name, "rb") as file:
+                        hasher.update(hashlib.sha256(file.read()).digest())
+
+            self._fingerprint = hasher.hexdigest()
+
+        return self._fingerprint
+
+    @staticmethod
+    def _load_symbol_table(file: Any) -> Any:
+        """Load the pickled TRLC symbol table from the given file.
+
+        The symbol table consists of a huge number of objects. The garbage collector
+        is paused while loading, because it would otherwise scan them over and over again.
+
+        Args:
+            file (Any): The opened symbols cache file, positioned after the header.
+
+        Returns:
+            Any: The unpickled object.
+        """
+        is_gc_enabled = gc.isenabled()
+        gc.disable()
+
+        try:
+            result = pickle.load(file)
+        finally:
+            if is_gc_enabled is True:
+                gc.enable()
+
+        return result
+
+# Functions ********************************************************************
+
+
+def get_trlc_symbols_cached(source_items: list[str],
+                            includes: Optional[list[str]],
+                            symbols_cache_file: Optional[str]) -> Optional[Symbol_Table]:
+    # lobster-trace: SwRequirements.sw_req_cli_symbols_cache
+    """Get the TRLC symbol table from the symbols cache or by processing the TRLC sources.
+
+    If the TRLC sources have to be processed, the snapshot of the resulting symbol
+    table is stored in the symbols cache.
+
+    Args:
+        source_items (list[str]): Paths to folders with TRLC files or to TRLC files.
+        includes (Optional[list[str]]): Paths for automatically file inclusion.
+        symbols_cache_file (Optional[str]): The symbols cache file name or None to not use it.
+
+    Returns:
+        Optional[Symbol_Table]: TRLC symbol table or None on error.
+    """
+    symbol_table = None
+    symbols_cache = None
+
+    if symbols_cache_file is not None:
+        symbols_cache = SymbolsCache(symbols_cache_file, source_items, includes)
+        symbol_table = symbols_cache.load()
+
+    if symbol_table is None:
+        symbol_table = get_trlc_symbols(source_items, includes)
+
+        if (symbol_table is not None) and (symbols_cache is not None):
+            symbols_cache.save(symbol_table)
+
+    return symbol_table
+
+# Main *************************************************************************
@@ -0,0 +1,135 @@
+"""Keeps the processed TRLC symbol tables of several source sets in memory.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+
+# Imports **********************************************************************
+import os
+import threading
+from typing import Optional
+from trlc.ast import Symbol_Table
+from pyTRLCConverter.logger import log_verbose
+from pyTRLCConverter.source_watcher import SourceWatcher
+from pyTRLCConverter.symbols_cache import get_trlc_symbols_cached
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+
+# pylint: disable-next=too-few-public-methods
+class _SymbolsEntry():
+    """The processed TRLC symbol table of a source set and the watcher of its TRLC files."""
+
+    def __init__(self, source_items: list[str], includes: Optional[list[str]]) -> None:
+        """Construct the entry without symbol table.
+
+        Args:
+            source_items (list[str]): Paths to folders with TRLC files or to TRLC files.
+            includes (Optional[list[str]]): Paths for automatically file inclusion.
+        """
+        self.lock = threading.Lock()
+        self.watcher = SourceWatcher(source_items, includes, [])
+        self.symbols: Optional[Symbol_Table] = None
+
+
+class SymbolsStore():
+    # lobster-trace: SwRequirements.sw_req_serve
+    """Keeps the processed TRLC symbol tables in memory, one per source set.
+
+    A source set is given by the source and include paths. Its symbol table is
+    processed on first request and reused as long as no TRLC file of the source
+    set changed, was added or removed. Requests of different source sets are
+    served concurrently, the same source set is processed only once at a time.
+    """
+
+    def __init__(self) -> None:
+        """Construct the empty symbols store."""
+        self._entries: dict[tuple, _SymbolsEntry] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self,
+            source_items: list[str],
+            includes: Optional[list[str]],
+            symbols_cache_file: Optional[str] = None) -> Optional[Symbol_Table]:
+        # lobster-trace: SwRequirements.sw_req_serve
+        """Get the TRLC symbol table of the given source set.
+
+        Args:
+            source_items (list[str]): Paths to folders with TRLC files or to TRLC files.
+            includes (Optional[list[str]]): Paths for automatically file inclusion.
+            symbols_cache_file (Optional[str]): The symbols cache file name, which is used if
+                the TRLC sources have to be processed, or None.
+
+        Returns:
+            Optional[Symbol_Table]: TRLC symbol table or None on error.
+        """
+        key = (tuple(os.path.abspath(source_item) for source_item in source_items),
+               tuple(os.path.abspath(include) for include in includes) if includes is not None else ())
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                entry = _SymbolsEntry(source_items, includes)
+                self._entries[key] = entry
+
+        with entry.lock:
+            is_up_to_date = (entry.symbols is not None) and (len(entry.watcher.get_changes()) == 0)
+
+            if is_up_to_date is False:
+                log_verbose(f"Processing the TRLC sources {source_items}.")
+
+                # The state of the files is taken before processing them, a change in between
+                # is detected by the next request.
+                entry.watcher.start()
+                entry.symbols = get_trlc_symbols_cached(source_items, includes, symbols_cache_file)
+
+            symbols = entry.symbols
+
+        with self._lock:
+            if is_up_to_date is True:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+        return symbols
+
+    def get_statistics(self) -> dict:
+        # lobster-trace: SwRequirements.sw_req_serve
+        """Get the statistics of the symbols store.
+
+        Returns:
+            dict: Number of source sets, hits and misses.
+        """
+        with self._lock:
+            statistics = {
+                "source_sets": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses
+            }
+
+        return statistics
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
@@ -0,0 +1,106 @@
+"""Escaping of the special characters of a markup language by a backslash.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+from functools import lru_cache
+from typing import Any
+
+# Variables ********************************************************************
+
+# Texts up to this length (e.g. attribute names, enum values and headings) are kept in the escape cache.
+ESCAPE_CACHE_TEXT_LENGTH_MAX = 64
+
+# Number of escaped texts kept in the escape cache.
+ESCAPE_CACHE_SIZE = 4096
+
+# Classes **********************************************************************
+
+
+class TextEscaper():
+    # lobster-trace: SwRequirements.sw_req_markdown_escape
+    # lobster-trace: SwRequirements.sw_req_rst_escape
+    """Escapes the given special characters of a text by a backslash.
+
+    Short texts repeat often, e.g. attribute names and enum values, therefore they are
+    escaped in a single pass and kept in a LRU cache. Long texts rarely repeat and would
+    only bloat the cache. They contain typically several special characters, which
+    str.replace() handles faster than the translation table.
+    """
+
+    def __init__(self, characters: list[str]) -> None:
+        """Construct the text escaper.
+
+        Args:
+            characters (list[str]): The special characters, which need to be escaped.
+        """
+        self._characters = characters
+        self._table = str.maketrans({character: "\\" + character for character in characters})
+        self._escape_short_text = lru_cache(maxsize=ESCAPE_CACHE_SIZE)(self._translate)
+
+    def escape(self, text: str) -> str:
+        # lobster-trace: SwRequirements.sw_req_markdown_escape
+        # lobster-trace: SwRequirements.sw_req_rst_escape
+        """Escapes the special characters of the text.
+
+        Args:
+            text (str): Text to escape
+
+        Returns:
+            str: Escaped text
+        """
+        escaped_text = ""
+
+        if len(text) <= ESCAPE_CACHE_TEXT_LENGTH_MAX:
+            escaped_text = self._escape_short_text(text)
+        else:
+            escaped_text = text
+
+            for character in self._characters:
+                escaped_text = escaped_text.replace(character, "\\" + character)
+
+        return escaped_text
+
+    def cache_info(self) -> Any:
+        """Get the statistics of the escape cache of the short texts.
+
+        Returns:
+            Any: The cache statistics, see functools.lru_cache().
+        """
+        return self._escape_short_text.cache_info()
+
+    def cache_clear(self) -> None:
+        """Clear the escape cache of the short texts."""
+        self._escape_short_text.cache_clear()
+
+    def _translate(self, text: str) -> str:
+        """Escapes a text in a single pass with the translation table.
+
+        Args:
+            text (str): Text to escape
+
+        Returns:
+            str: Escaped text
+        """
+        return text.translate(self._table)
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
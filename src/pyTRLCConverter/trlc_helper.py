@@ -59,6 +59,10 @@ class TrlcAstWalker():
         self._other_dispatcher: Optional[Callable] = None
         self._list_item_dispatcher: Optional[Callable] = None
 
+        # The begin, process and finish handler per node type, derived from the dispatcher maps
+        # on first use. Walking a node costs this way a single lookup.
+        self._dispatch_table = {}  # type: dict[type, tuple[Optional[Callable], Callable, Optional[Callable]]]
+
     def walk(self, expression: Expression) -> Union[list[Any],Any]:
         """
         Walk through the TRLC AST.
@@ -91,6 +95,8 @@ class TrlcAstWalker():
         if finish is not None:
             self._dispatcher_map_finish[type_name] = finish
 
+        self._dispatch_table.clear()
+
     def set_other_dispatcher(self, dispatcher: Callable) -> None:
         """
         Set the other dispatcher. This dispatcher is called when no dispatcher is found for the node.
@@ -99,6 +105,7 @@ class TrlcAstWalker():
             dispatcher (Callable): The other dispatcher
         """
         self._other_dispatcher = dispatcher
+        self._dispatch_table.clear()
 
     def set_list_item_dispatcher(self, dispatcher: Callable) -> None:
         """
@@ -109,28 +116,34 @@ class TrlcAstWalker():
         """
         self._list_item_dispatcher = dispatcher
 
-    def _dispatch(self, dispatcher_map: dict, expression: Expression, handle_other: bool) -> Union[list[Any],Any]:
+    def _get_handlers(self, type_name: type) -> tuple[Optional[Callable], Callable, Optional[Callable]]:
         """
-        Dispatch the expression to the dispatcher map.
+        Get the begin, process and finish handler of the given node type.
+
+        If no process handler is found, the other dispatcher processes the node.
 
         Args:
-            dispatcher_map (dict): The dispatcher map.
-            expression (Expression): The AST node.
-            handle_other (bool): If True, the other dispatcher is called when no dispatcher is found.
+            type_name (type): The type of the AST node.
 
         Returns:
-            Union[list[Any],Any]: The result of the dispatcher.
+            tuple[Optional[Callable], Callable, Optional[Callable]]: The begin, process and finish handler.
         """
-        result = ""
+        handlers = self._dispatch_table.get(type_name)
 
-        type_name = type(expression)
+        if handlers is None:
+            process = self._dispatcher_map_process.get(type_name)
 
-        if type_name in dispatcher_map:
-            result = dispatcher_map[type_name](expression)
-        elif handle_other is True:
-            result = self._on_other(expression)
+            if process is None:
+                process = self._other_dispatcher if self._other_dispatcher is not None else self._on_other
 
-        return result
+            handlers = (
+                self._dispatcher_map_begin.get(type_name),
+                process,
+                self._dispatcher_map_finish.get(type_name)
+            )
+            self._dispatch_table[type_name] = handlers
+
+        return handlers
 
     def _on_array_aggregate(self, array_aggregate: Array_Aggregate) -> list[Any]:
         """
@@ -144,10 +157,13 @@ class TrlcAstWalker():
         """
         result = []
 
-        self._dispatch(self._dispatcher_map_begin, array_aggregate, False)
+        begin, _, finish = self._get_handlers(type(array_aggregate))
+
+        if begin is not None:
+            begin(array_aggregate)
 
         for expression in array_aggregate.value:
-            value_result = self._dispatch(self._dispatcher_map_process, expression, True)
+            value_result = self._get_handlers(type(expression))[1](expression)
 
             if self._list_item_dispatcher is not None:
                 value_result = self._list_item_dispatcher(expression, value_result)
@@ -157,7 +173,8 @@ class TrlcAstWalker():
             else:
                 result.append(value_result)
 
-        self._dispatch(self._dispatcher_map_finish, array_aggregate, False)
+        if finish is not None:
+            finish(array_aggregate)
 
         return result
 
@@ -171,9 +188,15 @@ class TrlcAstWalker():
         Returns:
             Union[list[str],str]: The result of the handling.
         """
-        self._dispatch(self._dispatcher_map_begin, expression, False)
-        result = self._dispatch(self._dispatcher_map_process, expression, True)
-        self._dispatch(self._dispatcher_map_finish, expression, False)
+        begin, process, finish = self._get_handlers(type(expression))
+
+        if begin is not None:
+            begin(expression)
+
+        result = process(expression)
+
+        if finish is not None:
+            finish(expression)
 
         return result
 
@@ -238,6 +261,35 @@ def get_trlc_symbols(source_items, includes):
 
     return symbol_table
 
+def get_trlc_source_files(source_items, includes):
+    # lobster-trace: SwRequirements.sw_req_cli_cache_dir
+    """Get the TRLC source files in the same way as they are registered by get_trlc_symbols().
+
+    Args:
+        source_items ([str]|str): One or more paths to folder with TRLC files \
+                                  or a single path to a TRLC file.
+        includes (str|None): Path for automatically file inclusion.
+
+    Returns:
+        [str]: Sorted list of normalized .rsl and .trlc file names.
+    """
+    file_names = set()
+    folders = list(source_items)
+
+    if includes is not None:
+        folders.extend(includes)
+
+    for src_item in folders:
+        if os.path.isdir(src_item):
+            for path, _, files in os.walk(src_item):
+                for file_name in files:
+                    if os.path.splitext(file_name)[1] in (".rsl", ".trlc"):
+                        file_names.add(os.path.normpath(os.path.join(path, file_name)))
+        else:
+            file_names.add(os.path.normpath(src_item))
+
+    return sorted(file_names)
+
 def is_item_file_name(item):
     # lobster-trace: SwRequirements.sw_req_destination_format
     """Check if the item is a file name.
@@ -294,15 +346,31 @@ def get_file_dict_from_symbols(symbols):
     item_list = None
 
     if symbols is not None:
-        for item in symbols.iter_record_objects_by_section():
-            # Is item a file name?
-            if is_item_file_name(item):
-                file_dict[item] = []
-                item_list = file_dict[item]
+        # Symbol_Table.iter_record_objects_by_section() remembers the reported files and
+        # sections in the symbol table, so it reports them only once per symbol table.
+        # The same order is built here without changing the symbol table, which allows
+        # to convert it several times, e.g. in watch mode.
+        sections = set()
 
-            else:
-                assert item_list is not None
-                item_list.append(item)
+        for record_object in symbols.iter_record_objects():
+            file_name = record_object.location.file_name
+            object_level = 0
+
+            if file_name not in file_dict:
+                item_list = []
+                file_dict[file_name] = item_list
+
+            assert item_list is not None
+
+            if record_object.section:
+                object_level = len(record_object.section) - 1
+
+                for level, section in enumerate(record_object.section):
+                    if section not in sections:
+                        sections.add(section)
+                        item_list.append((section.name, level))
+
+            item_list.append((record_object, object_level))
 
     return file_dict
 
@@ -19,11 +19,27 @@
 
 # Imports **********************************************************************
 
+import argparse
+import filecmp
+import json
+import os
+import pstats
 import re
 import shutil
+import subprocess
+import sys
+import zipfile
+from importlib.metadata import EntryPoint
+from pathlib import Path
+from unittest.mock import patch
 import pytest
 
 from pyTRLCConverter.__main__ import main
+from pyTRLCConverter.converter_registry import ENTRY_POINT_GROUP, ConverterRegistry
+from pyTRLCConverter.exclude_matcher import ExcludeMatcher
+from pyTRLCConverter.link_index import RecordLinkIndex
+from pyTRLCConverter.render_cache import RenderCache
+from pyTRLCConverter.trlc_helper import get_trlc_symbols
 
 # Variables ********************************************************************
 
@@ -58,7 +74,7 @@ def test_tc_help(record_property, capsys, monkeypatch):
 
     # Check just the first line of the help message.
     print(captured.out)
-    regex = r"usage: pyTRLCConverter \[\-h\] \[\-\-version\] \[\-v\] \[\-i INCLUDE\] \-s SOURCE"
+    regex = r"usage: pyTRLCConverter \[\-h\] \[\-\-version\] \[\-v\] \[\-i INCLUDE\] \[\-s SOURCE\]"
     assert re.match(regex, captured.out)
 
 def test_tc_help_prj_spec(record_property, capsys, monkeypatch):
@@ -89,9 +105,118 @@ def test_tc_help_prj_spec(record_property, capsys, monkeypatch):
 
     # Check just the first line of the help message.
     print(captured.out)
-    regex = r"usage: pyTRLCConverter \[\-h\] \[\-\-version\] \[\-v\] \[\-i INCLUDE\] \-s SOURCE"
+    regex = r"usage: pyTRLCConverter \[\-h\] \[\-\-version\] \[\-v\] \[\-i INCLUDE\] \[\-s SOURCE\]"
     assert re.match(regex, captured.out)
 
+# The script which converts in a new interpreter and prints the loaded heavy weight libraries.
+LAZY_CONVERTERS_SCRIPT = """
+import json
+import sys
+from pyTRLCConverter.__main__ import main
+
+heavy_modules = json.loads(sys.argv[2])
+sys.argv = ["pyTRLCConverter"] + json.loads(sys.argv[1])
+
+try:
+    main()
+except SystemExit:
+    pass
+
+print(json.dumps([name for name in heavy_modules if name in sys.modules]))
+"""
+
+@pytest.mark.parametrize("arguments, expected_modules", [
+    (["--help"], []),
+    (["--source", "./tests/utils/req.rsl", "--source", "./tests/utils/single_req_no_section.trlc", "dump"], []),
+    (["--source", "./tests/utils/req.rsl", "--source", "./tests/utils/single_req_no_section.trlc", "markdown",
+      "--help"], []),
+    (["--source", "./tests/utils/req.rsl", "--source", "./tests/utils/single_req_no_section.trlc", "docx",
+      "--help"], ["docx", "lxml", "marko"])
+])
+def test_tc_cli_lazy_converters(record_property, arguments, expected_modules):
+    # lobster-trace: SwTests.tc_cli_lazy_converters
+    """
+    Check that only the module of the selected converter and its libraries are imported.
+
+    Every conversion runs in a new Python interpreter, because the modules imported by
+    other test cases can't be unloaded.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        arguments (list[str]): The program arguments.
+        expected_modules (list[str]): The heavy weight libraries, which are expected to be imported.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_lazy_converters")
+
+    heavy_modules = ["docx", "lxml", "marko", "reqif", "requests", "urllib3"]
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(["src", env.get("PYTHONPATH", "")])
+
+    result = subprocess.run(
+        [sys.executable, "-c", LAZY_CONVERTERS_SCRIPT, json.dumps(arguments), json.dumps(heavy_modules)],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True
+    )
+
+    assert json.loads(result.stdout.splitlines()[-1]) == expected_modules
+
+    # The metadata of the built-in converters must match their converter class.
+    for entry in ConverterRegistry.BUILD_IN_CONVERTERS:
+        converter_class = entry.load()
+
+        assert entry.subcommand == converter_class.get_subcommand()
+        assert entry.description == converter_class.get_description()
+
+def test_tc_cli_converter_entry_point(record_property, capsys, monkeypatch):
+    # lobster-trace: SwTests.tc_cli_converter_entry_point
+    """
+    Check that a third-party converter is provided by an entry point and imported only if it is selected.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_converter_entry_point")
+
+    module_name = "tests.utils.psc_do_nothing"
+    entry_point = EntryPoint(name="doNothing", value=f"{module_name}:DoNothingConverter", group=ENTRY_POINT_GROUP)
+    sources = ["--source", "./tests/utils/req.rsl", "--source", "./tests/utils/single_req_no_section.trlc"]
+
+    monkeypatch.delitem(sys.modules, module_name, raising=False)
+
+    with patch("pyTRLCConverter.converter_registry.entry_points", return_value=[entry_point]):
+        # The third-party converter is listed in the help, but not imported.
+        monkeypatch.setattr("sys.argv", ["pyTRLCConverter", "--help"])
+
+        with pytest.raises(SystemExit):
+            main()
+
+        assert "doNothing           Third-party converter of" in capsys.readouterr().out
+        assert module_name not in sys.modules
+
+        monkeypatch.setattr("sys.argv", ["pyTRLCConverter"] + sources + ["dump"])
+        assert main() == 0
+        assert module_name not in sys.modules
+
+        # The third-party converter is imported, if it is selected.
+        monkeypatch.setattr("sys.argv", ["pyTRLCConverter"] + sources + ["doNothing"])
+        assert main() == 0
+        assert module_name in sys.modules
+
+    # A converter which can't be imported is reported.
+    entry_point = EntryPoint(name="missing", value="tests.utils.missing:Converter", group=ENTRY_POINT_GROUP)
+
+    with patch("pyTRLCConverter.converter_registry.entry_points", return_value=[entry_point]):
+        monkeypatch.setattr("sys.argv", ["pyTRLCConverter"] + sources + ["missing"])
+
+        with pytest.raises(SystemExit):
+            main()
+
+        assert "Failed to load converter missing" in capsys.readouterr().err
+
 def test_tc_cli_exclude(record_property, capsys, monkeypatch):
     # lobster-trace: SwTests.tc_cli_exclude
     """
@@ -135,6 +260,81 @@ def test_tc_cli_exclude(record_property, capsys, monkeypatch):
     assert lines[4] == "req_id_2"
     assert lines[5] == "description: Test description"
 
+@pytest.mark.parametrize("excluded_path, file_name", [
+    ("./tests/utils", "tests/utils/req.rsl"),
+    ("./tests/utils/", "./tests/utils/sub/../req.rsl"),
+    ("tests/utils/req.rsl", "./tests/utils/req.rsl"),
+    ("tests/util", "tests/utils/req.rsl"),
+    ("tests/utils/req", "tests/utils/req.rsl"),
+    ("tests", "other/tests/req.rsl")
+])
+def test_tc_cli_exclude_matcher(record_property, excluded_path, file_name):
+    # lobster-trace: SwTests.tc_cli_exclude_index
+    """
+    Check whether the exclude matcher decides like a path comparison with os.path.commonpath().
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        excluded_path (str): The excluded path.
+        file_name (str): The file name to check.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_exclude_index")
+
+    normalized_path = os.path.normpath(excluded_path)
+    expected = os.path.commonpath([normalized_path, os.path.normpath(file_name)]) == normalized_path
+
+    exclude_matcher = ExcludeMatcher([excluded_path])
+    assert exclude_matcher.is_excluded(file_name) is expected
+    assert exclude_matcher.is_excluded(file_name) is expected
+
+    assert ExcludeMatcher(None).is_excluded(file_name) is False
+    assert ExcludeMatcher(None).is_empty() is True
+
+
+def test_tc_cli_exclude_index(record_property):
+    # lobster-trace: SwTests.tc_cli_exclude_index
+    """
+    Check whether the record link index locates the records in the single document, except the ones
+    of excluded files, and in the document of their file in multiple document mode. Every output document
+    name and link target shall be determined only once.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_exclude_index")
+
+    symbols = get_trlc_symbols(["./tests/utils/req.rsl",
+                                "./tests/utils/single_req_no_section.trlc",
+                                "./tests/utils/single_req_with_section.trlc"], None)
+    assert symbols is not None
+    records = {record.name: record for record in symbols.iter_record_objects()}
+
+    def create_index(single_document: bool) -> tuple[RecordLinkIndex, list]:
+        calls = []
+        args = argparse.Namespace(single_document=single_document,
+                                  name="all.md",
+                                  exclude=["./tests/utils/single_req_with_section.trlc"])
+
+        def get_output_file_name(file_name: str) -> str:
+            calls.append(file_name)
+            return os.path.splitext(os.path.basename(file_name))[0] + ".md"
+
+        return RecordLinkIndex(args, get_output_file_name, lambda file, name: f"{file}#{name}"), calls
+
+    # Single document mode
+    record_link_index, calls = create_index(True)
+    for _ in range(3):
+        assert record_link_index.get_link_target(records["req_id_1"]) == "all.md#req_id_1"
+        assert record_link_index.get_link_target(records["req_id_2"]) == "single_req_with_section.md#req_id_2"
+    assert len(calls) == 1
+
+    # Multiple document mode
+    record_link_index, calls = create_index(False)
+    for _ in range(3):
+        assert record_link_index.get_link_target(records["req_id_1"]) == "single_req_no_section.md#req_id_1"
+        assert record_link_index.get_link_target(records["req_id_2"]) == "single_req_with_section.md#req_id_2"
+    assert len(calls) == 2
+
 def test_tc_cli_include(record_property, capsys, monkeypatch, tmp_path):
     # lobster-trace: SwTests.tc_cli_include
     """
@@ -215,5 +415,393 @@ def test_tc_cli_render_cfg(record_property, capsys, monkeypatch):
     lines = captured.out.splitlines()
     assert f"Loading render configuration {config_path}." in lines
 
+@pytest.mark.parametrize("subcommand", ["markdown", "rst", "reqif"])
+def test_tc_cli_jobs(record_property, monkeypatch, tmp_path, subcommand):
+    # lobster-trace: SwTests.tc_cli_jobs
+    """
+    Check whether the parallel conversion produces the same output as the sequential conversion.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary output directory.
+        subcommand (str): The converter subcommand to use.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_jobs")
+
+    for jobs in ["1", "2"]:
+        # Mock program arguments to simulate running the script with several test requirement files.
+        monkeypatch.setattr("sys.argv", [
+            "pyTRLCConverter",
+            "--source", "./tests/utils/req.rsl",
+            "--source", "./tests/utils/single_req_no_section.trlc",
+            "--source", "./tests/utils/single_req_with_link.trlc",
+            "--source", "./tests/utils/single_req_with_section.trlc",
+            "--out", str(tmp_path / f"jobs_{jobs}"),
+            "--jobs", jobs,
+            subcommand
+        ])
+
+        # Expecting the programm to run without any exceptions.
+        main()
+
+    file_names = sorted(path.name for path in (tmp_path / "jobs_1").iterdir())
+    assert len(file_names) == 3
+
+    _, mismatch, errors = filecmp.cmpfiles(tmp_path / "jobs_1", tmp_path / "jobs_2", file_names, shallow=False)
+    if subcommand == "reqif":
+        # The ReqIF header contains the creation time, compare without it.
+        for file_name in file_names:
+            sequential = (tmp_path / "jobs_1" / file_name).read_text(encoding="utf-8")
+            parallel = (tmp_path / "jobs_2" / file_name).read_text(encoding="utf-8")
+            regex = r"<CREATION-TIME>.*?</CREATION-TIME>"
+            assert re.sub(regex, "", sequential) == re.sub(regex, "", parallel)
+    else:
+        assert not mismatch
+    assert not errors
+
+def test_tc_cli_jobs_worker(record_property, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_cli_jobs_worker
+    """
+    Check whether only the main process begins and finishes the conversion and whether a worker
+    process which fails to finish results in an error.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_jobs_worker")
+
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--source", "./tests/utils/req.rsl",
+        "--source", "./tests/utils/single_req_no_section.trlc",
+        "--source", "./tests/utils/single_req_with_link.trlc",
+        "--source", "./tests/utils/single_req_with_section.trlc",
+        "--out", str(tmp_path),
+        "--jobs", "2",
+        "--project", "./tests/utils/psc_parallel.py",
+        "parallel"
+    ])
+
+    # The worker processes fail to finish.
+    assert main() != 0
+
+    calls = [line.split() for line in (tmp_path / "calls.log").read_text(encoding="utf-8").splitlines()]
+    main_pid = str(os.getpid())
+
+    # The failed conversion isn't finished by the main process.
+    assert [step for step, pid in calls if pid == main_pid] == ["begin"]
+
+    worker_steps = [step for step, pid in calls if pid != main_pid]
+    assert worker_steps.count("convert_record_object") == 3
+    assert "begin" not in worker_steps
+    assert "finish" not in worker_steps
+    assert worker_steps.count("begin_worker") == worker_steps.count("finish_worker")
+    assert 0 < worker_steps.count("finish_worker")
+
+def test_tc_cli_cache_dir(record_property, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_cli_cache_dir
+    """
+    Check whether only the output documents whose inputs or link targets changed are written again.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary source, output and cache directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_cache_dir")
+
+    src_dir = tmp_path / "src"
+    out_dir = tmp_path / "out"
+    src_dir.mkdir()
+
+    for file_name in ["req.rsl", "single_req_no_section.trlc", "single_req_with_link.trlc",
+                      "single_req_with_section.trlc"]:
+        shutil.copy(f"./tests/utils/{file_name}", src_dir / file_name)
+
+    # Mock program arguments to simulate running the script with a build cache.
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--source", str(src_dir),
+        "--out", str(out_dir),
+        "--cache-dir", str(tmp_path / "cache"),
+        "markdown"
+    ])
+
+    # Initial conversion writes all documents.
+    assert main() == 0
+    file_names = ["single_req_no_section.md", "single_req_with_link.md", "single_req_with_section.md"]
+    for file_name in file_names:
+        assert (out_dir / file_name).is_file()
+
+        # Mark the output to detect whether it is written again.
+        (out_dir / file_name).write_text("unchanged", encoding="utf-8")
+
+    # Nothing changed, nothing is written.
+    assert main() == 0
+    for file_name in file_names:
+        assert (out_dir / file_name).read_text(encoding="utf-8") == "unchanged"
+
+    # Profiling has no influence on the output, the report of the previous conversion is no input file.
+    cache_argv = list(sys.argv)
+    monkeypatch.setattr("sys.argv", cache_argv[:-1] + ["--profile", str(tmp_path / "profile.json"), "markdown"])
+
+    for _ in range(2):
+        assert main() == 0
+        for file_name in file_names:
+            assert (out_dir / file_name).read_text(encoding="utf-8") == "unchanged"
+
+    monkeypatch.setattr("sys.argv", cache_argv)
+
+    # The link target req_id_2 changed, which affects the file itself and the file linking to it.
+    trlc_file = src_dir / "single_req_with_section.trlc"
+    trlc_file.write_text(trlc_file.read_text(encoding="utf-8").replace("0.01", "0.02"), encoding="utf-8")
+
+    assert main() == 0
+    assert (out_dir / "single_req_no_section.md").read_text(encoding="utf-8") == "unchanged"
+    assert (out_dir / "single_req_with_link.md").read_text(encoding="utf-8") != "unchanged"
+    assert "1/50" in (out_dir / "single_req_with_section.md").read_text(encoding="utf-8")
+
+    # A removed output document is written again.
+    (out_dir / "single_req_no_section.md").unlink()
+
+    assert main() == 0
+    assert (out_dir / "single_req_no_section.md").is_file()
+
+
+def test_tc_cli_symbols_cache(record_property, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_cli_symbols_cache
+    """
+    Check whether the snapshot of the TRLC symbols is used instead of processing the TRLC files again,
+    as long as no TRLC file changed.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary source, output and cache directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_symbols_cache")
+
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+
+    for file_name in ["req.rsl", "single_req_no_section.trlc", "single_req_with_link.trlc",
+                      "single_req_with_section.trlc"]:
+        shutil.copy(f"./tests/utils/{file_name}", src_dir / file_name)
+
+    symbols_cache_file = tmp_path / "cache" / "symbols.pickle"
+
+    def convert(subcommand: str, out_dir: Path, symbols_cache: bool) -> tuple[int, dict]:
+        args = ["pyTRLCConverter", "--source", str(src_dir), "--out", str(out_dir)]
+        if symbols_cache is True:
+            args += ["--symbols-cache", str(symbols_cache_file)]
+        monkeypatch.setattr("sys.argv", args + [subcommand])
+
+        with patch("pyTRLCConverter.symbols_cache.get_trlc_symbols", wraps=get_trlc_symbols) as get_symbols:
+            assert main() == 0
+
+        output = {path.name: path.read_bytes() for path in out_dir.iterdir() if path.is_file()}
+        return get_symbols.call_count, output
+
+    # The initial conversion processes the TRLC files and stores the snapshot.
+    call_count, expected_markdown = convert("markdown", tmp_path / "md_ref", False)
+    assert call_count == 1
+    assert convert("markdown", tmp_path / "md_1", True) == (1, expected_markdown)
+    assert symbols_cache_file.is_file()
+
+    # Nothing changed, the snapshot is used and the output is the same for every converter.
+    assert convert("markdown", tmp_path / "md_2", True) == (0, expected_markdown)
+    _, expected_rst = convert("rst", tmp_path / "rst_ref", False)
+    assert convert("rst", tmp_path / "rst_1", True) == (0, expected_rst)
+
+    # A changed TRLC file invalidates the snapshot.
+    trlc_file = src_dir / "single_req_with_section.trlc"
+    trlc_file.write_text(trlc_file.read_text(encoding="utf-8").replace("0.01", "0.02"), encoding="utf-8")
+
+    call_count, output = convert("markdown", tmp_path / "md_3", True)
+    assert call_count == 1
+    assert "1/50" in output["single_req_with_section.md"].decode("utf-8")
+    assert convert("markdown", tmp_path / "md_4", True) == (0, output)
+
+    # A corrupt snapshot is processed again and replaced.
+    symbols_cache_file.write_bytes(b"corrupt")
+    assert convert("markdown", tmp_path / "md_5", True) == (1, output)
+    assert convert("markdown", tmp_path / "md_6", True) == (0, output)
+
+
+def test_tc_cli_profile(record_property, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_cli_profile
+    """
+    Check whether the profiling report and the profiling statistics are written
+    and the conversion result is the same as without profiling.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_profile")
+
+    report_file = tmp_path / "profile.json"
+    stats_file = tmp_path / "profile.pstats"
+    sources = ["--source", "./tests/utils/req.rsl",
+               "--source", "./tests/utils/single_req_no_section.trlc",
+               "--source", "./tests/utils/single_req_with_section.trlc"]
+
+    monkeypatch.setattr("sys.argv", ["pyTRLCConverter"] + sources + ["--out", str(tmp_path / "ref"), "markdown"])
+    assert main() == 0
+
+    monkeypatch.setattr("sys.argv", ["pyTRLCConverter"] + sources + [
+        "--out", str(tmp_path / "out"),
+        "--jobs", "2",
+        "--profile", str(report_file),
+        "--profile-stats", str(stats_file),
+        "markdown"
+    ])
+    assert main() == 0
+
+    # Profiling doesn't change the conversion result.
+    dircmp = filecmp.dircmp(tmp_path / "ref", tmp_path / "out")
+    assert dircmp.left_list == dircmp.right_list
+    assert len(dircmp.diff_files) == 0
+
+    report = json.loads(report_file.read_text(encoding="utf-8"))
+
+    for phase in ["parse", "begin", "enter_file", "convert_record", "render", "write", "leave_file", "finish"]:
+        assert 0 < report["phases"][phase]["count"]
+        assert 0.0 <= report["phases"][phase]["wall_s"] <= report["total"]["wall_s"]
+
+    # The files are processed sequentially, to measure them in the main process.
+    assert len(report["files"]) == 2
+    assert report["record_types"]["Requirement"]["count"] == 2
+    assert report["phases"]["convert_record"]["count"] == 2
+    assert "plain" in report["attribute_formats"]
+
+    slowest_records = report["slowest_records"]
+    assert sorted(record["name"] for record in slowest_records) == ["req_id_1", "req_id_2"]
+    assert slowest_records[0]["wall_s"] >= slowest_records[1]["wall_s"]
+
+    # The profiling statistics can be analyzed with pstats.
+    assert 0 < pstats.Stats(str(stats_file)).total_calls
+
+
+def test_tc_cli_render_cache_lru(record_property):
+    # lobster-trace: SwTests.tc_cli_render_cache
+    """
+    Check whether the render cache evicts the least recently used value and counts hits and misses.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_render_cache")
+
+    key_a = RenderCache.get_key("A", "md", None, "rst")
+    key_b = RenderCache.get_key("B", "md", None, "rst")
+    key_c = RenderCache.get_key("C", "md", None, "rst")
+
+    # The key depends on the format, the table options and the target too.
+    assert key_a != RenderCache.get_key("A", "gfm", None, "rst")
+    assert key_a != RenderCache.get_key("A", "md", {"border": "all"}, "rst")
+    assert key_a != RenderCache.get_key("A", "md", None, "docx")
+    assert RenderCache.get_key("A", "md", {"border": "all", "headingStyle": "bold"}, "reqif") == \
+        RenderCache.get_key("A", "md", {"headingStyle": "bold", "border": "all"}, "reqif")
+
+    render_cache = RenderCache(2)
+    render_cache.put(key_a, "a")
+    render_cache.put(key_b, "b")
+    assert render_cache.get(key_a) == "a"
+
+    # B is the least recently used value now.
+    render_cache.put(key_c, "c")
+    assert render_cache.get(key_b) is None
+    assert render_cache.get(key_c) == "c"
+
+    statistics = render_cache.get_statistics()
+    assert statistics["hits"] == 2
+    assert statistics["misses"] == 1
+    assert statistics["evictions"] == 1
+    assert statistics["size"] == 2
+    assert statistics["max_size"] == 2
+
+    # A size of 0 disables the cache.
+    render_cache = RenderCache(0)
+    render_cache.put(key_a, "a")
+    assert render_cache.is_enabled() is False
+    assert render_cache.get_statistics()["size"] == 0
+
+
+def _read_rendered_output(subcommand: str, out_dir: Path) -> dict:
+    # lobster-exclude: Utility function for other test code.
+    """
+    Read the output files of a conversion without the parts which depend on the time.
+
+    Args:
+        subcommand (str): The converter subcommand.
+        out_dir (Path): The output directory.
+
+    Returns:
+        dict: The output file contents by file name.
+    """
+    output = {}
+
+    for path in sorted(out_dir.iterdir()):
+        if subcommand == "docx":
+            with zipfile.ZipFile(path) as docx_file:
+                output[path.name] = docx_file.read("word/document.xml").decode("utf-8")
+        elif path.is_file():
+            content = path.read_text(encoding="utf-8")
+            content = re.sub(r"<CREATION-TIME>.*?</CREATION-TIME>", "", content)
+            output[path.name] = re.sub(r'LAST-CHANGE="[^"]*"', "", content)
+
+    return output
+
+
+@pytest.mark.parametrize("subcommand", ["rst", "docx", "reqif"])
+def test_tc_cli_render_cache(record_property, monkeypatch, tmp_path, subcommand):
+    # lobster-trace: SwTests.tc_cli_render_cache
+    """
+    Check whether repeated Markdown attribute values are taken from the render cache
+    and the conversion result is the same as without the render cache.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary output directory.
+        subcommand (str): The converter subcommand to use.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_render_cache")
+
+    description = "# Rationale\n\n- Bullet point 1\n- Bullet point 2\n\n**Bold text** and *italic text*.\n"
+    records = "".join(
+        f"Requirement req_id_{index} {{\n    description = '''\n{description}'''\n}}\n\n" for index in range(4)
+    )
+    trlc_file = tmp_path / "repeated_req.trlc"
+    trlc_file.write_text(f"package Requirements\n\n{records}", encoding="utf-8")
+    report_file = tmp_path / "profile.json"
+
+    for render_cache_size in ["0", "16"]:
+        monkeypatch.setattr("sys.argv", [
+            "pyTRLCConverter",
+            "--source", "./tests/utils/req.rsl",
+            "--source", str(trlc_file),
+            "--out", str(tmp_path / f"out_{render_cache_size}"),
+            "--renderCfg", "./tests/utils/renderCfg.json",
+            "--render-cache-size", render_cache_size,
+            "--profile", str(report_file),
+            subcommand
+        ])
+        assert main() == 0
+
+    # The render cache doesn't change the conversion result.
+    assert _read_rendered_output(subcommand, tmp_path / "out_0") == \
+        _read_rendered_output(subcommand, tmp_path / "out_16")
+
+    # Only the first description is rendered, the others are taken from the cache.
+    statistics = json.loads(report_file.read_text(encoding="utf-8"))["statistics"]["render_cache"][subcommand]
+    assert statistics["misses"] == 1
+    assert statistics["hits"] == 3
+    assert statistics["size"] == 1
 
 # Main *************************************************************************
@@ -19,12 +19,17 @@
 
 # Imports **********************************************************************
 
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 import docx
+import pytest
 
 from pyTRLCConverter.__main__ import main
 from pyTRLCConverter.docx_converter import DocxConverter
+from pyTRLCConverter.marko.marko_renderer import MarkoRenderer
+from pyTRLCConverter.marko.md2docx_renderer import Md2DocxRenderer
 
 # Variables ********************************************************************
 
@@ -472,13 +477,8 @@ def test_tc_docx_render_plantuml(record_property, capsys, monkeypatch, tmp_path)
         b'\x00\x05\xfe\x02\xfe\r\xefF\xb8\x00\x00\x00\x00IEND\xaeB`\x82'
     )
 
-    def _fake_generate(_fmt, src, _dst):
-        png_path = src.replace(".puml", ".png")
-        with open(png_path, "wb") as f:
-            f.write(png_1x1)
-
-    with patch("pyTRLCConverter.marko.md2docx_renderer.PlantUML.generate",
-               side_effect=_fake_generate):
+    with patch("pyTRLCConverter.marko.md2docx_renderer.PlantUML.generate_to_bytes",
+               return_value=png_1x1):
         main()
 
     captured = capsys.readouterr()
@@ -551,4 +551,90 @@ def test_tc_docx_render_plantuml_error(record_property, capsys, monkeypatch, tmp
     error_found = any("[PlantUML error:" in p.text for p in description_cell.paragraphs)
     assert error_found, "No [PlantUML error:] paragraph found in docx output"
 
+def test_tc_render_markdown_reuse_docx(record_property):
+    # lobster-trace: SwTests.tc_render_markdown_reuse
+    """
+    Check whether the docx renderer keeps the block item container per conversion,
+    so several documents can be rendered from several threads with the same renderer.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+    """
+    record_property("lobster-trace", "SwTests.tc_render_markdown_reuse")
+
+    marko_renderer = MarkoRenderer(Md2DocxRenderer)
+
+    def render_document(index: int) -> list[str]:
+        # lobster-exclude: Utility function for other test code.
+        document = docx.Document()
+        for line in range(20):
+            marko_renderer.convert(f"Document {index} line {line} with **bold** text",
+                                   block_item_container=document)
+        return [paragraph.text for paragraph in document.paragraphs]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(render_document, range(8)))
+
+    for index, paragraphs in enumerate(results):
+        assert paragraphs == [f"Document {index} line {line} with bold text" for line in range(20)]
+
+@pytest.mark.parametrize("markup", ["md", "gfm"])
+def test_tc_docx_stream(record_property, capsys, monkeypatch, tmp_path, markup):
+    # lobster-trace: SwTests.tc_docx_stream
+    """
+    The test case checks whether the stream backend writes the same docx package as the python-docx backend.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary output directory.
+        markup (str): The Markdown flavour of the render configuration and the TRLC source file.
+    """
+    record_property("lobster-trace", "SwTests.tc_docx_stream")
+
+    # Provide a minimal valid 1x1 white PNG so python-docx can embed it.
+    png_1x1 = (
+        b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01'
+        b'\x08\x02\x00\x00\x00\x90wS\xde\x00\x00\x00\x0cIDATx\x9cc\xf8\xff\xff?'
+        b'\x00\x05\xfe\x02\xfe\r\xefF\xb8\x00\x00\x00\x00IEND\xaeB`\x82'
+    )
+
+    packages = {}
+
+    for backend in [DocxConverter.BACKEND_STREAM, DocxConverter.BACKEND_PYTHON_DOCX]:
+        out_path = tmp_path / backend
+
+        monkeypatch.setattr("sys.argv", [
+            "pyTRLCConverter",
+            "--source", "./tests/utils/req.rsl",
+            "--source", f"./tests/utils/single_req_description_{markup}.trlc",
+            "--source", "./tests/utils/multi_req_with_link.trlc",
+            "--out", str(out_path),
+            "--renderCfg", f"./tests/utils/renderCfgDocx{markup.capitalize()}.json",
+            "docx",
+            "--template", "./tests/utils/template.docx",
+            "--backend", backend
+        ])
+
+        with patch("pyTRLCConverter.marko.md2docx_renderer.PlantUML.generate_to_bytes",
+                   return_value=png_1x1):
+            main()
+
+        captured = capsys.readouterr()
+        assert captured.err == ""
+
+        with zipfile.ZipFile(out_path / DocxConverter.OUTPUT_FILE_NAME_DEFAULT) as docx_file:
+            packages[backend] = {name: docx_file.read(name) for name in docx_file.namelist()}
+
+    # The parts, e.g. the main document part, the styles of the template and the images, are identical.
+    assert list(packages[DocxConverter.BACKEND_STREAM]) == list(packages[DocxConverter.BACKEND_PYTHON_DOCX])
+    assert packages[DocxConverter.BACKEND_STREAM] == packages[DocxConverter.BACKEND_PYTHON_DOCX]
+
+    # The streamed document can be loaded again, with the template content and all records.
+    created_docx = docx.Document(docx=str(tmp_path / DocxConverter.BACKEND_STREAM /
+                                          DocxConverter.OUTPUT_FILE_NAME_DEFAULT))
+    assert created_docx.paragraphs[0].text == "Template text."
+    assert 3 == len(created_docx.tables)
+
 # Main *************************************************************************
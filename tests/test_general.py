@@ -19,10 +19,19 @@
 
 # Imports **********************************************************************
 
+import argparse
 import re
+from contextlib import ExitStack
+from unittest.mock import patch
 import pytest
 
 from pyTRLCConverter.__main__ import main
+from pyTRLCConverter.base_converter import BaseConverter
+from pyTRLCConverter.dump_converter import DumpConverter
+from pyTRLCConverter.record_type_schema import get_identifier_token
+from pyTRLCConverter.render_config import RenderConfig
+from pyTRLCConverter.ret import Ret
+from pyTRLCConverter.trlc_helper import get_trlc_symbols
 
 # Variables ********************************************************************
 
@@ -271,8 +280,139 @@ def test_tc_verbose(record_property, capsys, monkeypatch):
 
     # Check if the expected output.
     lines = captured.out.splitlines()
-    assert len(lines) == 18
-    assert lines[16] == "req_id_1"
-    assert lines[17] == "description: Test description"
+    assert len(lines) == 26
+    assert lines[24] == "req_id_1"
+    assert lines[25] == "description: Test description"
+
+def test_tc_record_type_schema(record_property):
+    # lobster-trace: SwTests.tc_record_type_schema
+    """
+    The record type schema shall be built once per record type and provide the field order, the enumeration
+    types, the translated attribute names, the render configuration and the attribute definition keys.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+    """
+    record_property("lobster-trace", "SwTests.tc_record_type_schema")
+
+    symbols = get_trlc_symbols(["./tests/utils/req_enum.rsl",
+                                "./tests/utils/single_req_with_enum.trlc"], None)
+    assert symbols is not None
+    record = next(symbols.iter_record_objects())
+
+    render_cfg = RenderConfig()
+    assert render_cfg.load("./tests/utils/renderCfg.json") is True
+
+    converter = DumpConverter(argparse.Namespace(translation="./tests/utils/translation.json"))
+    converter.set_render_cfg(render_cfg)
+    assert converter.begin() == Ret.OK
+
+    # pylint: disable=protected-access
+    with patch.object(render_cfg, "resolve", wraps=render_cfg.resolve) as resolve:
+        schema = converter._get_record_type_schema(record)
+
+        # The schema is built only once per record type.
+        for _ in range(3):
+            assert converter._get_record_type_schema(record) is schema
+        assert resolve.call_count == 2
+
+    assert schema.name == "Requirement"
+    assert schema.package_name == "Requirements"
+    assert list(schema.fields) == ["description", "status"]
+
+    description = schema.get_field("description")
+    assert description is not None
+    assert description.translated_name == "Translated Description"
+    assert description.get_attribute_name(schema.translation) == "Translated Description"
+    assert description.get_attribute_name(None) == "description"
+    assert description.format_specifier == RenderConfig.FORMAT_SPECIFIER_MD
+    assert description.enum_type is None
+    assert description.definition_key == "field_description"
+
+    status = schema.get_field("status")
+    assert status is not None
+    assert status.translated_name == "status"
+    assert status.format_specifier == RenderConfig.FORMAT_SPECIFIER_PLAIN
+    assert status.optional is True
+    assert status.enum_type is not None
+    assert status.enum_type.name == "Status"
+    assert status.enum_literal_names == ["Draft", "Approved", "Rejected"]
+
+    assert schema.get_field("unknown") is None
+    assert schema.get_fields_by_format(RenderConfig.FORMAT_SPECIFIER_MD) == [description]
+
+    # A new render configuration rebuilds the schema.
+    converter.set_render_cfg(RenderConfig())
+    assert converter._get_record_type_schema(record).get_field("description").format_specifier == \
+        RenderConfig.FORMAT_SPECIFIER_PLAIN
+    # pylint: enable=protected-access
+
+    assert get_identifier_token("Field_Status Name") == "field-status-name"
+    assert get_identifier_token("__") == "item"
+
+def test_tc_record_field_values(record_property):
+    # lobster-trace: SwTests.tc_record_field_values
+    """
+    The field values of a record shall be converted only once and only on demand, also if several
+    attributes are requested at once. The converted values shall be dropped for the next record.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+    """
+    record_property("lobster-trace", "SwTests.tc_record_field_values")
+
+    symbols = get_trlc_symbols(["./tests/utils/req_enum.rsl",
+                                "./tests/utils/single_req_with_enum.trlc",
+                                "./tests/utils/single_req_with_enum_null.trlc"], None)
+    assert symbols is not None
+    records = {record.name: record for record in symbols.iter_record_objects()}
+    record = records["req_enum_1"]
+    record_null = records["req_enum_null_1"]
+
+    converter = DumpConverter(argparse.Namespace(translation=None))
+    conversions = []
+
+    def to_python_object(expression):
+        conversions.append(expression)
+        return original_to_python_object[type(expression)](expression)
+
+    original_to_python_object = {
+        type(expression): type(expression).to_python_object
+        for expression in list(record.field.values()) + list(record_null.field.values())
+    }
+
+    # pylint: disable=protected-access
+    with ExitStack() as stack:
+        for expression_type in original_to_python_object:
+            stack.enter_context(patch.object(expression_type, "to_python_object", to_python_object))
+        to_python_dict = stack.enter_context(patch.object(type(record), "to_python_dict"))
+
+        # Only the requested field is converted, once.
+        assert converter._get_attribute(record, "description") == "Requirement with enumeration attribute."
+        assert converter._get_attribute(record, "description") == "Requirement with enumeration attribute."
+        assert len(conversions) == 1
+
+        # Several attributes at once, in the requested order.
+        assert converter._get_attributes(record, ["status", "description"]) == {
+            "status": "Approved",
+            "description": "Requirement with enumeration attribute."
+        }
+        assert len(conversions) == 2
+
+        # Another record drops the converted values, a null field gets the default value.
+        assert converter._get_attributes(record_null, ["description", "status"]) == {
+            "description": "Requirement with null enumeration attribute.",
+            "status": BaseConverter.EMPTY_ATTRIBUTE_DEFAULT
+        }
+        assert converter._get_field_value(record_null, "status") is None
+        assert len(conversions) == 4
+
+        # Converting the next record drops the converted values as well.
+        assert converter.convert_record_object(record, 0) == Ret.OK
+        assert converter._get_attribute(record, "status") == "Approved"
+        assert len(conversions) == 5
+
+        to_python_dict.assert_not_called()
+    # pylint: enable=protected-access
 
 # Main *************************************************************************
@@ -18,14 +18,16 @@
 # If not, see <https://www.gnu.org/licenses/>.
 
 # Imports **********************************************************************
+import io
 import os
 from collections import namedtuple
 from unittest.mock import patch
 
 from pyTRLCConverter.__main__ import main
 from pyTRLCConverter.markdown_converter import MarkdownConverter
+from pyTRLCConverter.markdown.document import MarkdownDocument
 from pyTRLCConverter.markdown.element import Heading, Table, BulletList, Image
-from pyTRLCConverter.markdown.text import MarkdownText
+from pyTRLCConverter.markdown.text import MARKDOWN_ESCAPER, MarkdownText
 
 # Variables ********************************************************************
 
@@ -253,12 +255,24 @@ def test_tc_markdown_escape(record_property):
         EscapingResult(initial=r'I contain nothing weird', escaped=r"I contain nothing weird"),
         EscapingResult(initial=r'I_contain.something+weird', escaped=r"I\_contain\.something\+weird"),
         EscapingResult(initial=r'\`*_{}[]()#+-.!', escaped=r"\\\`\*\_\{\}\[\]\(\)\#\+\-\.\!"),
-        EscapingResult(initial=r'unchanged', escaped=r"unchanged")
+        EscapingResult(initial=r'unchanged', escaped=r"unchanged"),
+        EscapingResult(initial=r'<>|' * 30, escaped=r"\<\>\|" * 30)
     ]
 
     for check in checks:
         assert MarkdownText.escape(check.initial) == check.escaped
 
+    # Short texts are escaped from the cache the second time, long texts are always escaped again.
+    MARKDOWN_ESCAPER.cache_clear()
+
+    for _ in range(2):
+        assert MarkdownText.escape(r'I_contain.something+weird') == r"I\_contain\.something\+weird"
+        assert MarkdownText.escape(r'<>|' * 30) == r"\<\>\|" * 30
+
+    cache_info = MARKDOWN_ESCAPER.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
+
 
 def test_tc_markdown_heading(record_property):
     # lobster-trace: SwTests.tc_markdown_heading
@@ -319,6 +333,45 @@ def test_tc_markdown_list(record_property):
     # Without escaping the values are taken as is, but every item is still listed.
     assert BulletList(["[a](x)", "[b](y)"], escape=False).render() == "- [a](x)\n- [b](y)\n"
 
+def test_tc_markdown_streaming(record_property):
+    # lobster-trace: SwTests.tc_markdown_streaming
+    """
+    The Markdown converter shall write every Markdown block element to the output file
+    as soon as it is created, instead of keeping the whole document in memory.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+    """
+    record_property("lobster-trace", "SwTests.tc_markdown_streaming")
+
+    elements = [
+        Heading("Title", 1),
+        Table(["Header1", "Header2"], [["left", "center"], ["a", "b"]]),
+        BulletList(["Item1", "Item2"]),
+        Image("diagram.svg", "Caption")
+    ]
+
+    document = MarkdownDocument()
+    for element in elements:
+        document.add(element)
+
+    writer = io.StringIO()
+    streamed_document = MarkdownDocument(writer)
+    assert streamed_document.is_empty() is True
+
+    # Every element is written immediately, separated by a blank line from the previous one.
+    streamed_document.add(elements[0])
+    assert writer.getvalue() == "# Title\n"
+
+    for element in elements[1:]:
+        streamed_document.add(element)
+
+    assert streamed_document.is_empty() is False
+    assert writer.getvalue() == document.render()
+
+    # The streamed document doesn't keep its elements.
+    assert len(streamed_document._elements) == 0  # pylint: disable=protected-access
+
 def test_tc_markdown_link(record_property):
     # lobster-trace: SwTests.tc_markdown_link
     """
@@ -836,7 +889,7 @@ def test_tc_markdown_render_plantuml(record_property, capsys, monkeypatch, tmp_p
         b'<?xml version="1.0" encoding="UTF-8" standalone="no"?>'
         b'<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"/>'
     )
-    with patch("pyTRLCConverter.markdown_converter.PlantUML.generate_to_bytes",
+    with patch("pyTRLCConverter.plantuml.PlantUML.generate_to_bytes",
                return_value=svg_payload):
         main()
 
@@ -0,0 +1,100 @@
+"""Test the multi format conversion requirements.
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import filecmp
+from unittest.mock import patch
+from pyTRLCConverter.__main__ import main
+from pyTRLCConverter.trlc_helper import get_trlc_symbols
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+# Functions ********************************************************************
+
+
+def test_tc_multi(record_property, capsys, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_multi
+    """
+    The software shall convert the TRLC sources into several formats with a single processing of the TRLC sources.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_multi")
+
+    sources = [
+        "--source", "./tests/utils/req.rsl",
+        "--source", "./tests/utils/single_req_no_section.trlc",
+        "--source", "./tests/utils/single_req_with_section.trlc"
+    ]
+
+    # Reference conversions, one per format.
+    monkeypatch.setattr("sys.argv", ["pyTRLCConverter"] + sources + [
+        "--out", str(tmp_path / "ref" / "markdown"), "markdown", "--single-document", "--name", "all.md"
+    ])
+    assert main() == 0
+
+    monkeypatch.setattr("sys.argv", ["pyTRLCConverter"] + sources + [
+        "--out", str(tmp_path / "ref" / "rst"), "rst"
+    ])
+    assert main() == 0
+
+    # The same conversions in one run, every format in its own sub folder.
+    monkeypatch.setattr("sys.argv", ["pyTRLCConverter"] + sources + [
+        "--out", str(tmp_path / "multi"),
+        "multi", "--to", "markdown,rst",
+        "--converter-args", "markdown=--single-document --name all.md"
+    ])
+
+    with patch("pyTRLCConverter.symbols_cache.get_trlc_symbols", wraps=get_trlc_symbols) as get_symbols:
+        assert main() == 0
+
+    # The TRLC sources are processed only once.
+    assert get_symbols.call_count == 1
+
+    for subcommand, file_names in [("markdown", ["all.md"]),
+                                   ("rst", ["single_req_no_section.rst", "single_req_with_section.rst"])]:
+        match, mismatch, errors = filecmp.cmpfiles(tmp_path / "ref" / subcommand, tmp_path / "multi" / subcommand,
+                                                   file_names, shallow=False)
+        assert match == file_names
+        assert not mismatch
+        assert not errors
+
+    capsys.readouterr()
+
+    # Unknown converters, arguments for converters which are not a target and invalid arguments are rejected.
+    for multi_args in [["--to", "markdown,unknown"],
+                       ["--to", "markdown,multi"],
+                       ["--to", "markdown", "--converter-args", "rst=--single-document"],
+                       ["--to", "markdown", "--converter-args", "markdown"],
+                       ["--to", "markdown", "--converter-args", "markdown=--unknown"],
+                       ["--to", "markdown", "--converter-args", "markdown=--name 'all.md"]]:
+        monkeypatch.setattr("sys.argv", ["pyTRLCConverter"] + sources + [
+            "--out", str(tmp_path / "invalid"), "multi"] + multi_args)
+        assert main() != 0
+
+        captured = capsys.readouterr()
+        assert captured.err != ""
+
+# Main *************************************************************************
@@ -9,6 +9,15 @@ Fixtures:
 
 Tests:
     test_make_server_url: Tests the _make_server_url method of the PlantUML class.
+    test_plantuml_cache: Tests that generated images are taken from the persistent cache.
+    test_plantuml_cache_eviction: Tests the LRU eviction of the persistent cache.
+    test_plantuml_cache_size: Tests that the cache folder is scanned only if the size limit is exceeded.
+    test_plantuml_batch: Tests that several diagrams are rendered by a single PlantUML process.
+    test_plantuml_batch_fallback: Tests that diagrams are rendered one by one if the batch fails.
+    test_plantuml_batch_conversion: Tests that a conversion renders all diagrams of a file at once.
+    test_plantuml_pipe_worker: Tests the persistent PlantUML process.
+    test_plantuml_pipe_worker_split_read: Tests the persistent PlantUML process with output split across reads.
+    test_plantuml_server_concurrency: Tests the concurrent requests to the PlantUML server.
 """
 
 # pyTRLCConverter - A tool to convert TRLC files to specific formats.
@@ -28,15 +37,70 @@ Tests:
 # If not, see <https://www.gnu.org/licenses/>.
 
 # Imports **********************************************************************
+import io
 import os
+import subprocess
+import threading
+import time
 from unittest.mock import patch, mock_open
 import pytest
-from pyTRLCConverter.plantuml import PlantUML
+import requests
+from pyTRLCConverter.__main__ import main
+from pyTRLCConverter.plantuml import PlantUML, PlantUMLPipeWorker, PLANTUML_PIPE_DELIMITER
+from pyTRLCConverter.plantuml_cache import PlantUMLCache
 
 # Variables ********************************************************************
 
+DELIMITER = PLANTUML_PIPE_DELIMITER.encode("utf-8")
+
 # Classes **********************************************************************
 
+
+# pylint: disable-next=too-few-public-methods
+class FakeChunkedOutput():
+    """Fake stdout of a process, which provides the given chunks one read after another.
+    """
+    def __init__(self, chunks: tuple[bytes, ...]) -> None:
+        """Construct the fake output.
+
+        Args:
+            chunks (tuple[bytes, ...]): The chunks, which are returned by the reads.
+        """
+        self._chunks = list(chunks)
+
+    def read1(self, _size: int) -> bytes:
+        """Read the next chunk.
+
+        Args:
+            _size (int): Maximum number of bytes, ignored.
+
+        Returns:
+            bytes: The next chunk or empty bytes if all chunks are read.
+        """
+        return self._chunks.pop(0) if 0 < len(self._chunks) else b""
+
+
+# pylint: disable-next=too-few-public-methods
+class FakePlantUMLProcess():
+    """Fake plantuml.jar process, which provides the given output on stdout.
+    """
+    def __init__(self, *outputs: bytes) -> None:
+        """Construct the fake process.
+
+        Args:
+            *outputs (bytes): The output of the process, every output is provided by a single read.
+        """
+        self.stdin = io.BytesIO()
+        self.stdout = FakeChunkedOutput(outputs)
+
+    def poll(self):
+        """The process is always running.
+
+        Returns:
+            None: No return code available.
+        """
+        return None
+
 # Functions ********************************************************************
 
 # pylint: disable=W0212 # Access to a protected member
@@ -92,4 +156,366 @@ def test_make_server_url(record_property, plantuml_instance: PlantUML):
     assert result_url.startswith("http://plantuml.com/plantuml/svg/")
     assert result_url == expected_url
 
+def test_plantuml_cache(record_property, tmp_path):
+    # lobster-trace: SwTests.tc_plantuml_cache
+    """
+    Test that an image is generated only once if the persistent cache is enabled.
+    A changed diagram source or diagram type results in a new image.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Used to create a temporary cache directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_plantuml_cache")
+
+    diagram_source = "@startuml\nAlice -> Bob: Hello\n@enduml"
+    env = {
+        "PLANTUML": "http://plantuml.com/plantuml",
+        "PLANTUML_CACHE_DIR": str(tmp_path)
+    }
+
+    with patch.dict(os.environ, env):
+        with patch.object(PlantUML, "_generate_to_bytes_server", return_value=b"<svg/>") as generate_mock:
+            # Every converter creates its own instance, the cache is shared.
+            assert PlantUML().generate_to_bytes("svg", diagram_source) == b"<svg/>"
+            assert PlantUML().generate_to_bytes("svg", diagram_source) == b"<svg/>"
+            assert generate_mock.call_count == 1
+
+            PlantUML().generate_to_bytes("png", diagram_source)
+            assert generate_mock.call_count == 2
+
+            PlantUML().generate_to_bytes("svg", diagram_source.replace("Hello", "Hi"))
+            assert generate_mock.call_count == 3
+
+def test_plantuml_cache_eviction(record_property, tmp_path):
+    # lobster-trace: SwTests.tc_plantuml_cache
+    """
+    Test that the least recently used images are removed if the cache exceeds its size limit.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Used to create a temporary cache directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_plantuml_cache")
+
+    cache = PlantUMLCache(str(tmp_path), size_limit=1)
+    image = b"x" * (400 * 1024)
+    keys = [PlantUMLCache.get_key("svg", f"diagram {index}", "") for index in range(3)]
+
+    cache.put(keys[0], "svg", image)
+    cache.put(keys[1], "svg", image)
+
+    # Make the first image the least recently used one, before it is used again.
+    for index, key in enumerate(keys[:2]):
+        os.utime(cache._get_file_name(key, "svg"), ns=(index, index))
+    assert cache.get(keys[0], "svg") == image
+
+    # The third image exceeds the limit, the second image is the least recently used one.
+    cache.put(keys[2], "svg", image)
+
+    assert cache.get(keys[0], "svg") == image
+    assert cache.get(keys[1], "svg") is None
+    assert cache.get(keys[2], "svg") == image
+
+def test_plantuml_cache_size(record_property, tmp_path):
+    # lobster-trace: SwTests.tc_plantuml_cache
+    """
+    Test that the cache folder is scanned for its size once and again only if the size limit is
+    exceeded and that the temporary files of other processes are kept.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Used to create a temporary cache directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_plantuml_cache")
+
+    cache = PlantUMLCache(str(tmp_path), size_limit=1)
+    image = b"x" * (300 * 1024)
+    keys = [PlantUMLCache.get_key("svg", f"diagram {index}", "") for index in range(4)]
+
+    # Temporary file of another process, which is still written.
+    tmp_file = tmp_path / "in_flight.tmp"
+    tmp_file.write_bytes(b"x" * (2 * 1024 * 1024))
+
+    with patch("pyTRLCConverter.plantuml_cache.os.walk", side_effect=os.walk) as walk_mock:
+        for key in keys[:3]:
+            cache.put(key, "svg", image)
+
+        # Only the first image scans the cache folder, the temporary file isn't counted.
+        assert walk_mock.call_count == 1
+
+        for index, key in enumerate(keys[:3]):
+            os.utime(cache._get_file_name(key, "svg"), ns=(index, index))
+
+        # The fourth image exceeds the limit. The least recently used images are removed
+        # down to the eviction target.
+        cache.put(keys[3], "svg", image)
+        assert walk_mock.call_count == 2
+
+    assert tmp_file.exists()
+    assert cache.get(keys[0], "svg") is None
+    assert all(cache.get(key, "svg") == image for key in keys[1:])
+
+def _fake_plantuml_run(cmd, **kwargs) -> subprocess.CompletedProcess:
+    # lobster-exclude: Utility function for other test cases.
+    """
+    Fake plantuml.jar call, which "renders" every diagram to its number of lines without the end.
+
+    Args:
+        cmd (list[str]): The command line.
+        kwargs (Any): The keyword arguments of subprocess.run().
+
+    Returns:
+        subprocess.CompletedProcess: The result of the call.
+    """
+    diagrams = kwargs["input"].decode("utf-8").split("@enduml")[:-1]
+    images = [f"<svg>{len(diagram.strip().splitlines())}</svg>".encode("utf-8") for diagram in diagrams]
+
+    if "-pipedelimitor" in cmd:
+        stdout = b"".join(image + DELIMITER + b"\n" for image in images)
+    else:
+        stdout = images[0]
+
+    return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr=b"")
+
+def test_plantuml_batch(record_property, tmp_path):
+    # lobster-trace: SwTests.tc_plantuml_batch
+    """
+    Test that several diagrams are rendered by a single plantuml.jar process and that
+    the images rendered in advance are used afterwards.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Used to create a fake plantuml.jar.
+    """
+    record_property("lobster-trace", "SwTests.tc_plantuml_batch")
+
+    plantuml_jar = tmp_path / "plantuml.jar"
+    plantuml_jar.write_bytes(b"jar")
+    diagram_1 = "@startuml\nA -> B\n@enduml\n"
+    diagram_2 = "@startuml\nA -> B\nB -> C\n@enduml\n"
+
+    with patch.dict(os.environ, {"PLANTUML": str(plantuml_jar)}):
+        with patch("pyTRLCConverter.plantuml.subprocess.run", side_effect=_fake_plantuml_run) as run_mock:
+            images = PlantUML().generate_batch_to_bytes("svg", [diagram_1, diagram_2, diagram_1])
+
+            assert images == [b"<svg>2</svg>", b"<svg>3</svg>", b"<svg>2</svg>"]
+            assert run_mock.call_count == 1
+            assert "-pipedelimitor" in run_mock.call_args.args[0]
+
+            plantuml = PlantUML()
+            plantuml.prefetch("svg", [diagram_1, diagram_2])
+            assert run_mock.call_count == 2
+
+            assert plantuml.generate_to_bytes("svg", diagram_2) == b"<svg>3</svg>"
+            assert run_mock.call_count == 2
+
+            # The images rendered in advance belong to the instance, which rendered them.
+            assert PlantUML().generate_to_bytes("svg", diagram_2) == b"<svg>3</svg>"
+            assert run_mock.call_count == 3
+
+def test_plantuml_batch_fallback(record_property, tmp_path):
+    # lobster-trace: SwTests.tc_plantuml_batch
+    """
+    Test that the diagrams are rendered one by one if rendering them in advance fails
+    or if a source can't be rendered in the multi-diagram pipe mode.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Used to create a fake plantuml.jar.
+    """
+    record_property("lobster-trace", "SwTests.tc_plantuml_batch")
+
+    plantuml_jar = tmp_path / "plantuml.jar"
+    plantuml_jar.write_bytes(b"jar")
+    diagram_1 = "@startuml\nA -> B\n@enduml\n"
+    diagram_2 = "@startuml\nA -> B\nB -> C\n@enduml\n"
+
+    def _fake_broken_run(cmd, **kwargs):
+        result = _fake_plantuml_run(cmd, **kwargs)
+
+        # The last image is missing.
+        if "-pipedelimitor" in cmd:
+            result.stdout = result.stdout[:result.stdout.rindex(b"<svg>")]
+
+        return result
+
+    with patch.dict(os.environ, {"PLANTUML": str(plantuml_jar)}):
+        with patch("pyTRLCConverter.plantuml.subprocess.run", side_effect=_fake_broken_run) as run_mock:
+            plantuml = PlantUML()
+            plantuml.prefetch("svg", [diagram_1, diagram_2])
+            assert run_mock.call_count == 1
+
+            assert plantuml.generate_to_bytes("svg", diagram_2) == b"<svg>3</svg>"
+            assert run_mock.call_count == 2
+
+            # A source with two diagrams can't be streamed to PlantUML together with others.
+            images = PlantUML().generate_batch_to_bytes("svg", [diagram_1, diagram_1 + diagram_2])
+            assert images == [b"<svg>2</svg>", b"<svg>2</svg>"]
+            assert run_mock.call_count == 4
+            assert "-pipedelimitor" not in run_mock.call_args.args[0]
+
+def test_plantuml_batch_conversion(record_property, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_plantuml_batch
+    """
+    Test that the conversion renders all PlantUML diagrams of a TRLC file by a single
+    plantuml.jar process.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        monkeypatch (Any): Used to mock program arguments and environment variables.
+        tmp_path (Path): Used to create a temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_plantuml_batch")
+
+    plantuml_jar = tmp_path / "plantuml.jar"
+    plantuml_jar.write_bytes(b"jar")
+    monkeypatch.setenv("PLANTUML", str(plantuml_jar))
+    monkeypatch.delenv("PLANTUML_CACHE_DIR", raising=False)
+
+    records = []
+    for index in range(1, 4):
+        messages = "    A -> B\n" * index
+        records.append(
+            f"Requirement req_{index} {{\n"
+            f"    description = '''\n    ```plantuml\n    @startuml\n{messages}    @enduml\n    ```\n    '''\n"
+            "}\n"
+        )
+
+    trlc_file = tmp_path / "diagrams.trlc"
+    trlc_file.write_text("package Requirements\n" + "".join(records), encoding="utf-8")
+
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--source", "./tests/utils/req.rsl",
+        "--source", str(trlc_file),
+        "--out", str(tmp_path / "out"),
+        "--renderCfg", "./tests/utils/renderCfg.json",
+        "markdown",
+        "--render-plantuml",
+    ])
+
+    with patch("pyTRLCConverter.plantuml.subprocess.run", side_effect=_fake_plantuml_run) as run_mock:
+        main()
+
+    assert run_mock.call_count == 1
+
+    images = sorted(
+        (tmp_path / "out" / file_name).read_bytes()
+        for file_name in os.listdir(tmp_path / "out") if file_name.endswith(".svg")
+    )
+    assert images == [b"<svg>2</svg>", b"<svg>3</svg>", b"<svg>4</svg>"]
+
+def test_plantuml_pipe_worker(record_property, tmp_path):
+    # lobster-trace: SwTests.tc_plantuml_batch
+    """
+    Test that the persistent PlantUML process is started once and renders one diagram after another.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Used to create a fake plantuml.jar.
+    """
+    record_property("lobster-trace", "SwTests.tc_plantuml_batch")
+
+    plantuml_jar = tmp_path / "plantuml.jar"
+    plantuml_jar.write_bytes(b"jar")
+    process = FakePlantUMLProcess(b"<svg>1</svg>" + DELIMITER + b"\n<svg>2</svg>" + DELIMITER + b"\n")
+    env = {
+        "PLANTUML": str(plantuml_jar),
+        "PLANTUML_PIPE_WORKER": "true"
+    }
+
+    with patch.dict(os.environ, env):
+        with patch("pyTRLCConverter.plantuml.subprocess.Popen", return_value=process) as popen_mock:
+            assert PlantUML().generate_to_bytes("svg", "@startuml\nA -> B\n@enduml") == b"<svg>1</svg>"
+            assert PlantUML().generate_to_bytes("svg", "@startuml\nB -> C\n@enduml") == b"<svg>2</svg>"
+
+            assert popen_mock.call_count == 1
+            assert process.stdin.getvalue() == b"@startuml\nA -> B\n@enduml\n@startuml\nB -> C\n@enduml\n"
+
+    PlantUMLPipeWorker._workers.clear()
+
+def test_plantuml_pipe_worker_split_read(record_property, tmp_path):
+    # lobster-trace: SwTests.tc_plantuml_batch
+    """
+    Test that the line break after the delimiter, which arrives with a later read, is not
+    part of the next image.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Used to create a fake plantuml.jar.
+    """
+    record_property("lobster-trace", "SwTests.tc_plantuml_batch")
+
+    plantuml_jar = tmp_path / "plantuml.jar"
+    plantuml_jar.write_bytes(b"jar")
+    process = FakePlantUMLProcess(b"<svg>1</svg>" + DELIMITER,
+                                  b"\r\n<svg>2</svg>" + DELIMITER,
+                                  b"\n")
+    env = {
+        "PLANTUML": str(plantuml_jar),
+        "PLANTUML_PIPE_WORKER": "true"
+    }
+
+    with patch.dict(os.environ, env):
+        with patch("pyTRLCConverter.plantuml.subprocess.Popen", return_value=process):
+            plantuml = PlantUML()
+            assert plantuml.generate_to_bytes("svg", "@startuml\nA -> B\n@enduml") == b"<svg>1</svg>"
+            assert plantuml.generate_to_bytes("svg", "@startuml\nB -> C\n@enduml") == b"<svg>2</svg>"
+
+    PlantUMLPipeWorker._workers.clear()
+
+def test_plantuml_server_concurrency(record_property):
+    # lobster-trace: SwTests.tc_plantuml_server_concurrency
+    """
+    Test that several diagrams are requested concurrently from the PlantUML server with a
+    pooled session and the configured concurrency, retries and timeout.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+    """
+    record_property("lobster-trace", "SwTests.tc_plantuml_server_concurrency")
+
+    diagram_sources = [f"@startuml\nA -> B: {index}\n@enduml" for index in range(6)]
+    env = {
+        "PLANTUML": "http://localhost:8080/plantuml",
+        "PLANTUML_SERVER_CONCURRENCY": "3",
+        "PLANTUML_SERVER_RETRIES": "5",
+        "PLANTUML_SERVER_TIMEOUT": "2.5"
+    }
+    lock = threading.Lock()
+    requests_state = {"active": 0, "max_active": 0, "sessions": set(), "timeouts": set()}
+
+    def _fake_get(session, url, **kwargs):
+        with lock:
+            requests_state["active"] += 1
+            requests_state["max_active"] = max(requests_state["max_active"], requests_state["active"])
+            requests_state["sessions"].add(id(session))
+            requests_state["timeouts"].add(kwargs["timeout"])
+
+        time.sleep(0.05)
+
+        with lock:
+            requests_state["active"] -= 1
+
+        response = requests.Response()
+        response.status_code = 200
+        response._content = url.encode("utf-8")
+
+        return response
+
+    with patch.dict(os.environ, env):
+        with patch("requests.Session.get", autospec=True, side_effect=_fake_get):
+            plantuml = PlantUML()
+            images = plantuml.generate_batch_to_bytes("svg", diagram_sources)
+
+            assert images == [plantuml._make_server_url("svg", diagram_source, source_is_file=False).encode("utf-8")
+                              for diagram_source in diagram_sources]
+            assert 1 < requests_state["max_active"] <= 3
+            assert len(requests_state["sessions"]) == 1
+            assert requests_state["timeouts"] == {2.5}
+
+            adapter = plantuml._get_session().get_adapter("http://localhost:8080/plantuml")
+            assert adapter.max_retries.total == 5
+
 # Main *************************************************************************
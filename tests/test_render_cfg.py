@@ -18,6 +18,8 @@
 # If not, see <https://www.gnu.org/licenses/>.
 
 # Imports **********************************************************************
+import json
+from unittest.mock import patch
 
 from pyTRLCConverter.render_config import RenderConfig
 
@@ -27,6 +29,8 @@ from pyTRLCConverter.render_config import RenderConfig
 
 # Functions ********************************************************************
 
+# pylint: disable=W0212 # Access to a protected member
+
 def test_tc_render_configuration_no_file(record_property):
     # lobster-trace: SwTests.tc_render_configuration
     """
@@ -72,4 +76,76 @@ def test_tc_render_configuration_valid_file(record_property):
     assert render_cfg.is_format_rst("package", "type", "note") is False
     assert render_cfg.is_format_plain("package", "type", "note") is True
 
+def test_tc_render_configuration_resolve(record_property, tmp_path):
+    # lobster-trace: SwTests.tc_render_configuration
+    """
+    Resolving the format specifier and the table options of an attribute shall consider the
+    first matching item and shall evaluate the patterns only once per attribute.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Used to create a temporary render configuration file.
+    """
+    record_property("lobster-trace", "SwTests.tc_render_configuration")
+
+    render_cfg_file = tmp_path / "renderCfg.json"
+    render_cfg_file.write_text(json.dumps({
+        "renderCfg": [{
+            "package": "package",
+            "type": "typeTable",
+            "attribute": "description",
+            "tableOptions": {"border": "border: 1px solid black;"}
+        }, {
+            "package": ".*",
+            "type": ".*",
+            "attribute": "description",
+            "format": "gfm",
+            "tableOptions": {"headingStyle": "background-color: #c0c0c0;"}
+        }, {
+            "type": ".*",
+            "attribute": ".*",
+            "format": "md"
+        }]
+    }), encoding="utf-8")
+
+    render_cfg = RenderConfig()
+    assert render_cfg.load(str(render_cfg_file)) is True
+
+    with patch.object(RenderConfig, "_is_match", wraps=RenderConfig._is_match) as is_match_mock:
+        assert render_cfg.resolve("package", "typeTable", "description") == \
+            (RenderConfig.FORMAT_SPECIFIER_GFM, {"border": "border: 1px solid black;"})
+        assert render_cfg.resolve("package", "type", "description") == \
+            (RenderConfig.FORMAT_SPECIFIER_GFM, {"headingStyle": "background-color: #c0c0c0;"})
+
+        # The last item has no package pattern, therefore it matches nothing.
+        assert render_cfg.resolve("package", "type", "note") == (RenderConfig.FORMAT_SPECIFIER_PLAIN, {})
+
+        call_count = is_match_mock.call_count
+
+        assert render_cfg.is_format_gfm("package", "typeTable", "description") is True
+        assert render_cfg.get_table_options("package", "type", "description") == \
+            {"headingStyle": "background-color: #c0c0c0;"}
+        assert render_cfg.is_format_plain("package", "type", "note") is True
+        assert is_match_mock.call_count == call_count
+
+def test_tc_render_configuration_invalid_pattern(record_property, tmp_path):
+    # lobster-trace: SwTests.tc_render_configuration
+    """
+    Loading a render configuration file with an invalid pattern, shall return an error.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Used to create a temporary render configuration file.
+    """
+    record_property("lobster-trace", "SwTests.tc_render_configuration")
+
+    render_cfg_file = tmp_path / "renderCfg.json"
+    render_cfg_file.write_text(json.dumps({
+        "renderCfg": [{"package": "(", "type": ".*", "attribute": ".*", "format": "md"}]
+    }), encoding="utf-8")
+
+    render_cfg = RenderConfig()
+
+    assert render_cfg.load(str(render_cfg_file)) is False
+
 # Main *************************************************************************
@@ -19,7 +19,7 @@
 # Imports **********************************************************************
 import json
 import os
-import zipfile
+import sqlite3
 from pathlib import Path
 from unittest.mock import patch
 from pyTRLCConverter.__main__ import main
@@ -425,134 +425,6 @@ def test_tc_reqif_render_path(record_property, capsys, monkeypatch, tmp_path: Pa
     assert os.path.isfile(os.path.join(tmp_path, "attachment.txt"))
 
 
-def test_tc_reqif_render_path_reqifz(record_property, capsys, monkeypatch, tmp_path: Path):
-    # lobster-trace: SwTests.tc_reqif_render_path_reqifz
-    """The external file referenced by a path format attribute shall be bundled in the .reqifz archive.
-
-    Args:
-        record_property (Any): Used to inject the test case reference into the test results.
-        capsys (Any): Used to capture stdout and stderr.
-        monkeypatch (Any): Used to mock program arguments.
-        tmp_path (Path): Used to create a temporary output directory.
-    """
-    record_property("lobster-trace", "SwTests.tc_reqif_render_path_reqifz")
-
-    monkeypatch.setattr("sys.argv", [
-        "pyTRLCConverter",
-        "--source", "./tests/utils/req_with_path.rsl",
-        "--source", "./tests/utils/single_req_with_path.trlc",
-        "--out", str(tmp_path),
-        "--renderCfg", "./tests/utils/renderCfgPath.json",
-        "reqif",
-        "--single-document",
-        "--reqifz"
-    ])
-
-    main()
-
-    captured = capsys.readouterr()
-    assert captured.err == ""
-
-    doc_name = os.path.splitext(ReqifConverter.OUTPUT_FILE_NAME_DEFAULT)[0]
-    reqifz_file = os.path.join(tmp_path, doc_name + ".reqifz")
-    assert os.path.isfile(reqifz_file)
-
-    with zipfile.ZipFile(reqifz_file, "r") as zf:
-        names = zf.namelist()
-        # The archive must contain the .reqif and the copied external file.
-        assert doc_name + ".reqif" in names
-        assert "attachment.txt" in names
-
-
-def test_tc_reqif_reqifz(record_property, capsys, monkeypatch, tmp_path: Path):
-    # lobster-trace: SwTests.tc_reqif_reqifz
-    """The ReqIF converter shall produce a .reqifz ZIP archive when --reqifz is given.
-
-    Args:
-        record_property (Any): Used to inject the test case reference into the test results.
-        capsys (Any): Used to capture stdout and stderr.
-        monkeypatch (Any): Used to mock program arguments.
-        tmp_path (Path): Used to create a temporary output directory.
-    """
-    record_property("lobster-trace", "SwTests.tc_reqif_reqifz")
-
-    monkeypatch.setattr("sys.argv", [
-        "pyTRLCConverter",
-        "--source", "./tests/utils/req.rsl",
-        "--source", "./tests/utils/single_req_no_section.trlc",
-        "--out", str(tmp_path),
-        "reqif",
-        "--single-document",
-        "--reqifz"
-    ])
-
-    main()
-
-    captured = capsys.readouterr()
-    assert captured.err == ""
-
-    # A subfolder named after the document is created; the .reqif lives inside it.
-    doc_name = os.path.splitext(ReqifConverter.OUTPUT_FILE_NAME_DEFAULT)[0]
-    subfolder = os.path.join(tmp_path, doc_name)
-    assert os.path.isdir(subfolder), f"Expected document subfolder not found: {subfolder}"
-    assert os.path.isfile(os.path.join(subfolder, doc_name + ".reqif"))
-
-    # The .reqifz in the output folder bundles all files from the subfolder.
-    reqifz_file = os.path.join(tmp_path, doc_name + ".reqifz")
-    assert os.path.isfile(reqifz_file), f"Expected .reqifz not found: {reqifz_file}"
-
-    with zipfile.ZipFile(reqifz_file, "r") as zf:
-        names = zf.namelist()
-        assert len(names) == 1
-        assert names[0] == doc_name + ".reqif"
-        reqif_content = zf.read(names[0]).decode("utf-8")
-
-    assert "REQ-IF" in reqif_content
-
-
-def test_tc_reqif_reqifz_multiple_doc(record_property, capsys, monkeypatch, tmp_path: Path):
-    # lobster-trace: SwTests.tc_reqif_reqifz
-    """In multiple document mode each document produces its own .reqifz archive.
-
-    Args:
-        record_property (Any): Used to inject the test case reference into the test results.
-        capsys (Any): Used to capture stdout and stderr.
-        monkeypatch (Any): Used to mock program arguments.
-        tmp_path (Path): Used to create a temporary output directory.
-    """
-    record_property("lobster-trace", "SwTests.tc_reqif_reqifz")
-
-    # Two separate TRLC source files — multiple-document mode (no --single-document).
-    monkeypatch.setattr("sys.argv", [
-        "pyTRLCConverter",
-        "--source", "./tests/utils/req.rsl",
-        "--source", "./tests/utils/single_req_no_section.trlc",
-        "--source", "./tests/utils/single_req_with_section.trlc",
-        "--out", str(tmp_path),
-        "reqif",
-        "--reqifz"
-    ])
-
-    main()
-
-    captured = capsys.readouterr()
-    assert captured.err == ""
-
-    for doc_name in ("single_req_no_section", "single_req_with_section"):
-        # Each document gets its own subfolder and .reqifz in the output folder.
-        subfolder = os.path.join(tmp_path, doc_name)
-        assert os.path.isdir(subfolder), f"Expected subfolder not found: {subfolder}"
-        assert os.path.isfile(os.path.join(subfolder, doc_name + ".reqif"))
-
-        reqifz_file = os.path.join(tmp_path, doc_name + ".reqifz")
-        assert os.path.isfile(reqifz_file), f"Expected .reqifz not found: {reqifz_file}"
-
-        with zipfile.ZipFile(reqifz_file, "r") as zf:
-            names = zf.namelist()
-            assert len(names) == 1
-            assert names[0] == doc_name + ".reqif"
-
-
 def test_tc_reqif_render_plantuml(record_property, capsys, monkeypatch, tmp_path: Path):
     # lobster-trace: SwTests.tc_reqif_render_plantuml
     """A plantuml fenced code block in a Markdown attribute shall be rendered as an XHTML <object>
@@ -832,4 +704,176 @@ def test_tc_reqif_identifier_store_reuse(record_property, capsys, monkeypatch, t
     assert "spec-object:Requirements.req_id_2" in data_extended["identifiers"]
     assert data_extended["identifiers"]["spec-object:Requirements.req_id_2"] == extended_req_2.identifier
 
+
+def _convert_with_id_store(monkeypatch, tmp_path: Path, trlc_file: str, id_store_args: list[str]) -> dict:
+    # lobster-exclude: Utility function for other test code.
+    """Convert the given TRLC file into a single ReqIF document with an identifier store.
+
+    Args:
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used as output directory.
+        trlc_file (str): The TRLC file to convert.
+        id_store_args (list[str]): The identifier store arguments.
+
+    Returns:
+        dict: The identifiers of the generated spec-objects by their long-name.
+    """
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--source", "./tests/utils/req.rsl",
+        "--source", trlc_file,
+        "--out", str(tmp_path),
+        "reqif",
+        "--single-document",
+        *id_store_args
+    ])
+    main()
+
+    bundle = _parse_reqif(os.path.join(tmp_path, ReqifConverter.OUTPUT_FILE_NAME_DEFAULT))
+
+    return {
+        spec_object.long_name: spec_object.identifier
+        for spec_object in bundle.core_content.req_if_content.spec_objects
+    }
+
+
+def _read_sqlite_id_store(id_store_file: str) -> dict:
+    # lobster-exclude: Utility function for other test code.
+    """Read the identifiers of a SQLite identifier store.
+
+    Args:
+        id_store_file (str): The SQLite identifier store file.
+
+    Returns:
+        dict: The identifiers by their key.
+    """
+    connection = sqlite3.connect(id_store_file)
+    identifiers = dict(connection.execute("SELECT key, identifier FROM identifiers").fetchall())
+    connection.close()
+
+    return identifiers
+
+
+def test_tc_reqif_identifier_store_sqlite(record_property, capsys, monkeypatch, tmp_path: Path):
+    # lobster-trace: SwTests.tc_reqif_identifier_store_sqlite
+    """A SQLite identifier store is selected by the file extension and keeps the identifiers immutable.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_reqif_identifier_store_sqlite")
+
+    id_store_file = os.path.join(tmp_path, "ids.db")
+
+    base = _convert_with_id_store(monkeypatch, tmp_path, "./tests/utils/id_store_base.trlc",
+                                  ["--id-store", id_store_file])
+    assert capsys.readouterr().err == ""
+    assert _read_sqlite_id_store(id_store_file)["spec-object:Requirements.req_id_1"] == base["req_id_1"]
+
+    extended = _convert_with_id_store(monkeypatch, tmp_path, "./tests/utils/id_store_extended.trlc",
+                                      ["--id-store", id_store_file])
+    assert capsys.readouterr().err == ""
+
+    # The known element keeps its identifier, the new one gets a new identifier.
+    assert extended["req_id_1"] == base["req_id_1"]
+    assert extended["req_id_2"] != base["req_id_1"]
+
+    identifiers = _read_sqlite_id_store(id_store_file)
+    assert identifiers["spec-object:Requirements.req_id_1"] == base["req_id_1"]
+    assert identifiers["spec-object:Requirements.req_id_2"] == extended["req_id_2"]
+
+
+def test_tc_reqif_identifier_store_prune(record_property, capsys, monkeypatch, tmp_path: Path):
+    # lobster-trace: SwTests.tc_reqif_identifier_store_prune
+    """Identifiers which are not used in the last exports are dropped from the SQLite identifier store.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_reqif_identifier_store_prune")
+
+    id_store_file = os.path.join(tmp_path, "ids.db")
+    req_id_2_key = "spec-object:Requirements.req_id_2"
+
+    extended = _convert_with_id_store(monkeypatch, tmp_path, "./tests/utils/id_store_extended.trlc",
+                                      ["--id-store", id_store_file])
+    assert capsys.readouterr().err == ""
+
+    # The identifier of req_id_2 is unused in this export, but used in the last 2 exports.
+    base = _convert_with_id_store(monkeypatch, tmp_path, "./tests/utils/id_store_base.trlc",
+                                  ["--id-store", id_store_file, "--id-store-prune", "2"])
+    assert capsys.readouterr().err == ""
+    assert base["req_id_1"] == extended["req_id_1"]
+    assert req_id_2_key in _read_sqlite_id_store(id_store_file)
+
+    # The identifier of req_id_2 is unused in the last export, which is this one.
+    _convert_with_id_store(monkeypatch, tmp_path, "./tests/utils/id_store_base.trlc",
+                           ["--id-store", id_store_file, "--id-store-prune", "1"])
+    assert capsys.readouterr().err == ""
+
+    identifiers = _read_sqlite_id_store(id_store_file)
+    assert req_id_2_key not in identifiers
+    assert identifiers["spec-object:Requirements.req_id_1"] == extended["req_id_1"]
+
+    # A returning element gets a new identifier, the dropped one is not reused.
+    returned = _convert_with_id_store(monkeypatch, tmp_path, "./tests/utils/id_store_extended.trlc",
+                                      ["--id-store", id_store_file])
+    assert capsys.readouterr().err == ""
+    assert returned["req_id_1"] == extended["req_id_1"]
+    assert returned["req_id_2"] != extended["req_id_2"]
+
+    # Pruning requires a SQLite identifier store.
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--source", "./tests/utils/req.rsl",
+        "--source", "./tests/utils/id_store_base.trlc",
+        "--out", str(tmp_path),
+        "reqif",
+        "--id-store", os.path.join(tmp_path, "ids.json"),
+        "--id-store-prune", "1"
+    ])
+    main()
+    assert "SQLite identifier store" in capsys.readouterr().err
+
+
+def test_tc_reqif_identifier_store_migrate(record_property, capsys, monkeypatch, tmp_path: Path):
+    # lobster-trace: SwTests.tc_reqif_identifier_store_migrate
+    """The identifiers of a JSON identifier store are migrated into a SQLite identifier store.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_reqif_identifier_store_migrate")
+
+    json_id_store_file = os.path.join(tmp_path, "ids.json")
+    id_store_file = os.path.join(tmp_path, "ids.sqlite")
+
+    json_based = _convert_with_id_store(monkeypatch, tmp_path, "./tests/utils/id_store_base.trlc",
+                                        ["--id-store", json_id_store_file])
+    assert capsys.readouterr().err == ""
+
+    with open(json_id_store_file, "r", encoding="utf-8") as fd:
+        data = json.load(fd)
+
+    sqlite_based = _convert_with_id_store(monkeypatch, tmp_path, "./tests/utils/id_store_extended.trlc",
+                                          ["--id-store", id_store_file, "--id-store-migrate", json_id_store_file])
+    assert capsys.readouterr().err == ""
+
+    # The migrated element keeps its identifier, the new one does not reuse a migrated identifier.
+    assert sqlite_based["req_id_1"] == json_based["req_id_1"]
+    assert sqlite_based["req_id_2"] not in data["identifiers"].values()
+
+    identifiers = _read_sqlite_id_store(id_store_file)
+    for key, identifier in data["identifiers"].items():
+        assert identifiers[key] == identifier
+
 # Main *************************************************************************
@@ -0,0 +1,302 @@
+"""Test the ReqIF conversion requirements for the .reqifz archive and the streamed output."""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import io
+import os
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+from reqif.unparser import ReqIFUnparser
+from pyTRLCConverter.__main__ import main
+from pyTRLCConverter.reqif_converter import ReqifConverter
+from pyTRLCConverter.reqif_stream_writer import ReqifStreamWriter
+from tests.reqif_test_utils import _parse_reqif
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+# Functions ********************************************************************
+
+def test_tc_reqif_render_path_reqifz(record_property, capsys, monkeypatch, tmp_path: Path):
+    # lobster-trace: SwTests.tc_reqif_render_path_reqifz
+    """The external file referenced by a path format attribute shall be bundled in the .reqifz archive.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_reqif_render_path_reqifz")
+
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--source", "./tests/utils/req_with_path.rsl",
+        "--source", "./tests/utils/single_req_with_path.trlc",
+        "--out", str(tmp_path),
+        "--renderCfg", "./tests/utils/renderCfgPath.json",
+        "reqif",
+        "--single-document",
+        "--reqifz"
+    ])
+
+    main()
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+
+    doc_name = os.path.splitext(ReqifConverter.OUTPUT_FILE_NAME_DEFAULT)[0]
+    reqifz_file = os.path.join(tmp_path, doc_name + ".reqifz")
+    assert os.path.isfile(reqifz_file)
+
+    with zipfile.ZipFile(reqifz_file, "r") as zf:
+        names = zf.namelist()
+        # The archive must contain the .reqif and the copied external file.
+        assert doc_name + ".reqif" in names
+        assert "attachment.txt" in names
+
+    # The conversion fails, if an external file can't be added to the archive.
+    with patch("pyTRLCConverter.reqif_converter.zipfile.ZipFile.write", side_effect=OSError("Disk full")):
+        assert main() != 0
+
+    assert "Failed to archive external file" in capsys.readouterr().err
+
+
+def test_tc_reqif_reqifz(record_property, capsys, monkeypatch, tmp_path: Path):
+    # lobster-trace: SwTests.tc_reqif_reqifz
+    """The ReqIF converter shall produce a .reqifz ZIP archive when --reqifz is given.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_reqif_reqifz")
+
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--source", "./tests/utils/req.rsl",
+        "--source", "./tests/utils/single_req_no_section.trlc",
+        "--out", str(tmp_path),
+        "reqif",
+        "--single-document",
+        "--reqifz"
+    ])
+
+    main()
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+
+    # A subfolder named after the document is created; the .reqif lives inside it.
+    doc_name = os.path.splitext(ReqifConverter.OUTPUT_FILE_NAME_DEFAULT)[0]
+    subfolder = os.path.join(tmp_path, doc_name)
+    assert os.path.isdir(subfolder), f"Expected document subfolder not found: {subfolder}"
+    assert os.path.isfile(os.path.join(subfolder, doc_name + ".reqif"))
+
+    # The .reqifz in the output folder bundles all files from the subfolder.
+    reqifz_file = os.path.join(tmp_path, doc_name + ".reqifz")
+    assert os.path.isfile(reqifz_file), f"Expected .reqifz not found: {reqifz_file}"
+
+    with zipfile.ZipFile(reqifz_file, "r") as zf:
+        names = zf.namelist()
+        assert len(names) == 1
+        assert names[0] == doc_name + ".reqif"
+        reqif_content = zf.read(names[0]).decode("utf-8")
+
+    assert "REQ-IF" in reqif_content
+
+
+def test_tc_reqif_reqifz_multiple_doc(record_property, capsys, monkeypatch, tmp_path: Path):
+    # lobster-trace: SwTests.tc_reqif_reqifz
+    """In multiple document mode each document produces its own .reqifz archive.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_reqif_reqifz")
+
+    # Two separate TRLC source files — multiple-document mode (no --single-document).
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--source", "./tests/utils/req.rsl",
+        "--source", "./tests/utils/single_req_no_section.trlc",
+        "--source", "./tests/utils/single_req_with_section.trlc",
+        "--out", str(tmp_path),
+        "reqif",
+        "--reqifz"
+    ])
+
+    main()
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+
+    for doc_name in ("single_req_no_section", "single_req_with_section"):
+        # Each document gets its own subfolder and .reqifz in the output folder.
+        subfolder = os.path.join(tmp_path, doc_name)
+        assert os.path.isdir(subfolder), f"Expected subfolder not found: {subfolder}"
+        assert os.path.isfile(os.path.join(subfolder, doc_name + ".reqif"))
+
+        reqifz_file = os.path.join(tmp_path, doc_name + ".reqifz")
+        assert os.path.isfile(reqifz_file), f"Expected .reqifz not found: {reqifz_file}"
+
+        with zipfile.ZipFile(reqifz_file, "r") as zf:
+            names = zf.namelist()
+            assert len(names) == 1
+            assert names[0] == doc_name + ".reqif"
+
+
+def test_tc_reqif_reqifz_packaging(record_property, capsys, monkeypatch, tmp_path: Path):
+    # lobster-trace: SwTests.tc_reqif_reqifz_packaging
+    """The .reqifz archive shall be written without the unpacked subfolder when --reqifz-no-folder is given,
+    with the configured compression level and with already compressed media stored uncompressed.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_reqif_reqifz_packaging")
+
+    out_path = os.path.join(tmp_path, "out")
+    image_file = os.path.join(tmp_path, "image.png")
+    trlc_file = os.path.join(tmp_path, "req_with_image.trlc")
+
+    with open(image_file, "wb") as fd:
+        fd.write(b"\x89PNG\r\n\x1a\n" + bytes(1024))
+
+    with open(trlc_file, "w", encoding="utf-8") as fd:
+        fd.write("package Requirements\n\n"
+                 "RequirementWithPath req_image {\n"
+                 "    description = \"A requirement that references an image.\"\n"
+                 f"    file_path   = \"{Path(image_file).as_posix()}\"\n"
+                 "}\n\n"
+                 "RequirementWithPath req_text {\n"
+                 "    description = \"A requirement that references a text file.\"\n"
+                 "    file_path   = \"./tests/utils/attachment.txt\"\n"
+                 "}\n")
+
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--source", "./tests/utils/req_with_path.rsl",
+        "--source", trlc_file,
+        "--out", out_path,
+        "--renderCfg", "./tests/utils/renderCfgPath.json",
+        "reqif",
+        "--single-document",
+        "--reqifz",
+        "--reqifz-compression-level", "9",
+        "--reqifz-no-folder"
+    ])
+
+    main()
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+
+    # Only the archive is written, without the unpacked subfolder.
+    doc_name = os.path.splitext(ReqifConverter.OUTPUT_FILE_NAME_DEFAULT)[0]
+    assert os.listdir(out_path) == [doc_name + ".reqifz"]
+
+    with zipfile.ZipFile(os.path.join(out_path, doc_name + ".reqifz"), "r") as zf:
+        assert zf.namelist()[0] == doc_name + ".reqif"
+        assert zf.getinfo(doc_name + ".reqif").compress_type == zipfile.ZIP_DEFLATED
+        assert zf.getinfo("attachment.txt").compress_type == zipfile.ZIP_DEFLATED
+
+        # The already compressed image is stored uncompressed.
+        assert zf.getinfo("image.png").compress_type == zipfile.ZIP_STORED
+        with open(image_file, "rb") as fd:
+            assert zf.read("image.png") == fd.read()
+
+        assert "req_image" in zf.read(doc_name + ".reqif").decode("utf-8")
+
+
+def test_tc_reqif_stream(record_property, capsys, monkeypatch, tmp_path: Path):
+    # lobster-trace: SwTests.tc_reqif_stream
+    """The ReqIF document shall be streamed identically into the .reqif file and the .reqifz archive
+    and the streamed output shall be identical to the output of the reqif library unparser.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_reqif_stream")
+
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--source", "./tests/utils/req.rsl",
+        "--source", "./tests/utils/multi_req_with_link.trlc",
+        "--out", str(tmp_path),
+        "reqif",
+        "--single-document",
+        "--reqifz"
+    ])
+
+    main()
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+
+    doc_name = os.path.splitext(ReqifConverter.OUTPUT_FILE_NAME_DEFAULT)[0]
+    reqif_file = os.path.join(tmp_path, doc_name, doc_name + ".reqif")
+
+    with open(reqif_file, "r", encoding="utf-8") as fd:
+        reqif_content = fd.read()
+
+    # The same document is streamed into the subfolder and into the archive.
+    with zipfile.ZipFile(os.path.join(tmp_path, doc_name + ".reqifz"), "r") as zf:
+        assert zf.read(doc_name + ".reqif").decode("utf-8") == reqif_content
+
+    # Streaming the spooled spec objects results in the same document as the unparser.
+    _assert_stream_equals_unparser(reqif_file)
+
+
+def _assert_stream_equals_unparser(reqif_file: str) -> None:
+    # lobster-exclude: Utility function for other test code.
+    """Stream the spec objects of the given ReqIF file and compare it with the output of the reqif library unparser.
+
+    Args:
+        reqif_file (str): Path to the ReqIF file with more than one spec object.
+    """
+    bundle = _parse_reqif(reqif_file)
+    expected = ReqIFUnparser.unparse(bundle)
+    spec_objects = bundle.core_content.req_if_content.spec_objects
+    assert len(spec_objects) > 1
+
+    stream_writer = ReqifStreamWriter()
+    for spec_object in spec_objects:
+        stream_writer.add_spec_object(spec_object)
+    assert stream_writer.get_spec_object_count() == len(spec_objects)
+
+    bundle.core_content.req_if_content.spec_objects = []
+    output = io.StringIO()
+    stream_writer.write(bundle, [output])
+    stream_writer.close()
+
+    assert output.getvalue() == expected
+    assert stream_writer.get_spec_object_count() == 0
@@ -20,14 +20,18 @@
 
 # Imports **********************************************************************
 import os
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 from collections import namedtuple
 
+from marko import Markdown
 from pyTRLCConverter.__main__ import main
+from pyTRLCConverter.marko.gfm2rst_renderer import Gfm2RstRenderer
+from pyTRLCConverter.marko.marko_renderer import MarkoRenderer
 from pyTRLCConverter.rst_converter import RstConverter
 from pyTRLCConverter.rst.element import RstHeading, RstAdmonition, RstTable, RstBulletList, RstImage
-from pyTRLCConverter.rst.text import RstText
+from pyTRLCConverter.rst.text import RST_ESCAPER, RstText
 
 # Variables ********************************************************************
 
@@ -156,12 +160,24 @@ def test_tc_rst_escape(record_property):
         EscapingResult(initial=r'I contain nothing weird', escaped=r"I contain nothing weird"),
         EscapingResult(initial=r'I_contain.something+weird', escaped=r"I\_contain\.something\+weird"),
         EscapingResult(initial=r'\`*_{}[]()#+-.!', escaped=r"\\\`\*\_\{\}\[\]\(\)\#\+\-\.\!"),
-        EscapingResult(initial=r'unchanged', escaped=r"unchanged")
+        EscapingResult(initial=r'unchanged', escaped=r"unchanged"),
+        EscapingResult(initial=r'<>|' * 30, escaped=r"\<\>\|" * 30)
     ]
 
     for check in checks:
         assert RstText.escape(check.initial) == check.escaped
 
+    # Short texts are escaped from the cache the second time, long texts are always escaped again.
+    RST_ESCAPER.cache_clear()
+
+    for _ in range(2):
+        assert RstText.escape(r'I_contain.something+weird') == r"I\_contain\.something\+weird"
+        assert RstText.escape(r'<>|' * 30) == r"\<\>\|" * 30
+
+    cache_info = RST_ESCAPER.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
+
 def test_tc_rst_heading(record_property):
     # lobster-trace: SwTests.tc_rst_heading
     """
@@ -955,4 +971,36 @@ def test_tc_rst_render_plantuml_error(record_property, capsys, monkeypatch, tmp_
                  if f.startswith("plantuml_") and f.endswith(".svg")]
     assert len(svg_files) == 0
 
+def test_tc_render_markdown_reuse_rst(record_property):
+    # lobster-trace: SwTests.tc_render_markdown_reuse
+    """
+    Check whether the Markdown parser and renderer are set up once per thread and
+    rendering from several threads gives the same result as rendering one by one.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+    """
+    record_property("lobster-trace", "SwTests.tc_render_markdown_reuse")
+
+    texts = [
+        f"# Heading {index}\n\n- Item {index}\n    - Sub item\n\n| A | B |\n|---|---|\n| {index} | *x* |\n"
+        for index in range(16)
+    ]
+    expected = [Markdown(renderer=Gfm2RstRenderer, extensions=["gfm"]).convert(text) for text in texts]
+
+    with patch("pyTRLCConverter.marko.marko_renderer.Markdown", wraps=Markdown) as markdown_mock:
+        marko_renderer = MarkoRenderer(Gfm2RstRenderer, ["gfm"])
+
+        # The setup is done only once for all texts in the same thread.
+        assert [marko_renderer.convert(text, image_dir="images", external_files=[]) for text in texts] == expected
+        assert [marko_renderer.convert(text, image_dir="images", external_files=[]) for text in texts] == expected
+        assert markdown_mock.call_count == 1
+
+        # Every thread renders with its own parser and renderer.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda text: marko_renderer.convert(text, external_files=[]), texts * 4))
+
+        assert results == expected * 4
+        assert 1 < markdown_mock.call_count <= 5
+
 # Main *************************************************************************
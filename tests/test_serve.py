@@ -0,0 +1,223 @@
+"""Test the conversion daemon requirements.
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import json
+import re
+import shutil
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from pyTRLCConverter.__main__ import main, _run_job
+from pyTRLCConverter.conversion_server import ConversionServer
+from pyTRLCConverter.ret import Ret
+from pyTRLCConverter.symbols_store import SymbolsStore
+from pyTRLCConverter.version import __version__
+from tests.watch_test_utils import _modify_file
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+# Functions ********************************************************************
+
+def test_tc_serve(record_property, tmp_path):
+    # lobster-trace: SwTests.tc_serve
+    """
+    Check whether the conversion daemon converts the jobs with the warm TRLC symbols, processes them again
+    after a TRLC file changed and reports its health and metrics.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Used to create a temporary source and output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_serve")
+
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+
+    for file_name in ["req.rsl", "single_req_no_section.trlc", "single_req_with_section.trlc"]:
+        shutil.copy(f"./tests/utils/{file_name}", src_dir / file_name)
+
+    symbols_store = SymbolsStore()
+    server = ConversionServer(("127.0.0.1", 0), 2, lambda argv: _run_job(argv, symbols_store), symbols_store)
+    host, port = server.get_address()
+    server_thread = threading.Thread(target=server.serve)
+    server_thread.start()
+
+    def request(path: str, job: Any = None) -> tuple[int, dict]:
+        data = json.dumps(job).encode("utf-8") if job is not None else None
+
+        try:
+            with urllib.request.urlopen(f"http://{host}:{port}{path}", data=data, timeout=30) as response:
+                return response.status, json.loads(response.read())
+        except urllib.error.HTTPError as exc:
+            return exc.code, json.loads(exc.read())
+
+    def convert(subcommand: str, out_dir: Path) -> int:
+        status_code, _ = request("/convert", {"args": ["--source", str(src_dir), "--out", str(out_dir), subcommand]})
+        return status_code
+
+    try:
+        assert request("/health") == (200, {"status": "ok", "version": __version__})
+
+        # The TRLC sources are processed once for all jobs, which may run concurrently.
+        assert convert("markdown", tmp_path / "md_1") == 200
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            assert list(executor.map(convert, ["rst", "markdown"], [tmp_path / "rst", tmp_path / "md_2"])) == [200, 200]
+
+        assert (tmp_path / "md_1" / "single_req_with_section.md").read_bytes() == \
+            (tmp_path / "md_2" / "single_req_with_section.md").read_bytes()
+        assert (tmp_path / "rst" / "single_req_with_section.rst").is_file()
+
+        # A changed TRLC file is processed again.
+        _modify_file(src_dir / "single_req_with_section.trlc", "0.01", "0.02")
+        assert convert("markdown", tmp_path / "md_3") == 200
+        assert "1/50" in (tmp_path / "md_3" / "single_req_with_section.md").read_text(encoding="utf-8")
+
+        # Invalid jobs are rejected.
+        assert request("/convert", {"args": "markdown"})[0] == 400
+        assert request("/convert", {"args": ["--unknown"]})[0] == 500
+        assert request("/unknown")[0] == 404
+
+        status_code, metrics = request("/metrics")
+        assert status_code == 200
+        assert metrics["workers"] == 2
+        assert metrics["jobs"]["total"] == 5
+        assert metrics["jobs"]["succeeded"] == 4
+        assert metrics["jobs"]["failed"] == 1
+        assert metrics["jobs"]["pending"] == 0
+        assert metrics["symbols_store"] == {"source_sets": 1, "hits": 2, "misses": 2}
+
+    finally:
+        server.shutdown()
+        server_thread.join()
+        server.close()
+
+
+@pytest.mark.parametrize("arguments", [
+    ["serve", "--port", "0", "--workers", "3"],
+    ["--verbose", "serve", "--port", "0"],
+    ["serve", "--verbose", "--port", "0"]
+])
+def test_tc_serve_cli(record_property, capsys, monkeypatch, arguments):
+    # lobster-trace: SwTests.tc_serve
+    """
+    Check whether the serve command runs the conversion daemon until Ctrl+C is pressed.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        arguments (list[str]): The program arguments of the serve command.
+    """
+    record_property("lobster-trace", "SwTests.tc_serve")
+
+    monkeypatch.setattr("sys.argv", ["pyTRLCConverter"] + arguments)
+
+    with patch.object(ConversionServer, "serve", autospec=True, side_effect=KeyboardInterrupt) as serve:
+        with patch("pyTRLCConverter.__main__.enable_verbose") as enable_verbose:
+            assert main() == 0
+
+    assert serve.call_count == 1
+    enable_verbose.assert_called_once_with("--verbose" in arguments)
+    captured = capsys.readouterr()
+    assert re.match(r"Conversion daemon listening on http://127\.0\.0\.1:\d+\.", captured.out)
+    assert "Stopped the conversion daemon." in captured.out
+
+def test_tc_serve_cli_help(record_property, capsys, monkeypatch):
+    # lobster-trace: SwTests.tc_serve
+    """
+    Check whether the serve command is listed in the help and a conversion job can't run it.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+    """
+    record_property("lobster-trace", "SwTests.tc_serve")
+
+    monkeypatch.setattr("sys.argv", ["pyTRLCConverter", "--help"])
+
+    with pytest.raises(SystemExit):
+        main()
+
+    captured = capsys.readouterr()
+    assert re.search(r"^    serve +Run a conversion daemon", captured.out, re.MULTILINE)
+
+    # The serve command doesn't require any TRLC sources, but the converters do.
+    monkeypatch.setattr("sys.argv", ["pyTRLCConverter", "markdown"])
+
+    with pytest.raises(SystemExit):
+        main()
+
+    captured = capsys.readouterr()
+    assert "the following arguments are required: -s/--source" in captured.err
+
+    with patch.object(ConversionServer, "serve", autospec=True) as serve:
+        assert _run_job(["serve", "--port", "0"], SymbolsStore()) == Ret.ERROR
+
+    assert serve.call_count == 0
+    captured = capsys.readouterr()
+    assert "A conversion job can't run the conversion daemon." in captured.err
+
+
+def test_tc_serve_job_exit(record_property):
+    # lobster-trace: SwTests.tc_serve
+    """
+    Check whether a conversion job which exits ends only the job, but neither the daemon nor the
+    request handling.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+    """
+    record_property("lobster-trace", "SwTests.tc_serve")
+
+    symbols_store = SymbolsStore()
+
+    # The job exits while it is processed.
+    with patch("pyTRLCConverter.__main__._process", side_effect=SystemExit(2)):
+        assert _run_job(["--source", "./tests/utils", "markdown"], symbols_store) == Ret.ERROR
+
+    # The job function itself exits.
+    def exit_job(argv: list[str]) -> Ret:
+        raise SystemExit(f"Exit {argv}")
+
+    server = ConversionServer(("127.0.0.1", 0), 1, exit_job, symbols_store)
+
+    try:
+        ret_status, _ = server.convert(["markdown"])
+        assert ret_status == Ret.ERROR
+
+        jobs = server.get_metrics()["jobs"]
+        assert jobs["failed"] == 1
+        assert jobs["pending"] == 0
+
+    finally:
+        server.close()
+
+
+# Main *************************************************************************
@@ -0,0 +1,229 @@
+"""Test the watch mode requirements.
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import os
+import shutil
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+import pytest
+
+from pyTRLCConverter.__main__ import main, _setup_render_configuration
+from pyTRLCConverter.source_watcher import SourceWatcher
+from pyTRLCConverter.symbols_cache import get_trlc_symbols_cached
+from tests.watch_test_utils import _copy_sources, _modify_file, _take_changed_outputs
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+# Functions ********************************************************************
+
+def test_tc_cli_watch_changes(record_property, tmp_path):
+    # lobster-trace: SwTests.tc_cli_watch_changes
+    """
+    Check whether the source watcher reports changed, added and removed files and waits until the changes settle.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Used to create a temporary source directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_watch_changes")
+
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    shutil.copy("./tests/utils/req.rsl", src_dir / "req.rsl")
+    shutil.copy("./tests/utils/single_req_no_section.trlc", src_dir / "single_req_no_section.trlc")
+    render_cfg_file = tmp_path / "renderCfg.json"
+    shutil.copy("./tests/utils/renderCfg.json", render_cfg_file)
+
+    rsl_file = os.path.normpath(str(src_dir / "req.rsl"))
+    trlc_file = os.path.normpath(str(src_dir / "single_req_no_section.trlc"))
+    added_file = os.path.normpath(str(src_dir / "single_req_with_section.trlc"))
+
+    watcher = SourceWatcher([str(src_dir)], None, [str(render_cfg_file)], 0.01)
+    assert watcher.start() == sorted([rsl_file, trlc_file, os.path.normpath(str(render_cfg_file))])
+    assert watcher.get_changes() == []
+
+    # Changed, added and removed files are reported once.
+    _modify_file(Path(trlc_file), "Test description", "Changed description")
+    shutil.copy("./tests/utils/single_req_with_section.trlc", added_file)
+    os.remove(rsl_file)
+    assert watcher.get_changes() == sorted([rsl_file, trlc_file, added_file])
+    assert watcher.get_changes() == []
+
+    # Waiting returns the changes of several polls together, after one poll without changes.
+    polls = [lambda: None, lambda: _modify_file(render_cfg_file, "md", "gfm"),
+             lambda: _modify_file(Path(trlc_file), "Changed", "Test")]
+
+    def sleep(_interval: float) -> None:
+        if 0 < len(polls):
+            polls.pop(0)()
+
+    with patch("pyTRLCConverter.source_watcher.time.sleep", side_effect=sleep) as mock_sleep:
+        assert watcher.wait_for_changes() == sorted([trlc_file, os.path.normpath(str(render_cfg_file))])
+
+    assert mock_sleep.call_count == 4
+
+    assert SourceWatcher.is_trlc_file(rsl_file) is True
+    assert SourceWatcher.is_trlc_file(str(render_cfg_file)) is False
+
+
+def test_tc_cli_watch(record_property, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_cli_watch
+    """
+    Check whether the watch mode converts again on changes, processes the TRLC sources again only
+    if a TRLC file changed and writes only the affected output documents.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary source and output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_watch")
+
+    src_dir = tmp_path / "src"
+    out_dir = tmp_path / "out"
+    _copy_sources(src_dir, ["req.rsl", "single_req_no_section.trlc", "single_req_with_link.trlc",
+                            "single_req_with_section.trlc"])
+
+    render_cfg_file = tmp_path / "renderCfg.json"
+    shutil.copy("./tests/utils/renderCfg.json", render_cfg_file)
+    file_names = ["single_req_no_section.md", "single_req_with_link.md", "single_req_with_section.md"]
+
+    # Mock program arguments to simulate running the script in watch mode.
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--source", str(src_dir),
+        "--out", str(out_dir),
+        "--renderCfg", str(render_cfg_file),
+        "--watch",
+        "markdown"
+    ])
+
+    def change_trlc_file() -> None:
+        # The initial conversion writes all documents.
+        assert _take_changed_outputs(out_dir, file_names) == file_names
+        assert get_symbols.call_count == 1
+
+        # The link target req_id_2 changed, which affects the file itself and the file linking to it.
+        _modify_file(src_dir / "single_req_with_section.trlc", "0.01", "0.02")
+
+    def change_render_cfg_file() -> None:
+        assert _take_changed_outputs(out_dir, file_names) == ["single_req_with_link.md", "single_req_with_section.md"]
+        assert get_symbols.call_count == 2
+        assert setup_render_cfg.call_count == 1
+
+        # Only the render configuration is loaded again, it affects all output documents.
+        _modify_file(render_cfg_file, '"md"', '"gfm"')
+
+    def stop() -> None:
+        assert _take_changed_outputs(out_dir, file_names) == file_names
+        assert get_symbols.call_count == 2
+        assert setup_render_cfg.call_count == 2
+        raise KeyboardInterrupt
+
+    rounds = [change_trlc_file, change_render_cfg_file, stop]
+
+    def wait_for_changes(watcher: SourceWatcher) -> list[str]:
+        rounds.pop(0)()
+        return watcher.get_changes()
+
+    with patch("pyTRLCConverter.__main__.get_trlc_symbols_cached", wraps=get_trlc_symbols_cached) as get_symbols, \
+         patch("pyTRLCConverter.__main__._setup_render_configuration",
+               wraps=_setup_render_configuration) as setup_render_cfg, \
+         patch.object(SourceWatcher, "wait_for_changes", autospec=True, side_effect=wait_for_changes):
+        assert main() == 0
+
+    assert len(rounds) == 0
+
+    # Watch mode can't be combined with profiling.
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--source", str(src_dir),
+        "--watch",
+        "--profile", str(tmp_path / "profile.json"),
+        "markdown"
+    ])
+    assert main() != 0
+
+
+@pytest.mark.parametrize("converter_args", [
+    ["rst", "--single-document"],
+    ["reqif", "--single-document", "--reqifz"]
+])
+def test_tc_cli_watch_plantuml(record_property, capsys, monkeypatch, tmp_path, converter_args):
+    # lobster-trace: SwTests.tc_cli_watch_plantuml
+    """
+    Check whether the PlantUML images are written again by every conversion in watch mode,
+    although the images of the previous conversion were removed.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary source and output directory.
+        converter_args (list[str]): The subcommand and the converter specific arguments.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_watch_plantuml")
+
+    src_dir = tmp_path / "src"
+    out_dir = tmp_path / "out"
+    _copy_sources(src_dir, ["req.rsl", "single_req_no_section.trlc", "single_req_description_md.trlc"])
+
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--source", str(src_dir),
+        "--out", str(out_dir),
+        "--renderCfg", "./tests/utils/renderCfg.json",
+        "--watch"
+    ] + converter_args)
+
+    def change_trlc_file() -> None:
+        # The images of the initial conversion are removed, the next conversion writes them again.
+        for image_file in out_dir.rglob("plantuml_*.svg"):
+            image_file.unlink()
+
+        _modify_file(src_dir / "single_req_no_section.trlc", "Test description", "Changed description")
+
+    def stop() -> None:
+        raise KeyboardInterrupt
+
+    rounds = [change_trlc_file, stop]
+
+    def wait_for_changes(watcher: SourceWatcher) -> list[str]:
+        rounds.pop(0)()
+        return watcher.get_changes()
+
+    svg_payload = b'<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"/>'
+
+    with patch("pyTRLCConverter.plantuml.PlantUML.generate_to_bytes", return_value=svg_payload), \
+         patch.object(SourceWatcher, "wait_for_changes", autospec=True, side_effect=wait_for_changes):
+        assert main() == 0
+
+    assert len(rounds) == 0
+    assert capsys.readouterr().err == ""
+    assert len(list(out_dir.rglob("plantuml_*.svg"))) == 1
+
+    for archive_file in out_dir.glob("*.reqifz"):
+        with zipfile.ZipFile(archive_file, "r") as zf:
+            assert len([name for name in zf.namelist() if name.endswith(".svg")]) == 1
+
+# Main *************************************************************************
@@ -0,0 +1,135 @@
+"""Project specific converter for testing purposes only.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import os
+from typing import Optional
+from trlc.ast import Record_Object
+
+from pyTRLCConverter.ret import Ret
+from pyTRLCConverter.base_converter import BaseConverter
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+
+class ParallelConverter(BaseConverter):
+    # lobster-exclude: Simple test utility that does not directly test any requirements.
+    """
+    Custom project specific converter for testing purposes only.
+
+    It supports parallel file processing and logs the calls of the conversion steps with
+    the process id to the file calls.log in the output folder. Finishing the conversion
+    in a worker process fails.
+    """
+
+    @staticmethod
+    def get_subcommand() -> str:
+        """ Return subcommand token for this converter.
+
+        Returns:
+            str: subcomand argument token
+        """
+        return "parallel"
+
+    @staticmethod
+    def get_description() -> str:
+        """ Return converter description.
+
+         Returns:
+            str: Converter description
+        """
+        return "Logs the conversion steps."
+
+    def is_parallel_file_processing_supported(self) -> bool:
+        """Check whether the files can be converted by independent converter instances in parallel.
+
+        Returns:
+            bool: Always True.
+        """
+        return True
+
+    def begin(self) -> Ret:
+        """Begin the conversion process.
+
+        Returns:
+            Ret: Status
+        """
+        self._log("begin")
+        return super().begin()
+
+    def begin_worker(self) -> Ret:
+        """Begin the conversion in a worker process.
+
+        Returns:
+            Ret: Status
+        """
+        self._log("begin_worker")
+        return super().begin_worker()
+
+    def finish_worker(self) -> Ret:
+        """Finish the conversion in a worker process, which fails always.
+
+        Returns:
+            Ret: Status
+        """
+        self._log("finish_worker")
+        return Ret.ERROR
+
+    def finish(self) -> Ret:
+        """Finish the conversion process.
+
+        Returns:
+            Ret: Status
+        """
+        self._log("finish")
+        return super().finish()
+
+    def convert_record_object_generic(self, record: Record_Object, level: int, translation: Optional[dict]) -> Ret:
+        """Convert a record object generically.
+
+        Args:
+            record (Record_Object): The record object.
+            level (int): The record level.
+            translation (Optional[dict]): Translation dictionary for the record object.
+                                            If None, no translation is applied.
+
+        Returns:
+            Ret: Status
+        """
+        self._log("convert_record_object")
+        return Ret.OK
+
+    def _log(self, step: str) -> None:
+        """Log the conversion step with the process id.
+
+        Args:
+            step (str): The conversion step.
+        """
+        os.makedirs(self._args.out, exist_ok=True)
+
+        with open(os.path.join(self._args.out, "calls.log"), "a", encoding="utf-8") as log_file:
+            log_file.write(f"{step} {os.getpid()}\n")
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
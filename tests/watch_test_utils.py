@@ -0,0 +1,75 @@
+"""Shared helper utilities for the watch mode and conversion daemon test suites."""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import os
+import shutil
+from pathlib import Path
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+# Functions ********************************************************************
+
+def _modify_file(file_name: Path, old: str, new: str) -> None:
+    # lobster-exclude: Utility function for other test code.
+    """Replace text in the given file and advance its modification time, to be detected by polling.
+
+    Args:
+        file_name (Path): The file name.
+        old (str): The text to replace.
+        new (str): The replacement.
+    """
+    file_name.write_text(file_name.read_text(encoding="utf-8").replace(old, new), encoding="utf-8")
+    stat_result = file_name.stat()
+    os.utime(file_name, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+
+def _copy_sources(src_dir: Path, file_names: list[str]) -> None:
+    # lobster-exclude: Utility function for other test code.
+    """Copy the given test files into the source folder, which is created, to be modified by the test.
+
+    Args:
+        src_dir (Path): The source folder.
+        file_names (list[str]): The file names in ./tests/utils.
+    """
+    src_dir.mkdir()
+
+    for file_name in file_names:
+        shutil.copy(f"./tests/utils/{file_name}", src_dir / file_name)
+
+def _take_changed_outputs(out_dir: Path, file_names: list[str]) -> list[str]:
+    # lobster-exclude: Utility function for other test code.
+    """Get the output files, which are written since the last call, and mark all of them as unchanged.
+
+    Args:
+        out_dir (Path): The output folder.
+        file_names (list[str]): The names of the output files.
+
+    Returns:
+        list[str]: The names of the written output files.
+    """
+    changed = [file_name for file_name in file_names
+               if (out_dir / file_name).read_text(encoding="utf-8") != "unchanged"]
+
+    for file_name in file_names:
+        (out_dir / file_name).write_text("unchanged", encoding="utf-8")
+
+    return changed
+
+# Main *************************************************************************
@@ -0,0 +1,330 @@
+"""Benchmark of the built-in converters over synthetic models of several sizes.
+
+    For every model size a synthetic model is generated and converted by every
+    selected converter in its own process. The throughput (records/s), the peak
+    resident set size of the converter process and the output size are reported
+    in JSON format. A previous report can be given to compare the results with it.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Optional
+from pyTRLCConverter.trlc_helper import get_trlc_symbols
+from pyTRLCConverter.version import __version__
+from .model_generator import RENDER_CFG_FILE_NAME, add_generator_arguments, create_generator
+
+# Variables ********************************************************************
+
+SCHEMA_VERSION = 1
+
+SIZES_DEFAULT = "1000,10000,100000"
+CONVERTERS_DEFAULT = "markdown,rst,docx,reqif"
+
+# Default number of records per TRLC file.
+RECORDS_PER_FILE_DEFAULT = 1000
+
+# Results which are compared with a previous report.
+COMPARED_RESULTS = ["records_per_s", "peak_rss_bytes", "output_bytes"]
+
+# Classes **********************************************************************
+
+# Functions ********************************************************************
+
+
+def _comma_separated_list(value: str) -> list[str]:
+    """Split the given command line argument value at the commas.
+
+    Args:
+        value (str): The command line argument value.
+
+    Returns:
+        list[str]: The non-empty list items.
+    """
+    return [item.strip() for item in value.split(",") if 0 < len(item.strip())]
+
+
+def _get_git_commit() -> Optional[str]:
+    """Get the git commit of the working copy, to identify the benchmarked code.
+
+    Returns:
+        Optional[str]: The commit hash or None if not available.
+    """
+    commit = None
+
+    try:
+        result = subprocess.run(["git", "rev-parse", "HEAD"],
+                                cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True,
+                                text=True,
+                                check=True)
+        commit = result.stdout.strip()
+
+    except (OSError, subprocess.CalledProcessError):
+        pass
+
+    return commit
+
+
+def _get_output_size(folder: str) -> tuple[int, int]:
+    """Get the number of files and their total size in the given folder and its sub folders.
+
+    Args:
+        folder (str): The output folder.
+
+    Returns:
+        tuple[int, int]: Number of files and total size in bytes.
+    """
+    file_count = 0
+    total_size = 0
+
+    for root, _, file_names in os.walk(folder):
+        for file_name in file_names:
+            file_count += 1
+            total_size += os.path.getsize(os.path.join(root, file_name))
+
+    return file_count, total_size
+
+
+def _run_process(cmd: list[str]) -> tuple[int, float, Optional[int]]:
+    """Run the given command and measure its wall time and peak resident set size.
+
+    The peak resident set size is only available on platforms with os.wait4().
+
+    Args:
+        cmd (list[str]): The command.
+
+    Returns:
+        tuple[int, float, Optional[int]]: Exit code, wall time in seconds and peak RSS in bytes.
+    """
+    peak_rss = None
+
+    # The error output is kept in a temporary file, because a pipe could block the converter process.
+    with tempfile.TemporaryFile() as error_file:
+        start = time.perf_counter()
+
+        # pylint: disable-next=consider-using-with
+        process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=error_file)
+
+        if hasattr(os, "wait4"):
+            _, status, rusage = os.wait4(process.pid, 0)
+            wall_time = time.perf_counter() - start
+            exit_code = os.waitstatus_to_exitcode(status)
+            process.returncode = exit_code
+
+            # Linux reports the maximum resident set size in KiB, macOS in bytes.
+            peak_rss = rusage.ru_maxrss if sys.platform == "darwin" else rusage.ru_maxrss * 1024
+
+        else:
+            exit_code = process.wait()
+            wall_time = time.perf_counter() - start
+
+        if exit_code != 0:
+            error_file.seek(0)
+            print(error_file.read().decode("utf-8", errors="replace"), file=sys.stderr)
+
+    return exit_code, wall_time, peak_rss
+
+
+def _run_converter(model_folder: str, out_folder: str, subcommand: str, record_count: int, repeat: int) -> dict:
+    """Convert the model with the given converter and measure the fastest run.
+
+    Args:
+        model_folder (str): The folder of the synthetic model.
+        out_folder (str): The output folder of the converter.
+        subcommand (str): The converter subcommand.
+        record_count (int): Number of records in the model.
+        repeat (int): Number of runs.
+
+    Returns:
+        dict: The result of the fastest run.
+    """
+    cmd = [
+        sys.executable, "-m", "pyTRLCConverter",
+        "--source", model_folder,
+        "--renderCfg", os.path.join(model_folder, RENDER_CFG_FILE_NAME),
+        "--out", out_folder,
+        subcommand
+    ]
+    result = {}
+    best_wall_time = None
+
+    for _ in range(max(1, repeat)):
+        exit_code, wall_time, peak_rss = _run_process(cmd)
+
+        if (best_wall_time is None) or (wall_time < best_wall_time):
+            best_wall_time = wall_time
+            file_count, total_size = _get_output_size(out_folder)
+
+            result = {
+                "records": record_count,
+                "converter": subcommand,
+                "exit_code": exit_code,
+                "wall_s": round(wall_time, 3),
+                "records_per_s": round(record_count / wall_time, 1),
+                "peak_rss_bytes": peak_rss,
+                "output_files": file_count,
+                "output_bytes": total_size
+            }
+
+    return result
+
+
+def _compare(results: list[dict], baseline_file: str) -> dict:
+    """Compare the results with the results of a previous report.
+
+    Args:
+        results (list[dict]): The results of this run.
+        baseline_file (str): The previous report.
+
+    Returns:
+        dict: Per converter and model size the ratio of this result to the previous one.
+    """
+    comparison = {}
+
+    with open(baseline_file, "r", encoding="utf-8") as file:
+        baseline = json.load(file)
+
+    baseline_results = {(item["converter"], item["records"]): item for item in baseline.get("results", [])}
+
+    for result in results:
+        baseline_result = baseline_results.get((result["converter"], result["records"]))
+
+        if baseline_result is not None:
+            ratios = {}
+
+            for name in COMPARED_RESULTS:
+                value = result.get(name)
+                baseline_value = baseline_result.get(name)
+
+                if (value is not None) and (baseline_value is not None) and (0 < baseline_value):
+                    ratios[name] = round(value / baseline_value, 3)
+
+            comparison[f"{result['converter']}@{result['records']}"] = ratios
+
+    return comparison
+
+
+def _benchmark_model_size(args: argparse.Namespace, record_count: int, report: dict) -> bool:
+    """Generate a synthetic model of the given size and convert it with every selected converter.
+
+    Args:
+        args (argparse.Namespace): The parsed program arguments.
+        record_count (int): Number of records in the model.
+        report (dict): The report, where the model and the results are added.
+
+    Returns:
+        bool: True if the model could be parsed, otherwise False.
+    """
+    status = True
+    file_count = max(1, -(-record_count // max(1, args.records_per_file)))
+    generator = create_generator(args, record_count, file_count)
+
+    with tempfile.TemporaryDirectory() as folder:
+        model_folder = os.path.join(folder, "model")
+        statistics = generator.generate(model_folder)
+
+        # The parse time is part of every conversion, it is reported separately to tell it apart.
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            symbols = get_trlc_symbols([model_folder], None)
+        parse_duration = time.perf_counter() - start
+
+        if symbols is None:
+            print(f"Failed to parse the synthetic model with {record_count} records.", file=sys.stderr)
+            status = False
+
+        else:
+            report["models"].append({
+                "parameters": generator.get_parameters(),
+                "statistics": statistics,
+                "parse_s": round(parse_duration, 3)
+            })
+
+            for subcommand in args.converters:
+                print(f"Converting {record_count} records with {subcommand}.", file=sys.stderr)
+                report["results"].append(_run_converter(model_folder,
+                                                        os.path.join(folder, subcommand),
+                                                        subcommand,
+                                                        record_count,
+                                                        args.repeat))
+
+    return status
+
+
+def main() -> int:
+    """The program entry point.
+
+    Returns:
+        int: Exit code
+    """
+    parser = argparse.ArgumentParser(description="Benchmark of the built-in converters.")
+    parser.add_argument("--sizes", type=_comma_separated_list, default=SIZES_DEFAULT,
+                        help=f"Comma separated list of model sizes in records (default {SIZES_DEFAULT}).")
+    parser.add_argument("--converters", type=_comma_separated_list, default=CONVERTERS_DEFAULT,
+                        help=f"Comma separated list of converter subcommands (default {CONVERTERS_DEFAULT}).")
+    parser.add_argument("--records-per-file", type=int, default=RECORDS_PER_FILE_DEFAULT,
+                        help="Number of records per TRLC file.")
+    parser.add_argument("--repeat", type=int, default=1, help="Number of runs, the fastest one is reported.")
+    parser.add_argument("--output", type=str, default=None, help="JSON file for the report.")
+    parser.add_argument("--compare", type=str, default=None, help="Previous JSON report to compare with.")
+    add_generator_arguments(parser)
+    args = parser.parse_args()
+
+    report = {
+        "version": SCHEMA_VERSION,
+        "program_version": __version__,
+        "commit": _get_git_commit(),
+        "python": sys.version,
+        "platform": platform.platform(),
+        "models": [],
+        "results": []
+    }
+
+    for size in args.sizes:
+        if _benchmark_model_size(args, int(size), report) is False:
+            return 1
+
+    if args.compare is not None:
+        report["comparison"] = _compare(report["results"], args.compare)
+
+    output = json.dumps(report, indent=4)
+    print(output)
+
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output)
+
+    return 0 if all(result["exit_code"] == 0 for result in report["results"]) else 1
+
+# Main *************************************************************************
+
+
+if __name__ == "__main__":
+    sys.exit(main())
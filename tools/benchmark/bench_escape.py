@@ -0,0 +1,180 @@
+"""Micro-benchmark of the Markdown and reStructuredText escaping.
+
+    The texts are taken from the requirements, architecture and test specification
+    of pyTRLCConverter itself, in the same way the converters escape them: record
+    names, attribute names, enum values and string values. They are escaped by:
+
+    * legacy: One str.replace() per special character, like the escaping before.
+    * markdown: MarkdownText.escape() with the escape cache cleared before every run.
+    * rst: RstText.escape() with the escape cache cleared before every run.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from typing import Callable
+from trlc.ast import Array_Aggregate, Enumeration_Literal, String_Literal
+from pyTRLCConverter.markdown.text import MARKDOWN_ESCAPE_CHARACTERS, MARKDOWN_ESCAPER, MarkdownText
+from pyTRLCConverter.rst.text import RST_ESCAPER, RstText
+from pyTRLCConverter.trlc_helper import get_trlc_symbols
+
+# Variables ********************************************************************
+
+TRLC_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "trlc")
+
+# Classes **********************************************************************
+
+# Functions ********************************************************************
+
+
+def _escape_legacy(text: str) -> str:
+    """Escape the text with one str.replace() per special character.
+
+    Args:
+        text (str): Text to escape
+
+    Returns:
+        str: Escaped text
+    """
+    for character in MARKDOWN_ESCAPE_CHARACTERS:
+        text = text.replace(character, "\\" + character)
+
+    return text
+
+
+def _collect_value_texts(expression, texts: list[str]) -> None:
+    """Collect the texts of a record field value, which are escaped by the converters.
+
+    Args:
+        expression (Expression): The field value.
+        texts (list[str]): The collected texts.
+    """
+    if isinstance(expression, String_Literal):
+        texts.append(expression.value)
+
+    elif isinstance(expression, Enumeration_Literal):
+        texts.append(expression.to_string())
+
+    elif isinstance(expression, Array_Aggregate):
+        for value in expression.value:
+            _collect_value_texts(value, texts)
+
+
+def _get_texts(folder: str) -> list[str]:
+    """Get the texts of all records in the given folder, which are escaped by the converters.
+
+    Args:
+        folder (str): Folder with the TRLC model and TRLC files.
+
+    Returns:
+        list[str]: The texts in conversion order.
+    """
+    texts = []
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        symbols = get_trlc_symbols([folder], None)
+
+    if symbols is not None:
+        for record in symbols.iter_record_objects():
+            texts.append(record.name)
+
+            for name, value in record.field.items():
+                texts.append(name)
+                _collect_value_texts(value, texts)
+
+    return texts
+
+
+def _run(texts: list[str], escape: Callable[[str], str], prepare: Callable[[], None]) -> float:
+    """Escape all texts and measure the duration.
+
+    Args:
+        texts (list[str]): The texts to escape.
+        escape (Callable[[str], str]): The escape function.
+        prepare (Callable[[], None]): Called before the measurement, e.g. to clear the cache.
+
+    Returns:
+        float: Duration in seconds.
+    """
+    prepare()
+    start = time.perf_counter()
+
+    for text in texts:
+        escape(text)
+
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    """The program entry point.
+
+    Returns:
+        int: Exit code
+    """
+    parser = argparse.ArgumentParser(description="Micro-benchmark of the Markdown and reStructuredText escaping.")
+    parser.add_argument("--passes", type=int, default=20, help="Number of passes over all texts per run.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs, the fastest one is reported.")
+    args = parser.parse_args()
+
+    texts = _get_texts(TRLC_FOLDER)
+
+    if len(texts) == 0:
+        print(f"No texts found in {TRLC_FOLDER}.", file=sys.stderr)
+        return 1
+
+    # Every pass is a new conversion of the same kind of content.
+    texts = texts * args.passes
+
+    for text in texts:
+        assert MarkdownText.escape(text) == _escape_legacy(text)
+        assert RstText.escape(text) == _escape_legacy(text)
+
+    variants = {
+        "legacy": (_escape_legacy, lambda: None),
+        "markdown": (MarkdownText.escape, MARKDOWN_ESCAPER.cache_clear),
+        "rst": (RstText.escape, RST_ESCAPER.cache_clear)
+    }
+
+    report = {
+        "texts": len(texts),
+        "characters": sum(len(text) for text in texts),
+        "escape_s": {}
+    }
+
+    for name, (escape, prepare) in variants.items():
+        report["escape_s"][name] = round(min(_run(texts, escape, prepare) for _ in range(args.repeat)), 4)
+
+    report["speedup"] = round(report["escape_s"]["legacy"] / report["escape_s"]["markdown"], 2)
+
+    print(json.dumps(report, indent=4))
+
+    return 0
+
+# Main *************************************************************************
+
+
+if __name__ == "__main__":
+    sys.exit(main())
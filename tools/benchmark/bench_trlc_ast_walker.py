@@ -0,0 +1,255 @@
+"""Micro-benchmark of the TRLC AST walker over a synthetic model.
+
+    The record field values of a synthetic model are walked in three ways:
+
+    * legacy: A new walker per record, which looks up every node in three dispatcher maps.
+    * per record: A new walker per record with the per-type dispatch table.
+    * cached: A single walker for all records with the per-type dispatch table,
+      like the converters use it.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Union
+from trlc.ast import Expression, Implicit_Null, Record_Reference, String_Literal
+from pyTRLCConverter.trlc_helper import TrlcAstWalker, get_trlc_symbols
+
+# Variables ********************************************************************
+
+RECORDS_DEFAULT = 100000
+RECORDS_PER_FILE = 1000
+
+MODEL_RSL = """package Bench
+
+enum Priority {
+    Low
+    Medium
+    High
+}
+
+type Requirement {
+    description String
+    priority Priority
+    note optional String
+    derived_from optional Requirement [0 .. *]
+}
+"""
+
+# Classes **********************************************************************
+
+
+class LegacyTrlcAstWalker(TrlcAstWalker):
+    """TRLC AST walker, which looks up every node in the three dispatcher maps
+    like the walker did before the per-type dispatch table was introduced.
+    """
+
+    def _dispatch(self, dispatcher_map: dict, expression: Expression, handle_other: bool) -> Union[list[Any], Any]:
+        """Dispatch the expression to the dispatcher map.
+
+        Args:
+            dispatcher_map (dict): The dispatcher map.
+            expression (Expression): The AST node.
+            handle_other (bool): If True, the other dispatcher is called when no dispatcher is found.
+
+        Returns:
+            Union[list[Any],Any]: The result of the dispatcher.
+        """
+        result = ""
+        type_name = type(expression)
+
+        if type_name in dispatcher_map:
+            result = dispatcher_map[type_name](expression)
+        elif handle_other is True:
+            result = self._on_other(expression)
+
+        return result
+
+    def _on_array_aggregate(self, array_aggregate) -> list[Any]:
+        """Handle the Array_Aggregate node.
+
+        Args:
+            array_aggregate (Array_Aggregate): The AST node.
+
+        Returns:
+            list[Any]: The result of the handling.
+        """
+        result = []
+
+        self._dispatch(self._dispatcher_map_begin, array_aggregate, False)
+
+        for expression in array_aggregate.value:
+            value_result = self._dispatch(self._dispatcher_map_process, expression, True)
+
+            if self._list_item_dispatcher is not None:
+                value_result = self._list_item_dispatcher(expression, value_result)
+
+            if isinstance(value_result, list):
+                result.extend(value_result)
+            else:
+                result.append(value_result)
+
+        self._dispatch(self._dispatcher_map_finish, array_aggregate, False)
+
+        return result
+
+    def _on_general(self, expression: Expression) -> Union[list[Any], Any]:
+        """Handle the general case.
+
+        Args:
+            expression (Expression): The AST node.
+
+        Returns:
+            Union[list[str],str]: The result of the handling.
+        """
+        self._dispatch(self._dispatcher_map_begin, expression, False)
+        result = self._dispatch(self._dispatcher_map_process, expression, True)
+        self._dispatch(self._dispatcher_map_finish, expression, False)
+
+        return result
+
+# Functions ********************************************************************
+
+
+def _create_walker(walker_class: type) -> TrlcAstWalker:
+    """Create a walker with the same dispatchers the built-in converters register.
+
+    Args:
+        walker_class (type): The walker class.
+
+    Returns:
+        TrlcAstWalker: The walker.
+    """
+    walker = walker_class()
+    walker.add_dispatcher(Implicit_Null, None, lambda _: "N/A", None)
+    walker.add_dispatcher(Record_Reference, None, lambda reference: reference.to_string(), None)
+    walker.add_dispatcher(String_Literal, None, lambda literal: literal.to_string(), None)
+    walker.set_other_dispatcher(lambda expression: expression.to_string())
+
+    return walker
+
+
+def _generate_model(folder: str, record_count: int) -> None:
+    """Generate a synthetic TRLC model with the given number of records.
+
+    Args:
+        folder (str): The folder where the model files are written.
+        record_count (int): Number of records.
+    """
+    with open(os.path.join(folder, "model.rsl"), "w", encoding="utf-8") as file:
+        file.write(MODEL_RSL)
+
+    priorities = ["Low", "Medium", "High"]
+
+    for file_index, first_record in enumerate(range(0, record_count, RECORDS_PER_FILE)):
+        with open(os.path.join(folder, f"records_{file_index}.trlc"), "w", encoding="utf-8") as file:
+            file.write("package Bench\n\n")
+
+            for index in range(first_record, min(first_record + RECORDS_PER_FILE, record_count)):
+                derived_from = ", ".join(f"req_{target}" for target in range(max(0, index - 3), index))
+
+                file.write(f"Requirement req_{index} {{\n")
+                file.write(f"    description = \"Requirement {index} shall be fulfilled.\"\n")
+                file.write(f"    priority = Priority.{priorities[index % len(priorities)]}\n")
+                if 0 < len(derived_from):
+                    file.write(f"    derived_from = [{derived_from}]\n")
+                file.write("}\n\n")
+
+
+def _run(records: list, create_walker: Callable) -> float:
+    """Walk all field values of all records and measure the duration.
+
+    Args:
+        records (list): The record objects.
+        create_walker (Callable): Called per record to get the walker.
+
+    Returns:
+        float: Duration in seconds.
+    """
+    start = time.perf_counter()
+
+    for record in records:
+        walker = create_walker()
+
+        for value in record.field.values():
+            walker.walk(value)
+
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    """The program entry point.
+
+    Returns:
+        int: Exit code
+    """
+    parser = argparse.ArgumentParser(description="Micro-benchmark of the TRLC AST walker.")
+    parser.add_argument("--records", type=int, default=RECORDS_DEFAULT, help="Number of records in the model.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs, the fastest one is reported.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        _generate_model(folder, args.records)
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            symbols = get_trlc_symbols([folder], None)
+        parse_duration = time.perf_counter() - start
+
+    if symbols is None:
+        print("Failed to parse the synthetic model.", file=sys.stderr)
+        return 1
+
+    records = list(symbols.iter_record_objects())
+    cached_walker = _create_walker(TrlcAstWalker)
+
+    variants = {
+        "legacy": lambda: _create_walker(LegacyTrlcAstWalker),
+        "per_record": lambda: _create_walker(TrlcAstWalker),
+        "cached": lambda: cached_walker
+    }
+
+    report = {
+        "records": len(records),
+        "parse_s": round(parse_duration, 3),
+        "walk_s": {}
+    }
+
+    for name, create_walker in variants.items():
+        report["walk_s"][name] = round(min(_run(records, create_walker) for _ in range(args.repeat)), 3)
+
+    report["speedup"] = round(report["walk_s"]["legacy"] / report["walk_s"]["cached"], 2)
+
+    print(json.dumps(report, indent=4))
+
+    return 0
+
+# Main *************************************************************************
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,428 @@
+"""Generator of synthetic TRLC models for the benchmarks.
+
+    The model consists of a model file (model.rsl), a render configuration
+    (renderCfg.json) and TRLC files with requirements. The requirements are of
+    the types Requirement (plain text description), MdRequirement (Markdown
+    description) and GfmRequirement (GitHub Flavored Markdown description).
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2026 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import argparse
+import json
+import os
+import random
+import sys
+from typing import TextIO
+
+# Variables ********************************************************************
+
+PACKAGE_NAME = "Bench"
+
+MODEL_FILE_NAME = "model.rsl"
+RENDER_CFG_FILE_NAME = "renderCfg.json"
+
+ENUM_LITERALS = ["Low", "Medium", "High", "Critical"]
+
+RENDER_CFG = {
+    "renderCfg": [{
+        "package": f"{PACKAGE_NAME}$",
+        "type": "MdRequirement$",
+        "attribute": "description$",
+        "format": "md"
+    }, {
+        "package": f"{PACKAGE_NAME}$",
+        "type": "GfmRequirement$",
+        "attribute": "description$",
+        "format": "gfm"
+    }]
+}
+
+PLANTUML_BLOCK = """
+```plantuml
+@startuml
+component "Component {index}" as comp_{index}
+component "Consumer {index}" as cons_{index}
+comp_{index} --> cons_{index} : provides
+@enduml
+```
+"""
+
+# Classes **********************************************************************
+
+
+# pylint: disable-next=too-many-instance-attributes
+class ModelGenerator():
+    """Generator of a synthetic TRLC model with tunable size and content.
+
+    The generated model is reproducible, it only depends on the parameters.
+    """
+
+    # pylint: disable-next=too-many-arguments
+    def __init__(self,
+                 records: int = 1000,
+                 files: int = 1,
+                 *,
+                 section_depth: int = 2,
+                 reference_density: float = 1.0,
+                 enum_fields: int = 1,
+                 markdown_share: float = 0.25,
+                 gfm_share: float = 0.25,
+                 plantuml_share: float = 0.0,
+                 seed: int = 0) -> None:
+        """Construct the model generator.
+
+        Args:
+            records (int): Number of records.
+            files (int): Number of TRLC files, the records are distributed evenly.
+            section_depth (int): Nesting depth of the sections in every file, 0 for no sections.
+            reference_density (float): Average number of references per record to other records.
+            enum_fields (int): Number of enumeration fields per record.
+            markdown_share (float): Share of the records with a Markdown description (0..1).
+            gfm_share (float): Share of the records with a GitHub Flavored Markdown description (0..1).
+            plantuml_share (float): Share of the Markdown and GFM records with a PlantUML block (0..1).
+            seed (int): Seed of the random number generator.
+        """
+        self.records = max(0, records)
+        self.files = max(1, files)
+        self.section_depth = max(0, section_depth)
+        self.reference_density = max(0.0, reference_density)
+        self.enum_fields = max(0, enum_fields)
+        self.markdown_share = min(max(0.0, markdown_share), 1.0)
+        self.gfm_share = min(max(0.0, gfm_share), 1.0 - self.markdown_share)
+        self.plantuml_share = min(max(0.0, plantuml_share), 1.0)
+        self.seed = seed
+
+    def get_parameters(self) -> dict:
+        """Get the generator parameters, e.g. to store them with the benchmark results.
+
+        Returns:
+            dict: The generator parameters.
+        """
+        return {
+            "records": self.records,
+            "files": self.files,
+            "section_depth": self.section_depth,
+            "reference_density": self.reference_density,
+            "enum_fields": self.enum_fields,
+            "markdown_share": self.markdown_share,
+            "gfm_share": self.gfm_share,
+            "plantuml_share": self.plantuml_share,
+            "seed": self.seed
+        }
+
+    def generate(self, folder: str) -> dict:
+        """Generate the model, render configuration and TRLC files into the given folder.
+
+        Args:
+            folder (str): The destination folder, which is created if necessary.
+
+        Returns:
+            dict: Statistics of the generated model, e.g. number of references.
+        """
+        rng = random.Random(self.seed)
+        statistics = {
+            "records": 0,
+            "sections": 0,
+            "references": 0,
+            "md_records": 0,
+            "gfm_records": 0,
+            "plantuml_blocks": 0
+        }
+
+        os.makedirs(folder, exist_ok=True)
+
+        with open(os.path.join(folder, MODEL_FILE_NAME), "w", encoding="utf-8") as file:
+            file.write(self._get_model())
+
+        with open(os.path.join(folder, RENDER_CFG_FILE_NAME), "w", encoding="utf-8") as file:
+            json.dump(RENDER_CFG, file, indent=4)
+
+        records_per_file, remainder = divmod(self.records, self.files)
+        first_record = 0
+
+        for file_index in range(self.files):
+            record_count = records_per_file + (1 if file_index < remainder else 0)
+
+            with open(os.path.join(folder, f"records_{file_index}.trlc"), "w", encoding="utf-8") as file:
+                file.write(f"package {PACKAGE_NAME}\n\n")
+                self._write_sections(file, rng, statistics, range(first_record, first_record + record_count),
+                                     self.section_depth, f"{file_index}", 0)
+
+            first_record += record_count
+
+        return statistics
+
+    def _get_model(self) -> str:
+        """Get the content of the model file.
+
+        Returns:
+            str: The TRLC model.
+        """
+        lines = [f"package {PACKAGE_NAME}", ""]
+
+        for enum_index in range(self.enum_fields):
+            lines.append(f"enum Enum{enum_index} {{")
+            lines.extend(f"    {literal}" for literal in ENUM_LITERALS)
+            lines.extend(["}", ""])
+
+        lines.append("type Requirement {")
+        lines.append("    description String")
+        lines.append("    note optional String")
+        lines.extend(f"    enum_{enum_index} Enum{enum_index}" for enum_index in range(self.enum_fields))
+        lines.append("    derived_from optional Requirement [1 .. *]")
+        lines.extend(["}", ""])
+
+        lines.extend(["type MdRequirement extends Requirement {", "}", ""])
+        lines.extend(["type GfmRequirement extends Requirement {", "}", ""])
+
+        return "\n".join(lines)
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def _write_sections(self,
+                        file: TextIO,
+                        rng: random.Random,
+                        statistics: dict,
+                        record_indices: range,
+                        depth: int,
+                        section_number: str,
+                        level: int) -> None:
+        """Write the given records, nested in sections up to the given depth.
+
+        Every section level splits its records into two sections.
+
+        Args:
+            file (TextIO): The TRLC file.
+            rng (random.Random): The random number generator.
+            statistics (dict): Statistics of the generated model, updated by the written records.
+            record_indices (range): The indices of the records to write.
+            depth (int): Remaining section depth.
+            section_number (str): Number of the surrounding section.
+            level (int): The indentation level.
+        """
+        indent = "    " * level
+
+        if (0 == depth) or (len(record_indices) < 2):
+            for index in record_indices:
+                self._write_record(file, rng, statistics, index, indent)
+
+        else:
+            middle = len(record_indices) // 2
+
+            for part, part_indices in enumerate([record_indices[:middle], record_indices[middle:]]):
+                part_number = f"{section_number}.{part + 1}"
+
+                statistics["sections"] += 1
+                file.write(f"{indent}section \"Section {part_number}\" {{\n\n")
+                self._write_sections(file, rng, statistics, part_indices, depth - 1, part_number, level + 1)
+                file.write(f"{indent}}}\n\n")
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def _write_record(self, file: TextIO, rng: random.Random, statistics: dict, index: int, indent: str) -> None:
+        """Write a single record.
+
+        Args:
+            file (TextIO): The TRLC file.
+            rng (random.Random): The random number generator.
+            statistics (dict): Statistics of the generated model, updated by the record.
+            index (int): The record index, which is part of its name.
+            indent (str): The indentation of the record.
+        """
+        kind = rng.random()
+
+        if kind < self.markdown_share:
+            type_name = "MdRequirement"
+            description = self._get_markdown_description(rng, statistics, index)
+            statistics["md_records"] += 1
+        elif kind < self.markdown_share + self.gfm_share:
+            type_name = "GfmRequirement"
+            description = self._get_gfm_description(rng, statistics, index)
+            statistics["gfm_records"] += 1
+        else:
+            type_name = "Requirement"
+            description = f"\"The system shall handle <event {index}> within {index % 100} ms | " \
+                          f"use *fast* path_{index}.\""
+
+        file.write(f"{indent}{type_name} req_{index} {{\n")
+        file.write(f"{indent}    description = {description}\n")
+
+        if 0 == index % 3:
+            file.write(f"{indent}    note = \"Note of requirement {index}.\"\n")
+
+        for enum_index in range(self.enum_fields):
+            file.write(f"{indent}    enum_{enum_index} = Enum{enum_index}.{rng.choice(ENUM_LITERALS)}\n")
+
+        references = self._get_references(rng, index)
+        if 0 < len(references):
+            statistics["references"] += len(references)
+            file.write(f"{indent}    derived_from = [{', '.join(references)}]\n")
+
+        file.write(f"{indent}}}\n\n")
+        statistics["records"] += 1
+
+    def _get_references(self, rng: random.Random, index: int) -> list[str]:
+        """Get the references of a record to records with a lower index, which may be in other files.
+
+        Args:
+            rng (random.Random): The random number generator.
+            index (int): The record index.
+
+        Returns:
+            list[str]: The names of the referenced records.
+        """
+        count = int(self.reference_density)
+
+        if rng.random() < self.reference_density - count:
+            count += 1
+
+        count = min(count, index)
+
+        return [f"req_{target}" for target in sorted(rng.sample(range(index), count))]
+
+    def _get_plantuml_block(self, rng: random.Random, statistics: dict, index: int) -> str:
+        """Get a PlantUML block for a Markdown or GFM description with the configured probability.
+
+        Args:
+            rng (random.Random): The random number generator.
+            statistics (dict): Statistics of the generated model, updated by the PlantUML block.
+            index (int): The record index.
+
+        Returns:
+            str: The PlantUML block or an empty string.
+        """
+        block = ""
+
+        if rng.random() < self.plantuml_share:
+            block = PLANTUML_BLOCK.format(index=index)
+            statistics["plantuml_blocks"] += 1
+
+        return block
+
+    def _get_markdown_description(self, rng: random.Random, statistics: dict, index: int) -> str:
+        """Get a Markdown description.
+
+        Args:
+            rng (random.Random): The random number generator.
+            statistics (dict): Statistics of the generated model.
+            index (int): The record index.
+
+        Returns:
+            str: The description as TRLC string literal.
+        """
+        return f"""'''
+The system shall process **message {index}** with the *default* settings.
+
+* Validate the `header` of the message.
+* Store the payload in the [buffer](#buffer).
+* Reply within {index % 100} ms.
+{self._get_plantuml_block(rng, statistics, index)}'''"""
+
+    def _get_gfm_description(self, rng: random.Random, statistics: dict, index: int) -> str:
+        """Get a GitHub Flavored Markdown description.
+
+        Args:
+            rng (random.Random): The random number generator.
+            statistics (dict): Statistics of the generated model.
+            index (int): The record index.
+
+        Returns:
+            str: The description as TRLC string literal.
+        """
+        return f"""'''
+The system shall support ~~legacy~~ **mode {index}**.
+
+| Parameter | Value |
+| --------- | ----- |
+| timeout   | {index % 100} ms |
+| retries   | {index % 5} |
+
+- [x] Configured
+- [ ] Verified
+{self._get_plantuml_block(rng, statistics, index)}'''"""
+
+# Functions ********************************************************************
+
+
+def main() -> int:
+    """The program entry point, which generates a synthetic model into a folder.
+
+    Returns:
+        int: Exit code
+    """
+    parser = argparse.ArgumentParser(description="Generate a synthetic TRLC model for the benchmarks.")
+    parser.add_argument("folder", type=str, help="Destination folder.")
+    add_generator_arguments(parser)
+    parser.add_argument("--records", type=int, default=1000, help="Number of records.")
+    parser.add_argument("--files", type=int, default=1, help="Number of TRLC files.")
+    args = parser.parse_args()
+
+    generator = create_generator(args, args.records, args.files)
+    statistics = generator.generate(args.folder)
+
+    print(json.dumps({"parameters": generator.get_parameters(), "statistics": statistics}, indent=4))
+
+    return 0
+
+
+def add_generator_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the model content to the given parser.
+
+    Args:
+        parser (argparse.ArgumentParser): The argument parser.
+    """
+    parser.add_argument("--section-depth", type=int, default=2, help="Nesting depth of the sections per file.")
+    parser.add_argument("--reference-density", type=float, default=1.0,
+                        help="Average number of references per record.")
+    parser.add_argument("--enum-fields", type=int, default=1, help="Number of enumeration fields per record.")
+    parser.add_argument("--markdown-share", type=float, default=0.25,
+                        help="Share of the records with a Markdown description (0..1).")
+    parser.add_argument("--gfm-share", type=float, default=0.25,
+                        help="Share of the records with a GitHub Flavored Markdown description (0..1).")
+    parser.add_argument("--plantuml-share", type=float, default=0.0,
+                        help="Share of the Markdown and GFM records with a PlantUML block (0..1).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random number generator.")
+
+
+def create_generator(args: argparse.Namespace, records: int, files: int) -> ModelGenerator:
+    """Create the model generator with the parsed arguments of add_generator_arguments().
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+        records (int): Number of records.
+        files (int): Number of TRLC files.
+
+    Returns:
+        ModelGenerator: The model generator.
+    """
+    return ModelGenerator(records,
+                          files,
+                          section_depth=args.section_depth,
+                          reference_density=args.reference_density,
+                          enum_fields=args.enum_fields,
+                          markdown_share=args.markdown_share,
+                          gfm_share=args.gfm_share,
+                          plantuml_share=args.plantuml_share,
+                          seed=args.seed)
+
+# Main *************************************************************************
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -123,12 +123,12 @@ class CustomRstConverter(RstConverter):
         Returns:
             list[str]: Table row
         """
-        test_case_result_attributes = test_case_result.to_python_dict()
+        attributes = self._get_attributes(test_case_result, ["name", "result"])
 
-        test_function_name = self._get_attribute(test_case_result, "name")
-        test_result = self._get_attribute(test_case_result, "result")
+        test_function_name = attributes["name"]
+        test_result = attributes["result"]
 
-        test_case = test_case_result_attributes["relates"]
+        test_case = self._get_field_value(test_case_result, "relates")
         if test_case is None:
             test_case = RstText.escape("N/A")
         elif isinstance(test_case, list):
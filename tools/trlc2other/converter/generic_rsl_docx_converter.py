@@ -28,10 +28,10 @@ import docx
 # pylint: disable=import-error
 from pyTRLCConverter.docx_converter import DocxConverter
 from pyTRLCConverter.ret import Ret
-from pyTRLCConverter.trlc_helper import Record_Object
+from pyTRLCConverter.trlc_helper import Record_Object, is_item_record
 
 # pylint: disable=wrong-import-order
-from image_processing import convert_plantuml_to_image, locate_file
+from image_processing import convert_plantuml_files_to_images, convert_plantuml_to_image, locate_file
 
 # Variables ********************************************************************
 
@@ -41,6 +41,7 @@ class GenericRslDocxConverter(DocxConverter):
     """
     Project specific docx converter subclass for generic.rsl types.
     """
+
     def __init__(self, args: Any) -> None:
         """
         Initialize the custom docx converter.
@@ -52,6 +53,22 @@ class GenericRslDocxConverter(DocxConverter):
 
         self._img_counter = 1
 
+    def prefetch_plantuml_diagrams(self, item_list: list) -> None:
+        """Convert all PlantUML diagram records of a TRLC file to images at once.
+
+        Args:
+            item_list (list): The list of TRLC items in the file.
+        """
+        super().prefetch_plantuml_diagrams(item_list)
+
+        convert_plantuml_files_to_images(
+            [self._get_attribute(item[0], "file_path") for item in item_list
+             if is_item_record(item) and (item[0].n_typ.name == "PlantUML")],
+            self._args.out,
+            self._args.source,
+            "png"
+        )
+
     # pylint: disable-next=unused-argument
     def _convert_record_object_info(self, record: Record_Object, level: int, translation: Optional[dict]) -> Ret:
         """Convert an information record object to the destination format.
@@ -69,7 +86,7 @@ class GenericRslDocxConverter(DocxConverter):
         # as the render function uses it to add the content.
         self._block_item_container = self._docx # type: ignore
 
-        self._render(record.n_package.name,
+        self._render_attribute(record.n_package.name,
                      record.n_typ.name,
                      "description",
                      self._get_attribute(record, "description"))
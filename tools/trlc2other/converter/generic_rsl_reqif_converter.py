@@ -32,10 +32,10 @@ from typing import Optional
 from reqif.models.reqif_types import SpecObjectAttributeType
 from pyTRLCConverter.ret import Ret
 from pyTRLCConverter.reqif_converter import ReqifConverter
-from pyTRLCConverter.trlc_helper import Record_Object
+from pyTRLCConverter.trlc_helper import Record_Object, is_item_record
 
 # pylint: disable=wrong-import-order
-from image_processing import convert_plantuml_to_image, locate_file
+from image_processing import convert_plantuml_files_to_images, convert_plantuml_to_image, locate_file
 
 # Variables ********************************************************************
 
@@ -45,6 +45,21 @@ from image_processing import convert_plantuml_to_image, locate_file
 class GenericRslReqifConverter(ReqifConverter):
     """Project specific ReqIF converter subclass for generic.rsl types."""
 
+    def prefetch_plantuml_diagrams(self, item_list: list) -> None:
+        """Convert all PlantUML diagram records of a TRLC file to images at once.
+
+        Args:
+            item_list (list): The list of TRLC items in the file.
+        """
+        super().prefetch_plantuml_diagrams(item_list)
+
+        convert_plantuml_files_to_images(
+            [self._get_attribute(item[0], "file_path") for item in item_list
+             if is_item_record(item) and (item[0].n_typ.name == "PlantUML")],
+            self._args.out,
+            self._args.source
+        )
+
     # pylint: disable-next=unused-argument
     def _print_info(self, info: Record_Object, level: int, translation: Optional[dict]) -> Ret:
         """Prints the information as a ReqIF spec-object.
@@ -59,7 +74,7 @@ class GenericRslReqifConverter(ReqifConverter):
             Ret: Status
         """
         description = self._get_attribute(info, "description")
-        rendered = self._render(
+        rendered = self._render_attribute(
             info.n_package.name,
             info.n_typ.name,
             "description",
@@ -162,8 +177,9 @@ class GenericRslReqifConverter(ReqifConverter):
         Returns:
             Ret: Status
         """
-        image_file = locate_file(self._get_attribute(image, "file_path"), self._args.source)
-        caption = self._get_attribute(image, "caption")
+        attributes = self._get_attributes(image, ["file_path", "caption"])
+        image_file = locate_file(attributes["file_path"], self._args.source)
+        caption = attributes["caption"]
 
         if image_file is not None:
             # Copy image file to the output folder so it is co-located with the .reqif file.
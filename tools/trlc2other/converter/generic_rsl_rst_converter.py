@@ -31,10 +31,10 @@ from typing import Optional
 from pyTRLCConverter.ret import Ret
 from pyTRLCConverter.rst_converter import RstConverter
 from pyTRLCConverter.rst.element import RstImage, RstRawText
-from pyTRLCConverter.trlc_helper import Record_Object
+from pyTRLCConverter.trlc_helper import Record_Object, is_item_record
 
 # pylint: disable=wrong-import-order
-from image_processing import convert_plantuml_to_image, locate_file
+from image_processing import convert_plantuml_files_to_images, convert_plantuml_to_image, locate_file
 
 # Variables ********************************************************************
 
@@ -45,6 +45,21 @@ class GenericRslRstConverter(RstConverter):
     """Project specific reStructuredText converter subclass for generic.rsl types.
     """
 
+    def prefetch_plantuml_diagrams(self, item_list: list) -> None:
+        """Convert all PlantUML diagram records of a TRLC file to images at once.
+
+        Args:
+            item_list (list): The list of TRLC items in the file.
+        """
+        super().prefetch_plantuml_diagrams(item_list)
+
+        convert_plantuml_files_to_images(
+            [self._get_attribute(item[0], "file_path") for item in item_list
+             if is_item_record(item) and (item[0].n_typ.name == "PlantUML")],
+            self._args.out,
+            self._args.source
+        )
+
     # pylint: disable-next=unused-argument
     def _print_info(self, info: Record_Object, level: int, translation: Optional[dict]) -> Ret:
         """Prints the information.
@@ -60,7 +75,7 @@ class GenericRslRstConverter(RstConverter):
         """
         assert self._document is not None
 
-        rst_info = self._render(info.n_package.name,
+        rst_info = self._render_attribute(info.n_package.name,
                                 info.n_typ.name,
                                 "description",
                                 self._get_attribute(info, "description"))
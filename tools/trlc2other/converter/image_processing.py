@@ -21,13 +21,19 @@
 
 # Imports **********************************************************************
 import os
+import subprocess
 from pathlib import Path
 from typing import List, Optional
 
+import requests
+from pyTRLCConverter.logger import log_verbose
 from pyTRLCConverter.plantuml import PlantUML
 
 # Variables ********************************************************************
 
+# Images which were already generated, identified by PlantUML file, destination and format.
+_generated_images = set()
+
 # Classes **********************************************************************
 
 # Functions ********************************************************************
@@ -52,8 +58,9 @@ def convert_plantuml_to_image(plantuml_file: str, dest_dir: str, directories: Li
 
     file_path = locate_file(plantuml_file, directories)
     if file_path is not None:
-        puml = PlantUML()
-        puml.generate(image_format, file_path, dest_dir)
+        if _get_image_key(file_path, dest_dir, image_format) not in _generated_images:
+            puml = PlantUML()
+            puml.generate(image_format, file_path, dest_dir)
 
         file_dst_path = os.path.basename(file_path)
         file_dst_path = os.path.splitext(file_dst_path)[0]
@@ -74,6 +81,59 @@ def convert_plantuml_to_image(plantuml_file: str, dest_dir: str, directories: Li
     return result
 
 
+def convert_plantuml_files_to_images(plantuml_files: List[str], dest_dir: str, directories: List[str],
+                                     image_format: str = "svg") -> None:
+    """Convert several PlantUML diagrams to image files at once.
+
+    All diagrams are handed over to PlantUML in a single call, which avoids the Java
+    startup time per diagram. A later convert_plantuml_to_image() call for one of the
+    diagrams takes the already generated image. Errors are not reported here, because
+    the diagrams are converted one by one with the usual error handling in this case.
+
+    Args:
+        plantuml_files (List[str]): Paths or names of the PlantUML source files.
+        dest_dir (str): Directory where the generated images will be written.
+        directories (List[str]): Directories to search when a file is not an absolute path.
+        image_format (str): Output image format passed to PlantUML (e.g. "svg" or "png").
+                            Defaults to "svg".
+    """
+    assert image_format in ("svg", "png"), f"Unsupported image format: {image_format!r}"
+
+    file_paths = []
+
+    for plantuml_file in plantuml_files:
+        file_path = locate_file(plantuml_file, directories)
+
+        if (file_path is not None) and \
+           (_get_image_key(file_path, dest_dir, image_format) not in _generated_images) and \
+           (file_path not in file_paths):
+            file_paths.append(file_path)
+
+    if 0 < len(file_paths):
+        try:
+            PlantUML().generate_batch(image_format, file_paths, dest_dir)
+
+            for file_path in file_paths:
+                _generated_images.add(_get_image_key(file_path, dest_dir, image_format))
+
+        except (OSError, subprocess.SubprocessError, requests.exceptions.RequestException) as exc:
+            log_verbose(f"Failed to convert PlantUML diagrams at once: {exc}")
+
+
+def _get_image_key(file_path: str, dest_dir: str, image_format: str) -> tuple:
+    """Get the key which identifies a generated image.
+
+    Args:
+        file_path (str): Path to the PlantUML source file.
+        dest_dir (str): Directory where the generated image is written.
+        image_format (str): Output image format.
+
+    Returns:
+        tuple: The key.
+    """
+    return (os.path.abspath(file_path), os.path.abspath(dest_dir), image_format)
+
+
 def locate_file(file_path: str, directories: List[str]) -> Optional[str]:
     """
     Locate a file by searching through the sources list if it 